@@ -0,0 +1,50 @@
+"""
+pytest 명령줄 옵션 등록
+
+pytest_addoption은 rootdir의 conftest.py에 있어야 경로 인자 없이 실행할 때도 인식되므로
+옵션 정의만 이곳에 두고, 픽스처와 훅은 e2e/conftest.py에 둡니다.
+"""
+import os
+
+from dotenv import load_dotenv
+
+# 옵션 기본값도 .env.test를 따르도록 먼저 로드
+load_dotenv('.env.test')
+
+from e2e.utils.run_history import DEFAULT_DB_PATH  # noqa: E402
+
+
+def pytest_addoption(parser):
+    """
+    커스텀 명령줄 옵션 등록
+    """
+    parser.addoption(
+        '--emulation-profile',
+        action='store',
+        default=os.getenv('EMULATION_PROFILE', ''),
+        help='네트워크/CPU 스로틀링 프로파일 (none, lan, site-dsl, kiosk-3g, congested)',
+    )
+    parser.addoption(
+        '--run-history-db',
+        action='store',
+        default=DEFAULT_DB_PATH,
+        help='실행 이력 SQLite 경로 (e2e/utils/run_history.py)',
+    )
+    parser.addoption(
+        '--no-run-history',
+        action='store_true',
+        default=False,
+        help='실행 이력 기록 비활성화',
+    )
+    parser.addoption(
+        '--timeline',
+        action='store',
+        default=os.getenv('TIMELINE_REPORT', ''),
+        help='단계/네트워크/대기 타임라인 HTML 저장 경로 (e2e/utils/timeline.py)',
+    )
+    parser.addoption(
+        '--keep-resources',
+        action='store_true',
+        default=os.getenv('KEEP_TEST_RESOURCES', '') == '1',
+        help='세션 종료 시 테스트가 만든 장소/임직원을 삭제하지 않음 (e2e/utils/resources.py)',
+    )
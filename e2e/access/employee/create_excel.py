@@ -1,10 +1,85 @@
 """
 Excel template file generator for employee management tests
+
+기본 실행 시 5개 샘플 행이 들어간 em_add.xlsx 템플릿을 생성합니다.
+10만 행 이상의 임직원 마스터를 만들 때는 write-only 스트리밍 모드를 사용하세요.
+행을 생성기(generator)에서 하나씩 받아 바로 기록하므로 메모리 사용량이 행 수와 무관하게 일정합니다.
+
+실행 방법:
+    python create_excel.py                                  # 기본 템플릿 (5행)
+    python create_excel.py --rows 100000 -o em_add_100k.xlsx  # 합성 데이터 스트리밍
+    python create_excel.py --csv master.csv -o em_add.xlsx     # 임직원 마스터 CSV 스트리밍
+    python create_excel.py --rows 100000 --benchmark           # 초당 행 수, 최대 메모리 측정
 """
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from typing import Iterable, Iterator
+
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
 
+HEADERS_ADD = ["index", "department", "job_grade", "job_position", "assignment_start_date", "access_cases", "rf_card", "비고"]
+HEADERS_REMOVE = ["index", "name", "비고"]
+HEADERS_PERSONNEL = HEADERS_ADD + ["name", "id"]
+COLUMN_WIDTHS_ADD = [8, 15, 12, 12, 20, 20, 15, 15]
+
+HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="000000")
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+
+GUIDE_TITLE = "임직원 관리 Excel 파일 사용 가이드"
+
+# 사용가이드 시트 내용 (None은 빈 행, bold=True는 섹션 제목)
+GUIDE_ROWS = [
+    None,
+    (["[임직원_추가 시트]", ""], True),
+    (["index", "임직원 추가 순서 (1부터 시작, 이미지 파일 순서와 매칭)"], False),
+    (["department", "부서명 (예: 개발팀, 영업팀)"], False),
+    (["job_grade", "직급 (예: Pro, Manager, Director)"], False),
+    (["job_position", "직책 (예: Pro, Manager, Director)"], False),
+    (["assignment_start_date", "발령 시작일 (today, 2025-03-01 또는 Excel 날짜)"], False),
+    (["access_cases", "출입케이스 (쉼표로 구분, 예: 출근,퇴근)"], False),
+    (["rf_card", "RF 카드 번호 (쉼표로 구분, 없으면 빈 값)"], False),
+    (["비고", "메모 (테스트에 영향 없음)"], False),
+    None,
+    (["[임직원_삭제 시트]", ""], True),
+    (["name", "삭제할 임직원 이름 또는 ID"], False),
+    (["", "빈 값: 목록 맨 위 임직원 삭제"], False),
+    (["1000460", "특정 ID 삭제"], False),
+    None,
+    (["[주의사항]", ""], True),
+    (["1.", "index는 employee 폴더의 이미지 파일 순서와 매칭됩니다."], False),
+    (["2.", "department, job_grade, job_position은 시스템에 등록된 값과 일치해야 합니다."], False),
+    (["3.", "access_cases는 쉼표로 구분하여 여러 개 지정 가능합니다."], False),
+    (["4.", "rf_card는 선택사항입니다. 빈 값으로 두면 카드 없이 등록됩니다."], False),
+]
+
+REMOVE_SAMPLE_ROWS = [
+    ["1", "", "빈 값은 목록 맨 위 임직원 삭제"],
+    ["2", "1000460", "특정 ID 삭제 예시"],
+]
+
+# 임직원 마스터 CSV 컬럼명 -> 템플릿 컬럼 매핑 (영문 헤더는 그대로 사용)
+CSV_COLUMN_MAP = {
+    "부서": "department",
+    "직급": "job_grade",
+    "직책": "job_position",
+    "발령 시작일": "assignment_start_date",
+    "발령시작일": "assignment_start_date",
+    "출입케이스": "access_cases",
+    "출입 케이스": "access_cases",
+    "RF카드": "rf_card",
+    "RF 카드": "rf_card",
+    "비고": "비고",
+}
+
+
 def create_excel_template():
     wb = Workbook()
 
@@ -13,18 +88,14 @@ def create_excel_template():
     ws_add.title = "임직원_추가"
 
     # Headers
-    headers_add = ["index", "department", "job_grade", "job_position", "assignment_start_date", "access_cases", "rf_card", "비고"]
-    ws_add.append(headers_add)
+    ws_add.append(HEADERS_ADD)
 
     # Style headers
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_font = Font(bold=True, color="000000")
-
-    for col_num, header in enumerate(headers_add, 1):
+    for col_num, header in enumerate(HEADERS_ADD, 1):
         cell = ws_add.cell(row=1, column=col_num)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = HEADER_ALIGNMENT
 
     # Sample data (5 rows matching JSON)
     sample_data = [
@@ -39,26 +110,24 @@ def create_excel_template():
         ws_add.append(row_data)
 
     # Adjust column widths
-    column_widths = [8, 15, 12, 12, 20, 20, 15, 15]
-    for idx, width in enumerate(column_widths, 1):
+    for idx, width in enumerate(COLUMN_WIDTHS_ADD, 1):
         ws_add.column_dimensions[get_column_letter(idx)].width = width
 
     # Sheet 2: Employee Remove
     ws_remove = wb.create_sheet("임직원_삭제")
 
-    headers_remove = ["index", "name", "비고"]
-    ws_remove.append(headers_remove)
+    ws_remove.append(HEADERS_REMOVE)
 
     # Style headers
-    for col_num, header in enumerate(headers_remove, 1):
+    for col_num, header in enumerate(HEADERS_REMOVE, 1):
         cell = ws_remove.cell(row=1, column=col_num)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = HEADER_ALIGNMENT
 
     # Sample data
-    ws_remove.append(["1", "", "빈 값은 목록 맨 위 임직원 삭제"])
-    ws_remove.append(["2","1000460", "특정 ID 삭제 예시"])
+    for row_data in REMOVE_SAMPLE_ROWS:
+        ws_remove.append(row_data)
 
     # Adjust column widths
     ws_remove.column_dimensions['A'].width = 20
@@ -71,49 +140,24 @@ def create_excel_template():
     guide_header_font = Font(bold=True, size=11)
 
     # Title
-    ws_guide['A1'] = "임직원 관리 Excel 파일 사용 가이드"
+    ws_guide['A1'] = GUIDE_TITLE
     ws_guide['A1'].font = guide_title_font
     ws_guide.merge_cells('A1:B1')
 
-    ws_guide.append([])
-
-    # Add sheet guide
-    ws_guide.append(["[임직원_추가 시트]", ""])
-    ws_guide['A3'].font = guide_header_font
-    ws_guide.append(["index", "임직원 추가 순서 (1부터 시작, 이미지 파일 순서와 매칭)"])
-    ws_guide.append(["department", "부서명 (예: 개발팀, 영업팀)"])
-    ws_guide.append(["job_grade", "직급 (예: Pro, Manager, Director)"])
-    ws_guide.append(["job_position", "직책 (예: Pro, Manager, Director)"])
-    ws_guide.append(["assignment_start_date", "발령 시작일 (today 또는 날짜)"])
-    ws_guide.append(["access_cases", "출입케이스 (쉼표로 구분, 예: 출근,퇴근)"])
-    ws_guide.append(["rf_card", "RF 카드 번호 (쉼표로 구분, 없으면 빈 값)"])
-    ws_guide.append(["비고", "메모 (테스트에 영향 없음)"])
-
-    ws_guide.append([])
-
-    # Remove sheet guide
-    ws_guide.append(["[임직원_삭제 시트]", ""])
-    ws_guide['A13'].font = guide_header_font
-    ws_guide.append(["name", "삭제할 임직원 이름 또는 ID"])
-    ws_guide.append(["", "빈 값: 목록 맨 위 임직원 삭제"])
-    ws_guide.append(["1000460", "특정 ID 삭제"])
-
-    ws_guide.append([])
-
-    # Notes
-    ws_guide.append(["[주의사항]", ""])
-    ws_guide['A18'].font = guide_header_font
-    ws_guide.append(["1.", "index는 employee 폴더의 이미지 파일 순서와 매칭됩니다."])
-    ws_guide.append(["2.", "department, job_grade, job_position은 시스템에 등록된 값과 일치해야 합니다."])
-    ws_guide.append(["3.", "access_cases는 쉼표로 구분하여 여러 개 지정 가능합니다."])
-    ws_guide.append(["4.", "rf_card는 선택사항입니다. 빈 값으로 두면 카드 없이 등록됩니다."])
+    for guide_row in GUIDE_ROWS:
+        if guide_row is None:
+            ws_guide.append([])
+            continue
+        values, is_section = guide_row
+        ws_guide.append(values)
+        if is_section:
+            ws_guide.cell(row=ws_guide.max_row, column=1).font = guide_header_font
 
     # Adjust column widths
     ws_guide.column_dimensions['A'].width = 25
     ws_guide.column_dimensions['B'].width = 60
 
     # Save file
-    import os
     output_path = os.path.join(os.path.dirname(__file__), "em_add.xlsx")
     wb.save(output_path)
     print(f"Excel file created: {output_path}")
@@ -121,5 +165,179 @@ def create_excel_template():
     print(f"  - Sheet 2: 임직원_삭제 (2 sample rows)")
     print(f"  - Sheet 3: 사용가이드")
 
+
+# ============================================================================
+# Write-only 스트리밍 모드
+# ============================================================================
+
+def synthetic_rows(count: int, seed: int = 0) -> Iterator[list]:
+    """
+    합성 임직원 행 생성기 (seed가 같으면 항상 같은 데이터)
+    """
+    rng = random.Random(seed)
+    departments = ["개발팀", "영업팀", "기획팀", "인사팀", "보안팀", "총무팀"]
+    grades = ["Pro", "Manager", "Director"]
+    access_cases = ["출근", "퇴근", "전구역", "식당", "주차장"]
+    for index in range(1, count + 1):
+        grade = rng.choice(grades)
+        cases = rng.sample(access_cases, rng.randint(1, 3))
+        yield [index, rng.choice(departments), grade, grade, "today", ",".join(cases), "", ""]
+
+
+def csv_rows(csv_path: str, encoding: str = "utf-8-sig") -> Iterator[list]:
+    """
+    임직원 마스터 CSV를 템플릿 행으로 변환하는 생성기
+
+    헤더는 템플릿 컬럼명(department 등) 또는 CSV_COLUMN_MAP의 한글 컬럼명을 인식합니다.
+    index는 1부터 순서대로 부여합니다.
+    """
+    with open(csv_path, "r", encoding=encoding, newline="") as f:
+        reader = csv.DictReader(f)
+        columns = {name: CSV_COLUMN_MAP.get(name.strip(), name.strip()) for name in reader.fieldnames or []}
+        for index, record in enumerate(reader, 1):
+            mapped = {columns[k]: (v or "").strip() for k, v in record.items() if k in columns}
+            yield [index] + [mapped.get(h, "") for h in HEADERS_ADD[1:]]
+
+
+def _styled_header(ws, headers: list[str]) -> list:
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = HEADER_ALIGNMENT
+        cells.append(cell)
+    return cells
+
+
+def create_excel_template_streaming(output_path: str, rows: Iterable[list]) -> int:
+    """
+    write-only 워크북으로 템플릿 생성
+
+    기본 템플릿과 같은 헤더 서식, 임직원_삭제/사용가이드 시트를 유지하고,
+    테스트가 결과를 기록하는 '인원' 시트(헤더만)를 함께 만듭니다.
+    write-only 워크시트는 셀 병합을 지원하지 않으므로 사용가이드 제목은 A1에만 기록합니다.
+
+    Returns:
+        int: 기록한 데이터 행 수
+    """
+    wb = Workbook(write_only=True)
+
+    # Sheet 1: Employee Add (컬럼 너비는 행 기록 전에 지정해야 함)
+    ws_add = wb.create_sheet("임직원_추가")
+    for idx, width in enumerate(COLUMN_WIDTHS_ADD, 1):
+        ws_add.column_dimensions[get_column_letter(idx)].width = width
+    ws_add.append(_styled_header(ws_add, HEADERS_ADD))
+
+    count = 0
+    for row in rows:
+        ws_add.append(row)
+        count += 1
+
+    # Sheet 2: Employee Remove
+    ws_remove = wb.create_sheet("임직원_삭제")
+    ws_remove.column_dimensions['A'].width = 20
+    ws_remove.column_dimensions['B'].width = 30
+    ws_remove.append(_styled_header(ws_remove, HEADERS_REMOVE))
+    for row_data in REMOVE_SAMPLE_ROWS:
+        ws_remove.append(row_data)
+
+    # Sheet 3: Usage Guide
+    ws_guide = wb.create_sheet("사용가이드")
+    ws_guide.column_dimensions['A'].width = 25
+    ws_guide.column_dimensions['B'].width = 60
+    title = WriteOnlyCell(ws_guide, value=GUIDE_TITLE)
+    title.font = Font(bold=True, size=14)
+    ws_guide.append([title])
+    guide_header_font = Font(bold=True, size=11)
+    for guide_row in GUIDE_ROWS:
+        if guide_row is None:
+            ws_guide.append([])
+            continue
+        values, is_section = guide_row
+        if is_section:
+            first = WriteOnlyCell(ws_guide, value=values[0])
+            first.font = guide_header_font
+            values = [first] + values[1:]
+        ws_guide.append(values)
+
+    # Sheet 4: 인원 (테스트 결과 기록용)
+    ws_personnel = wb.create_sheet("인원")
+    ws_personnel.append(_styled_header(ws_personnel, HEADERS_PERSONNEL))
+
+    wb.save(output_path)
+    return count
+
+
+def _peak_rss_mb():
+    """
+    프로세스 최대 RSS (MB). 측정할 수 없으면 None
+    """
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def benchmark(output_path: str, rows: Iterable[list]) -> dict:
+    """
+    스트리밍 생성 성능 측정 (초당 행 수, 프로세스 최대 메모리)
+
+    tracemalloc은 생성 속도를 크게 떨어뜨리므로 최대 RSS로 메모리를 측정합니다.
+    """
+    start = time.perf_counter()
+    count = create_excel_template_streaming(output_path, rows)
+    elapsed = time.perf_counter() - start
+    peak = _peak_rss_mb()
+
+    result = {
+        "rows": count,
+        "seconds": elapsed,
+        "rows_per_second": count / elapsed if elapsed else 0,
+        "peak_memory_mb": peak,
+        "file_size_mb": os.path.getsize(output_path) / (1024 * 1024),
+    }
+    peak_text = f"{peak:.1f}MB" if peak is not None else "n/a"
+    print(f"[BENCH] rows={result['rows']}, Time={result['seconds']:.2f}s, "
+          f"rows/s={result['rows_per_second']:.0f}, peak_memory={peak_text}, "
+          f"file={result['file_size_mb']:.1f}MB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="임직원 관리 Excel 템플릿 생성")
+    parser.add_argument("--rows", type=int, help="합성 데이터 행 수 (write-only 스트리밍 모드)")
+    parser.add_argument("--csv", help="임직원 마스터 CSV 경로 (write-only 스트리밍 모드)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 seed")
+    parser.add_argument("-o", "--output", help="출력 파일 경로")
+    parser.add_argument("--benchmark", action="store_true", help="초당 행 수와 최대 메모리 측정")
+    args = parser.parse_args()
+
+    if args.rows is None and args.csv is None:
+        create_excel_template()
+        return
+
+    rows = csv_rows(args.csv) if args.csv else synthetic_rows(args.rows, args.seed)
+    output_path = args.output or os.path.join(os.path.dirname(__file__), "em_add_stream.xlsx")
+
+    if args.benchmark:
+        benchmark(output_path, rows)
+    else:
+        count = create_excel_template_streaming(output_path, rows)
+        print(f"Excel file created (write-only): {output_path}")
+        print(f"  - Sheet 1: 임직원_추가 ({count} rows)")
+        print(f"  - Sheet 2: 임직원_삭제 (2 sample rows)")
+        print(f"  - Sheet 3: 사용가이드")
+        print(f"  - Sheet 4: 인원 (header only)")
+
+
 if __name__ == "__main__":
-    create_excel_template()
+    main()
@@ -0,0 +1,277 @@
+"""
+임직원 추가/검색/삭제 처리량 벤치마크 (동시성 스윕)
+
+"분당 몇 명을 등록할 수 있는가"를 반복 가능하게 측정합니다.
+동시성 수준(1, 2, 4, 8 ...)별로 워밍업 후 반복 실행하여 처리량, 지연 백분위, 오류율을 보고하고
+실행 이력 DB에 저장해 이전 실행과 비교합니다.
+
+대상(target):
+    stub    로컬 대역 API 서버(e2e/utils/stub_server.py)를 띄워 측정 (오프라인 개발용)
+    server  .env.test의 BASE_URL / API_BASE_URL 서버
+
+드라이버(driver):
+    api     REST API 직접 호출 (e2e/utils/api.py)
+    ui      브라우저 UI 흐름 (e2e/utils/async_core.py, server 대상 전용)
+
+실행 예 (저장소 루트에서):
+    python -m e2e.access.employee.employee_benchmark --target stub --levels 1,2,4,8
+    python -m e2e.access.employee.employee_benchmark --target server --driver ui --levels 1,2,4 --ops 3
+    python -m e2e.utils.run_history bench --suite employee
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import tempfile
+import time
+
+from e2e.access.employee.generate_dataset import DEFAULT_CATALOG, draw_face, make_employee
+from e2e.utils import settings
+from e2e.utils.api import ApiClient, items_of
+from e2e.utils.async_core import (
+    AsyncBulkRunner, _accept_dialog, add_employee, delete_employee, open_employee_list, search_employee,
+)
+from e2e.utils.benchmark import Flow, aggregate, format_rows, sweep
+from e2e.utils.run_history import DEFAULT_DB_PATH, git_revision, previous_throughput, record_benchmark
+from e2e.utils.stub_server import StubServer
+
+SUITE = 'employee'
+FLOWS = ('add', 'search', 'delete')
+# search 흐름에서 반복 검색할 임직원 수
+SEARCH_POOL_SIZE = 20
+
+
+class ApiDriver:
+    """
+    REST API 드라이버 (동기 urllib 클라이언트를 스레드에서 실행)
+    """
+
+    name = 'api'
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+
+    async def open(self, worker_id: int) -> ApiClient:
+        return await asyncio.to_thread(ApiClient(self.base_url).login)
+
+    async def close(self, client: ApiClient):
+        pass
+
+    async def recover(self, client: ApiClient):
+        pass
+
+    async def add(self, client: ApiClient, employee: dict):
+        await asyncio.to_thread(client.create_employee, employee)
+
+    async def search(self, client: ApiClient, employee: dict):
+        response = await asyncio.to_thread(client.list_employees, employee_id=employee['id'])
+        if not any(str(item.get('employeeId')) == employee['id'] for item in items_of(response)):
+            raise LookupError(f"검색 결과 없음: {employee['id']}")
+
+    async def delete(self, client: ApiClient, employee: dict):
+        await asyncio.to_thread(client.delete_employee, employee['id'])
+
+
+class UiDriver:
+    """
+    브라우저 UI 드라이버 (작업자마다 인증 컨텍스트 하나)
+    """
+
+    name = 'ui'
+
+    def __init__(self, runner, image_path: str):
+        self.runner = runner
+        self.image_path = image_path
+
+    async def open(self, worker_id: int):
+        context = await self.runner.new_context()
+        page = await context.new_page()
+        page.on("dialog", _accept_dialog)
+        await open_employee_list(page)
+        return page
+
+    async def close(self, page):
+        await page.context.close()
+
+    async def recover(self, page):
+        await open_employee_list(page)
+
+    async def add(self, page, employee: dict):
+        await add_employee(page, employee['id'], employee['name'], employee, self.image_path)
+
+    async def search(self, page, employee: dict):
+        await search_employee(page, employee['id'])
+
+    async def delete(self, page, employee: dict):
+        await search_employee(page, employee['id'])
+        await delete_employee(page, employee['id'])
+
+
+class EmployeeFlow(Flow):
+    """
+    add: 새 임직원 추가 / search: 미리 만든 임직원을 사번으로 검색 / delete: 미리 만든 임직원 삭제
+
+    벤치마크가 만든 임직원은 id_prefix로 시작하는 사번을 쓰며 cleanup()에서 삭제합니다.
+    """
+
+    def __init__(self, kind: str, driver, id_prefix: str, seed: int = 0, catalog: dict | None = None):
+        if kind not in FLOWS:
+            raise ValueError(f"알 수 없는 흐름: {kind} (사용 가능: {', '.join(FLOWS)})")
+        self.name = kind
+        self.driver = driver
+        self.id_prefix = id_prefix
+        self.seed = seed
+        self.catalog = catalog or DEFAULT_CATALOG
+        self._counter = itertools.count()
+        self.pool: list[dict] = []
+        self.created: list[dict] = []
+
+    def new_employee(self) -> dict:
+        index = next(self._counter)
+        return make_employee(self.seed, index, f"{self.id_prefix}{index:06d}", self.catalog, rf_ratio=0)
+
+    async def _bulk(self, action: str, employees: list[dict], workers: int = 4):
+        """
+        측정 밖의 준비/정리 작업 (실패는 무시하고 건수만 반환)
+        """
+        queue = list(employees)
+        done = 0
+
+        async def worker(worker_id: int):
+            nonlocal done
+            ctx = await self.driver.open(worker_id)
+            try:
+                while queue:
+                    employee = queue.pop()
+                    try:
+                        await getattr(self.driver, action)(ctx, employee)
+                        done += 1
+                    except Exception:
+                        await self.driver.recover(ctx)
+            finally:
+                await self.driver.close(ctx)
+
+        if queue:
+            await asyncio.gather(*(worker(i) for i in range(min(workers, len(queue)))))
+        return done
+
+    async def prepare(self, total_ops: int):
+        if self.name == 'search':
+            self.pool = [self.new_employee() for _ in range(SEARCH_POOL_SIZE)]
+        elif self.name == 'delete':
+            self.pool = [self.new_employee() for _ in range(total_ops)]
+        if self.pool:
+            added = await self._bulk('add', self.pool)
+            print(f"[INFO] {self.name} 준비: 임직원 {added}/{len(self.pool)}명 추가")
+
+    async def setup(self, worker_id: int):
+        return await self.driver.open(worker_id)
+
+    async def op(self, ctx, seq: int):
+        try:
+            if self.name == 'add':
+                employee = self.new_employee()
+                await self.driver.add(ctx, employee)
+                self.created.append(employee)
+            elif self.name == 'search':
+                await self.driver.search(ctx, self.pool[seq % len(self.pool)])
+            else:
+                await self.driver.delete(ctx, self.pool.pop())
+        except Exception:
+            await self.driver.recover(ctx)
+            raise
+
+    async def teardown(self, ctx):
+        await self.driver.close(ctx)
+
+    async def cleanup(self):
+        # add 흐름이 만든 임직원 + search 대상/delete 흐름에서 남은 임직원
+        leftovers = self.created + self.pool
+        if leftovers:
+            removed = await self._bulk('delete', leftovers)
+            print(f"[INFO] {self.name} 정리: 임직원 {removed}/{len(leftovers)}명 삭제")
+
+
+async def run_benchmark(flows: list[str], levels: list[int], ops_per_worker: int = 5, warmup: int = 1,
+                        reps: int = 3, target: str = 'stub', driver: str = 'api',
+                        stub_latency_ms: float = 5.0, seed: int = 0):
+    """
+    흐름별 동시성 스윕 실행
+
+    Returns:
+        tuple: (집계 rows, LevelResult 목록, 대상 이름)
+    """
+    if target == 'stub' and driver == 'ui':
+        raise ValueError("ui 드라이버는 server 대상에서만 사용할 수 있습니다.")
+
+    # 실행마다 다른 사번 접두사 (이전 실행의 잔여 데이터와 충돌 방지)
+    id_prefix = f"9{int(time.time()) % 100000:05d}"
+    server = StubServer(latency_ms=stub_latency_ms).start() if target == 'stub' else None
+    runner = None
+    try:
+        if driver == 'ui':
+            image_path = os.path.join(tempfile.mkdtemp(prefix='bench-'), 'face.jpg')
+            draw_face(random.Random(seed), image_path)
+            runner = AsyncBulkRunner(concurrency=max(levels))
+            await runner.start()
+            bench_driver = UiDriver(runner, image_path)
+        else:
+            bench_driver = ApiDriver(server.url if server else None)
+
+        results = []
+        for kind in flows:
+            flow = EmployeeFlow(kind, bench_driver, id_prefix, seed)
+            results += await sweep(flow, levels, ops_per_worker, warmup, reps)
+    finally:
+        if runner is not None:
+            await runner.close()
+        if server is not None:
+            server.stop()
+
+    target_name = 'stub' if server else settings.BASE_URL
+    return aggregate(results), results, target_name
+
+
+def report(rows: list[dict], target: str, driver: str, started_at: float, db_path: str | None) -> list[str]:
+    """
+    이전 실행 대비 표를 만들고 이력 DB에 기록 (db_path가 None이면 기록 생략)
+    """
+    previous = previous_throughput(db_path, SUITE, target, driver, started_at) if db_path else {}
+    lines = [f"[INFO] employee benchmark: driver={driver}, target={target}"] + format_rows(rows, previous)
+    if db_path:
+        record_benchmark(db_path, SUITE, {
+            'started_at': started_at, 'target': target, 'driver': driver, 'git_rev': git_revision(),
+        }, rows)
+    return lines
+
+
+def _levels(text: str) -> list[int]:
+    return [int(v) for v in text.split(',') if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='임직원 처리량 벤치마크 (동시성 스윕)')
+    parser.add_argument('--flows', default='add,search,delete', help='쉼표 구분 (add, search, delete)')
+    parser.add_argument('--levels', default='1,2,4,8', help='동시성 수준 (쉼표 구분)')
+    parser.add_argument('--ops', type=int, default=5, help='수준/반복당 작업자별 작업 수')
+    parser.add_argument('--warmup', type=int, default=1, help='작업자별 워밍업 작업 수 (측정 제외)')
+    parser.add_argument('--reps', type=int, default=3, help='수준별 반복 횟수')
+    parser.add_argument('--target', choices=['stub', 'server'], default='stub')
+    parser.add_argument('--driver', choices=['api', 'ui'], default='api')
+    parser.add_argument('--stub-latency-ms', type=float, default=5.0, help='대역 서버 응답 지연')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='실행 이력 SQLite 경로')
+    parser.add_argument('--no-record', action='store_true', help='이력 DB에 기록하지 않음')
+    args = parser.parse_args()
+
+    started_at = time.time()
+    rows, _, target = asyncio.run(run_benchmark(
+        [f.strip() for f in args.flows.split(',') if f.strip()], _levels(args.levels),
+        args.ops, args.warmup, args.reps, args.target, args.driver, args.stub_latency_ms,
+    ))
+    for line in report(rows, target, args.driver, started_at, None if args.no_record else args.db):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
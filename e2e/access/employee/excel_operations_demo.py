@@ -12,12 +12,17 @@ Excel 파일 생성 및 조작 종합 예제 스크립트
 
 실행 방법:
     python excel_operations_demo.py
+    python excel_operations_demo.py --photos ./employee --output photo_audit.xlsx   # 사진 감사용 워크북
 
 필수 패키지:
     pip install openpyxl pillow
 """
 
+import argparse
+import hashlib
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -32,6 +37,143 @@ except ImportError as e:
     exit(1)
 
 
+# 지원하는 이미지 확장자
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif')
+
+# 사진 셀에 표시할 썸네일 크기 (픽셀)
+THUMBNAIL_SIZE = (60, 75)
+
+
+def scan_image_files(image_dir):
+    """
+    이미지 디렉토리를 한 번만 스캔하여 이미지 파일 목록 반환 (이름순)
+
+    확장자별로 소문자/대문자를 따로 glob하면 디렉토리를 10번 읽고,
+    대소문자를 구분하지 않는 파일 시스템(Windows)에서는 같은 파일이 두 번 잡힙니다.
+    """
+    with os.scandir(image_dir) as entries:
+        files = [
+            Path(entry.path) for entry in entries
+            if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS)
+        ]
+    return sorted(files, key=lambda p: p.name)
+
+
+def make_thumbnail(image_path, cache_dir, size=THUMBNAIL_SIZE):
+    """
+    고정 크기 JPEG 썸네일 생성 (프로세스 풀 작업 함수)
+
+    캐시 파일 이름은 원본 내용 해시와 크기이므로 같은 사진은 한 번만 변환됩니다.
+
+    Returns:
+        str: 썸네일 파일 경로
+    """
+    from PIL import Image, ImageOps
+
+    with open(image_path, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    thumb_path = os.path.join(cache_dir, f"{digest}_{size[0]}x{size[1]}.jpg")
+    if os.path.exists(thumb_path):
+        return thumb_path
+
+    with Image.open(image_path) as img:
+        # JPEG는 디코딩 단계에서 축소 (원본 전체 디코딩 대비 수 배 빠름)
+        img.draft('RGB', (size[0] * 2, size[1] * 2))
+        img = ImageOps.exif_transpose(img)
+        thumb = ImageOps.fit(img.convert('RGB'), size)
+    # 다른 작업자와 동시에 쓰더라도 완성된 파일만 보이도록 임시 파일에 저장 후 교체
+    tmp_path = f"{thumb_path}.{os.getpid()}.tmp"
+    thumb.save(tmp_path, 'JPEG', quality=80, optimize=True)
+    os.replace(tmp_path, thumb_path)
+    return thumb_path
+
+
+def create_photo_audit_excel(image_dir, output_file="photo_audit.xlsx", cache_dir=None,
+                             size=THUMBNAIL_SIZE, workers=None):
+    """
+    사진 감사용 워크북 생성
+
+    디렉토리를 한 번 스캔하고, 프로세스 풀에서 고정 크기 썸네일을 만든 뒤(내용 해시 캐시)
+    한 번에 시트에 삽입합니다. 원본 대신 작은 썸네일을 넣으므로 파일 크기와 생성 시간이
+    사진 수에 완만하게 비례합니다.
+
+    Args:
+        image_dir: 임직원 사진 디렉토리
+        output_file: 저장할 파일 경로
+        cache_dir: 썸네일 캐시 디렉토리 (기본: image_dir/.thumbnails)
+        size: 썸네일 크기 (width, height)
+        workers: 프로세스 수 (기본: CPU 수)
+
+    Returns:
+        str: 생성된 파일의 경로
+    """
+    start = time.time()
+    image_dir = Path(image_dir)
+    cache_dir = cache_dir or str(image_dir / ".thumbnails")
+    os.makedirs(cache_dir, exist_ok=True)
+
+    image_files = scan_image_files(image_dir)
+    print(f"[INFO] {len(image_files)}개의 이미지 파일을 찾았습니다: {image_dir}")
+
+    # 썸네일 생성 (CPU 작업이므로 프로세스 풀 사용)
+    thumbnails = {}
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            (path, pool.submit(make_thumbnail, str(path), cache_dir, size))
+            for path in image_files
+        ]
+        for path, future in futures:
+            try:
+                thumbnails[path] = future.result()
+            except Exception as e:
+                failed.append(path)
+                print(f"[WARNING] 썸네일 생성 실패 ({path.name}): {e}")
+    thumb_elapsed = time.time() - start
+    print(f"[INFO] 썸네일 생성 완료: {len(thumbnails)}개 ({thumb_elapsed:.2f}초)")
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "사진감사"
+
+    headers = ["순번", "파일명", "원본 크기(KB)", "사진"]
+    ws.append(headers)
+    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF", size=11)
+    for col_num in range(1, len(headers) + 1):
+        cell = ws.cell(row=1, column=col_num)
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = Alignment(horizontal="center", vertical="center")
+
+    for col_idx, width in enumerate([8, 30, 14, 12], 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
+    ws.row_dimensions[1].height = 25
+
+    # 셀 높이는 포인트 단위 (1px = 0.75pt), 여백 포함
+    row_height = size[1] * 0.75 + 4
+    for idx, path in enumerate(image_files, 1):
+        row_num = idx + 1
+        ws.append([idx, path.name, round(path.stat().st_size / 1024, 1)])
+        ws.row_dimensions[row_num].height = row_height
+
+        thumb_path = thumbnails.get(path)
+        if thumb_path is None:
+            ws.cell(row=row_num, column=4, value="생성 실패")
+            continue
+        img = XLImage(thumb_path)
+        img.width, img.height = size
+        ws.add_image(img, f"D{row_num}")
+
+    wb.save(output_file)
+    elapsed = time.time() - start
+    file_size_mb = os.path.getsize(output_file) / (1024 * 1024)
+    print(f"[SUCCESS] 사진 감사 워크북 저장: {os.path.abspath(output_file)}")
+    print(f"[INFO] 사진 {len(image_files)}개, 실패 {len(failed)}개, "
+          f"파일 {file_size_mb:.1f}MB, 총 {elapsed:.2f}초")
+    return os.path.abspath(output_file)
+
+
 def create_sample_excel():
     """
     샘플 Excel 파일을 생성하는 메인 함수
@@ -228,15 +370,8 @@ def create_sample_excel():
     if not image_dir.exists():
         image_dir = script_dir
 
-    # 지원하는 이미지 확장자
-    image_extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.gif']
-
-    # 이미지 파일 검색
-    image_files = []
-    if image_dir.exists():
-        for ext in image_extensions:
-            image_files.extend(list(image_dir.glob(f'*{ext}')))
-            image_files.extend(list(image_dir.glob(f'*{ext.upper()}')))
+    # 이미지 파일 검색 (디렉토리 1회 스캔, 확장자 대소문자 무시)
+    image_files = scan_image_files(image_dir) if image_dir.exists() else []
 
     # 찾은 이미지 파일 출력
     if image_files:
@@ -328,6 +463,17 @@ def main():
     """
     메인 실행 함수
     """
+    parser = argparse.ArgumentParser(description="Excel 파일 생성 및 조작 예제")
+    parser.add_argument("--photos", help="사진 감사 워크북을 만들 이미지 디렉토리")
+    parser.add_argument("--output", default="photo_audit.xlsx", help="사진 감사 워크북 경로")
+    parser.add_argument("--cache-dir", help="썸네일 캐시 디렉토리")
+    parser.add_argument("--workers", type=int, help="썸네일 생성 프로세스 수")
+    args = parser.parse_args()
+
+    if args.photos:
+        create_photo_audit_excel(args.photos, args.output, cache_dir=args.cache_dir, workers=args.workers)
+        return
+
     print("=" * 80)
     print("Excel 파일 생성 및 조작 종합 예제 스크립트")
     print("=" * 80)
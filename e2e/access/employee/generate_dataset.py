@@ -0,0 +1,284 @@
+"""
+부하 테스트용 합성 임직원 데이터셋 생성기
+
+N명의 임직원(사번, 한글 이름, 부서/직급/직책/출입케이스, RF 카드)과
+사번별 합성 얼굴 사진(JPEG)을 만듭니다. seed가 같으면 작업자 수와 관계없이
+항상 같은 데이터가 생성됩니다 (임직원마다 seed와 순번으로 난수 생성기를 만듦).
+
+출력 (--out-dir):
+    employees.json   em_add.json 형식 (test_add_employees_from_json, async_core add --json)
+    employees.xlsx   em_add.xlsx 형식 (test_add_employees_from_excel, async_core add --excel)
+    employees.jsonl  임직원 1명당 1줄 (사번, 이름, 이미지 경로, RF 카드 번호 등 전체 필드)
+    images/          {사번}.jpg (추가 흐름은 이름순 이미지와 행 순서를 매칭, 사번은 같은 자릿수라 행 순서와 같음)
+
+부서/직급/직책/출입케이스는 서버의 /employeeadd 드롭다운에서 수집한 카탈로그에서 고릅니다.
+rf_card에는 카탈로그의 등록된 카드만 (중복 없이) 배정하고, 카드 등록용 번호는
+JSONL의 rf_card_number에 별도로 기록합니다.
+
+실행 예 (저장소 루트에서):
+    python -m e2e.access.employee.generate_dataset catalog --output catalog.json
+    python -m e2e.access.employee.generate_dataset generate -n 100000 --seed 42 --catalog catalog.json --out-dir dataset
+"""
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from e2e.access.employee.create_excel import create_excel_template_streaming
+
+# 서버 카탈로그를 수집하지 않았을 때 사용하는 기본값 (em_add.json 샘플과 동일)
+DEFAULT_CATALOG = {
+    "departments": ["개발팀"],
+    "job_grades": ["Pro"],
+    "job_positions": ["Pro"],
+    "access_cases": ["출근", "퇴근"],
+    "rf_cards": [],
+}
+
+SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임",
+            "한", "오", "서", "신", "권", "황", "안", "송", "류", "홍"]
+# 실제 성씨 분포에 가깝게 앞쪽 성씨의 가중치를 높임
+SURNAME_WEIGHTS = [21, 15, 8, 5, 4, 2.3, 2.1, 2, 2, 1.6,
+                   1.5, 1.5, 1.5, 1.5, 1.4, 1.4, 1.3, 1.3, 1.1, 1.1]
+GIVEN_SYLLABLES = ["민", "서", "지", "현", "준", "우", "예", "도", "하", "윤",
+                   "수", "연", "은", "영", "진", "호", "성", "재", "훈", "유",
+                   "아", "희", "경", "태", "주", "혜", "동", "승", "정", "원"]
+
+IMAGE_SIZE = (240, 320)
+CHUNK_SIZE = 1000
+
+
+def korean_name(rng: random.Random) -> str:
+    surname = rng.choices(SURNAMES, weights=SURNAME_WEIGHTS)[0]
+    return surname + rng.choice(GIVEN_SYLLABLES) + rng.choice(GIVEN_SYLLABLES)
+
+
+def rf_card_number(seed: int, index: int) -> str:
+    """
+    데이터셋 안에서 중복되지 않는 10자리 카드 번호
+
+    7919는 10^10과 서로소이므로 index -> 번호 대응이 일대일입니다.
+    """
+    return f"{(seed * 104729 + index * 7919) % 10**10:010d}"
+
+
+def draw_face(rng: random.Random, path: str, size: tuple[int, int] = IMAGE_SIZE):
+    """
+    증명사진 형태의 합성 얼굴 이미지 (배경, 어깨, 얼굴, 머리카락, 눈/코/입)
+    """
+    from PIL import Image, ImageDraw
+
+    w, h = size
+    bg = rng.choice([(235, 238, 242), (214, 228, 240), (240, 240, 232), (226, 232, 226)])
+    skin = rng.choice([(241, 204, 177), (226, 185, 150), (232, 196, 160), (205, 160, 125)])
+    hair = rng.choice([(25, 20, 18), (45, 32, 25), (70, 50, 35), (20, 20, 28)])
+    cloth = (rng.randint(20, 90), rng.randint(30, 90), rng.randint(50, 120))
+
+    img = Image.new('RGB', size, bg)
+    d = ImageDraw.Draw(img)
+
+    cx = w // 2 + rng.randint(-6, 6)
+    face_w = int(w * rng.uniform(0.40, 0.48))
+    face_h = int(face_w * rng.uniform(1.25, 1.4))
+    top = int(h * rng.uniform(0.18, 0.24))
+    face = (cx - face_w // 2, top, cx + face_w // 2, top + face_h)
+
+    # 어깨, 목
+    d.ellipse((cx - w * 0.55, h * 0.78, cx + w * 0.55, h * 1.35), fill=cloth)
+    d.rectangle((cx - face_w * 0.18, face[3] - 12, cx + face_w * 0.18, h * 0.82), fill=skin)
+    # 머리카락 (뒤) -> 얼굴 -> 앞머리
+    d.ellipse((face[0] - 8, face[1] - 14, face[2] + 8, face[1] + face_h * 0.75), fill=hair)
+    d.ellipse(face, fill=skin)
+    d.chord((face[0] - 2, face[1] - 10, face[2] + 2, face[1] + face_h * rng.uniform(0.45, 0.6)),
+            180, 360, fill=hair)
+
+    # 눈썹, 눈
+    eye_y = face[1] + face_h * 0.45
+    eye_dx = face_w * 0.2
+    for sx in (-1, 1):
+        ex = cx + sx * eye_dx
+        d.line((ex - 10, eye_y - 12, ex + 10, eye_y - 13), fill=hair, width=3)
+        d.ellipse((ex - 7, eye_y - 4, ex + 7, eye_y + 4), fill=(250, 250, 250))
+        d.ellipse((ex - 3, eye_y - 3, ex + 3, eye_y + 3), fill=(40, 30, 25))
+    # 코, 입
+    nose_y = face[1] + face_h * 0.62
+    d.line((cx, eye_y + 8, cx - 3, nose_y), fill=tuple(c - 35 for c in skin), width=2)
+    mouth_y = face[1] + face_h * 0.76
+    mouth_w = face_w * rng.uniform(0.14, 0.2)
+    d.arc((cx - mouth_w, mouth_y - 6, cx + mouth_w, mouth_y + 6), 10, 170, fill=(170, 80, 80), width=3)
+
+    img.save(path, 'JPEG', quality=85)
+
+
+def make_employee(seed: int, index: int, employee_id: str, catalog: dict, rf_ratio: float) -> dict:
+    """
+    index번째 임직원 레코드 생성 (seed와 index만으로 결정됨)
+    """
+    rng = random.Random(f"{seed}:{index}")
+    access_cases = catalog["access_cases"]
+    case_count = rng.randint(1, min(3, len(access_cases))) if access_cases else 0
+    rf_cards = catalog.get("rf_cards", [])
+    has_card = rng.random() < rf_ratio
+
+    return {
+        "index": index + 1,
+        "id": employee_id,
+        "name": korean_name(rng),
+        "email": f"{employee_id}@secern.ai",
+        "department": rng.choice(catalog["departments"]),
+        "job_grade": rng.choice(catalog["job_grades"]),
+        "job_position": rng.choice(catalog["job_positions"]),
+        "assignment_start_date": "today",
+        "access_cases": sorted(rng.sample(access_cases, case_count), key=access_cases.index),
+        # 등록된 카드는 한 명에게만 배정 (index 기준으로 중복 없음)
+        "rf_card": [rf_cards[index]] if has_card and index < len(rf_cards) else [],
+        "rf_card_number": rf_card_number(seed, index) if has_card else "",
+    }
+
+
+def _generate_chunk(seed: int, start: int, count: int, id_start: int, catalog: dict,
+                    rf_ratio: float, image_dir: str | None) -> list[dict]:
+    """
+    프로세스 풀 작업 함수: start부터 count명의 레코드(와 이미지) 생성
+    """
+    records = []
+    for index in range(start, start + count):
+        employee_id = str(id_start + index)
+        record = make_employee(seed, index, employee_id, catalog, rf_ratio)
+        if image_dir:
+            draw_face(random.Random(f"{seed}:face:{index}"), os.path.join(image_dir, f"{employee_id}.jpg"))
+            # 출력 디렉터리 기준 상대 경로 (데이터셋을 옮겨도 유효)
+            record["image"] = f"images/{employee_id}.jpg"
+        records.append(record)
+    return records
+
+
+def load_catalog(path: str | None) -> dict:
+    if not path:
+        return dict(DEFAULT_CATALOG)
+    with open(path, 'r', encoding='utf-8') as f:
+        catalog = {**DEFAULT_CATALOG, **json.load(f)}
+    for key in ("departments", "job_grades", "job_positions"):
+        if not catalog[key]:
+            raise ValueError(f"카탈로그에 {key} 값이 없습니다: {path}")
+    return catalog
+
+
+def generate_dataset(count: int, out_dir: str, seed: int = 0, catalog: dict | None = None,
+                     id_start: int = 2000000, rf_ratio: float = 0.3, images: bool = True,
+                     workers: int | None = None) -> dict:
+    """
+    합성 임직원 데이터셋 생성
+
+    청크 단위로 프로세스 풀에서 생성하고, 순서대로 받아 JSON/JSONL/Excel에 스트리밍 기록합니다.
+
+    Returns:
+        dict: 생성 요약 (count, seconds, 출력 경로)
+    """
+    catalog = catalog or dict(DEFAULT_CATALOG)
+    os.makedirs(out_dir, exist_ok=True)
+    image_dir = os.path.join(out_dir, "images") if images else None
+    if image_dir:
+        os.makedirs(image_dir, exist_ok=True)
+
+    paths = {
+        "json": os.path.join(out_dir, "employees.json"),
+        "jsonl": os.path.join(out_dir, "employees.jsonl"),
+        "excel": os.path.join(out_dir, "employees.xlsx"),
+    }
+    start_time = time.time()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            open(paths["json"], 'w', encoding='utf-8') as f_json, \
+            open(paths["jsonl"], 'w', encoding='utf-8') as f_jsonl:
+
+        chunks = [(s, min(CHUNK_SIZE, count - s)) for s in range(0, count, CHUNK_SIZE)]
+        futures = [
+            pool.submit(_generate_chunk, seed, s, n, id_start, catalog, rf_ratio, image_dir)
+            for s, n in chunks
+        ]
+
+        f_json.write('{\n  "comment": "합성 임직원 데이터셋 (generate_dataset.py)",\n')
+        f_json.write(f'  "seed": {seed},\n  "employees": [\n')
+
+        def excel_rows():
+            """
+            청크 결과를 순서대로 받아 JSON/JSONL을 기록하면서 Excel 행을 내보냄
+            """
+            for chunk_no, future in enumerate(futures):
+                for record in future.result():
+                    add_fields = {k: record[k] for k in (
+                        "name", "department", "job_grade", "job_position",
+                        "assignment_start_date", "access_cases", "rf_card")}
+                    sep = ',\n' if record["index"] > 1 else ''
+                    f_json.write(sep + '    ' + json.dumps(add_fields, ensure_ascii=False))
+                    f_jsonl.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    yield [record["index"], record["department"], record["job_grade"],
+                           record["job_position"], record["assignment_start_date"],
+                           ",".join(record["access_cases"]), ",".join(record["rf_card"]), record["name"]]
+                done = min((chunk_no + 1) * CHUNK_SIZE, count)
+                print(f"[INFO] {done}/{count} 생성 ({time.time() - start_time:.1f}초)")
+
+        written = create_excel_template_streaming(paths["excel"], excel_rows())
+        f_json.write('\n  ]\n}\n')
+
+    elapsed = time.time() - start_time
+    print(f"[OK] 임직원 {written}명 생성 완료: {out_dir} ({elapsed:.1f}초, {written / elapsed:.0f}명/초)")
+    return {"count": written, "seconds": elapsed, "image_dir": image_dir, **paths}
+
+
+def fetch_catalog(output_path: str) -> dict:
+    """
+    서버 /employeeadd 화면에서 카탈로그를 수집해 JSON으로 저장
+    """
+    import asyncio
+
+    from e2e.utils.async_core import AsyncBulkRunner, open_employee_list, read_employee_catalog
+
+    async def scenario():
+        async with AsyncBulkRunner(concurrency=1) as runner:
+            context = await runner.new_context()
+            page = await context.new_page()
+            await open_employee_list(page)
+            return await read_employee_catalog(page)
+
+    catalog = asyncio.run(scenario())
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, indent=2)
+    counts = ", ".join(f"{k}={len(v)}" for k, v in catalog.items())
+    print(f"[OK] 카탈로그 저장: {output_path} ({counts})")
+    return catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description='부하 테스트용 합성 임직원 데이터셋 생성')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_catalog = sub.add_parser('catalog', help='서버에서 부서/직급/직책/출입케이스/카드 카탈로그 수집')
+    p_catalog.add_argument('--output', default='catalog.json')
+
+    p_gen = sub.add_parser('generate', help='데이터셋 생성')
+    p_gen.add_argument('-n', '--count', type=int, required=True, help='임직원 수')
+    p_gen.add_argument('--seed', type=int, default=0)
+    p_gen.add_argument('--catalog', help='catalog 명령으로 저장한 JSON (없으면 기본값)')
+    p_gen.add_argument('--out-dir', default='dataset')
+    p_gen.add_argument('--id-start', type=int, default=2000000, help='첫 사번')
+    p_gen.add_argument('--rf-ratio', type=float, default=0.3, help='RF 카드 보유 비율')
+    p_gen.add_argument('--no-images', action='store_true', help='사진 생성 생략')
+    p_gen.add_argument('--workers', type=int, help='프로세스 수 (기본: CPU 수)')
+
+    args = parser.parse_args()
+    if args.command == 'catalog':
+        fetch_catalog(args.output)
+    else:
+        generate_dataset(
+            args.count, args.out_dir, seed=args.seed, catalog=load_catalog(args.catalog),
+            id_start=args.id_start, rf_ratio=args.rf_ratio, images=not args.no_images,
+            workers=args.workers,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+임직원 목록/필터 검색 가상 사용자(VU) 부하 생성
+
+교대 시간에 수백 명의 경비원이 동시에 하는 동작(test_search_and_delete_employee의
+"필터" -> "이름" 입력 -> "검색")을 흉내 냅니다.
+소수의 브라우저가 실제 UI 경로를 실행하고, 다수의 경량 API 클라이언트가 같은 목록/검색 요청을
+재생합니다. 단계(stage)별로 가상 사용자 수를 올리며 엔드포인트별 서버 응답 지연을 기록하고,
+지연(p95)이나 오류율이 기준 단계 대비 나빠지기 시작하는 동시 사용자 수를 찾습니다.
+
+단계 형식: "사용자수:초" 쉼표 구분 (예: "10:30,50:60,100:60,200:60")
+
+실행 예 (저장소 루트에서):
+    python -m e2e.access.employee.search_load --target stub --stages 10:10,50:10,100:10
+    python -m e2e.access.employee.search_load --target server --browsers 2 --stages 20:60,100:60,300:60
+"""
+import argparse
+import asyncio
+import random
+import re
+import time
+import urllib.parse
+from dataclasses import dataclass, field
+
+from e2e.access.employee.generate_dataset import DEFAULT_CATALOG, make_employee
+from e2e.utils import settings
+from e2e.utils.api import ApiClient, ApiError, items_of
+from e2e.utils.async_core import (
+    AsyncBulkRunner, _accept_dialog, open_employee_list, run_in_thread, search_employee,
+)
+from e2e.utils.benchmark import default_executor, percentile
+from e2e.utils.run_history import DEFAULT_DB_PATH, git_revision, record_benchmark
+from e2e.utils.stub_server import StubServer, api_record
+
+SUITE = 'employee-search-load'
+
+
+def parse_stages(text: str) -> list[tuple[int, float]]:
+    """
+    "10:30,50:60" -> [(10, 30.0), (50, 60.0)]
+    """
+    stages = []
+    for part in text.split(','):
+        users, _, seconds = part.strip().partition(':')
+        if not users or not seconds:
+            raise ValueError(f"단계 형식은 '사용자수:초' 입니다: {part}")
+        stages.append((int(users), float(seconds)))
+    return stages
+
+
+@dataclass
+class LatencyRecorder:
+    """
+    (단계, 엔드포인트)별 응답 지연/오류 수집
+    """
+    stage: int = 0
+    samples: dict[tuple[int, str], list[float]] = field(default_factory=dict)
+    errors: dict[tuple[int, str], int] = field(default_factory=dict)
+
+    def add(self, endpoint: str, seconds: float, ok: bool):
+        key = (self.stage, endpoint)
+        if ok:
+            self.samples.setdefault(key, []).append(seconds)
+        else:
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    def rows(self, stages: list[tuple[int, float]]) -> list[dict]:
+        """
+        run_history.record_benchmark 형식 (flow=엔드포인트, concurrency=단계 사용자 수)
+        """
+        rows = []
+        for (stage, endpoint) in sorted(set(self.samples) | set(self.errors)):
+            users, seconds = stages[stage]
+            latencies = self.samples.get((stage, endpoint), [])
+            errors = self.errors.get((stage, endpoint), 0)
+            ops = len(latencies) + errors
+            rows.append({
+                'stage': stage,
+                'flow': endpoint,
+                'concurrency': users,
+                'reps': 1,
+                'ops': ops,
+                'errors': errors,
+                'error_rate': errors / ops if ops else 0.0,
+                'throughput_per_min': len(latencies) / seconds * 60,
+                'p50': percentile(latencies, 50),
+                'p90': percentile(latencies, 90),
+                'p95': percentile(latencies, 95),
+                'p99': percentile(latencies, 99),
+            })
+        return rows
+
+
+def find_degradation(rows: list[dict], p95_factor: float = 2.0, max_error_rate: float = 0.01) -> dict[str, dict]:
+    """
+    엔드포인트별로 첫 단계 대비 p95가 p95_factor배 이상이거나 오류율이 max_error_rate를 넘는 첫 단계
+    """
+    by_endpoint: dict[str, list[dict]] = {}
+    for row in rows:
+        by_endpoint.setdefault(row['flow'], []).append(row)
+
+    degraded = {}
+    for endpoint, endpoint_rows in by_endpoint.items():
+        endpoint_rows.sort(key=lambda r: r['stage'])
+        baseline = endpoint_rows[0]['p95']
+        for row in endpoint_rows:
+            slow = baseline and row['p95'] is not None and row['p95'] >= baseline * p95_factor
+            if slow or row['error_rate'] > max_error_rate:
+                degraded[endpoint] = {
+                    'users': row['concurrency'],
+                    'reason': 'errors' if row['error_rate'] > max_error_rate else 'p95',
+                    'p95': row['p95'],
+                    'baseline_p95': baseline,
+                    'error_rate': row['error_rate'],
+                }
+                break
+    return degraded
+
+
+_ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+
+def endpoint_label(url: str, method: str) -> str:
+    """
+    브라우저 요청 URL -> 'GET /api/employees/{id}' (숫자 경로는 {id}로 묶음)
+    """
+    path = urllib.parse.urlsplit(url).path
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+class SearchLoad:
+    """
+    단계별 가상 사용자 부하 실행기
+    """
+
+    def __init__(self, stages: list[tuple[int, float]], names: list[str], base_url: str | None = None,
+                 browsers: int = 0, think_time: float = 1.0, prefix_length: int = 2):
+        self.stages = stages
+        self.names = names
+        self.base_url = base_url
+        self.browsers = browsers
+        self.think_time = think_time
+        self.prefix_length = prefix_length
+        self.recorder = LatencyRecorder()
+        self._stop = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._vu_stop: list[asyncio.Event] = []
+
+    async def _api_vu(self, stop: asyncio.Event, vu_id: int):
+        rng = random.Random(vu_id)
+        label = ['employees:list']
+
+        def on_response(endpoint: str, method: str, status: int, seconds: float):
+            # 로그인은 목록/검색 지연에 섞이지 않도록 따로 기록
+            self.recorder.add('signin' if endpoint == 'signin' else label[0], seconds, 200 <= status < 300)
+
+        client = ApiClient(self.base_url, on_response=on_response)
+        try:
+            await asyncio.to_thread(client.login)
+        except ApiError:
+            return
+        # 접속 시점이 몰리지 않도록 첫 요청을 분산
+        await asyncio.sleep(rng.uniform(0, self.think_time))
+        while not stop.is_set() and not self._stop.is_set():
+            name = rng.choice(self.names)
+            try:
+                label[0] = 'employees:list'
+                await asyncio.to_thread(client.list_employees)
+                label[0] = 'employees:search'
+                await asyncio.to_thread(client.list_employees, name=name[:self.prefix_length])
+            except ApiError:
+                pass
+            await asyncio.sleep(rng.expovariate(1 / self.think_time) if self.think_time else 0)
+
+    async def _browser_vu(self, runner: AsyncBulkRunner, vu_id: int):
+        rng = random.Random(f"browser:{vu_id}")
+        context = await runner.new_context()
+        page = await context.new_page()
+        page.on("dialog", _accept_dialog)
+
+        def on_finished(request):
+            if request.resource_type in ('xhr', 'fetch'):
+                timing = request.timing
+                if timing.get('responseEnd', -1) >= 0:
+                    self.recorder.add(f"ui {endpoint_label(request.url, request.method)}",
+                                      timing['responseEnd'] / 1000, True)
+
+        def on_failed(request):
+            if request.resource_type in ('xhr', 'fetch'):
+                self.recorder.add(f"ui {endpoint_label(request.url, request.method)}", 0.0, False)
+
+        page.on("requestfinished", on_finished)
+        page.on("requestfailed", on_failed)
+        try:
+            await open_employee_list(page)
+            while not self._stop.is_set():
+                start = time.perf_counter()
+                try:
+                    # 이름 전체로 검색해야 결과 셀이 정확히 일치
+                    await search_employee(page, rng.choice(self.names))
+                    self.recorder.add('ui:search-to-cell', time.perf_counter() - start, True)
+                except Exception:
+                    self.recorder.add('ui:search-to-cell', time.perf_counter() - start, False)
+                    await open_employee_list(page)
+                await asyncio.sleep(rng.uniform(0.5, 1.5) * self.think_time)
+        finally:
+            await context.close()
+
+    def _scale_to(self, users: int):
+        """
+        API 가상 사용자 수를 users로 맞춤 (늘리면 새 VU 시작, 줄이면 마지막 VU부터 정지)
+        """
+        while len(self._vu_stop) < users:
+            stop = asyncio.Event()
+            self._vu_stop.append(stop)
+            self._tasks.append(asyncio.create_task(self._api_vu(stop, len(self._vu_stop))))
+        while len(self._vu_stop) > users:
+            self._vu_stop.pop().set()
+
+    async def run(self) -> list[dict]:
+        # urllib 호출은 스레드에서 실행되므로 최대 사용자 수만큼 스레드 확보
+        max_users = max(users for users, _ in self.stages)
+        with default_executor(max_users + 4):
+            return await self._run()
+
+    async def _run(self) -> list[dict]:
+        runner = None
+        browser_tasks = []
+        if self.browsers:
+            runner = AsyncBulkRunner(concurrency=self.browsers)
+            await runner.start()
+            browser_tasks = [asyncio.create_task(self._browser_vu(runner, i)) for i in range(self.browsers)]
+
+        try:
+            for index, (users, seconds) in enumerate(self.stages):
+                self.recorder.stage = index
+                self._scale_to(users)
+                print(f"[INFO] stage {index + 1}/{len(self.stages)}: API VU {users}명, "
+                      f"브라우저 {self.browsers}개, {seconds:.0f}초")
+                await asyncio.sleep(seconds)
+        finally:
+            self._stop.set()
+            await asyncio.gather(*self._tasks, *browser_tasks, return_exceptions=True)
+            if runner is not None:
+                await runner.close()
+        return self.recorder.rows(self.stages)
+
+
+def _ms(seconds: float | None) -> str:
+    return f"{seconds * 1000:.0f}ms" if seconds is not None else "-"
+
+
+def format_load_rows(rows: list[dict]) -> list[str]:
+    lines = [f"  {'users':>5} {'endpoint':<40} {'req':>7} {'req/s':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'err':>6}"]
+    for row in rows:
+        lines.append(
+            f"  {row['concurrency']:>5} {row['flow']:<40} {row['ops']:>7} {row['throughput_per_min'] / 60:>7.1f} "
+            f"{_ms(row['p50']):>8} {_ms(row['p95']):>8} {_ms(row['p99']):>8} {row['error_rate'] * 100:>5.1f}%"
+        )
+    return lines
+
+
+def run_search_load(stages: list[tuple[int, float]], target: str = 'stub', browsers: int = 0,
+                    think_time: float = 1.0, stub_size: int = 5000,
+                    stub_latency_ms: float = 5.0) -> tuple[list[dict], str]:
+    """
+    부하 실행 (stub 대상이면 합성 임직원 stub_size명을 적재한 대역 서버를 띄움)
+
+    Returns:
+        tuple: (단계/엔드포인트별 rows, 대상 이름)
+    """
+    server = None
+    if target == 'stub':
+        if browsers:
+            raise ValueError("브라우저 VU는 server 대상에서만 사용할 수 있습니다.")
+        server = StubServer(latency_ms=stub_latency_ms).start()
+        server.store.bulk_load([
+            api_record(make_employee(0, index, str(3000000 + index), DEFAULT_CATALOG, 0))
+            for index in range(stub_size)
+        ])
+    try:
+        base_url = server.url if server else None
+        # 검색어로 쓸 실제 이름 목록 (첫 페이지)
+        client = ApiClient(base_url).login()
+        names = [item['name'] for item in items_of(client.list_employees(size=200)) if item.get('name')]
+        if not names:
+            raise RuntimeError("검색어로 사용할 임직원이 없습니다.")
+        load = SearchLoad(stages, names, base_url, browsers=browsers, think_time=think_time)
+        # pytest 세션(동기 Playwright)에서도 호출할 수 있도록 별도 스레드의 이벤트 루프에서 실행
+        rows = run_in_thread(load.run())
+    finally:
+        if server is not None:
+            server.stop()
+    return rows, 'stub' if server else settings.BASE_URL
+
+
+def record_load(db_path: str, started_at: float, target: str, browsers: int, rows: list[dict]):
+    """
+    실행 이력 DB의 benchmark_results에 기록 (flow=엔드포인트, concurrency=단계 사용자 수)
+    """
+    record_benchmark(db_path, SUITE, {
+        'started_at': started_at, 'target': target, 'driver': f"vu+{browsers}browsers",
+        'git_rev': git_revision(),
+    }, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='임직원 목록/검색 가상 사용자 부하')
+    parser.add_argument('--stages', default='10:30,50:30,100:30,200:30', help="'사용자수:초' 쉼표 구분")
+    parser.add_argument('--target', choices=['stub', 'server'], default='stub')
+    parser.add_argument('--browsers', type=int, default=0, help='UI 경로를 실행할 브라우저 수 (server 전용)')
+    parser.add_argument('--think-time', type=float, default=1.0, help='VU 요청 간 평균 대기(초)')
+    parser.add_argument('--stub-size', type=int, default=5000, help='대역 서버에 적재할 임직원 수')
+    parser.add_argument('--stub-latency-ms', type=float, default=5.0)
+    parser.add_argument('--p95-factor', type=float, default=2.0, help='첫 단계 대비 p95 저하 판정 배율')
+    parser.add_argument('--max-error-rate', type=float, default=0.01)
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='실행 이력 SQLite 경로')
+    parser.add_argument('--no-record', action='store_true', help='이력 DB에 기록하지 않음')
+    args = parser.parse_args()
+
+    started_at = time.time()
+    rows, target = run_search_load(parse_stages(args.stages), args.target, args.browsers, args.think_time,
+                                   args.stub_size, args.stub_latency_ms)
+    print(f"[INFO] search load: target={target}")
+    for line in format_load_rows(rows):
+        print(line)
+    degraded = find_degradation(rows, args.p95_factor, args.max_error_rate)
+    for endpoint, info in degraded.items():
+        print(f"[WARNING] {endpoint}: {info['users']}명에서 저하 ({info['reason']}, "
+              f"p95 {_ms(info['baseline_p95'])} -> {_ms(info['p95'])}, "
+              f"오류율 {info['error_rate']:.1%})")
+    if not degraded:
+        print("[OK] 모든 단계에서 저하 없음")
+    if not args.no_record:
+        record_load(args.db, started_at, target, args.browsers, rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+임직원 데이터 규모별 필터 검색 지연 벤치마크
+
+임직원 수(1k, 10k, 100k)를 늘려가며 세 가지 검색의 지연을 측정합니다.
+    name    이름 접두사 (앞 2글자)
+    id      사번 정확히 일치
+    dept    부서 필터
+
+API 응답 시간과, 브라우저를 쓰는 경우 "검색" 클릭부터 결과 cell이 보일 때까지의 시간을 함께 잽니다.
+UI 경로는 test_search_and_delete_employee와 같은 "필터" -> "이름" -> "검색" 선택자를 사용합니다.
+
+규모가 커질 때 지연이 얼마나 늘어나는지 로그-로그 기울기(scaling exponent)로 요약합니다.
+인덱스를 쓰는 사번 검색은 기울기가 0에 가까워야 하며, MAX_EXPONENTS를 넘으면 전체 스캔(인덱스 누락)을 의심합니다.
+부서 검색은 결과 수 자체가 규모에 비례하므로 판정하지 않습니다.
+대역 서버는 검색이 살펴본 레코드 수(EmployeeStore.scanned)로도 기울기를 구하며(scan_exponents),
+벽시계 기울기와 달리 다른 부하에 흔들리지 않으므로 테스트 판정에는 이 값을 씁니다.
+
+실행 예 (저장소 루트에서):
+    python -m e2e.access.employee.search_scaling --sizes 1000,10000,100000
+    python -m e2e.access.employee.search_scaling --sizes 1000,10000,100000 --stub-no-index   # 회귀 재현
+    python -m e2e.access.employee.search_scaling --target server --sizes 1000,10000 --ui
+"""
+import argparse
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from e2e.access.employee.generate_dataset import make_employee
+from e2e.utils import settings
+from e2e.utils.api import ENDPOINTS, ApiClient, ApiError, items_of
+from e2e.utils.async_core import AsyncBulkRunner, _accept_dialog, open_employee_list, run_in_thread
+from e2e.utils.benchmark import percentile
+from e2e.utils.run_history import DEFAULT_DB_PATH, git_revision, record_benchmark
+from e2e.utils.stub_server import StubServer, api_record
+
+SUITE = 'employee-search-scaling'
+QUERIES = ('name', 'id', 'dept')
+
+# 규모 측정용 카탈로그 (부서 필터 결과가 전체의 1/10 정도가 되도록)
+SCALING_CATALOG = {
+    "departments": ["개발팀", "영업팀", "기획팀", "인사팀", "보안팀", "총무팀", "재무팀", "법무팀", "구매팀", "품질팀"],
+    "job_grades": ["Pro", "Manager", "Director"],
+    "job_positions": ["Pro", "Manager", "Director"],
+    "access_cases": ["출근", "퇴근"],
+    "rf_cards": [],
+}
+ID_START = 4000000
+SEED = 36
+# 검색별 허용 기울기 (고정 응답 지연이 섞여 전체 스캔도 1보다 훨씬 작게 나오므로 낮게 잡음)
+MAX_EXPONENTS = {'api:id': 0.15, 'api:name': 0.3}
+
+
+def dataset_employee(index: int) -> dict:
+    return make_employee(SEED, index, str(ID_START + index), SCALING_CATALOG, rf_ratio=0)
+
+
+def seed_server(client: ApiClient, size: int, workers: int = 8) -> int:
+    """
+    서버에 규모 측정용 임직원(사번 ID_START부터)을 size명까지 API로 추가
+
+    마지막 사번이 이미 있으면 준비된 것으로 보고 건너뜁니다. 이미 있는 사번(409 등)은 무시합니다.
+
+    Returns:
+        int: 새로 추가한 수
+    """
+    last = dataset_employee(size - 1)
+    if any(str(r.get('employeeId')) == last['id'] for r in items_of(client.list_employees(employee_id=last['id']))):
+        return 0
+
+    local = threading.local()
+
+    def add(index: int) -> bool:
+        # ApiClient는 스레드 간 공유하지 않음
+        if not hasattr(local, 'client'):
+            local.client = ApiClient(client.base_url).login()
+        try:
+            local.client.create_employee(dataset_employee(index))
+            return True
+        except ApiError:
+            return False
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(add, range(size), chunksize=100))
+
+
+def query_params(kind: str, employee: dict) -> dict:
+    if kind == 'name':
+        return {'name': employee['name'][:2]}
+    if kind == 'id':
+        return {'employee_id': employee['id']}
+    return {'department': employee['department']}
+
+
+def measure_api(client: ApiClient, size: int, reps: int, warmup: int, rng: random.Random,
+                scanned: Callable[[], int] | None = None,
+                scans: dict[str, list[int]] | None = None) -> dict[str, list[float]]:
+    """
+    검색 종류별 API 응답 시간 표본
+
+    Args:
+        scanned: 서버가 살펴본 레코드 수 누계를 읽는 함수 (대역 서버 전용)
+        scans: scanned가 있으면 검색 종류별 요청당 레코드 수를 여기에 추가
+    """
+    samples = {kind: [] for kind in QUERIES}
+    for i in range(warmup + reps):
+        employee = dataset_employee(rng.randrange(size))
+        for kind in QUERIES:
+            before = scanned() if scanned else 0
+            start = time.perf_counter()
+            response = client.list_employees(**query_params(kind, employee))
+            elapsed = time.perf_counter() - start
+            if kind == 'id' and not any(str(r.get('employeeId')) == employee['id'] for r in items_of(response)):
+                raise AssertionError(f"사번 검색 결과 없음: {employee['id']} (size={size})")
+            if i >= warmup:
+                samples[kind].append(elapsed)
+                if scanned and scans is not None:
+                    scans.setdefault(kind, []).append(scanned() - before)
+    return samples
+
+
+async def measure_ui(size: int, reps: int, rng: random.Random) -> dict[str, list[float]]:
+    """
+    "검색" 클릭 -> 결과 cell 표시까지 시간 (name: 이름 접두사, id: 사번)
+
+    부서 필터는 기존 테스트에 선택자가 없으므로 "부서" 콤보박스가 보일 때만 측정합니다.
+    """
+    samples = {'ui:name': [], 'ui:id': [], 'ui:dept': [], 'ui-api:id': []}
+    async with AsyncBulkRunner(concurrency=1) as runner:
+        context = await runner.new_context()
+        page = await context.new_page()
+        page.on("dialog", _accept_dialog)
+        await open_employee_list(page)
+        await page.get_by_role("button", name="필터").click()
+        name_input = page.get_by_role("textbox", name="이름")
+        dept_select = page.get_by_role("combobox", name="부서")
+        has_dept = await dept_select.is_visible()
+        if not has_dept:
+            print("[WARNING] 필터에 '부서' 콤보박스가 없어 UI 부서 검색은 측정하지 않습니다.")
+
+        for _ in range(reps):
+            employee = dataset_employee(rng.randrange(size))
+            for kind, text, expected in (('name', employee['name'][:2], None),
+                                         ('id', employee['id'], employee['id'])):
+                await name_input.fill(text)
+                start = time.perf_counter()
+                async with page.expect_response(lambda r: ENDPOINTS['employees'] in r.url) as response_info:
+                    await page.get_by_role("button", name="검색").click()
+                response = await response_info.value
+                if expected:
+                    await page.get_by_role("cell", name=expected, exact=True).first.wait_for(state='visible')
+                else:
+                    await page.get_by_role("cell").filter(has_text=text).first.wait_for(state='visible')
+                samples[f'ui:{kind}'].append(time.perf_counter() - start)
+                if kind == 'id':
+                    timing = response.request.timing
+                    if timing.get('responseEnd', -1) >= 0:
+                        samples['ui-api:id'].append(timing['responseEnd'] / 1000)
+
+            if has_dept:
+                await name_input.fill('')
+                await dept_select.click()
+                start = time.perf_counter()
+                await page.get_by_role("option", name=employee['department'], exact=True).click()
+                await page.get_by_role("button", name="검색").click()
+                await page.get_by_role("cell", name=employee['department'], exact=True).first.wait_for(
+                    state='visible')
+                samples['ui:dept'].append(time.perf_counter() - start)
+        await context.close()
+    return {k: v for k, v in samples.items() if v}
+
+
+def scaling_exponent(points: list[tuple[int, float]]) -> float | None:
+    """
+    (규모, 지연) 점들의 로그-로그 최소제곱 기울기 (0: 일정, 1: 규모에 비례)
+    """
+    points = [(math.log(n), math.log(t)) for n, t in points if n > 0 and t and t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+def run_search_scaling(sizes: list[int], reps: int = 20, warmup: int = 3, target: str = 'stub',
+                       ui: bool = False, stub_latency_ms: float = 2.0, stub_indexed: bool = True) -> dict:
+    """
+    규모별 측정 실행
+
+    Returns:
+        dict: {'rows': [...], 'exponents': {query: 기울기}, 'scan_exponents': {query: 레코드 수 기울기}
+        (대역 서버 전용, 실서버는 빈 dict), 'target': 대상 이름}
+    """
+    if ui and target == 'stub':
+        raise ValueError("UI 측정은 server 대상에서만 사용할 수 있습니다.")
+
+    server = StubServer(latency_ms=stub_latency_ms, indexed=stub_indexed).start() if target == 'stub' else None
+    rows = []
+    scan_points: dict[str, list[tuple[int, float]]] = {}
+    try:
+        client = ApiClient(server.url if server else None).login()
+        for size in sorted(sizes):
+            if server:
+                server.store.bulk_load([api_record(dataset_employee(i)) for i in range(size)])
+            else:
+                added = seed_server(client, size)
+                print(f"[INFO] size={size}: 임직원 {added}명 추가")
+
+            rng = random.Random(size)
+            scans: dict[str, list[int]] = {}
+            samples = measure_api(client, size, reps, warmup, rng,
+                                  (lambda: server.store.scanned) if server else None, scans)
+            for kind, counts in scans.items():
+                scan_points.setdefault(f"api:{kind}", []).append((size, sum(counts) / len(counts)))
+            if ui:
+                samples.update(run_in_thread(measure_ui(size, max(3, reps // 4), rng)))
+
+            for kind, values in samples.items():
+                flow = kind if ':' in kind else f"api:{kind}"
+                rows.append({
+                    'flow': f"{flow}@{size}", 'query': flow, 'size': size, 'concurrency': 1, 'reps': 1,
+                    'ops': len(values), 'errors': 0, 'error_rate': 0.0,
+                    'throughput_per_min': len(values) / sum(values) * 60 if sum(values) else 0.0,
+                    'p50': percentile(values, 50), 'p90': percentile(values, 90),
+                    'p95': percentile(values, 95), 'p99': percentile(values, 99),
+                })
+            print(f"[INFO] size={size}: " + ", ".join(
+                f"{r['query']} p50={r['p50'] * 1000:.1f}ms" for r in rows if r['size'] == size))
+    finally:
+        if server is not None:
+            server.stop()
+
+    exponents = {}
+    for query in sorted({r['query'] for r in rows}):
+        exponents[query] = scaling_exponent([(r['size'], r['p50']) for r in rows if r['query'] == query])
+    scan_exponents = {query: scaling_exponent(points) for query, points in sorted(scan_points.items())}
+    return {'rows': rows, 'exponents': exponents, 'scan_exponents': scan_exponents,
+            'target': 'stub' if server else settings.BASE_URL}
+
+
+def format_scaling(result: dict) -> list[str]:
+    rows = result['rows']
+    sizes = sorted({r['size'] for r in rows})
+    lines = ["  " + f"{'query':<14}" + "".join(f"{f'{n:,}':>18}" for n in sizes) + f"{'exponent':>10}"]
+    for query, exponent in result['exponents'].items():
+        cells = []
+        for size in sizes:
+            row = next((r for r in rows if r['query'] == query and r['size'] == size), None)
+            cells.append(f"{row['p50'] * 1000:.1f}/{row['p95'] * 1000:.1f}ms" if row else "-")
+        exp_text = f"{exponent:.2f}" if exponent is not None else "-"
+        lines.append("  " + f"{query:<14}" + "".join(f"{c:>18}" for c in cells) + f"{exp_text:>10}")
+    lines.append("  (p50/p95, exponent: 규모 대비 p50 로그-로그 기울기)")
+    scan_exponents = {q: e for q, e in result.get('scan_exponents', {}).items() if e is not None}
+    if scan_exponents:
+        lines.append("  scan exponent: " + ", ".join(f"{q}={e:.2f}" for q, e in scan_exponents.items()))
+    return lines
+
+
+def suspicious_queries(result: dict, limits: dict[str, float] | None = None, key: str = 'exponents') -> list[str]:
+    """
+    기울기가 허용치(MAX_EXPONENTS)를 넘는 API 검색 (인덱스 누락 의심)
+
+    Args:
+        key: 'exponents' (응답 시간) 또는 'scan_exponents' (대역 서버가 살펴본 레코드 수)
+    """
+    limits = MAX_EXPONENTS if limits is None else limits
+    exponents = result.get(key, {})
+    return [q for q, limit in limits.items() if exponents.get(q) is not None and exponents[q] > limit]
+
+
+def record_scaling(db_path: str, started_at: float, result: dict, driver: str):
+    record_benchmark(db_path, SUITE, {
+        'started_at': started_at, 'target': result['target'], 'driver': driver, 'git_rev': git_revision(),
+    }, result['rows'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='임직원 규모별 검색 지연 벤치마크')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='임직원 수 (쉼표 구분)')
+    parser.add_argument('--reps', type=int, default=20, help='규모/검색 종류별 측정 횟수')
+    parser.add_argument('--warmup', type=int, default=3)
+    parser.add_argument('--target', choices=['stub', 'server'], default='stub')
+    parser.add_argument('--ui', action='store_true', help='브라우저에서 결과 cell 표시 시간도 측정 (server 전용)')
+    parser.add_argument('--stub-latency-ms', type=float, default=2.0)
+    parser.add_argument('--stub-no-index', action='store_true', help='대역 서버 검색을 전체 스캔으로 (회귀 재현)')
+    parser.add_argument('--max-id-exponent', type=float, default=MAX_EXPONENTS['api:id'], help='사번 검색 허용 기울기')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='실행 이력 SQLite 경로')
+    parser.add_argument('--no-record', action='store_true', help='이력 DB에 기록하지 않음')
+    args = parser.parse_args()
+
+    started_at = time.time()
+    result = run_search_scaling([int(v) for v in args.sizes.split(',')], args.reps, args.warmup, args.target,
+                                args.ui, args.stub_latency_ms, not args.stub_no_index)
+    print(f"[INFO] search scaling: target={result['target']}")
+    for line in format_scaling(result):
+        print(line)
+    for query in suspicious_queries(result, {**MAX_EXPONENTS, 'api:id': args.max_id_exponent}):
+        print(f"[WARNING] {query}: 규모에 비례해 느려집니다 (기울기 {result['exponents'][query]:.2f}). "
+              f"서버 인덱스를 확인하세요.")
+    if not args.no_record:
+        record_scaling(args.db, started_at, result, 'api+ui' if args.ui else 'api')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+데이터셋 캡처/복원(e2e/utils/datasets.py) 테스트
+
+로컬 대역 API 서버를 사용하므로 서버/브라우저 없이 실행됩니다.
+"""
+import pytest
+
+from e2e.utils.api import ApiClient, items_of
+from e2e.utils.datasets import Dataset, capture_dataset, restore_dataset
+from e2e.utils.location_tree import LocationSnapshot
+from e2e.utils.stub_server import StubServer
+
+
+class TestDatasetRestore:
+    """
+    API 경로로 차이만 맞추는 복원과 대역 서버 스냅샷 복원
+    """
+
+    def test_capture_and_restore(self, tmp_path):
+        """
+        캡처한 상태에서 삭제/수정/추가를 한 뒤 복원하면 데이터셋 상태로 돌아오는지 확인
+        """
+        dataset = Dataset.load('employee-basic')
+        with StubServer() as server:
+            first = restore_dataset(dataset, server.url)
+            assert first.mode == 'api' and not first.failed, first.summary()
+            client = ApiClient(server.url).login()
+            building = client.create_location('데이터셋_본사', '건물')
+            floor = client.create_location('데이터셋_1층', '층', parent_id=building['id'])
+            client.create_location('데이터셋_101호', parent_id=floor['id'])
+
+            captured = capture_dataset(client, 'restore-case', ['1000460', '1000415'], ['데이터셋_본사'])
+            path = captured.save(str(tmp_path / 'restore-case.json'))
+            loaded = Dataset.load(path)
+            assert loaded.access_cases == ['출근', '퇴근']
+            assert loaded.locations[0]['children'][0]['children'][0]['name'] == '데이터셋_101호'
+
+            # 앞선 테스트가 데이터를 바꾼 상황
+            client.delete_employee('1000460')
+            server.store.by_id['1000415']['department'] = '영업팀'
+            client.create_location('남은_자식', parent_id=floor['id'])
+
+            report = restore_dataset(loaded, server.url, use_snapshot=False)
+            print(f"\n[INFO] restore: {report.summary()}")
+            assert not report.failed, report.failed
+            assert ('employee', '1000460') in report.created
+            assert ('employee', '1000415') in report.replaced
+            records = items_of(client.list_employees(employee_id='1000415'))
+            assert records[0]['department'] == '개발팀'
+            actual = LocationSnapshot.from_api(client).subtree(['데이터셋_본사'])
+            assert sorted(actual.names) == ['데이터셋_101호', '데이터셋_1층', '데이터셋_본사']
+
+            again = restore_dataset(loaded, server.url, use_snapshot=False)
+            assert not again.created and not again.replaced and not again.deleted, again.summary()
+
+    def test_snapshot_restore(self):
+        """
+        대역 서버에서는 첫 복원 후 저장한 스냅샷으로 요청 한 번에 되돌리는지 확인
+        """
+        dataset = Dataset.load('employee-basic')
+        with StubServer() as server:
+            first = restore_dataset(dataset, server.url)
+            assert first.mode == 'api'
+            assert 'employee-basic' in server.snapshots
+
+            client = ApiClient(server.url).login()
+            client.delete_employee('1000460')
+            client.delete_employee('1000415')
+            client.create_location('스냅샷_이후_장소')
+
+            second = restore_dataset(dataset, server.url)
+            print(f"\n[INFO] restore: {first.summary()} -> {second.summary()}")
+            assert second.mode == 'snapshot'
+            assert {r['employeeId'] for r in items_of(client.list_employees())} == {'1000460', '1000415'}
+            assert not server.locations.all()
+            assert {r['name'] for r in items_of(client.list_access_cases())} == {'출근', '퇴근'}
+
+    def test_missing_capture_target(self):
+        with StubServer() as server:
+            with pytest.raises(ValueError):
+                capture_dataset(ApiClient(server.url).login(), 'missing', ['없는사번'])
@@ -0,0 +1,124 @@
+"""
+임직원 처리량 벤치마크 테스트 (동시성 스윕)
+
+기본은 로컬 대역 API 서버를 대상으로 하므로 서버 없이도 실행됩니다.
+실제 서버 측정은 BENCH_TARGET=server (UI 흐름은 BENCH_DRIVER=ui)로 실행하세요.
+
+환경 변수:
+    BENCH_TARGET          stub | server (기본 stub)
+    BENCH_DRIVER          api | ui (기본 api)
+    BENCH_LEVELS          동시성 수준 (기본 1,2,4,8)
+    BENCH_OPS             수준/반복당 작업자별 작업 수 (기본 5)
+    BENCH_WARMUP          작업자별 워밍업 작업 수 (기본 1)
+    BENCH_REPS            수준별 반복 횟수 (기본 3)
+    BENCH_MAX_ERROR_RATE  허용 오류율 (기본 0.05)
+    LOAD_STAGES           검색 부하 단계 '사용자수:초' (기본 5:2,20:2)
+    LOAD_BROWSERS         검색 부하 중 UI 경로를 실행할 브라우저 수 (server 전용, 기본 0)
+    SCALE_SIZES           검색 지연 규모 측정 임직원 수 (기본 1000,10000,100000)
+"""
+import os
+import time
+
+import pytest
+
+from e2e.access.employee.employee_benchmark import FLOWS, report, run_benchmark
+from e2e.access.employee.search_load import (
+    find_degradation, format_load_rows, parse_stages, record_load, run_search_load,
+)
+from e2e.access.employee.search_scaling import (
+    MAX_EXPONENTS, format_scaling, record_scaling, run_search_scaling, suspicious_queries,
+)
+from e2e.utils.async_core import run_in_thread
+
+BENCH_TARGET = os.getenv('BENCH_TARGET', 'stub')
+BENCH_DRIVER = os.getenv('BENCH_DRIVER', 'api')
+BENCH_LEVELS = [int(v) for v in os.getenv('BENCH_LEVELS', '1,2,4,8').split(',') if v.strip()]
+BENCH_OPS = int(os.getenv('BENCH_OPS', '5'))
+BENCH_WARMUP = int(os.getenv('BENCH_WARMUP', '1'))
+BENCH_REPS = int(os.getenv('BENCH_REPS', '3'))
+BENCH_MAX_ERROR_RATE = float(os.getenv('BENCH_MAX_ERROR_RATE', '0.05'))
+LOAD_STAGES = os.getenv('LOAD_STAGES', '5:2,20:2')
+LOAD_BROWSERS = int(os.getenv('LOAD_BROWSERS', '0'))
+SCALE_SIZES = [int(v) for v in os.getenv('SCALE_SIZES', '1000,10000,100000').split(',') if v.strip()]
+
+
+@pytest.mark.benchmark
+class TestEmployeeBenchmark:
+    """
+    임직원 추가/검색/삭제 처리량 벤치마크
+    """
+
+    @pytest.mark.parametrize("flow", FLOWS)
+    def test_throughput_sweep(self, flow, pytestconfig):
+        """
+        동시성 수준별 처리량/지연 백분위/오류율 측정 후 실행 이력 DB에 기록
+        """
+        started_at = time.time()
+        rows, results, target = run_in_thread(run_benchmark(
+            [flow], BENCH_LEVELS, BENCH_OPS, BENCH_WARMUP, BENCH_REPS, BENCH_TARGET, BENCH_DRIVER,
+        ))
+
+        db_path = None if pytestconfig.getoption('no_run_history') else pytestconfig.getoption('run_history_db')
+        print()
+        for line in report(rows, target, BENCH_DRIVER, started_at, db_path):
+            print(line)
+
+        for row in rows:
+            assert row['error_rate'] <= BENCH_MAX_ERROR_RATE, (
+                f"{flow} c={row['concurrency']}: 오류율 {row['error_rate']:.1%} "
+                f"(예: {[s for r in results if r.concurrency == row['concurrency'] for s in r.error_samples][:3]})"
+            )
+
+    def test_search_load_stages(self, pytestconfig):
+        """
+        가상 사용자 단계별 목록/검색 응답 지연 기록 및 저하 시작 지점 보고
+        """
+        stages = parse_stages(LOAD_STAGES)
+        started_at = time.time()
+        rows, target = run_search_load(stages, BENCH_TARGET, browsers=LOAD_BROWSERS, think_time=0.2)
+
+        print(f"\n[INFO] search load: target={target}")
+        for line in format_load_rows(rows):
+            print(line)
+        for endpoint, info in find_degradation(rows).items():
+            print(f"[WARNING] {endpoint}: {info['users']}명에서 저하 ({info['reason']})")
+
+        if not pytestconfig.getoption('no_run_history'):
+            record_load(pytestconfig.getoption('run_history_db'), started_at, target, LOAD_BROWSERS, rows)
+
+        assert {row['stage'] for row in rows} == set(range(len(stages))), "모든 단계에서 요청이 기록되어야 합니다."
+        # 가상 사용자 로그인은 목록 지연과 섞이지 않고 'signin'으로 한 번씩만 기록
+        started_vus = sum(max(0, users - prev) for (users, _), prev in zip(stages, [0] + [u for u, _ in stages]))
+        assert sum(row['ops'] for row in rows if row['flow'] == 'signin') == started_vus
+
+    def test_search_latency_scaling(self, pytestconfig):
+        """
+        임직원 수별 이름/사번/부서 검색 지연 측정 후 사번 검색 인덱스 누락 여부 확인
+        """
+        started_at = time.time()
+        ui = BENCH_TARGET == 'server' and BENCH_DRIVER == 'ui'
+        result = run_search_scaling(SCALE_SIZES, reps=10, target=BENCH_TARGET, ui=ui)
+
+        print(f"\n[INFO] search scaling: target={result['target']}")
+        for line in format_scaling(result):
+            print(line)
+
+        if not pytestconfig.getoption('no_run_history'):
+            record_scaling(pytestconfig.getoption('run_history_db'), started_at, result, 'api+ui' if ui else 'api')
+
+        if BENCH_TARGET != 'stub':
+            # 실서버는 살펴본 레코드 수를 알 수 없고 벽시계 기울기는 다른 부하에 흔들리므로 경고만
+            for query in suspicious_queries(result):
+                print(f"[WARNING] {query}: 규모에 비례해 느려집니다 (기울기 {result['exponents'][query]:.2f}).")
+            return
+
+        # 대역 서버는 시간 대신 검색이 살펴본 레코드 수의 기울기로 판정 (부하와 무관하게 결정적)
+        limits = {'api:id': MAX_EXPONENTS['api:id']}
+        assert not suspicious_queries(result, limits, key='scan_exponents'), (
+            f"사번 검색이 규모에 비례해 느려집니다 (레코드 수 기울기 {result['scan_exponents']['api:id']:.2f}). "
+            f"인덱스를 확인하세요."
+        )
+        regressed = run_search_scaling([1000, 10000], reps=2, warmup=0, stub_indexed=False)
+        assert suspicious_queries(regressed, limits, key='scan_exponents') == ['api:id'], (
+            "인덱스 누락(전체 스캔)은 레코드 수 기울기로 잡혀야 합니다."
+        )
@@ -0,0 +1,98 @@
+"""
+asyncio 실행 코어를 이용한 임직원 대량 추가/삭제 E2E 테스트
+
+여러 인증 컨텍스트를 하나의 프로세스에서 동시에 구동합니다.
+동시 작업자 수는 ASYNC_CONCURRENCY 환경 변수로 조정합니다 (기본 4).
+파이프라인 모드(컨텍스트 하나, 탭 여러 개)의 탭 수는 PIPELINE_TABS로 조정합니다 (기본 2).
+"""
+import os
+import time
+
+import pytest
+
+from e2e.utils import settings
+from e2e.utils.async_core import AsyncBulkRunner, run_in_thread, summarize
+from e2e.utils.employee_data import list_image_files, load_employees_json, read_excel_employees
+
+CONCURRENCY = int(os.getenv('ASYNC_CONCURRENCY', '4'))
+PIPELINE_TABS = int(os.getenv('PIPELINE_TABS', '2'))
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.mark.slow
+class TestEmployeeBulkAsync:
+    """
+    임직원 대량 처리 (asyncio) 테스트
+    """
+
+    def test_add_employees_from_json_async(self):
+        """
+        em_add.json의 임직원을 CONCURRENCY개의 컨텍스트로 동시에 추가
+        """
+        employees = load_employees_json(os.path.join(DATA_DIR, "em_add.json"))
+        if not employees:
+            pytest.skip("em_add.json 파일에 employees 데이터가 없습니다.")
+        if not os.path.isdir(settings.EMPLOYEE_IMAGE_DIR):
+            pytest.skip(f"이미지 디렉터리가 없습니다: {settings.EMPLOYEE_IMAGE_DIR}")
+        if len(list_image_files(settings.EMPLOYEE_IMAGE_DIR)) < len(employees):
+            pytest.skip("이미지 파일이 부족합니다.")
+
+        async def scenario():
+            async with AsyncBulkRunner(concurrency=CONCURRENCY) as runner:
+                return await runner.add_employees(employees, settings.EMPLOYEE_IMAGE_DIR)
+
+        start = time.time()
+        results = run_in_thread(scenario())
+        print(f"\n{summarize(results, time.time() - start)}")
+
+        failed = [r for r in results if not r.ok]
+        assert not failed, f"추가 실패: {[(r.key, r.error) for r in failed]}"
+
+    def test_add_employees_from_excel_pipelined(self):
+        """
+        em_add.xlsx의 임직원을 인증 컨텍스트 하나의 탭 PIPELINE_TABS개로 추가 ('인원' 시트는 입력 순서대로 기록)
+        """
+        excel_path = os.path.join(DATA_DIR, "em_add.xlsx")
+        if not os.path.exists(excel_path):
+            pytest.skip(f"em_add.xlsx 파일이 없습니다: {excel_path}")
+        _, _, employees, next_index = read_excel_employees(excel_path)
+        if not employees:
+            pytest.skip("em_add.xlsx 파일의 '임직원_추가' 시트에 데이터가 없습니다.")
+        if not os.path.isdir(settings.EMPLOYEE_IMAGE_DIR):
+            pytest.skip(f"이미지 디렉터리가 없습니다: {settings.EMPLOYEE_IMAGE_DIR}")
+
+        async def scenario():
+            async with AsyncBulkRunner(concurrency=1) as runner:
+                return await runner.add_employees_pipelined(
+                    employees, settings.EMPLOYEE_IMAGE_DIR, excel_path, next_index, tabs=PIPELINE_TABS
+                )
+
+        start = time.time()
+        results = run_in_thread(scenario())
+        print(f"\n{summarize(results, time.time() - start)}")
+
+        failed = [r for r in results if not r.ok]
+        assert not failed, f"추가 실패: {[(r.key, r.error) for r in failed]}"
+        # 탭이 여러 개여도 "저장" 클릭은 입력 순서대로여야 함 (차례 넘김이 깨지면 순서가 바뀜)
+        saved = [r for r in results if r.saved_at is not None]
+        assert len(saved) == len(results), "모든 임직원이 저장 클릭까지 진행되어야 합니다."
+        assert [r.index for r in sorted(saved, key=lambda r: r.saved_at)] == [r.index for r in saved]
+
+    def test_remove_employees_from_json_async(self):
+        """
+        em_remove.json 기준으로 임직원을 동시에 삭제 (이름이 없으면 목록 상단 임직원)
+        """
+        employees = load_employees_json(os.path.join(DATA_DIR, "em_remove.json"))
+        if not employees:
+            pytest.skip("em_remove.json 파일에 employees 데이터가 없습니다.")
+
+        async def scenario():
+            async with AsyncBulkRunner(concurrency=CONCURRENCY) as runner:
+                return await runner.remove_employees([e.get("name") for e in employees])
+
+        start = time.time()
+        results = run_in_thread(scenario())
+        print(f"\n{summarize(results, time.time() - start)}")
+
+        failed = [r for r in results if not r.ok]
+        assert not failed, f"삭제 실패: {[(r.key, r.error) for r in failed]}"
@@ -6,29 +6,48 @@ import re
 from datetime import date, datetime
 from playwright.sync_api import Page, expect
 
-# 임직원 관리 페이지로 이동하는 픽스처
-@pytest.fixture
-def navigate_to_employee_page(page: Page):
+from e2e.utils.date_picker import set_date
+from e2e.utils.employee_data import list_image_files, personnel_row, read_excel_employees
+from e2e.utils.employee_form import EmployeeForm
+from e2e.utils.list_scanner import ListScanner
+
+# 삭제 테스트 사전조건 (1000460, 1000415) - dataset 픽스처가 모듈 시작 전에 복원
+pytestmark = pytest.mark.dataset('employee-basic')
+
+
+def open_employee_list(page: Page):
     """
     인증된 페이지에서 임직원 출입자 관리 메뉴로 이동합니다.
     """
     page.get_by_role("button", name="출입 통합 관리").click()
     page.get_by_role("button", name="임직원 출입자 관리").click()
-    
+
     # 탭이 완전히 로드될 때까지 기다립니다.
     expect(page.get_by_role("tab", name="임직원 출입자")).to_be_visible()
     page.get_by_role("tab", name="임직원 출입자").click()
-    
+
     # 데이터가 로드될 때까지 잠시 대기
     page.wait_for_load_state('networkidle')
     return page
 
+
+# 임직원 관리 페이지로 이동하는 픽스처
+@pytest.fixture
+def navigate_to_employee_page(page: Page, step_timer):
+    """
+    인증된 페이지에서 임직원 출입자 관리 메뉴로 이동합니다.
+    """
+    with step_timer.step("employee: 임직원 목록 진입"):
+        open_employee_list(page)
+    return page
+
 class TestEmployeeManagement:
     """
     임직원 출입자 관리 기능 E2E 테스트
     """
 
-    def test_add_employee_with_photo(self, navigate_to_employee_page: Page, take_screenshot):
+    def test_add_employee_with_photo(self, navigate_to_employee_page: Page, take_screenshot, step_timer,
+                                     resource_registry):
         """
         사진을 포함하여 새로운 임직원을 추가하는 기능 테스트
         `tests-python/employee` 폴더의 첫 번째 이미지를 사용합니다.
@@ -50,7 +69,7 @@ class TestEmployeeManagement:
         page.on("dialog", handle_dialog)
         
         image_dir = os.path.abspath("C:/00project/2025/SDG/ACS-WebApp-Test/employee")
-        image_files = [f for f in os.listdir(image_dir) if os.path.isfile(os.path.join(image_dir, f))]
+        image_files = list_image_files(image_dir)
         
         if not image_files:
             pytest.skip("테스트할 이미지가 employee 폴더에 없습니다.")
@@ -63,9 +82,11 @@ class TestEmployeeManagement:
         timestamp = datetime.now().strftime("%y%m%d-%H%M")
         unique_name = f"{employee_id}-{timestamp}"
 
+        step_timer.checkpoint("employee: 추가 화면 진입")
         page.get_by_role("button", name="임직원 추가").click()
         page.wait_for_url("**/employeeadd")
 
+        step_timer.checkpoint("employee: 프로필 사진 업로드")
         # 프로필 사진 업로드
         with page.expect_file_chooser() as fc_info:
             page.locator(".MuiSvgIcon-root.MuiSvgIcon-fontSizeMedium.css-185tx24 > path").first.click()
@@ -73,10 +94,12 @@ class TestEmployeeManagement:
         file_chooser.set_files(image_path)
         page.wait_for_timeout(500)
 
+        step_timer.checkpoint("employee: 기본 정보 입력")
         page.get_by_label("사번").fill(employee_id)
         page.get_by_label("이름").fill(unique_name)
         page.get_by_label("이메일").fill(f"{employee_id}@secern.ai")
 
+        step_timer.checkpoint("employee: 부서 선택")
         # 부서 선택
         page.locator("#mui-component-select-departmentId").click()
         page.wait_for_timeout(500)
@@ -87,6 +110,7 @@ class TestEmployeeManagement:
             dept_options[0].click()
         page.wait_for_timeout(300)
 
+        step_timer.checkpoint("employee: 직급 선택")
         # 직급 선택
         page.locator("#mui-component-select-jobGradeId").click()
         page.wait_for_timeout(500)
@@ -97,6 +121,7 @@ class TestEmployeeManagement:
             grade_options[0].click()
         page.wait_for_timeout(300)
 
+        step_timer.checkpoint("employee: 직책 선택")
         # 직책 선택
         page.locator("#mui-component-select-jobPositionId").click()
         page.wait_for_timeout(500)
@@ -107,17 +132,11 @@ class TestEmployeeManagement:
             pos_options[0].click()
         page.wait_for_timeout(300)
 
-        # 날짜 선택
-        page.get_by_role("group", name="발령 시작일").get_by_label("날짜를 선택하세요").click()
-        page.wait_for_timeout(500)
-        today_button = page.get_by_role("button", name="오늘", exact=True)
-        if today_button.is_visible():
-            today_button.click()
-        else:
-            today_day = date.today().day
-            page.get_by_role("gridcell", name=str(today_day), exact=True).click()
-        page.wait_for_timeout(300)
+        step_timer.checkpoint("employee: 발령 시작일 선택")
+        # 날짜 직접 입력 (입력이 안 되는 경우에만 달력 사용)
+        set_date(page, date.today())
 
+        step_timer.checkpoint("employee: 출입케이스 선택")
         # 출입 정책 랜덤 다중 선택
         page.locator("#mui-component-select-accessCaseId").click()
         page.wait_for_timeout(500)
@@ -132,6 +151,7 @@ class TestEmployeeManagement:
         page.keyboard.press('Escape')
         page.wait_for_timeout(300)
 
+        step_timer.checkpoint("employee: 출입자 이미지 업로드")
         # 두 번째 출입자 이미지 업로드
         with page.expect_file_chooser() as fc_info:
             page.locator("div").filter(has_text=re.compile(r"^출입자 이미지$")).locator("svg").first.click()
@@ -139,7 +159,9 @@ class TestEmployeeManagement:
         file_chooser.set_files(image_path)
         page.wait_for_timeout(500)
 
+        step_timer.checkpoint("employee: 저장")
         page.get_by_role("button", name="저장").click()
+        resource_registry.add('employee', employee_id, label=unique_name, test_id='test_add_employee_with_photo')
 
         # 저장 후 다이얼로그 자동 처리 및 페이지 전환 대기
         page.wait_for_timeout(3000)
@@ -153,10 +175,12 @@ class TestEmployeeManagement:
         # 또는 목록 페이지에서 employee_id 확인
         page.wait_for_timeout(2000)  # 추가 데이터 로딩 대기
 
-        # 목록에서 추가한 employee_id가 보이는지 확인
-        employee_cell = page.get_by_role("cell", name=employee_id, exact=True)
-        expect(employee_cell).to_be_visible(timeout=10000)
+        step_timer.checkpoint("employee: 목록 검증")
+        # 목록에서 추가한 employee_id 확인 (현재 페이지 -> 이름 필터 -> 페이지 순회)
+        hit = ListScanner(page).find(employee_id, search=unique_name)
+        assert hit, f"Employee not found in list: ID={employee_id}"
 
+        step_timer.stop()
         print(f"[OK] Employee added successfully: ID={employee_id}, Name={unique_name}")
 
         # 테스트 성공 시 이미지 파일을 employee_add 폴더로 이동
@@ -172,12 +196,11 @@ class TestEmployeeManagement:
             os.rename(image_path, dest_path)
             print(f"[INFO] Image file moved: {image_filename} -> employee_add/")
 
-    def test_delete_employee_from_list(self, navigate_to_employee_page: Page, take_screenshot):
+    def test_delete_employee_from_list(self, dataset, navigate_to_employee_page: Page, take_screenshot):
         """
         리스트에서 특정 임직원을 선택하여 삭제하는 기능 테스트
 
-        주의: 이 테스트는 특정 ID가 존재한다고 가정합니다.
-        실제 환경에서는 먼저 임직원을 추가한 후 삭제하는 것이 권장됩니다.
+        사전조건: 'employee-basic' 데이터셋(사번 1000460 포함)을 dataset 픽스처가 복원
         """
         page = navigate_to_employee_page
         employee_id_to_delete = "1000460"
@@ -203,12 +226,11 @@ class TestEmployeeManagement:
 
         expect(employee_cell).not_to_be_visible()
 
-    def test_search_and_delete_employee(self, navigate_to_employee_page: Page, take_screenshot):
+    def test_search_and_delete_employee(self, dataset, navigate_to_employee_page: Page, take_screenshot):
         """
         특정 임직원을 검색한 후 삭제하는 기능 테스트
 
-        주의: 이 테스트는 특정 ID가 존재한다고 가정합니다.
-        실제 환경에서는 먼저 임직원을 추가한 후 검색/삭제하는 것이 권장됩니다.
+        사전조건: 'employee-basic' 데이터셋(사번/이름 1000415 포함)을 dataset 픽스처가 복원
         """
         page = navigate_to_employee_page
         employee_name_to_search = "1000415"
@@ -246,7 +268,8 @@ class TestEmployeeManagement:
 
         expect(searched_cell).not_to_be_visible()
 
-    def test_add_employees_from_json(self, navigate_to_employee_page: Page, take_screenshot):
+    def test_add_employees_from_json(self, navigate_to_employee_page: Page, take_screenshot, step_timer,
+                                     resource_registry):
         """
         em_add.json 파일의 데이터를 기반으로 여러 임직원을 추가하는 기능 테스트
         JSON의 employees 배열을 순회하며 각 임직원을 등록합니다.
@@ -277,7 +300,7 @@ class TestEmployeeManagement:
             pytest.skip("em_add.json 파일에 employees 데이터가 없습니다.")
 
         image_dir = os.path.abspath("C:/00project/2025/SDG/ACS-WebApp-Test/employee")
-        image_files = [f for f in os.listdir(image_dir) if os.path.isfile(os.path.join(image_dir, f))]
+        image_files = list_image_files(image_dir)
 
         if len(image_files) < len(employees):
             pytest.skip(f"이미지 파일이 부족합니다. 필요: {len(employees)}, 보유: {len(image_files)}")
@@ -304,125 +327,19 @@ class TestEmployeeManagement:
 
             print(f"\n[INFO] Processing employee {idx + 1}/{len(employees)}: ID={employee_id}, Name={unique_name}")
 
+            step_timer.checkpoint("employee: 추가 화면 진입")
             page.get_by_role("button", name="임직원 추가").click()
             page.wait_for_url("**/employeeadd")
 
-            # 프로필 사진 업로드
-            with page.expect_file_chooser() as fc_info:
-                page.locator(".MuiSvgIcon-root.MuiSvgIcon-fontSizeMedium.css-185tx24 > path").first.click()
-            file_chooser = fc_info.value
-            file_chooser.set_files(image_path)
-            page.wait_for_timeout(500)
-
-            page.get_by_label("사번").fill(employee_id)
-            page.get_by_label("이름").fill(unique_name)
-            page.get_by_label("이메일").fill(f"{employee_id}@secern.ai")
-
-            # 부서 선택
-            department = employee_data.get("department")
-            if department:
-                page.locator("#mui-component-select-departmentId").click()
-                page.wait_for_timeout(500)
-                dept_option = page.get_by_role("option", name=department, exact=True)
-                if dept_option.is_visible():
-                    dept_option.click()
-                else:
-                    dept_options = page.locator('[role="option"]').all()
-                    if len(dept_options) > 1:
-                        random.choice(dept_options[1:]).click()
-                    elif dept_options:
-                        dept_options[0].click()
-                page.wait_for_timeout(300)
-
-            # 직급 선택
-            job_grade = employee_data.get("job_grade")
-            print(job_grade)
-            if job_grade:
-                page.locator("#mui-component-select-jobGradeId").click()
-                page.wait_for_timeout(500)
-                grade_option = page.get_by_role("option", name=job_grade, exact=True)
-                if grade_option.is_visible():
-                    grade_option.click()
-                else:
-                    grade_options = page.locator('[role="option"]').all()
-                    if len(grade_options) > 1:
-                        random.choice(grade_options[1:]).click()
-                    elif grade_options:
-                        grade_options[0].click()
-                page.wait_for_timeout(300)
-
-            # 직책 선택
-            job_position = employee_data.get("job_position")
-            print(job_position)
-            if job_position:
-                page.locator("#mui-component-select-jobPositionId").click()
-                page.wait_for_timeout(500)
-                pos_option = page.get_by_role("option", name=job_position, exact=True)
-                if pos_option.is_visible():
-                    pos_option.click()
-                else:
-                    pos_options = page.locator('[role="option"]').all()
-                    if len(pos_options) > 1:
-                        random.choice(pos_options[1:]).click()
-                    elif pos_options:
-                        pos_options[0].click()
-                page.wait_for_timeout(300)
-
-            # 발령 시작일 선택
-            assignment_start = employee_data.get("assignment_start_date")
-            if assignment_start == "today" or assignment_start:
-                page.get_by_role("group", name="발령 시작일").get_by_label("날짜를 선택하세요").click()
-                page.wait_for_timeout(500)
-                today_button = page.get_by_role("button", name="오늘", exact=True)
-                if today_button.is_visible():
-                    today_button.click()
-                else:
-                    today_day = date.today().day
-                    page.get_by_role("gridcell", name=str(today_day), exact=True).click()
-                page.wait_for_timeout(300)
-
-            # 출입케이스 선택
-            access_cases = employee_data.get("access_cases", [])
-            if access_cases:
-                page.locator("#mui-component-select-accessCaseId").click()
-                page.wait_for_timeout(500)
-                for case_name in access_cases:
-                    case_option = page.get_by_role("option", name=case_name, exact=True)
-                    if case_option.is_visible():
-                        case_option.click()
-                        page.wait_for_timeout(200)
-                page.keyboard.press('Escape')
-                page.wait_for_timeout(300)
-
-            # RF 카드 처리
-            rf_cards = employee_data.get("rf_card", [])
-            if rf_cards:
-                page.get_by_role("combobox", name="출입 카드").click()
-                page.wait_for_timeout(500)
-
-                # 모든 옵션 가져오기
-                card_options = page.locator('[role="option"]').all()
-
-                for card_value in rf_cards:
-                    # 각 옵션의 텍스트에서 카드 번호 매칭
-                    for option in card_options:
-                        option_text = option.text_content()
-                        if option_text and card_value in option_text:
-                            option.click()
-                            page.wait_for_timeout(200)
-                            break
-
-                page.keyboard.press('Escape')
-                page.wait_for_timeout(300)
-
-            # 두 번째 출입자 이미지 업로드
-            with page.expect_file_chooser() as fc_info:
-                page.locator("div").filter(has_text=re.compile(r"^출입자 이미지$")).locator("svg").first.click()
-            file_chooser = fc_info.value
-            file_chooser.set_files(image_path)
-            page.wait_for_timeout(500)
+            step_timer.checkpoint("employee: 폼 입력")
+            # 사진 2장은 숨은 file input에 직접 설정, 텍스트/드롭다운은 evaluate로 묶어 입력 (고정 대기 없음)
+            form_report = EmployeeForm(page).fill(employee_id, unique_name, employee_data, image_path)
+            print(f"[INFO] Form filled: {form_report.round_trips} round-trips, {form_report.seconds:.2f}s"
+                  + (f", fallbacks={form_report.fallbacks}" if form_report.fallbacks else ""))
 
+            step_timer.checkpoint("employee: 저장")
             page.get_by_role("button", name="저장").click()
+            resource_registry.add('employee', employee_id, label=unique_name, test_id='test_add_employees_from_json')
 
             # 저장 후 다이얼로그 자동 처리 및 페이지 전환 대기
             page.wait_for_timeout(3000)
@@ -431,13 +348,12 @@ class TestEmployeeManagement:
             # 목록으로 돌아왔는지 확인
             page.wait_for_timeout(2000)
 
-            # 목록에서 추가한 employee_id가 보이는지 확인
-            employee_cell = page.get_by_role("cell", name=employee_id, exact=True)
+            step_timer.checkpoint("employee: 목록 검증")
+            # 목록에서 추가한 employee_id 확인 (현재 페이지 -> 이름 필터 -> 페이지 순회)
+            hit = ListScanner(page).find(employee_id, search=unique_name)
 
             # 검증 실패 시 디버깅 정보 출력
-            try:
-                expect(employee_cell).to_be_visible(timeout=10000)
-            except AssertionError:
+            if hit is None:
                 print(f"[ERROR] Employee cell not found: ID={employee_id}")
                 print(f"Current URL: {page.url}")
 
@@ -455,8 +371,9 @@ class TestEmployeeManagement:
                 page.screenshot(path=screenshot_path, full_page=True)
                 print(f"Screenshot saved: {screenshot_path}")
 
-                raise
+                raise AssertionError(f"Employee not found in list: ID={employee_id}")
 
+            step_timer.stop()
             added_employee_ids.append(employee_id)
 
             # 개별 임직원 처리 완료 시간 계산
@@ -515,6 +432,7 @@ class TestEmployeeManagement:
 
         print(f"\n[START] Processing {len(employees)} employee removals...")
         removed_employee_names = []
+        scanner = ListScanner(page)
 
         # JSON의 각 employee 데이터를 순회
         for idx, employee_data in enumerate(employees):
@@ -528,10 +446,11 @@ class TestEmployeeManagement:
                 # 이름이 있으면 해당 이름으로 검색하여 삭제
                 print(f"\n[INFO] Removing employee {idx + 1}/{len(employees)}: Name={target_name}")
 
-                # 셀 클릭하여 선택
-                employee_cell = page.get_by_role("cell", name=target_name).first
-                if employee_cell.is_visible(timeout=5000):
-                    employee_cell.click()
+                # 현재 페이지 -> 이름 필터 -> 페이지 순회로 찾아 셀 클릭하여 선택
+                # (삭제 반복 중에는 목록이 새로 저장되지 않으므로 나타나기를 기다리지 않음)
+                hit = scanner.find(target_name, exact=False, search=target_name, settle_ms=0)
+                if hit:
+                    scanner.cell_locator(hit).click()
                     page.wait_for_timeout(500)
 
                     # 삭제 버튼 클릭 (다이얼로그 열기)
@@ -542,27 +461,29 @@ class TestEmployeeManagement:
                     page.get_by_role("button", name="삭제").click()
                     page.wait_for_timeout(1000)
 
-                    # 삭제 확인
-                    expect(employee_cell).not_to_be_visible(timeout=5000)
+                    # 삭제 확인 (해당 위치의 행이 바뀌었는지)
+                    scanner.wait_row_gone(hit)
+                    scanner.clear_search()
                     removed_employee_names.append(target_name)
 
                     # 처리 시간 계산
                     employee_elapsed = time.time() - employee_start_time
                     print(f"[OK] Employee removed successfully: Name={target_name}, Time={employee_elapsed:.2f}s")
                 else:
+                    # 다음 "맨 위 임직원" 삭제가 필터된 목록을 읽지 않도록 필터 해제
+                    scanner.clear_search()
                     print(f"[WARNING] Employee not found: Name={target_name}")
 
             else:
                 # 이름이 없으면 목록의 맨 위 첫 번째 임직원 삭제
                 print(f"\n[INFO] Removing top employee {idx + 1}/{len(employees)} (no name specified)")
 
-                # 첫 번째 행의 세 번째 셀 클릭 (이름 또는 사번)
-                page.wait_for_timeout(500)
-                first_cell = page.locator("td:nth-child(3)").first
+                # 첫 번째 행의 세 번째 셀 클릭 (이름 또는 사번) - 행 전체를 evaluate 한 번으로 읽음
+                top = scanner.first_row(column=2)
 
-                if first_cell.is_visible(timeout=3000):
-                    first_cell_text = first_cell.text_content()
-                    first_cell.click()
+                if top:
+                    first_cell_text = top.text
+                    scanner.cell_locator(top).click()
                     page.wait_for_timeout(500)
 
                     # 삭제 버튼 클릭 (다이얼로그 열기)
@@ -571,7 +492,7 @@ class TestEmployeeManagement:
 
                     # 다이얼로그에서 삭제 버튼 클릭 (확인)
                     page.get_by_role("button", name="삭제").click()
-                    page.wait_for_timeout(1000)
+                    scanner.wait_row_gone(top)
 
                     removed_employee_names.append(f"Top employee ({first_cell_text})")
 
@@ -587,7 +508,8 @@ class TestEmployeeManagement:
         print(f"\n[COMPLETE] Successfully removed {len(removed_employee_names)} employees from JSON")
         print(f"[TIME] Total: {test_elapsed:.2f}s, Average per employee: {avg_time:.2f}s")
 
-    def test_add_employees_from_excel(self, navigate_to_employee_page: Page, take_screenshot):
+    def test_add_employees_from_excel(self, navigate_to_employee_page: Page, take_screenshot, step_timer, page_recycler,
+                                      resource_registry):
         """
         em_add.xlsx Excel file의 '임직원_추가' 시트 데이터를 기반으로 여러 임직원을 추가하는 기능 테스트
         Excel의 index 컬럼 값만큼 임직원을 등록합니다.
@@ -595,9 +517,8 @@ class TestEmployeeManagement:
         개선사항:
         - 테스트 시작 전 '인원' 시트의 마지막 index를 확인하여 다음 번호부터 추가
         - 추가된 인원의 name과 id를 '인원' 시트에 기록
+        - 메모리 샘플링 및 N건/임계치 초과 시 페이지 자동 재생성 (page_recycler)
         """
-        from openpyxl import load_workbook
-
         # 전체 테스트 시작 시간
         test_start_time = time.time()
 
@@ -624,42 +545,8 @@ class TestEmployeeManagement:
             print(f"[WARNING] 테스트는 실행되지만 '인원' 시트에 데이터를 저장하지 못할 수 있습니다.")
             print(f"[WARNING] 데이터 저장을 위해 Excel 파일을 닫고 테스트를 실행하세요.\n")
 
-        wb = load_workbook(excel_path)
-        ws = wb["임직원_추가"]
-
-        # "인원" 시트에서 마지막 index 확인
-        ws_personnel = wb["인원"]
-        last_index = 0
-
-        # 컬럼 A에서 마지막 숫자 찾기 (헤더 제외)
-        for row in ws_personnel.iter_rows(min_row=2, min_col=1, max_col=1):
-            if row[0].value is not None:
-                try:
-                    current_index = int(row[0].value)
-                    if current_index > last_index:
-                        last_index = current_index
-                except (ValueError, TypeError):
-                    continue
-
-        next_index = last_index + 1
-        print(f"[INFO] '인원' 시트의 마지막 index: {last_index}, 다음 추가할 index: {next_index}")
-
-        # 데이터 읽기 (헤더 제외, row 2부터)
-        employees = []
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if row[0] is None:  # index가 없으면 중단
-                break
-
-            employee_data = {
-                "original_index": int(row[0]) if row[0] else None,  # 원래 index 보관
-                "department": row[1] if row[1] else "",
-                "job_grade": row[2] if row[2] else "",
-                "job_position": row[3] if row[3] else "",
-                "assignment_start_date": row[4] if row[4] else "today",
-                "access_cases": row[5].split(",") if row[5] else [],
-                "rf_card": row[6].split(",") if row[6] else [],
-            }
-            employees.append(employee_data)
+        wb, ws_personnel, employees, next_index = read_excel_employees(excel_path)
+        print(f"[INFO] '인원' 시트의 마지막 index: {next_index - 1}, 다음 추가할 index: {next_index}")
 
         if not employees:
             pytest.skip("em_add.xlsx 파일의 '임직원_추가' 시트에 데이터가 없습니다.")
@@ -667,7 +554,7 @@ class TestEmployeeManagement:
             print(f"[INFO] Excel에서 읽은 임직원 수: {len(employees)}명")
 
         image_dir = os.path.abspath("C:/00project/2025/SDG/ACS-WebApp-Test//employee")
-        image_files = [f for f in os.listdir(image_dir) if os.path.isfile(os.path.join(image_dir, f))]
+        image_files = list_image_files(image_dir)
 
         if len(image_files) < len(employees):
             pytest.skip(f"이미지 파일이 부족합니다. 필요: {len(employees)}, 보유: {len(image_files)}")
@@ -675,6 +562,15 @@ class TestEmployeeManagement:
         print(f"\n[START] Processing {len(employees)} employees from Excel...")
         added_employee_ids = []
 
+        # 페이지 재생성 시 다이얼로그 핸들러 재등록 후 목록으로 이동
+        def prepare_page(new_page: Page) -> Page:
+            new_page.on("dialog", handle_dialog)
+            new_page.goto(os.getenv('BASE_URL', 'http://localhost:3000'))
+            new_page.wait_for_load_state('networkidle')
+            return open_employee_list(new_page)
+
+        page = page_recycler.start(page, setup=prepare_page)
+
         # Excel의 각 employee 데이터를 순회
         for idx, employee_data in enumerate(employees):
             # 개별 임직원 처리 시작 시간
@@ -700,193 +596,29 @@ class TestEmployeeManagement:
 
             print(f"\n[INFO] Processing employee {idx + 1}/{len(employees)}: Personnel Index={current_personnel_index}, Image Index={original_index}, ID={employee_id}, Name={unique_name}")
 
+            step_timer.checkpoint("employee: 추가 화면 진입")
             page.get_by_role("button", name="임직원 추가").click()
             page.wait_for_url("**/employeeadd")
 
-            # 프로필 사진 업로드 - 대기 시간 단축 (500ms → 200ms)
-            with page.expect_file_chooser() as fc_info:
-                page.locator(".MuiSvgIcon-root.MuiSvgIcon-fontSizeMedium.css-185tx24 > path").first.click()
-            file_chooser = fc_info.value
-            file_chooser.set_files(image_path)
-            page.wait_for_timeout(200)
-
-            page.get_by_label("사번").fill(employee_id)
-            page.get_by_label("이름").fill(unique_name)
-            page.get_by_label("이메일").fill(f"{employee_id}@secern.ai")
-
-            # 부서 선택
-            department = employee_data.get("department")
-            if department:
-                page.locator("#mui-component-select-departmentId").click()
-                # "부서 선택" 옵션이 나타날 때까지 대기 (드롭다운 렌더링 완료)
-                page.get_by_role("option").first.wait_for(state="visible", timeout=5000)
-
-                dept_option = page.get_by_role("option", name=department, exact=True)
-
-                # Strict mode 위반 방지: 동일한 이름이 여러 개 있을 수 있음
-                count = dept_option.count()
-                if count == 1:
-                    dept_option.click()
-                elif count > 1:
-                    print(f"[WARNING] 부서 '{department}'이(가) {count}개 존재 - 첫 번째 선택")
-                    dept_option.first.click()
-                else:
-                    # 이름으로 못 찾으면 fallback
-                    print(f"[WARNING] 부서 '{department}'을(를) 찾을 수 없음 - 랜덤 선택")
-                    dept_options = page.locator('[role="option"]').all()
-                    if len(dept_options) > 1:
-                        random.choice(dept_options[1:]).click()
-                    elif dept_options:
-                        dept_options[0].click()
-                # 드롭다운 닫힘 확인 불필요 - 다음 클릭으로 자동 닫힘
-
-            # 직급 선택
-            job_grade = employee_data.get("job_grade")
-            if job_grade:
-                page.locator("#mui-component-select-jobGradeId").click()
-                page.get_by_role("option").first.wait_for(state="visible", timeout=3000)
-                grade_option = page.get_by_role("option", name=job_grade, exact=True)
-
-                # Strict mode 위반 방지: 동일한 이름이 여러 개 있을 수 있음
-                count = grade_option.count()
-                if count == 1:
-                    grade_option.click()
-                elif count > 1:
-                    print(f"[WARNING] 직급 '{job_grade}'이(가) {count}개 존재 - 첫 번째 선택")
-                    grade_option.first.click()
-                else:
-                    # 이름으로 못 찾으면 fallback
-                    print(f"[WARNING] 직급 '{job_grade}'을(를) 찾을 수 없음 - 랜덤 선택")
-                    grade_options = page.locator('[role="option"]').all()
-                    if len(grade_options) > 1:
-                        random.choice(grade_options[1:]).click()
-                    elif grade_options:
-                        grade_options[0].click()
-                # 드롭다운 닫힘 확인 불필요
-
-            # 직책 선택
-            job_position = employee_data.get("job_position")
-            if job_position:
-                page.locator("#mui-component-select-jobPositionId").click()
-                page.get_by_role("option").first.wait_for(state="visible", timeout=3000)
-                pos_option = page.get_by_role("option", name=job_position, exact=True)
-
-                # Strict mode 위반 방지: 동일한 이름이 여러 개 있을 수 있음
-                count = pos_option.count()
-                if count == 1:
-                    pos_option.click()
-                elif count > 1:
-                    print(f"[WARNING] 직책 '{job_position}'이(가) {count}개 존재 - 첫 번째 선택")
-                    pos_option.first.click()
-                else:
-                    # 이름으로 못 찾으면 fallback
-                    print(f"[WARNING] 직책 '{job_position}'을(를) 찾을 수 없음 - 랜덤 선택")
-                    pos_options = page.locator('[role="option"]').all()
-                    if len(pos_options) > 1:
-                        random.choice(pos_options[1:]).click()
-                    elif pos_options:
-                        pos_options[0].click()
-                # 드롭다운 닫힘 확인 불필요
-
-            # 발령 시작일 선택
-            assignment_start = employee_data.get("assignment_start_date")
-            if assignment_start == "today" or assignment_start:
-                page.get_by_role("group", name="발령 시작일").get_by_label("날짜를 선택하세요").click()
-                # 캘린더 표시 대기 - gridcell 사용 (인코딩 문제 회피)
-                page.wait_for_timeout(200)
-                today_button = page.get_by_role("button", name="오늘", exact=True)
-                if today_button.is_visible():
-                    today_button.click()
-                else:
-                    today_day = date.today().day
-                    page.get_by_role("gridcell", name=str(today_day), exact=True).click()
-                # 캘린더 닫힘 확인 불필요
-
-            # 출입케이스 선택 (멀티 선택 가능)
-            access_cases = employee_data.get("access_cases", [])
-
-            # Excel에서 읽은 access_cases만 사용 (비어있으면 스킵)
-            if not access_cases or (len(access_cases) == 1 and not access_cases[0]):
-                print(f"[INFO] Access cases empty, skipping...")
-                access_cases = []
-            else:
-                # Excel에서 정의된 케이스 사용
-                print(f"[INFO] Using access cases from Excel: {access_cases}")
-
-            # 드롭다운 열기 및 멀티 선택
-            if access_cases:
-                page.locator("#mui-component-select-accessCaseId").click()
-                page.get_by_role("option").first.wait_for(state="visible", timeout=3000)
-
-                selected_count = 0
-                for case_name in access_cases:
-                    case_name = case_name.strip()
-                    if not case_name:
-                        continue
-
-                    # Strict mode 위반 방지
-                    case_option = page.get_by_role("option", name=case_name, exact=True)
-                    count = case_option.count()
-
-                    if count == 1:
-                        case_option.click()
-                        selected_count += 1
-                        page.wait_for_timeout(100)
-                    elif count > 1:
-                        print(f"[WARNING] 출입케이스 '{case_name}'이(가) {count}개 존재 - 첫 번째 선택")
-                        case_option.first.click()
-                        selected_count += 1
-                        page.wait_for_timeout(100)
-                    else:
-                        print(f"[WARNING] 출입케이스 '{case_name}'을(를) 찾을 수 없음")
-
-                print(f"[INFO] Selected {selected_count}/{len(access_cases)} access cases")
-                page.keyboard.press('Escape')
-                page.wait_for_timeout(100)
-
-            # RF 카드 처리
-            rf_cards = employee_data.get("rf_card", [])
-            if rf_cards and rf_cards[0]:  # 빈 문자열이 아닌 경우만
-                page.get_by_role("combobox", name="출입 카드").click()
-                page.get_by_role("option").first.wait_for(state="visible", timeout=3000)
-
-                # 모든 옵션 가져오기
-                card_options = page.locator('[role="option"]').all()
-
-                for card_value in rf_cards:
-                    card_value = card_value.strip()
-                    if not card_value:
-                        continue
-                    # 각 옵션의 텍스트에서 카드 번호 매칭
-                    for option in card_options:
-                        option_text = option.text_content()
-                        if option_text and card_value in option_text:
-                            option.click()
-                            page.wait_for_timeout(100)  # 200ms → 100ms 단축
-                            break
-
-                page.keyboard.press('Escape')
-                page.wait_for_timeout(100)  # 300ms → 100ms 단축
-
-            # 두 번째 출입자 이미지 업로드 - 대기 시간 단축 (750ms → 300ms)
-            with page.expect_file_chooser() as fc_info:
-                page.locator("div").filter(has_text=re.compile(r"^출입자 이미지$")).locator("svg").first.click()
-            file_chooser = fc_info.value
-            file_chooser.set_files(image_path)
-            page.wait_for_timeout(300)
+            step_timer.checkpoint("employee: 폼 입력")
+            # 사진 2장은 숨은 file input에 직접 설정, 텍스트/드롭다운은 evaluate로 묶어 입력 (고정 대기 없음)
+            form_report = EmployeeForm(page).fill(employee_id, unique_name, employee_data, image_path)
+            print(f"[INFO] Form filled: {form_report.round_trips} round-trips, {form_report.seconds:.2f}s"
+                  + (f", fallbacks={form_report.fallbacks}" if form_report.fallbacks else ""))
 
+            step_timer.checkpoint("employee: 저장")
             page.get_by_role("button", name="저장").click()
+            resource_registry.add('employee', employee_id, label=unique_name, test_id='test_add_employees_from_excel')
 
             # 저장 후 페이지 전환 대기 - networkidle로 자동 감지 (고정 3000ms 제거)
             page.wait_for_load_state('networkidle', timeout=15000)
 
-            # 목록에서 추가한 employee_id가 보이는지 확인 - 고정 대기 제거, 직접 검증
-            employee_cell = page.get_by_role("cell", name=employee_id, exact=True)
+            step_timer.checkpoint("employee: 목록 검증")
+            # 목록에서 추가한 employee_id 확인 - 고정 대기 제거 (현재 페이지 -> 이름 필터 -> 페이지 순회)
+            hit = ListScanner(page).find(employee_id, search=unique_name)
 
             # 검증 실패 시 디버깅 정보 출력
-            try:
-                expect(employee_cell).to_be_visible(timeout=10000)
-            except AssertionError:
+            if hit is None:
                 print(f"[ERROR] Employee cell not found: ID={employee_id}")
                 print(f"Current URL: {page.url}")
 
@@ -904,8 +636,9 @@ class TestEmployeeManagement:
                 page.screenshot(path=screenshot_path, full_page=True)
                 print(f"Screenshot saved: {screenshot_path}")
 
-                raise
+                raise AssertionError(f"Employee not found in list: ID={employee_id}")
 
+            step_timer.stop()
             added_employee_ids.append(employee_id)
 
             # 개별 임직원 처리 완료 시간 계산
@@ -914,18 +647,7 @@ class TestEmployeeManagement:
 
             # "인원" 시트에 결과 기록
             # 새로운 행 추가: 컬럼 A=index, B=department, C=job_grade, D=job_position, E=assignment_start_date, F=access_cases, G=rf_card, I=name, J=id
-            new_row_data = [
-                current_personnel_index,  # A: index
-                employee_data.get("department", ""),  # B: department
-                employee_data.get("job_grade", ""),  # C: job_grade
-                employee_data.get("job_position", ""),  # D: job_position
-                employee_data.get("assignment_start_date", ""),  # E: assignment_start_date
-                ",".join(employee_data.get("access_cases", [])),  # F: access_cases
-                ",".join(employee_data.get("rf_card", [])),  # G: rf_card
-                None,  # H: empty column
-                unique_name,  # I: name
-                employee_id,  # J: id
-            ]
+            new_row_data = personnel_row(current_personnel_index, employee_data, unique_name, employee_id)
             ws_personnel.append(new_row_data)
             print(f"[INFO] Added to '인원' sheet: Index={current_personnel_index}, Name={unique_name}, ID={employee_id}")
 
@@ -942,6 +664,9 @@ class TestEmployeeManagement:
                 os.rename(image_path, dest_path)
                 print(f"[INFO] Image file moved: {image_filename} -> employee_add/")
 
+            # 메모리 샘플링 및 재생성 정책 확인
+            page = page_recycler.after_row(page, idx + 1)
+
         # Excel 파일 한 번에 저장 (모든 임직원 추가 완료 후)
         max_retries = 3
         saved = False
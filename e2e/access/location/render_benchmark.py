@@ -0,0 +1,305 @@
+"""
+장소 정보 관리 화면 트리 렌더링 규모 벤치마크
+
+사이트가 큰 고객에서 "장소 정보 관리" 화면이 느려진다는 보고가 있어,
+트리 크기(노드 수)와 모양(넓은 트리/깊은 트리)을 바꿔가며 화면 구간별 시간을 잽니다.
+
+    first_render  /location 이동 -> 시드 루트 treeitem 표시
+    expand_all    시드 하위 트리의 접힌 treeitem을 모두 펼침 (페이지 안에서 evaluate 한 번)
+    select_deep   가장 깊은 treeitem 클릭 -> aria-selected
+    add_render    "저장" 클릭 -> 새 treeitem 표시
+    delete_render "삭제" 클릭 -> treeitem 사라짐
+
+구간마다 CDP Performance.getMetrics 차이(LayoutCount, RecalcStyleCount, LayoutDuration, ScriptDuration)와
+PerformanceObserver로 모은 long task(50ms 이상) 수/합계를 함께 기록합니다.
+크기별 결과에서 search_scaling.scaling_exponent로 로그-로그 기울기를 계산해 프론트엔드 팀에 전달할 수치로 정리합니다.
+
+트리는 tree_builder의 API 생성으로 시드하고 측정 후 삭제합니다 (브라우저와 실제 서버 필요).
+
+실행 예 (저장소 루트에서):
+    python -m e2e.access.location.render_benchmark --sizes 100,1000,5000 --shapes wide,deep
+    python -m e2e.access.location.render_benchmark --sizes 1000 --shapes deep --reps 5 --keep
+"""
+import argparse
+import math
+import time
+
+from playwright.async_api import Page
+
+from e2e.access.employee.search_scaling import scaling_exponent
+from e2e.access.location.tree_builder import build_via_api, cleanup, generate_spec, spec_levels
+from e2e.utils import settings
+from e2e.utils.api import ApiClient
+from e2e.utils.async_core import AsyncBulkRunner, _accept_dialog, run_in_thread
+from e2e.utils.run_history import DEFAULT_DB_PATH, git_revision, record_benchmark
+
+SUITE = 'location-render-scaling'
+SHAPES = ('wide', 'deep')
+PHASES = ('first_render', 'expand_all', 'select_deep', 'add_render', 'delete_render')
+METRICS = ('LayoutCount', 'RecalcStyleCount', 'LayoutDuration', 'ScriptDuration')
+WIDE_ROOTS = 10
+DEEP_FANOUT = 2
+
+# 페이지 로드 전부터 long task 수집 (50ms 이상 메인 스레드 점유)
+LONG_TASK_INIT_JS = """(() => {
+    window.__longTasks = [];
+    try {
+        new PerformanceObserver(list => {
+            for (const entry of list.getEntries()) window.__longTasks.push(entry.duration);
+        }).observe({type: 'longtask', buffered: true});
+    } catch (e) {}
+})()"""
+
+# 지금까지 모인 long task를 꺼내고 비움
+TAKE_LONG_TASKS_JS = """() => {
+    const tasks = window.__longTasks || [];
+    window.__longTasks = [];
+    return tasks;
+}"""
+
+# 루트 이름의 treeitem 아래 접힌 항목을 레벨마다 한꺼번에 클릭, 더 없을 때까지 반복
+EXPAND_ALL_JS = """async ([rootName, maxRounds]) => {
+    const labelOf = el => {
+        const label = el.querySelector('.MuiTreeItem-label, [class*="TreeItem-label"]');
+        return (label ? label.textContent : el.getAttribute('aria-label') || '').trim();
+    };
+    const frame = () => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+    const root = Array.from(document.querySelectorAll('[role="treeitem"]')).find(el => labelOf(el) === rootName);
+    if (!root) return {rounds: 0, clicks: 0, items: 0, found: false};
+    let rounds = 0, clicks = 0;
+    while (rounds < maxRounds) {
+        const collapsed = [root, ...root.querySelectorAll('[role="treeitem"]')]
+            .filter(el => el.getAttribute('aria-expanded') === 'false');
+        if (!collapsed.length) break;
+        for (const el of collapsed) {
+            const content = el.querySelector('.MuiTreeItem-content, [class*="TreeItem-content"]') || el;
+            const icon = content.querySelector('.MuiTreeItem-iconContainer, [class*="TreeItem-iconContainer"]');
+            (icon || content).click();
+            clicks++;
+        }
+        rounds++;
+        await frame();
+    }
+    return {rounds, clicks, items: root.querySelectorAll('[role="treeitem"]').length + 1, found: true};
+}"""
+
+
+def shape_fanouts(shape: str, size: int) -> list[int]:
+    """
+    목표 노드 수에 가까운 레벨별 자식 수
+
+    wide  루트 WIDE_ROOTS개, 각 루트 아래 나머지를 고르게 (2단, 형제가 많음)
+    deep  자식 DEEP_FANOUT개씩 노드 수가 size 이상이 될 때까지 (단이 많음)
+    """
+    if shape == 'wide':
+        return [WIDE_ROOTS, max(1, math.ceil((size - WIDE_ROOTS) / WIDE_ROOTS))]
+    fanouts, total, width = [], 0, 1
+    while total < size:
+        width *= DEEP_FANOUT
+        fanouts.append(DEEP_FANOUT)
+        total += width
+    return fanouts
+
+
+def seed_spec(shape: str, size: int, prefix: str) -> list[dict]:
+    """
+    측정용 트리 스펙 (루트 하나 아래에 모양별 트리, 화면에서 시드만 골라 펼치기 위함)
+    """
+    return [{'name': prefix, 'order': 1, 'children': generate_spec(shape_fanouts(shape, size), prefix=prefix)}]
+
+
+async def _metrics(session) -> dict[str, float]:
+    result = await session.send('Performance.getMetrics')
+    return {m['name']: m['value'] for m in result['metrics'] if m['name'] in METRICS}
+
+
+async def _phase(page: Page, session, action) -> dict:
+    """
+    action 실행 시간과 그동안의 레이아웃/스타일 계산/long task 차이
+    """
+    await page.evaluate(TAKE_LONG_TASKS_JS)
+    before = await _metrics(session)
+    start = time.perf_counter()
+    detail = await action()
+    seconds = time.perf_counter() - start
+    after = await _metrics(session)
+    tasks = await page.evaluate(TAKE_LONG_TASKS_JS)
+    row = {'seconds': seconds, 'long_tasks': len(tasks), 'long_task_ms': sum(tasks)}
+    row.update({name: after.get(name, 0) - before.get(name, 0) for name in METRICS})
+    if isinstance(detail, dict):
+        row.update(detail)
+    return row
+
+
+async def measure_tree(runner: AsyncBulkRunner, levels: list[list[dict]], reps: int = 3) -> dict[str, list[dict]]:
+    """
+    시드된 트리 하나의 구간별 측정 (first_render/expand_all/select_deep는 reps번, 추가/삭제는 1번)
+    """
+    root, deep = levels[0][0]['name'], levels[-1][0]['name']
+    added = f"{root}-added"
+    context = await runner.new_context()
+    await context.add_init_script(LONG_TASK_INIT_JS)
+    page = await context.new_page()
+    page.on("dialog", _accept_dialog)
+    session = await context.new_cdp_session(page)
+    await session.send('Performance.enable')
+    phases = {phase: [] for phase in PHASES}
+
+    async def first_render():
+        await page.goto(settings.url('location'))
+        await page.get_by_role("treeitem", name=root, exact=True).wait_for(state='visible', timeout=60000)
+
+    async def expand_all():
+        result = await page.evaluate(EXPAND_ALL_JS, [root, len(levels) + 2])
+        await page.get_by_role("treeitem", name=deep, exact=True).wait_for(state='visible', timeout=60000)
+        return {'items': result['items'], 'rounds': result['rounds']}
+
+    async def select_deep():
+        item = page.get_by_role("treeitem", name=deep, exact=True)
+        await item.click()
+        await page.wait_for_function(
+            "(el) => el.getAttribute('aria-selected') === 'true'", arg=await item.element_handle(), timeout=10000)
+
+    try:
+        for _ in range(max(1, reps)):
+            phases['first_render'].append(await _phase(page, session, first_render))
+            phases['expand_all'].append(await _phase(page, session, expand_all))
+            phases['select_deep'].append(await _phase(page, session, select_deep))
+
+        # 루트 아래에 하나 추가 후 삭제 (폼 입력은 제외하고 저장/삭제 클릭부터 측정)
+        await page.get_by_role("treeitem", name=root, exact=True).click()
+        await page.get_by_role("button", name="장소 추가").click()
+        await page.get_by_role("textbox", name="장소 이름").fill(added)
+        await page.get_by_label("", exact=True).click()
+        await page.get_by_role("option", name="사무공간").click()
+        await page.get_by_role("spinbutton", name="표시 순서").fill("1")
+
+        async def add_render():
+            await page.get_by_role("button", name="저장").click()
+            await page.get_by_role("treeitem", name=added, exact=True).wait_for(state='visible', timeout=60000)
+
+        phases['add_render'].append(await _phase(page, session, add_render))
+        await page.get_by_role("treeitem", name=added, exact=True).click()
+
+        async def delete_render():
+            await page.get_by_role("button", name="삭제").click()
+            await page.get_by_role("treeitem", name=added, exact=True).wait_for(state='hidden', timeout=60000)
+
+        phases['delete_render'].append(await _phase(page, session, delete_render))
+    finally:
+        await session.detach()
+        await context.close()
+    return phases
+
+
+def _median(values: list[float]) -> float:
+    values = sorted(values)
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+
+def summarize_phase(samples: list[dict]) -> dict:
+    """
+    반복 측정의 중앙값
+    """
+    keys = [k for k in samples[0] if isinstance(samples[0][k], (int, float))]
+    return {k: _median([s[k] for s in samples]) for k in keys}
+
+
+def run_render_scaling(sizes: list[int], shapes: list[str], reps: int = 3, keep: bool = False,
+                       headless: bool | None = None, workers: int = 8) -> dict:
+    """
+    모양/크기별 시드 -> 측정 -> 정리
+
+    Returns:
+        dict: {'rows': [...], 'exponents': {(phase, shape): 기울기}, 'target': 대상 URL}
+    """
+    client = ApiClient().login()
+    rows = []
+
+    async def measure(levels):
+        async with AsyncBulkRunner(concurrency=1, headless=headless) as runner:
+            return await measure_tree(runner, levels, reps)
+
+    for shape in shapes:
+        for size in sorted(sizes):
+            prefix = f"RENDER_{shape}_{size}_{int(time.time())}"
+            levels = spec_levels(seed_spec(shape, size, prefix))
+            nodes = sum(len(level) for level in levels)
+            build = build_via_api(levels, workers=workers)
+            if build.errors:
+                print(f"[WARNING] {shape}/{size}: 시드 실패 {len(build.errors)}건 (예: {build.errors[:2]})")
+            print(f"[INFO] {shape}/{size}: {nodes}개 노드, 깊이 {len(levels)} 시드 {build.seconds:.1f}s")
+            try:
+                phases = run_in_thread(measure(levels))
+            finally:
+                if not keep:
+                    cleanup(client, build, workers)
+            for phase, samples in phases.items():
+                if samples:
+                    rows.append({'shape': shape, 'size': size, 'nodes': nodes, 'depth': len(levels),
+                                 'phase': phase, **summarize_phase(samples)})
+
+    exponents = {}
+    for phase in PHASES:
+        for shape in shapes:
+            points = [(r['nodes'], r['seconds']) for r in rows if r['phase'] == phase and r['shape'] == shape]
+            exponents[(phase, shape)] = scaling_exponent(points)
+    return {'rows': rows, 'exponents': exponents, 'target': settings.BASE_URL}
+
+
+def format_render(result: dict) -> list[str]:
+    lines = [f"  {'shape':<6}{'nodes':>7}{'depth':>6}  {'phase':<14}{'ms':>9}{'long tasks':>14}"
+             f"{'layouts':>9}{'styles':>8}{'layout ms':>11}{'script ms':>11}"]
+    for r in result['rows']:
+        long_tasks = f"{r['long_tasks']:.0f}/{r['long_task_ms']:.0f}ms"
+        lines.append(
+            f"  {r['shape']:<6}{r['nodes']:>7,}{r['depth']:>6}  {r['phase']:<14}{r['seconds'] * 1000:>9.0f}"
+            f"{long_tasks:>14}{r['LayoutCount']:>9.0f}"
+            f"{r['RecalcStyleCount']:>8.0f}{r['LayoutDuration'] * 1000:>11.0f}{r['ScriptDuration'] * 1000:>11.0f}")
+    lines.append("  scaling exponent (시간 vs 노드 수 로그-로그 기울기, 1이면 노드 수에 비례):")
+    for (phase, shape), exponent in result['exponents'].items():
+        if exponent is not None:
+            lines.append(f"    {phase:<14}{shape:<6}{exponent:>6.2f}")
+    return lines
+
+
+def record_render(db_path: str, started_at: float, result: dict):
+    record_benchmark(db_path, SUITE, {
+        'started_at': started_at, 'target': result['target'], 'driver': 'ui', 'git_rev': git_revision(),
+    }, [{
+        'flow': f"{r['phase']}:{r['shape']}@{r['nodes']}", 'concurrency': 1, 'reps': 1, 'ops': 1,
+        'errors': 0, 'error_rate': 0.0, 'throughput_per_min': 60 / r['seconds'] if r['seconds'] else 0.0,
+        'p50': r['seconds'], 'p90': r['seconds'], 'p95': r['seconds'], 'p99': r['seconds'],
+    } for r in result['rows']])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='장소 트리 렌더링 규모 벤치마크 (실제 서버)')
+    parser.add_argument('--sizes', default='100,1000,5000', help='트리 노드 수 (쉼표 구분)')
+    parser.add_argument('--shapes', default=','.join(SHAPES), help='wide, deep (쉼표 구분)')
+    parser.add_argument('--reps', type=int, default=3, help='렌더/펼치기/선택 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--workers', type=int, default=8, help='시드 API 동시 요청 수')
+    parser.add_argument('--keep', action='store_true', help='측정 후 시드 트리를 삭제하지 않음')
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='실행 이력 SQLite 경로')
+    parser.add_argument('--no-record', action='store_true', help='이력 DB에 기록하지 않음')
+    args = parser.parse_args()
+
+    shapes = [s.strip() for s in args.shapes.split(',') if s.strip()]
+    unknown = set(shapes) - set(SHAPES)
+    if unknown:
+        parser.error(f"알 수 없는 모양: {sorted(unknown)}")
+
+    started_at = time.time()
+    result = run_render_scaling([int(v) for v in args.sizes.split(',')], shapes, args.reps, args.keep,
+                                False if args.headed else None, args.workers)
+    print(f"[INFO] location render scaling: target={result['target']}")
+    for line in format_render(result):
+        print(line)
+    if not args.no_record:
+        record_render(args.db, started_at, result)
+
+
+if __name__ == "__main__":
+    main()
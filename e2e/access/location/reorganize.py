@@ -0,0 +1,445 @@
+"""
+장소 일괄 재정렬/이동
+
+test_location_simple.py는 "표시 순서" spinbutton을 노드마다 하나씩 채웁니다.
+사이트 개편으로 형제 수백 개의 순서를 바꾸거나 하위 트리를 옮길 때는 (노드, 새 부모, 새 표시 순서) 목록을
+현재 트리 스냅샷과 비교해 실제로 바뀌는 노드만 PATCH하고, 결과 트리를 다시 읽어 요청한 순서와 비교합니다.
+
+    계획   노드/부모를 이름 또는 id로 찾고, 최종 트리에 순환이 없는지 확인, 바뀌지 않는 항목은 제외
+    적용   순서만 바뀌는 노드는 모두 한 번에 병렬로 보냄
+           이동은 라운드로 나눔: 새 조상 중 아직 옮기지 않은 노드가 k개인 이동은 k번째 라운드
+           (앞 라운드가 끝나면 새 부모의 조상 경로가 확정되므로, 같은 라운드 안의 이동은 서로 순환을 만들지 않음)
+    검증   장소 목록 한 번 조회로 요청 노드의 부모/표시 순서와 영향받은 형제 그룹의 순서 비교
+
+변경 파일 형식:
+    JSON    [{'node': 이름|id, 'parent': 이름|id|null, 'order': 숫자}, ...] 또는 {'changes': [...]}
+            'parent' 키가 없으면 부모 유지, null이면 최상위로 이동, 'order'가 없으면 순서 유지
+            (부모만 바뀌면 새 형제 중 마지막)
+    Excel   tree_builder와 같은 머리글 (이름/부모/표시 순서), 부모가 비면 유지, '-'면 최상위
+
+실행 예 (저장소 루트에서):
+    python -m e2e.access.location.reorganize --changes reorg.json --target server
+    python -m e2e.access.location.reorganize --target server --reverse 본사 --dry-run
+    python -m e2e.access.location.reorganize --generate 1,300,3 --reverse TREE_DEMO-1 --workers 16
+"""
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from e2e.access.location.tree_builder import build_via_api, generate_spec, read_excel_rows, spec_levels
+from e2e.utils import settings
+from e2e.utils.api import ApiClient, ApiError
+from e2e.utils.benchmark import percentile
+from e2e.utils.location_tree import LocationSnapshot
+from e2e.utils.run_history import DEFAULT_DB_PATH, git_revision, record_benchmark
+from e2e.utils.stub_server import StubServer
+
+SUITE = 'location-reorganize'
+# 부모를 바꾸지 않음 (Move.parent 기본값)
+KEEP = '__keep__'
+# Excel 부모 칸에서 최상위를 뜻하는 값
+ROOT_MARKERS = ('-', '(최상위)')
+
+
+@dataclass
+class Move:
+    """
+    요청 하나 (이름 또는 id로 지정)
+
+    Attributes:
+        node: 옮기거나 순서를 바꿀 노드
+        parent: 새 부모 (KEEP이면 유지, None이면 최상위)
+        order: 새 표시 순서 (None이면 유지, 부모만 바뀌면 새 형제 중 마지막)
+    """
+    node: str | int
+    parent: str | int | None = KEEP
+    order: int | None = None
+
+
+@dataclass
+class Update:
+    """
+    실제로 보낼 PATCH 하나
+
+    Attributes:
+        index: 스냅샷 위치
+        id: 서버 id
+        name: 노드 이름
+        changes: PATCH 본문 (parentId/order 중 바뀌는 것만)
+        round: 적용 라운드 (순서만 바뀌면 0)
+    """
+    index: int
+    id: object
+    name: str
+    changes: dict
+    round: int = 0
+
+    @property
+    def kind(self) -> str:
+        return 'move' if 'parentId' in self.changes else 'order'
+
+
+@dataclass
+class Plan:
+    """
+    스냅샷 대비 최소 변경 계획
+
+    Attributes:
+        snapshot: 계획 기준 스냅샷
+        parents: 노드별 최종 부모 위치 (-1은 최상위)
+        orders: 노드별 최종 표시 순서
+        updates: 보낼 PATCH
+        requested: 요청 노드 위치
+        unchanged: 이미 요청 상태라 제외한 요청 수
+    """
+    snapshot: LocationSnapshot
+    parents: list[int]
+    orders: list
+    updates: list[Update] = field(default_factory=list)
+    requested: list[int] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def rounds(self) -> list[list[Update]]:
+        grouped: dict[int, list[Update]] = {}
+        for update in self.updates:
+            grouped.setdefault(update.round, []).append(update)
+        return [grouped[r] for r in sorted(grouped)]
+
+    def sibling_groups(self) -> set[int]:
+        """
+        순서를 다시 확인해야 하는 부모 위치 (이전/새 부모 모두)
+        """
+        groups = set()
+        for update in self.updates:
+            groups.add(self.snapshot.parents[update.index])
+            groups.add(self.parents[update.index])
+        return groups
+
+
+@dataclass
+class ApplyResult:
+    """
+    적용 결과
+
+    Attributes:
+        latencies: 종류('order', 'move')별 요청 시간(초)
+        errors: (노드 이름, 실패 사유)
+        rounds: 라운드별 요청 수
+        seconds: 전체 소요 시간
+    """
+    latencies: dict[str, list[float]] = field(default_factory=lambda: {'order': [], 'move': []})
+    errors: list[tuple[str, str]] = field(default_factory=list)
+    rounds: list[int] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def applied(self) -> int:
+        return sum(len(v) for v in self.latencies.values())
+
+    @property
+    def per_second(self) -> float:
+        return self.applied / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class Verification:
+    """
+    최종 트리 확인 결과
+
+    Attributes:
+        mismatched: (노드 이름, 항목, 기대값, 실제값)
+        misordered: 형제 순서가 다른 부모 이름 ('(최상위)' 포함)
+        seconds: 조회+비교 시간
+    """
+    mismatched: list[tuple] = field(default_factory=list)
+    misordered: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not (self.mismatched or self.misordered)
+
+    def summary(self, limit: int = 5) -> str:
+        if self.ok:
+            return f"일치 ({self.seconds * 1000:.0f}ms)"
+        return (f"mismatched={len(self.mismatched)} {self.mismatched[:limit]}, "
+                f"misordered={len(self.misordered)} {self.misordered[:limit]} ({self.seconds * 1000:.0f}ms)")
+
+
+# ============================================================================
+# 변경 목록
+# ============================================================================
+
+def load_changes(path: str) -> list[Move]:
+    """
+    JSON/Excel 변경 파일 읽기
+    """
+    if Path(path).suffix.lower() in ('.xlsx', '.xlsm'):
+        moves = []
+        for row in read_excel_rows(path):
+            parent = row.get('parent', KEEP)
+            moves.append(Move(row['name'], None if parent in ROOT_MARKERS else parent, row.get('order')))
+        return moves
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    rows = data.get('changes', []) if isinstance(data, dict) else data
+    return [Move(row['node'], row.get('parent', KEEP), row.get('order')) for row in rows]
+
+
+def reverse_siblings(snapshot: LocationSnapshot, parent: str | int | None) -> list[Move]:
+    """
+    부모(None이면 최상위)의 자식 표시 순서를 뒤집는 요청 목록 (1부터 다시 번호)
+    """
+    children = snapshot.roots() if parent is None else snapshot.children[snapshot.resolve(parent)]
+    ordered = sorted(children, key=lambda i: _order_key(snapshot.orders[i], snapshot.names[i]))
+    return [Move(snapshot.ids[i], KEEP, n) for n, i in enumerate(reversed(ordered), 1)]
+
+
+def _order_key(order, name: str) -> tuple:
+    return (order is None, order if order is not None else 0, name)
+
+
+# ============================================================================
+# 계획
+# ============================================================================
+
+def plan_moves(snapshot: LocationSnapshot, moves: list[Move]) -> Plan:
+    """
+    요청을 스냅샷에 적용한 최종 트리를 만들고 바뀌는 노드만 Update로
+
+    Raises:
+        ValueError: 찾을 수 없는 노드, 같은 노드 중복 요청, 자기 하위로 이동(순환)
+    """
+    parents, orders = list(snapshot.parents), list(snapshot.orders)
+    plan = Plan(snapshot, parents, orders)
+    seen, explicit_order = set(), set()
+    for move in moves:
+        i = snapshot.resolve(move.node)
+        if i in seen:
+            raise ValueError(f"같은 장소를 두 번 요청했습니다: {snapshot.names[i]}")
+        seen.add(i)
+        plan.requested.append(i)
+        if move.parent != KEEP:
+            parents[i] = -1 if move.parent is None else snapshot.resolve(move.parent)
+        if move.order is not None:
+            orders[i] = int(move.order)
+            explicit_order.add(i)
+
+    # 부모만 바뀌고 순서를 지정하지 않은 노드는 새 형제 중 마지막
+    appended = [i for i in plan.requested if parents[i] != snapshot.parents[i] and i not in explicit_order]
+    if appended:
+        skip, last = set(appended), {}
+        for j, parent in enumerate(parents):
+            if j not in skip:
+                last[parent] = max(last.get(parent, 0), orders[j] or 0)
+        for i in appended:
+            last[parents[i]] = orders[i] = last.get(parents[i], 0) + 1
+
+    moved = {i for i in plan.requested if parents[i] != snapshot.parents[i]}
+    for i in moved:
+        ancestor, steps = parents[i], 0
+        while ancestor >= 0:
+            if ancestor == i or steps > len(parents):
+                raise ValueError(f"자기 자신이나 하위 장소 아래로 옮길 수 없습니다: {snapshot.names[i]}")
+            ancestor, steps = parents[ancestor], steps + 1
+
+    for i in plan.requested:
+        changes = {}
+        if i in moved:
+            changes['parentId'] = snapshot.ids[parents[i]] if parents[i] >= 0 else None
+        if orders[i] != snapshot.orders[i] or i in moved:
+            changes['order'] = orders[i]
+        if not changes:
+            plan.unchanged += 1
+            continue
+        # 라운드 = 새 조상 중 이번 요청으로 옮겨지는 노드 수
+        rank, ancestor = 0, parents[i]
+        if i in moved:
+            while ancestor >= 0:
+                rank += ancestor in moved
+                ancestor = parents[ancestor]
+        plan.updates.append(Update(i, snapshot.ids[i], snapshot.names[i], changes, rank))
+    return plan
+
+
+# ============================================================================
+# 적용/검증
+# ============================================================================
+
+def apply_plan(plan: Plan, base_url: str | None = None, workers: int = 8) -> ApplyResult:
+    """
+    라운드마다 병렬로 PATCH (라운드 사이에서만 기다림)
+    """
+    result = ApplyResult()
+    local = threading.local()
+    lock = threading.Lock()
+
+    def send(update: Update):
+        # ApiClient는 스레드 간 공유하지 않음
+        if not hasattr(local, 'client'):
+            local.client = ApiClient(base_url).login()
+        start = time.perf_counter()
+        try:
+            local.client.update_location(update.id, update.changes)
+        except ApiError as e:
+            with lock:
+                result.errors.append((update.name, str(e)))
+            return
+        with lock:
+            result.latencies[update.kind].append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for updates in plan.rounds:
+            result.rounds.append(len(updates))
+            list(pool.map(send, updates))
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def verify_plan(client: ApiClient, plan: Plan) -> Verification:
+    """
+    장소 목록 한 번 조회로 요청 노드의 부모/순서와 영향받은 형제 그룹의 순서 확인
+    """
+    start = time.perf_counter()
+    snapshot, actual = plan.snapshot, LocationSnapshot.from_api(client)
+    verification = Verification()
+
+    def actual_index(i: int) -> int | None:
+        return actual.index.get(snapshot.ids[i])
+
+    for i in plan.requested:
+        j = actual_index(i)
+        if j is None:
+            verification.mismatched.append((snapshot.names[i], 'exists', True, False))
+            continue
+        want_parent = snapshot.ids[plan.parents[i]] if plan.parents[i] >= 0 else None
+        got_parent = actual.ids[actual.parents[j]] if actual.parents[j] >= 0 else None
+        if want_parent != got_parent:
+            verification.mismatched.append((snapshot.names[i], 'parent', want_parent, got_parent))
+        if actual.orders[j] is not None and actual.orders[j] != plan.orders[i]:
+            verification.mismatched.append((snapshot.names[i], 'order', plan.orders[i], actual.orders[j]))
+
+    for group in plan.sibling_groups():
+        expected = sorted((i for i, p in enumerate(plan.parents) if p == group),
+                          key=lambda i: _order_key(plan.orders[i], snapshot.names[i]))
+        parent_j = actual_index(group) if group >= 0 else -1
+        got = actual.roots() if parent_j == -1 else actual.children[parent_j] if parent_j is not None else []
+        got = sorted(got, key=lambda j: _order_key(actual.orders[j], actual.names[j]))
+        if [snapshot.ids[i] for i in expected] != [actual.ids[j] for j in got]:
+            verification.misordered.append(snapshot.names[group] if group >= 0 else '(최상위)')
+
+    verification.seconds = time.perf_counter() - start
+    return verification
+
+
+def reorganize(moves: list[Move] | None = None, base_url: str | None = None, workers: int = 8,
+               reverse: str | None = None, dry_run: bool = False) -> dict:
+    """
+    스냅샷 -> 계획 -> 적용 -> 검증
+
+    Returns:
+        dict: {'plan': Plan, 'result': ApplyResult | None, 'verification': Verification | None}
+    """
+    client = ApiClient(base_url).login()
+    snapshot = LocationSnapshot.from_api(client)
+    moves = list(moves or [])
+    if reverse is not None:
+        moves += reverse_siblings(snapshot, None if reverse in ROOT_MARKERS else reverse)
+    plan = plan_moves(snapshot, moves)
+    if dry_run or not plan.updates:
+        return {'plan': plan, 'result': None, 'verification': None}
+    result = apply_plan(plan, base_url, workers)
+    return {'plan': plan, 'result': result, 'verification': verify_plan(client, plan)}
+
+
+def format_reorganize(outcome: dict) -> list[str]:
+    plan, result = outcome['plan'], outcome['result']
+    kinds = {kind: sum(u.kind == kind for u in plan.updates) for kind in ('order', 'move')}
+    lines = [f"  requested: {len(plan.requested)}, updates: {len(plan.updates)} "
+             f"(order {kinds['order']}, move {kinds['move']}), unchanged: {plan.unchanged}, "
+             f"rounds: {len(plan.rounds)}"]
+    if result is None:
+        return lines
+    lines.append(f"  time: {result.seconds:.2f}s, {result.per_second:.1f} updates/s, "
+                 f"rounds {' / '.join(str(n) for n in result.rounds)}")
+    for kind, values in result.latencies.items():
+        if values:
+            lines.append(f"  {kind}: n={len(values)} p50={percentile(values, 50) * 1000:.1f}ms "
+                         f"p95={percentile(values, 95) * 1000:.1f}ms max={max(values) * 1000:.1f}ms")
+    if result.errors:
+        lines.append(f"  errors: {len(result.errors)} (예: {result.errors[:3]})")
+    lines.append(f"  verify: {outcome['verification'].summary()}")
+    return lines
+
+
+def record_reorganize(db_path: str, started_at: float, outcome: dict, target: str, workers: int):
+    result = outcome['result']
+    rows = []
+    for kind, values in result.latencies.items():
+        errors = sum(1 for u in outcome['plan'].updates if u.kind == kind) - len(values)
+        ops = len(values) + errors
+        if not ops:
+            continue
+        values = values or [0.0]
+        rows.append({
+            'flow': f"location-reorganize:{kind}", 'concurrency': workers, 'reps': 1, 'ops': ops,
+            'errors': errors, 'error_rate': errors / ops,
+            'throughput_per_min': ops / result.seconds * 60 if result.seconds else 0.0,
+            'p50': percentile(values, 50), 'p90': percentile(values, 90),
+            'p95': percentile(values, 95), 'p99': percentile(values, 99),
+        })
+    record_benchmark(db_path, SUITE, {
+        'started_at': started_at, 'target': target, 'driver': 'api', 'git_rev': git_revision(),
+    }, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='장소 일괄 재정렬/이동')
+    parser.add_argument('--changes', help='변경 목록 (JSON/Excel)')
+    parser.add_argument('--reverse', help="이 부모의 자식 순서를 뒤집음 ('-'는 최상위)")
+    parser.add_argument('--target', choices=['stub', 'server'], default='stub')
+    parser.add_argument('--generate', default='1,300,3', help='stub 대상일 때 미리 만들 트리 (레벨별 자식 수)')
+    parser.add_argument('--workers', type=int, default=8, help='동시 요청 수')
+    parser.add_argument('--dry-run', action='store_true', help='계획만 출력')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='실행 이력 SQLite 경로')
+    parser.add_argument('--no-record', action='store_true', help='이력 DB에 기록하지 않음')
+    args = parser.parse_args()
+    if not args.changes and args.reverse is None:
+        parser.error('--changes 또는 --reverse가 필요합니다.')
+
+    moves = load_changes(args.changes) if args.changes else []
+    started_at = time.time()
+    server = StubServer(latency_ms=2.0).start() if args.target == 'stub' else None
+    try:
+        if server is not None:
+            levels = spec_levels(generate_spec([int(v) for v in args.generate.split(',')], prefix='TREE_DEMO'))
+            build_via_api(levels, server.url, args.workers)
+            print(f"[INFO] stub 트리 생성: {sum(len(level) for level in levels)}개 (TREE_DEMO-...)")
+        outcome = reorganize(moves, server.url if server else None, args.workers, args.reverse, args.dry_run)
+    finally:
+        if server is not None:
+            server.stop()
+
+    target = 'stub' if server else settings.BASE_URL
+    print(f"[INFO] location reorganize: target={target}")
+    for line in format_reorganize(outcome):
+        print(line)
+    verification = outcome['verification']
+    if verification is None:
+        return
+    if verification.ok:
+        print("[OK] 요청한 부모/표시 순서와 일치")
+    else:
+        print(f"[WARNING] 결과 불일치: {verification.summary()}")
+    if not args.no_record:
+        record_reorganize(args.db, started_at, outcome, target, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+장소 하위 트리 일괄 삭제
+
+test_location_simple.py는 treeitem을 하나씩 골라 "삭제"를 누르고, 자식이 있는 장소는 지울 수 없으므로
+3단 트리도 자식 -> 부모 순서로 직접 지웁니다. 노드가 1,000개인 하위 트리를 같은 방식으로 지우면 수십 분이 걸립니다.
+
+루트(treeitem 이름 또는 id)를 받아 장소 목록 한 번 조회로 하위 트리를 구하고, 후위 순서의 노드를
+높이별 묶음(잎이 첫 묶음, 루트가 마지막)으로 나눠 묶음마다 병렬로 DELETE합니다.
+다음 묶음은 앞 묶음의 삭제 응답을 모두 받은 뒤에 시작하므로 자식이 남은 부모를 지우려다 거부되지 않습니다.
+
+    실패    404는 이미 없는 것으로 보고, 그 밖의 실패가 난 노드의 조상은 보내지 않고 건너뜀
+    검증    끝나면 장소 목록을 다시 읽어 하위 트리 id가 남아 있지 않은지 확인
+
+실행 예 (저장소 루트에서):
+    python -m e2e.access.location.subtree_delete --root 본사 --target server --dry-run
+    python -m e2e.access.location.subtree_delete --root 본사 --target server --workers 16
+    python -m e2e.access.location.subtree_delete --generate 1,10,10,10 --workers 16
+"""
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from e2e.access.location.tree_builder import build_via_api, generate_spec, spec_levels
+from e2e.utils import settings
+from e2e.utils.api import ApiClient, ApiError
+from e2e.utils.benchmark import percentile
+from e2e.utils.location_tree import LocationSnapshot, delete_by_height
+from e2e.utils.run_history import DEFAULT_DB_PATH, git_revision, record_benchmark
+from e2e.utils.stub_server import StubServer
+
+SUITE = 'location-subtree-delete'
+
+
+@dataclass
+class DeleteResult:
+    """
+    하위 트리 삭제 결과
+
+    Attributes:
+        root: 루트 이름
+        batches: 묶음별 노드 수 (잎부터)
+        deleted: 삭제한 노드 수
+        missing: 이미 없던 노드 수 (404)
+        failed: (노드 이름, 실패 사유)
+        skipped: 하위 노드 실패로 보내지 않은 조상 이름
+        latencies: 요청 시간(초)
+        seconds: 전체 소요 시간
+        remaining: 삭제 후 남은 하위 트리 노드 수 (검증 전에는 None)
+    """
+    root: str
+    batches: list[int] = field(default_factory=list)
+    deleted: int = 0
+    missing: int = 0
+    failed: list[tuple[str, str]] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    latencies: list[float] = field(default_factory=list)
+    seconds: float = 0.0
+    remaining: int | None = None
+
+    @property
+    def total(self) -> int:
+        return sum(self.batches)
+
+    @property
+    def per_second(self) -> float:
+        return self.deleted / self.seconds if self.seconds else 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not (self.failed or self.skipped) and not self.remaining
+
+    def summary(self) -> str:
+        text = (f"{self.root}: deleted={self.deleted}/{self.total}, missing={self.missing}, "
+                f"failed={len(self.failed)}, skipped={len(self.skipped)}, batches={len(self.batches)}, "
+                f"{self.seconds:.2f}s ({self.per_second:.0f}/s)")
+        if self.remaining is not None:
+            text += f", remaining={self.remaining}"
+        return text
+
+
+def delete_subtree(root: str | int, base_url: str | None = None, workers: int = 8,
+                   dry_run: bool = False, snapshot: LocationSnapshot | None = None) -> DeleteResult:
+    """
+    루트와 모든 하위 장소를 잎부터 높이별 묶음으로 병렬 삭제
+
+    Args:
+        root: 루트 장소 이름 또는 id
+        snapshot: 미리 읽은 스냅샷 (없으면 장소 목록 조회)
+
+    Raises:
+        ValueError: 루트를 찾을 수 없거나 이름이 중복됨
+    """
+    client = ApiClient(base_url).login()
+    snapshot = snapshot or LocationSnapshot.from_api(client)
+    root_index = snapshot.resolve(root)
+    batches = snapshot.height_batches(root_index)
+    result = DeleteResult(snapshot.names[root_index], [len(batch) for batch in batches])
+    if dry_run:
+        return result
+
+    local = threading.local()
+    lock = threading.Lock()
+    # 실패한 노드의 조상 (자식이 남아 있으므로 보내지 않음)
+    blocked: set[int] = set()
+
+    def delete(i: int):
+        # ApiClient는 스레드 간 공유하지 않음
+        if not hasattr(local, 'client'):
+            local.client = ApiClient(base_url).login()
+        start = time.perf_counter()
+        try:
+            local.client.delete_location(snapshot.ids[i])
+            outcome = 'deleted'
+        except ApiError as e:
+            outcome = 'missing' if e.status == 404 else str(e)
+        elapsed = time.perf_counter() - start
+        with lock:
+            result.latencies.append(elapsed)
+            if outcome == 'deleted':
+                result.deleted += 1
+            elif outcome == 'missing':
+                result.missing += 1
+            else:
+                result.failed.append((snapshot.names[i], outcome))
+                ancestor = snapshot.parents[i]
+                while ancestor >= 0 and ancestor not in blocked:
+                    blocked.add(ancestor)
+                    if ancestor == root_index:
+                        break
+                    ancestor = snapshot.parents[ancestor]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        delete_by_height(pool, batches, delete, blocked)
+    # 조상은 항상 실패한 노드보다 뒤 묶음이므로 blocked 노드는 보내지 않은 노드
+    result.skipped = [snapshot.names[i] for batch in batches for i in batch if i in blocked]
+    result.seconds = time.perf_counter() - start
+
+    remaining = LocationSnapshot.from_api(client).index
+    result.remaining = sum(1 for i in snapshot.descendants(root_index) if snapshot.ids[i] in remaining)
+    return result
+
+
+def format_delete(result: DeleteResult) -> list[str]:
+    lines = [f"  root: {result.root}, nodes: {result.total}, "
+             f"batches: {' / '.join(str(n) for n in result.batches)}"]
+    if not result.latencies:
+        return lines
+    lines.append(f"  time: {result.seconds:.2f}s, {result.per_second:.1f} deletes/s, "
+                 f"p50={percentile(result.latencies, 50) * 1000:.1f}ms "
+                 f"p95={percentile(result.latencies, 95) * 1000:.1f}ms "
+                 f"max={max(result.latencies) * 1000:.1f}ms")
+    lines.append(f"  deleted: {result.deleted}, missing: {result.missing}, remaining: {result.remaining}")
+    if result.failed:
+        lines.append(f"  failed: {len(result.failed)} (예: {result.failed[:3]}), skipped: {len(result.skipped)}")
+    return lines
+
+
+def record_delete(db_path: str, started_at: float, result: DeleteResult, target: str, workers: int):
+    ops = len(result.latencies)
+    if not ops:
+        return
+    errors = len(result.failed)
+    record_benchmark(db_path, SUITE, {
+        'started_at': started_at, 'target': target, 'driver': 'api', 'git_rev': git_revision(),
+    }, [{
+        'flow': f"location-subtree-delete@{result.total}", 'concurrency': workers, 'reps': 1, 'ops': ops,
+        'errors': errors, 'error_rate': errors / ops,
+        'throughput_per_min': ops / result.seconds * 60 if result.seconds else 0.0,
+        'p50': percentile(result.latencies, 50), 'p90': percentile(result.latencies, 90),
+        'p95': percentile(result.latencies, 95), 'p99': percentile(result.latencies, 99),
+    }])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='장소 하위 트리 일괄 삭제')
+    parser.add_argument('--root', help='삭제할 루트 장소 이름 또는 id (stub 대상이면 생성한 첫 루트)')
+    parser.add_argument('--target', choices=['stub', 'server'], default='stub')
+    parser.add_argument('--generate', default='1,10,10,10', help='stub 대상일 때 미리 만들 트리 (레벨별 자식 수)')
+    parser.add_argument('--workers', type=int, default=8, help='동시 요청 수')
+    parser.add_argument('--dry-run', action='store_true', help='묶음 계획만 출력')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='실행 이력 SQLite 경로')
+    parser.add_argument('--no-record', action='store_true', help='이력 DB에 기록하지 않음')
+    args = parser.parse_args()
+    if args.target == 'server' and not args.root:
+        parser.error('server 대상에는 --root가 필요합니다.')
+
+    started_at = time.time()
+    server = StubServer(latency_ms=2.0).start() if args.target == 'stub' else None
+    try:
+        root = args.root
+        if server is not None:
+            levels = spec_levels(generate_spec([int(v) for v in args.generate.split(',')], prefix='TREE_DEMO'))
+            build_via_api(levels, server.url, args.workers)
+            print(f"[INFO] stub 트리 생성: {sum(len(level) for level in levels)}개 (TREE_DEMO-...)")
+            root = root or levels[0][0]['name']
+        result = delete_subtree(root, server.url if server else None, args.workers, args.dry_run)
+    finally:
+        if server is not None:
+            server.stop()
+
+    target = 'stub' if server else settings.BASE_URL
+    print(f"[INFO] location subtree delete: target={target}")
+    for line in format_delete(result):
+        print(line)
+    if args.dry_run:
+        return
+    if result.ok:
+        print(f"[OK] 하위 트리 삭제 완료: {result.summary()}")
+    else:
+        print(f"[WARNING] 삭제되지 않은 노드가 있습니다: {result.summary()}")
+    if not args.no_record:
+        record_delete(args.db, started_at, result, target, args.workers)
+
+
+if __name__ == "__main__":
+    main()
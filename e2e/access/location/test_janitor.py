@@ -0,0 +1,101 @@
+"""
+오래된 테스트 데이터 정리 도구(e2e/utils/janitor.py) 테스트
+
+로컬 대역 API 서버를 사용하므로 서버/브라우저 없이 실행됩니다.
+"""
+import time
+from datetime import datetime
+
+import pytest
+
+from e2e.utils.api import ApiClient, items_of
+from e2e.utils.janitor import list_all_employees, location_created_at, parse_age, purge
+from e2e.utils.stub_server import StubServer, api_record
+
+
+@pytest.mark.location
+class TestJanitor:
+    """
+    이름 규칙/나이 판별과 하위 장소 포함 동시 삭제
+    """
+
+    def test_name_rules(self):
+        """
+        테스트가 만드는 이름만 대상으로 인식하는지 확인
+        """
+        assert location_created_at('1단_원본_1700000000') == 1700000000
+        assert location_created_at('다중삭제_3_1700000000') == 1700000000
+        assert location_created_at('TREE_1700000000') == 1700000000
+        assert location_created_at('RENDER_deep_1000_1700000000') == 1700000000
+        assert location_created_at('본사_1700000000') is None
+        assert location_created_at('1단_원본') is None
+        assert parse_age('90m') == 5400 and parse_age('2d') == 172800
+
+    def test_purge_old_pattern_data(self):
+        """
+        오래된 테스트 데이터만 하위 장소까지 지우고 최근 데이터/실제 데이터는 남기는지 확인
+        """
+        old, fresh = int(time.time()) - 3 * 86400, int(time.time())
+        old_stamp = datetime.fromtimestamp(old).strftime("%y%m%d-%H%M")
+        fresh_stamp = datetime.fromtimestamp(fresh).strftime("%y%m%d-%H%M")
+
+        with StubServer() as server:
+            client = ApiClient(server.url).login()
+            parent = client.create_location(f'2단_부모_{old}')
+            child = client.create_location(f'2단_원본_{old}', parent_id=parent['id'])
+            client.create_location('1층', parent_id=child['id'])
+            tree = client.create_location(f'TREE_{old}')
+            for i in range(20):
+                client.create_location(f'TREE_{old}-{i + 1}', parent_id=tree['id'])
+            client.create_location(f'다이얼로그테스트_{fresh}')
+            client.create_location('본사')
+            server.store.bulk_load([
+                api_record({'id': '1000001', 'name': f'1000001-{old_stamp}'}),
+                api_record({'id': '1000002', 'name': f'1000002-{fresh_stamp}'}),
+                api_record({'id': '1000003', 'name': f'9999999-{old_stamp}'}),  # 사번 불일치
+                api_record({'id': '1000004', 'name': '홍길동'}),
+            ])
+
+            preview = purge(server.url, older_than=86400, dry_run=True, progress=False)
+            assert sorted(c.name for c in preview.candidates) == sorted(
+                [f'1000001-{old_stamp}', f'2단_부모_{old}', f'TREE_{old}'])
+            assert preview.total == 1 + 3 + 21
+            assert len(server.locations.all()) == 26, "dry-run은 삭제하지 않아야 합니다."
+
+            report = purge(server.url, older_than=86400, workers=8, rate=500, progress=False)
+            print(f"\n[INFO] janitor: {report.summary()}")
+
+            assert not report.failed, f"정리 실패: {report.failed}"
+            assert report.deleted == 25
+            assert sorted(r['name'] for r in server.locations.all()) == sorted(
+                [f'다이얼로그테스트_{fresh}', '본사'])
+            remaining = {r['employeeId'] for r in items_of(client.list_employees(size=100))}
+            assert remaining == {'1000002', '1000003', '1000004'}
+
+    def test_list_all_employees_with_capped_page(self):
+        """
+        서버가 size를 상한으로 줄여도(짧은 페이지) 목록 끝까지 조회하는지 확인
+        """
+        with StubServer(max_page_size=3) as server:
+            server.store.bulk_load([api_record({'id': f'{1000001 + i}', 'name': f'임직원{i}'}) for i in range(10)])
+            client = ApiClient(server.url).login()
+
+            records = list_all_employees(client, page_size=500)
+            assert sorted(r['employeeId'] for r in records) == [f'{1000001 + i}' for i in range(10)]
+            assert len(list_all_employees(client, page_size=5)) == 10
+
+    def test_purge_employees_only(self):
+        """
+        kinds=('employee',)면 장소를 조회하지 않고 임직원만 지우는지 확인
+        """
+        old_stamp = datetime.fromtimestamp(int(time.time()) - 3 * 86400).strftime("%y%m%d-%H%M")
+        with StubServer() as server:
+            client = ApiClient(server.url).login()
+            client.create_location(f'TREE_{int(time.time()) - 3 * 86400}')
+            server.store.bulk_load([api_record({'id': '1000001', 'name': f'1000001-{old_stamp}'})])
+
+            report = purge(server.url, older_than=86400, kinds=('employee',), rate=0, progress=False)
+
+            assert not report.failed and report.deleted == 1
+            assert not items_of(client.list_employees())
+            assert len(server.locations.all()) == 1, "장소는 대상이 아니므로 남아야 합니다."
@@ -0,0 +1,62 @@
+"""
+장소 트리 렌더링 규모 벤치마크 테스트
+
+측정은 브라우저와 실제 서버가 필요하므로 RENDER_TARGET=server일 때만 실행합니다.
+
+환경 변수:
+    RENDER_TARGET   server일 때만 측정 (기본 건너뜀)
+    RENDER_SIZES    트리 노드 수 (기본 100,1000)
+    RENDER_SHAPES   wide, deep (기본 wide,deep)
+    RENDER_REPS     렌더/펼치기/선택 반복 횟수 (기본 3)
+"""
+import os
+import time
+
+import pytest
+
+from e2e.access.location.render_benchmark import (
+    SHAPES, format_render, record_render, run_render_scaling, seed_spec, shape_fanouts,
+)
+from e2e.access.location.tree_builder import spec_levels
+
+RENDER_TARGET = os.getenv('RENDER_TARGET', '')
+RENDER_SIZES = [int(v) for v in os.getenv('RENDER_SIZES', '100,1000').split(',') if v.strip()]
+RENDER_SHAPES = [s for s in os.getenv('RENDER_SHAPES', ','.join(SHAPES)).split(',') if s.strip()]
+RENDER_REPS = int(os.getenv('RENDER_REPS', '3'))
+
+
+@pytest.mark.location
+@pytest.mark.benchmark
+class TestLocationRenderBenchmark:
+    """
+    트리 크기/모양별 첫 렌더, 전체 펼치기, 깊은 항목 선택, 추가/삭제 후 재렌더 시간
+    """
+
+    @pytest.mark.parametrize("shape", SHAPES)
+    def test_seed_shapes(self, shape):
+        """
+        모양별 시드 트리가 목표 노드 수 이상이고 wide는 얕고 deep은 깊은지 확인
+        """
+        for size in (100, 1000, 5000):
+            levels = spec_levels(seed_spec(shape, size, f'SEED_{shape}'))
+            assert sum(len(level) for level in levels) >= size
+            assert len(levels) == (len(shape_fanouts(shape, size)) + 1)
+        assert len(spec_levels(seed_spec('wide', 5000, 'W'))) < len(spec_levels(seed_spec('deep', 5000, 'D')))
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(RENDER_TARGET != 'server', reason="RENDER_TARGET=server에서만 측정 (브라우저/실제 서버 필요)")
+    def test_render_scaling(self, pytestconfig):
+        """
+        크기별 구간 시간/long task/레이아웃 수 측정 후 실행 이력 DB에 기록
+        """
+        started_at = time.time()
+        result = run_render_scaling(RENDER_SIZES, RENDER_SHAPES, RENDER_REPS)
+
+        print(f"\n[INFO] location render scaling: target={result['target']}")
+        for line in format_render(result):
+            print(line)
+        if not pytestconfig.getoption('no_run_history'):
+            record_render(pytestconfig.getoption('run_history_db'), started_at, result)
+
+        measured = {(r['shape'], r['size']) for r in result['rows'] if r['phase'] == 'first_render'}
+        assert measured == {(s, n) for s in RENDER_SHAPES for n in RENDER_SIZES}, "모든 크기/모양을 측정해야 합니다."
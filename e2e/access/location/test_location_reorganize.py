@@ -0,0 +1,70 @@
+"""
+장소 일괄 재정렬/이동(reorganize.py) 테스트
+
+로컬 대역 API 서버를 사용하므로 서버/브라우저 없이 실행됩니다.
+대역 서버는 자기 하위로의 이동을 409로 거부하므로, 이동 라운드 순서가 틀리면 실패로 드러납니다.
+"""
+import pytest
+
+from e2e.access.location.reorganize import (
+    KEEP, Move, apply_plan, format_reorganize, plan_moves, reorganize, verify_plan,
+)
+from e2e.access.location.tree_builder import build_via_api, generate_spec, spec_levels
+from e2e.utils.api import ApiClient
+from e2e.utils.location_tree import LocationSnapshot
+from e2e.utils.stub_server import StubServer
+
+
+@pytest.mark.location
+class TestLocationReorganize:
+    """
+    최소 변경 계획, 라운드별 병렬 적용, 최종 순서 검증
+    """
+
+    def test_reverse_and_move_subtrees(self):
+        """
+        형제 300개 순서 뒤집기 + 하위 트리 이동 (부모를 원래 자식 아래로 옮기는 경우 포함)
+        """
+        with StubServer(latency_ms=1) as server:
+            levels = spec_levels(generate_spec([2, 300, 2], prefix='RE'))
+            build_via_api(levels, server.url, workers=16)
+
+            moves = [
+                Move('RE-2-5', None, 3),           # RE-2-5를 최상위로
+                Move('RE-2', 'RE-2-5-1'),          # 원래 부모였던 RE-2를 RE-2-5 하위 트리 아래로
+                Move('RE-2-7', 'RE-2-3', 1),       # 옮겨지는 하위 트리 아래로 이동 (세 번째 라운드)
+                Move('RE-2-8', KEEP, 8),           # 이미 같은 값 -> 제외
+            ]
+            outcome = reorganize(moves, server.url, workers=16, reverse='RE-1')
+            for line in format_reorganize(outcome):
+                print(line)
+
+            plan, result, verification = outcome['plan'], outcome['result'], outcome['verification']
+            assert not result.errors, result.errors
+            assert verification.ok, verification.summary()
+            assert [len(r) for r in plan.rounds] == [301, 1, 1]
+            assert plan.unchanged == 1
+            actual = LocationSnapshot.from_api(ApiClient(server.url).login())
+            assert actual.path(actual.find('RE-2-7')[0]) == ('RE-2-5', 'RE-2-5-1', 'RE-2', 'RE-2-3', 'RE-2-7')
+            first = sorted(actual.children[actual.find('RE-1')[0]], key=lambda j: actual.orders[j])
+            assert actual.names[first[0]] == 'RE-1-300'
+
+    def test_plan_is_minimal_and_rejects_cycles(self):
+        """
+        바뀌는 노드만 PATCH하고, 자손 아래로 옮기기와 없는 장소 이동은 거부하는지 확인
+        """
+        with StubServer() as server:
+            build_via_api(spec_levels(generate_spec([1, 3, 2], prefix='MIN')), server.url)
+            client = ApiClient(server.url).login()
+            snapshot = LocationSnapshot.from_api(client)
+
+            plan = plan_moves(snapshot, [Move('MIN-1-1', KEEP, 1), Move('MIN-1-2', KEEP, 3),
+                                         Move('MIN-1-3', KEEP, 2)])
+            assert plan.unchanged == 1 and [u.name for u in plan.updates] == ['MIN-1-2', 'MIN-1-3']
+            apply_plan(plan, server.url)
+            assert verify_plan(client, plan).ok
+
+            with pytest.raises(ValueError):
+                plan_moves(snapshot, [Move('MIN-1', 'MIN-1-2-1')])
+            with pytest.raises(ValueError):
+                plan_moves(snapshot, [Move('없는장소', None)])
@@ -5,10 +5,11 @@
 
 테스트 구조:
 - 1단 장소: 추가 -> 수정 -> 삭제
-- 2단 장소: 추가 -> 수정 -> 삭제
-- 3단 장소: 추가 -> 수정 -> 삭제
+- 2단 장소: 추가 -> 수정 -> 삭제 (1단 부모는 API로 준비)
+- 3단 장소: 추가 -> 수정 -> 삭제 (1단/2단 부모는 API로 준비)
 
 사전조건: conftest.py의 authenticated_context fixture를 통해 자동으로 로그인됨
+부모 장소: conftest.py의 location_parents fixture가 모듈당 한 번 API로 만들고 모듈 종료 시 삭제
 """
 import pytest
 from playwright.sync_api import Page, expect
@@ -23,7 +24,7 @@ class TestLocationSimple:
     1단, 2단, 3단 장소를 순차적으로 추가/수정/삭제
     """
 
-    def test_1_level_location_add_edit_delete(self, navigate_to_location):
+    def test_1_level_location_add_edit_delete(self, navigate_to_location, step_timer, resource_registry):
         """
         1단 장소: 추가 -> 수정 -> 삭제
         """
@@ -44,6 +45,7 @@ class TestLocationSimple:
         edited_name = f'1단_수정_{timestamp}'
 
         # === 1단 장소 추가 ===
+        step_timer.checkpoint('location: 1단 장소 추가')
         page.get_by_role("button", name="장소 추가").click()
         page.wait_for_timeout(1000)
 
@@ -57,12 +59,14 @@ class TestLocationSimple:
 
         page.wait_for_timeout(3000)
         page.wait_for_load_state('networkidle', timeout=10000)
+        resource_registry.add('location', original_name)
 
         # 추가 확인
         treeitem = page.get_by_role("treeitem", name=original_name)
         expect(treeitem).to_be_visible(timeout=5000)
 
         # === 1단 장소 수정 ===
+        step_timer.checkpoint('location: 1단 장소 수정')
         treeitem.click()
         page.wait_for_timeout(1000)
 
@@ -82,11 +86,13 @@ class TestLocationSimple:
 
             page.wait_for_timeout(3000)
             page.wait_for_load_state('networkidle', timeout=10000)
+            resource_registry.rename('location', original_name, edited_name)
 
             # 수정 확인
             expect(page.get_by_role("treeitem", name=edited_name)).to_be_visible(timeout=5000)
 
         # === 1단 장소 삭제 ===
+        step_timer.checkpoint('location: 1단 장소 삭제')
         treeitem_updated = page.get_by_role("treeitem", name=edited_name)
         treeitem_updated.click()
         page.wait_for_timeout(1000)
@@ -101,13 +107,15 @@ class TestLocationSimple:
 
             # 삭제 확인
             expect(page.get_by_role("treeitem", name=edited_name)).not_to_be_visible()
+            resource_registry.discard('location', edited_name)
 
 
-    def test_2_level_location_add_edit_delete(self, navigate_to_location):
+    def test_2_level_location_add_edit_delete(self, navigate_to_location, step_timer, resource_registry,
+                                              location_parents):
         """
-        2단 장소: 추가 -> 수정 -> 삭제 -> 부모 삭제
+        2단 장소: 추가 -> 수정 -> 삭제
 
-        사전조건: 1단 부모 장소가 필요함
+        사전조건: 1단 부모 장소는 location_parents 픽스처가 API로 생성/삭제
         """
         page = navigate_to_location()
 
@@ -121,25 +129,10 @@ class TestLocationSimple:
         page.on("dialog", handle_dialog)
 
         timestamp = int(time.time())
-        parent_name = f'2단_부모_{timestamp}'
+        parent_name = location_parents[0]['name']
         original_name = f'2단_원본_{timestamp}'
         edited_name = f'2단_수정_{timestamp}'
 
-        # === 1단 부모 장소 추가 ===
-        page.get_by_role("button", name="장소 추가").click()
-        page.wait_for_timeout(1000)
-
-        page.get_by_role("textbox", name="장소 이름").fill(parent_name)
-        page.get_by_label("", exact=True).click()
-        page.wait_for_timeout(500)
-        page.get_by_role("option", name="사무공간").click()
-        page.get_by_role("spinbutton", name="표시 순서").fill("10")
-
-        page.get_by_role("button", name="저장").click()
-
-        page.wait_for_timeout(3000)
-        page.wait_for_load_state('networkidle', timeout=10000)
-
         # 부모 장소 선택
         parent_treeitem = page.get_by_role("treeitem", name=parent_name)
         expect(parent_treeitem).to_be_visible(timeout=5000)
@@ -147,6 +140,7 @@ class TestLocationSimple:
         page.wait_for_timeout(1000)
 
         # === 2단 자식 장소 추가 ===
+        step_timer.checkpoint('location: 2단 자식 장소 추가')
         page.get_by_role("button", name="장소 추가").click()
         page.wait_for_timeout(1000)
 
@@ -160,12 +154,14 @@ class TestLocationSimple:
 
         page.wait_for_timeout(3000)
         page.wait_for_load_state('networkidle', timeout=10000)
+        resource_registry.add('location', original_name, parent=parent_name)
 
         # 추가 확인
         child_treeitem = page.get_by_role("treeitem", name=original_name)
         expect(child_treeitem).to_be_visible(timeout=5000)
 
         # === 2단 장소 수정 ===
+        step_timer.checkpoint('location: 2단 장소 수정')
         child_treeitem.click()
         page.wait_for_timeout(1000)
 
@@ -183,11 +179,13 @@ class TestLocationSimple:
 
             page.wait_for_timeout(3000)
             page.wait_for_load_state('networkidle', timeout=10000)
+            resource_registry.rename('location', original_name, edited_name)
 
             # 수정 확인
             expect(page.get_by_role("treeitem", name=edited_name)).to_be_visible(timeout=5000)
 
         # === 2단 장소 삭제 ===
+        step_timer.checkpoint('location: 2단 장소 삭제')
         child_treeitem_updated = page.get_by_role("treeitem", name=edited_name)
         child_treeitem_updated.click()
         page.wait_for_timeout(1000)
@@ -202,30 +200,15 @@ class TestLocationSimple:
 
             # 삭제 확인
             expect(page.get_by_role("treeitem", name=edited_name)).not_to_be_visible()
-
-        # === 1단 부모 장소 삭제 ===
-        parent_treeitem = page.get_by_role("treeitem", name=parent_name)
-        if parent_treeitem.is_visible():
-            parent_treeitem.click()
-            page.wait_for_timeout(1000)
-
-            delete_button = page.get_by_role("button", name="삭제")
-            if delete_button.is_visible():
-                delete_button.click()
-                page.wait_for_timeout(500)
-
-                page.wait_for_timeout(3000)
-                page.wait_for_load_state('networkidle', timeout=10000)
-
-                # 부모 삭제 확인
-                expect(page.get_by_role("treeitem", name=parent_name)).not_to_be_visible()
+            resource_registry.discard('location', edited_name)
 
 
-    def test_3_level_location_add_edit_delete(self, navigate_to_location):
+    def test_3_level_location_add_edit_delete(self, navigate_to_location, step_timer, resource_registry,
+                                              location_parents):
         """
-        3단 장소: 추가 -> 수정 -> 삭제 -> 2단 부모 삭제 -> 1단 부모 삭제
+        3단 장소: 추가 -> 수정 -> 삭제
 
-        사전조건: 1단 부모, 2단 부모 장소가 필요함
+        사전조건: 1단/2단 부모 장소는 location_parents 픽스처가 API로 생성/삭제
         """
         page = navigate_to_location()
 
@@ -239,47 +222,17 @@ class TestLocationSimple:
         page.on("dialog", handle_dialog)
 
         timestamp = int(time.time())
-        parent1_name = f'3단_부모1_{timestamp}'
-        parent2_name = f'3단_부모2_{timestamp}'
+        parent1_name = location_parents[0]['name']
+        parent2_name = location_parents[1]['name']
         original_name = f'3단_원본_{timestamp}'
         edited_name = f'3단_수정_{timestamp}'
 
-        # === 1단 부모 장소 추가 ===
-        page.get_by_role("button", name="장소 추가").click()
-        page.wait_for_timeout(1000)
-
-        page.get_by_role("textbox", name="장소 이름").fill(parent1_name)
-        page.get_by_label("", exact=True).click()
-        page.wait_for_timeout(500)
-        page.get_by_role("option", name="사무공간").click()
-        page.get_by_role("spinbutton", name="표시 순서").fill("20")
-
-        page.get_by_role("button", name="저장").click()
-
-        page.wait_for_timeout(3000)
-        page.wait_for_load_state('networkidle', timeout=10000)
-
-        # 1단 부모 선택
+        # 1단 부모 선택 (2단 부모가 보이도록 펼침)
         parent1_treeitem = page.get_by_role("treeitem", name=parent1_name)
         expect(parent1_treeitem).to_be_visible(timeout=5000)
         parent1_treeitem.click()
         page.wait_for_timeout(1000)
 
-        # === 2단 부모 장소 추가 ===
-        page.get_by_role("button", name="장소 추가").click()
-        page.wait_for_timeout(1000)
-
-        page.get_by_role("textbox", name="장소 이름").fill(parent2_name)
-        page.get_by_label("", exact=True).click()
-        page.wait_for_timeout(500)
-        page.get_by_role("option", name="사무공간").click()
-        page.get_by_role("spinbutton", name="표시 순서").fill("1")
-
-        page.get_by_role("button", name="저장").click()
-
-        page.wait_for_timeout(3000)
-        page.wait_for_load_state('networkidle', timeout=10000)
-
         # 2단 부모 선택
         parent2_treeitem = page.get_by_role("treeitem", name=parent2_name)
         expect(parent2_treeitem).to_be_visible(timeout=5000)
@@ -287,6 +240,7 @@ class TestLocationSimple:
         page.wait_for_timeout(1000)
 
         # === 3단 자식 장소 추가 ===
+        step_timer.checkpoint('location: 3단 자식 장소 추가')
         page.get_by_role("button", name="장소 추가").click()
         page.wait_for_timeout(1000)
 
@@ -300,12 +254,14 @@ class TestLocationSimple:
 
         page.wait_for_timeout(3000)
         page.wait_for_load_state('networkidle', timeout=10000)
+        resource_registry.add('location', original_name, parent=parent2_name)
 
         # 추가 확인
         child_treeitem = page.get_by_role("treeitem", name=original_name)
         expect(child_treeitem).to_be_visible(timeout=5000)
 
         # === 3단 장소 수정 ===
+        step_timer.checkpoint('location: 3단 장소 수정')
         child_treeitem.click()
         page.wait_for_timeout(1000)
 
@@ -323,11 +279,13 @@ class TestLocationSimple:
 
             page.wait_for_timeout(3000)
             page.wait_for_load_state('networkidle', timeout=10000)
+            resource_registry.rename('location', original_name, edited_name)
 
             # 수정 확인
             expect(page.get_by_role("treeitem", name=edited_name)).to_be_visible(timeout=5000)
 
         # === 3단 장소 삭제 ===
+        step_timer.checkpoint('location: 3단 장소 삭제')
         child_treeitem_updated = page.get_by_role("treeitem", name=edited_name)
         child_treeitem_updated.click()
         page.wait_for_timeout(1000)
@@ -342,37 +300,4 @@ class TestLocationSimple:
 
             # 삭제 확인
             expect(page.get_by_role("treeitem", name=edited_name)).not_to_be_visible()
-
-        # === 2단 부모 장소 삭제 ===
-        parent2_treeitem = page.get_by_role("treeitem", name=parent2_name)
-        if parent2_treeitem.is_visible():
-            parent2_treeitem.click()
-            page.wait_for_timeout(1000)
-
-            delete_button = page.get_by_role("button", name="삭제")
-            if delete_button.is_visible():
-                delete_button.click()
-                page.wait_for_timeout(500)
-
-                page.wait_for_timeout(3000)
-                page.wait_for_load_state('networkidle', timeout=10000)
-
-                # 2단 부모 삭제 확인
-                expect(page.get_by_role("treeitem", name=parent2_name)).not_to_be_visible()
-
-        # === 1단 부모 장소 삭제 ===
-        parent1_treeitem = page.get_by_role("treeitem", name=parent1_name)
-        if parent1_treeitem.is_visible():
-            parent1_treeitem.click()
-            page.wait_for_timeout(1000)
-
-            delete_button = page.get_by_role("button", name="삭제")
-            if delete_button.is_visible():
-                delete_button.click()
-                page.wait_for_timeout(500)
-
-                page.wait_for_timeout(3000)
-                page.wait_for_load_state('networkidle', timeout=10000)
-
-                # 1단 부모 삭제 확인
-                expect(page.get_by_role("treeitem", name=parent1_name)).not_to_be_visible()
+            resource_registry.discard('location', edited_name)
@@ -0,0 +1,64 @@
+"""
+장소 하위 트리 일괄 삭제(subtree_delete.py) 테스트
+
+로컬 대역 API 서버를 사용하므로 서버/브라우저 없이 실행됩니다.
+대역 서버는 자식이 남은 장소 삭제를 409로 거부하므로, 묶음 순서가 틀리면 실패로 드러납니다.
+"""
+import pytest
+
+from e2e.access.location.subtree_delete import delete_subtree, format_delete
+from e2e.access.location.tree_builder import build_via_api, generate_spec, spec_levels
+from e2e.utils.api import ApiClient
+from e2e.utils.location_tree import LocationSnapshot
+from e2e.utils.stub_server import StubServer
+
+
+@pytest.mark.location
+class TestLocationSubtreeDelete:
+    """
+    높이별 묶음 병렬 삭제와 실패한 노드의 조상 건너뛰기
+    """
+
+    def test_delete_1000_node_subtree(self):
+        """
+        1 -> 10 -> 10 -> 10 하위 트리(1,111개)를 지우고 다른 루트는 남기는지 확인
+        """
+        with StubServer(latency_ms=2) as server:
+            build_via_api(spec_levels(generate_spec([2, 10, 10, 10], prefix='DEL')), server.url, workers=16)
+            client = ApiClient(server.url).login()
+            snapshot = LocationSnapshot.from_api(client)
+            client.create_location('DEL-1-얕은잎', parent_id=snapshot.ids[snapshot.resolve('DEL-1')])
+
+            preview = delete_subtree('DEL-1', server.url, dry_run=True)
+            assert preview.batches == [1001, 100, 10, 1], "얕은 잎도 첫 묶음에 들어가야 합니다."
+            assert len(server.locations.all()) == 2 * 1111 + 1
+
+            result = delete_subtree('DEL-1', server.url, workers=16)
+            for line in format_delete(result):
+                print(line)
+
+            assert result.ok, result.summary()
+            assert result.deleted == 1112
+            snapshot = LocationSnapshot.from_api(client)
+            assert not snapshot.find('DEL-1') and len(snapshot) == 1111
+            assert [snapshot.names[i] for i in snapshot.roots()] == ['DEL-2']
+
+    def test_failure_skips_ancestors(self):
+        """
+        계획 후 자식이 생긴 잎은 409로 실패하고, 그 조상만 남기고 나머지는 지우는지 확인
+        """
+        with StubServer() as server:
+            build_via_api(spec_levels(generate_spec([1, 3, 2], prefix='SKIP')), server.url)
+            client = ApiClient(server.url).login()
+            snapshot = LocationSnapshot.from_api(client)
+            client.create_location('늦게추가', parent_id=snapshot.ids[snapshot.resolve('SKIP-1-2-1')])
+
+            result = delete_subtree('SKIP-1', server.url, workers=4, snapshot=snapshot)
+
+            assert [name for name, _ in result.failed] == ['SKIP-1-2-1']
+            assert sorted(result.skipped) == ['SKIP-1', 'SKIP-1-2']
+            assert result.deleted == 7 and result.remaining == 3
+            remaining = LocationSnapshot.from_api(client)
+            assert remaining.path(remaining.find('늦게추가')[0]) == ('SKIP-1', 'SKIP-1-2', 'SKIP-1-2-1', '늦게추가')
+            with pytest.raises(ValueError):
+                delete_subtree('없는장소', server.url)
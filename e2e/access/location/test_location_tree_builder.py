@@ -0,0 +1,133 @@
+"""
+장소 트리 대량 생성기 테스트
+
+기본은 로컬 대역 API 서버를 대상으로 하므로 서버 없이도 실행됩니다.
+실제 서버 측정은 TREE_TARGET=server (폼 입력은 TREE_DRIVER=ui)로 실행하세요.
+
+환경 변수:
+    TREE_TARGET    stub | server (기본 stub)
+    TREE_DRIVER    api | ui (기본 api)
+    TREE_FANOUTS   레벨별 자식 수 (기본 2,3,4,5 -> 152개 노드)
+    TREE_WORKERS   api 동시 요청 수 (기본 8)
+"""
+import json
+import os
+import time
+
+import pytest
+from openpyxl import Workbook
+
+from e2e.access.location.tree_builder import (
+    build_tree, build_via_api, cleanup, format_build, generate_spec, load_spec, record_build, spec_levels,
+)
+from e2e.utils.api import ApiClient
+from e2e.utils.location_tree import LocationSnapshot, diff_trees
+from e2e.utils.stub_server import StubServer
+
+TREE_TARGET = os.getenv('TREE_TARGET', 'stub')
+TREE_DRIVER = os.getenv('TREE_DRIVER', 'api')
+TREE_FANOUTS = [int(v) for v in os.getenv('TREE_FANOUTS', '2,3,4,5').split(',') if v.strip()]
+TREE_WORKERS = int(os.getenv('TREE_WORKERS', '8'))
+
+
+@pytest.mark.location
+class TestLocationTreeBuilder:
+    """
+    트리 스펙 읽기와 병렬 생성/모양 검증
+    """
+
+    def test_snapshot_diff_10k(self):
+        """
+        10k 노드 트리에서 누락/추가/이동/표시 순서 변경을 찾고 Python 시간이 짧은지 확인
+        """
+        levels = spec_levels(generate_spec([10, 10, 10, 10], prefix='DIFF'))
+        rows = [{'id': n['name'], 'parentId': n['parent'], 'name': n['name'], 'type': n['type'],
+                 'order': n['order']} for level in levels for n in level]
+        by_name = {row['name']: row for row in rows}
+        rows.remove(by_name['DIFF-1-1-1-1'])
+        by_name['DIFF-2-2-2'].update(parentId='DIFF-3-3', order=11)
+        by_name['DIFF-4-4-4-4']['order'] = 99
+        rows.append({'id': 'extra', 'parentId': 'DIFF-5', 'name': '추가', 'type': '사무공간', 'order': 11})
+
+        expected = LocationSnapshot.from_levels(levels)
+        diff = diff_trees(expected, LocationSnapshot.from_rows(rows))
+        print(f"\n[INFO] {len(expected)} nodes: {diff.summary()}")
+
+        assert diff.missing == ['DIFF-1 / DIFF-1-1 / DIFF-1-1-1 / DIFF-1-1-1-1']
+        assert diff.unexpected == ['DIFF-5 / 추가']
+        assert diff.moved == [('DIFF-2-2-2', 'DIFF-2 / DIFF-2-2 / DIFF-2-2-2',
+                               'DIFF-3 / DIFF-3-3 / DIFF-2-2-2')]
+        assert diff.changed == [('DIFF-4 / DIFF-4-4 / DIFF-4-4-4 / DIFF-4-4-4-4', 'order', 4, 99)]
+        assert diff.seconds < 0.5, f"10k 노드 비교가 느립니다: {diff.seconds:.3f}s"
+
+    def test_load_spec_formats(self, tmp_path):
+        """
+        JSON/YAML/Excel 스펙이 같은 레벨 목록으로 읽히는지 확인
+        """
+        spec = generate_spec([2, 2], types=['건물', '사무공간'], prefix='SPEC')
+        json_path = tmp_path / 'tree.json'
+        json_path.write_text(json.dumps({'nodes': spec}, ensure_ascii=False), encoding='utf-8')
+        yaml_path = tmp_path / 'tree.yaml'
+        yaml_path.write_text(json.dumps(spec, ensure_ascii=False), encoding='utf-8')  # JSON은 YAML의 부분집합
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = '장소'
+        sheet.append(['이름', '유형', '표시 순서', '부모'])
+        for level in spec_levels(spec):
+            for node in level:
+                sheet.append([node['name'], node['type'], node['order'], node['parent']])
+        excel_path = tmp_path / 'tree.xlsx'
+        workbook.save(excel_path)
+
+        expected = spec_levels(spec)
+        for path in (json_path, yaml_path, excel_path):
+            assert spec_levels(load_spec(str(path))) == expected, f"{path.name} 스펙이 다르게 읽혔습니다."
+
+    def test_build_generated_tree(self, pytestconfig):
+        """
+        생성한 트리를 만들고 서버 목록 한 번 조회로 모양 검증 (server 대상이면 검증 후 삭제)
+        """
+        spec = generate_spec(TREE_FANOUTS)
+        started_at = time.time()
+        outcome = build_tree(spec, TREE_DRIVER, TREE_TARGET, workers=TREE_WORKERS,
+                             remove=TREE_TARGET == 'server')
+
+        print(f"\n[INFO] location tree: target={outcome['target']}, driver={TREE_DRIVER}")
+        for line in format_build(outcome):
+            print(line)
+        if not pytestconfig.getoption('no_run_history'):
+            record_build(pytestconfig.getoption('run_history_db'), started_at, outcome, TREE_DRIVER, TREE_WORKERS)
+
+        assert not outcome['result'].errors, f"생성 실패: {outcome['result'].errors[:3]}"
+        assert outcome['shape'].ok, f"트리 모양 불일치: {outcome['shape'].summary()}"
+
+    def test_cleanup_deletes_only_created_nodes(self):
+        """
+        생성한 트리만 잎부터 묶음 삭제하고, 생성 후 추가된 장소의 조상과 다른 루트는 남기는지 확인
+        """
+        with StubServer() as server:
+            build = build_via_api(spec_levels(generate_spec([2, 3, 4], prefix='CLEAN')), server.url, workers=4)
+            client = ApiClient(server.url).login()
+            client.create_location('본사')
+            client.create_location('나중추가', parent_id=build.ids['CLEAN-2-3'])
+
+            assert cleanup(client, build, workers=4) == len(build.order) - 2
+            snapshot = LocationSnapshot.from_api(client)
+            assert sorted(snapshot.names) == sorted(['본사', 'CLEAN-2', 'CLEAN-2-3', '나중추가'])
+
+    def test_build_without_id_in_response(self, monkeypatch):
+        """
+        생성 응답에 id가 없는 서버에서도 자식을 최상위가 아닌 부모 아래에 만드는지 확인
+        """
+        create_location = ApiClient.create_location
+        monkeypatch.setattr(ApiClient, 'create_location',
+                            lambda self, *args, **kwargs: {**create_location(self, *args, **kwargs), 'id': None})
+        levels = spec_levels(generate_spec([2, 2, 2], prefix='NOID'))
+        with StubServer() as server:
+            build = build_via_api(levels, server.url, workers=4)
+            client = ApiClient(server.url).login()
+            diff = diff_trees(LocationSnapshot.from_levels(levels), LocationSnapshot.from_api(client))
+
+        assert not build.errors and all(build.ids.values())
+        assert diff.ok, diff.summary()
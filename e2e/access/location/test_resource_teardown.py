@@ -0,0 +1,90 @@
+"""
+테스트 데이터 기록기(ResourceRegistry) 정리 순서 테스트
+
+로컬 대역 API 서버를 사용하므로 서버/브라우저 없이 실행됩니다.
+대역 서버는 자식이 남은 장소의 삭제를 409로 거부하므로, 정리 순서가 틀리면 실패로 드러납니다.
+"""
+import pytest
+
+from e2e.utils.api import ApiClient
+from e2e.utils.resources import ResourceRegistry
+from e2e.utils.stub_server import StubServer, api_record
+
+
+@pytest.mark.location
+class TestResourceTeardown:
+    """
+    자식 -> 부모 순서 병렬 삭제와 저널 이어받기
+    """
+
+    def test_teardown_children_before_parents(self, tmp_path):
+        """
+        등록 순서와 관계없이 깊은 장소부터 지우고, 등록하지 않은 하위 장소와 임직원도 정리
+        """
+        journal = str(tmp_path / 'resources.jsonl')
+        with StubServer() as server:
+            client = ApiClient(server.url).login()
+            parent = client.create_location('정리_부모')
+            child = client.create_location('정리_자식', parent_id=parent['id'])
+            client.create_location('정리_손자', parent_id=child['id'])  # 테스트가 등록하지 못한 자식
+            client.create_location('다른_테스트_장소')
+            server.store.bulk_load([api_record({'id': 'E1', 'name': '정리_임직원'}),
+                                    api_record({'id': 'E2', 'name': '원래_있던_임직원'})])
+
+            registry = ResourceRegistry(journal)
+            registry.add('location', '정리_부모')
+            registry.add('location', '정리_원본', parent='정리_부모')
+            registry.rename('location', '정리_원본', '정리_자식')
+            registry.add('employee', 'E1', label='정리_임직원')
+            registry.add('employee', 'E2', label='테스트가_만든_이름')  # 같은 사번의 기존 데이터는 지우지 않음
+            registry.add('employee', 'E3', label='없는_임직원')
+
+            report = registry.teardown(base_url=server.url, workers=4)
+            print(f"\n[INFO] teardown: {report.summary()}")
+
+            assert not report.failed, f"정리 실패: {report.failed}"
+            assert {name for kind, name in report.deleted if kind == 'location'} == {
+                '정리_부모', '정리_자식', '정리_손자'}
+            assert ('employee', 'E1') in report.deleted
+            assert report.skipped == [('employee', 'E2')]
+            assert report.missing == [('employee', 'E3')]
+            assert [r['name'] for r in server.locations.all()] == ['다른_테스트_장소']
+            assert not len(registry)
+
+        registry = ResourceRegistry.load(journal)
+        assert not len(registry), "정리가 끝나면 저널이 비어야 합니다."
+
+    def test_login_failure_keeps_journal(self, tmp_path):
+        """
+        로그인/조회가 실패하면 '없음'으로 버리지 않고 실패로 남겨 다음 세션이 다시 시도하는지 확인
+        """
+        journal = str(tmp_path / 'resources.jsonl')
+        with StubServer(password='다른_비밀번호') as server:
+            registry = ResourceRegistry(journal)
+            registry.add('employee', 'E1', label='정리_임직원')
+            registry.add('location', '정리_부모')
+
+            report = registry.teardown(base_url=server.url)
+
+            assert not report.missing and not report.deleted
+            assert sorted((kind, name) for kind, name, _ in report.failed) == [
+                ('employee', 'E1'), ('location', '정리_부모')]
+        assert len(ResourceRegistry.load(journal)) == 2
+
+    def test_journal_replay(self, tmp_path):
+        """
+        비정상 종료 후 다음 세션이 추가/이름 변경/삭제 기록을 재생해 남은 항목만 이어받는지 확인
+        """
+        journal = str(tmp_path / 'resources.jsonl')
+        registry = ResourceRegistry(journal)
+        registry.add('location', '3단_부모1')
+        registry.add('location', '3단_부모2', parent='3단_부모1')
+        registry.add('location', '3단_원본', parent='3단_부모2')
+        registry.rename('location', '3단_부모2', '3단_부모2_수정')
+        registry.discard('location', '3단_원본')
+        with open(journal, 'a', encoding='utf-8') as f:
+            f.write('{"op": "add", "kind": "loc')  # 기록 중 종료된 마지막 줄
+
+        resumed = ResourceRegistry.load(journal)
+        assert [(r.name, r.parent) for r in resumed.pending()] == [
+            ('3단_부모1', None), ('3단_부모2_수정', '3단_부모1')]
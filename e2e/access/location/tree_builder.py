@@ -0,0 +1,423 @@
+"""
+선언형 장소 트리 대량 생성기
+
+test_location_simple.py는 "장소 추가" 폼을 한 번에 하나씩 채워 1~3단 트리만 만듭니다.
+실제 건물(사이트 -> 건물 -> 층 -> 호실 -> 출입문)은 수천 개 노드이므로,
+트리 스펙(JSON/YAML/Excel)을 읽어 한 번에 생성하고 결과 모양을 검증합니다.
+
+    api  부모가 만들어지는 즉시 자식을 스레드 풀에 넣어 생성 (서로 독립인 하위 트리는 병렬)
+         레벨 순서는 하위 트리마다 지켜지며, 느린 가지가 다른 가지의 다음 레벨을 막지 않습니다.
+    ui   AsyncBulkRunner.create_location_levels로 레벨마다 여러 컨텍스트에서 폼 입력
+
+스펙 형식 (노드 이름은 트리 전체에서 고유해야 함, 부모를 이름으로 찾기 때문):
+    JSON/YAML   [{'name', 'type', 'order', 'children': [...]}, ...] 또는 {'nodes': [...]}
+    Excel       '장소' 시트(없으면 첫 시트), 머리글 이름/유형/표시 순서/부모 (name/type/order/parent)
+
+실행 예 (저장소 루트에서):
+    python -m e2e.access.location.tree_builder --spec tree.yaml --target server --cleanup
+    python -m e2e.access.location.tree_builder --generate 3,5,10,20,2 --workers 16
+    python -m e2e.access.location.tree_builder --spec tree.xlsx --target server --driver ui --concurrency 4
+"""
+import argparse
+import json
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from e2e.utils import settings
+from e2e.utils.api import ApiClient, ApiError
+from e2e.utils.async_core import AsyncBulkRunner, flatten_tree, run_in_thread
+from e2e.utils.benchmark import percentile
+from e2e.utils.location_tree import LocationSnapshot, TreeDiff, delete_by_height, diff_trees
+from e2e.utils.run_history import DEFAULT_DB_PATH, git_revision, record_benchmark
+from e2e.utils.stub_server import StubServer
+
+SUITE = 'location-tree-build'
+DEFAULT_TYPE = '사무공간'
+EXCEL_SHEET = '장소'
+# Excel 머리글 -> 스펙 키
+EXCEL_HEADERS = {
+    '이름': 'name', 'name': 'name',
+    '유형': 'type', 'type': 'type',
+    '표시 순서': 'order', 'order': 'order',
+    '부모': 'parent', 'parent': 'parent',
+}
+
+
+@dataclass
+class BuildResult:
+    """
+    트리 생성 결과
+
+    Attributes:
+        ids: 생성한 노드 이름 -> 서버 id (ui 경로는 생성 후 조회한 id)
+        order: 생성 완료 순서
+        errors: (노드 이름, 실패 사유)
+        skipped: 부모 생성 실패로 건너뛴 노드 이름
+        durations: 노드별 생성 시간 (초)
+        seconds: 전체 소요 시간
+    """
+    ids: dict = field(default_factory=dict)
+    order: list[str] = field(default_factory=list)
+    errors: list[tuple[str, str]] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    durations: list[float] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return len(self.order) / self.seconds if self.seconds else 0.0
+
+
+# ============================================================================
+# 스펙
+# ============================================================================
+
+def load_spec(path: str) -> list[dict]:
+    """
+    JSON/YAML/Excel 트리 스펙을 중첩 노드 목록으로 읽기
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in ('.xlsx', '.xlsm'):
+        return rows_to_tree(read_excel_rows(path))
+    with open(path, encoding='utf-8') as f:
+        if suffix in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError as e:
+                raise RuntimeError("YAML 스펙을 읽으려면 PyYAML이 필요합니다: pip install pyyaml") from e
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+    return spec.get('nodes', []) if isinstance(spec, dict) else spec
+
+
+def read_excel_rows(path: str) -> list[dict]:
+    """
+    Excel 시트의 (이름, 유형, 표시 순서, 부모) 행 목록
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    sheet = workbook[EXCEL_SHEET] if EXCEL_SHEET in workbook.sheetnames else workbook.worksheets[0]
+    rows = sheet.iter_rows(values_only=True)
+    header = [EXCEL_HEADERS.get(str(h).strip().lower() if h else '', None) for h in next(rows, [])]
+    if 'name' not in header:
+        workbook.close()
+        raise ValueError(f"{path}: '이름'(name) 열이 없습니다.")
+
+    result = []
+    for values in rows:
+        row = {key: value for key, value in zip(header, values) if key and value not in (None, '')}
+        if row.get('name'):
+            row['name'] = str(row['name']).strip()
+            if row.get('parent'):
+                row['parent'] = str(row['parent']).strip()
+            if row.get('order'):
+                row['order'] = int(row['order'])
+            result.append(row)
+    workbook.close()
+    return result
+
+
+def rows_to_tree(rows: list[dict]) -> list[dict]:
+    """
+    부모 이름으로 연결된 평면 행을 중첩 스펙으로 변환 (행 순서가 같은 부모 안의 기본 표시 순서)
+    """
+    nodes = {}
+    for row in rows:
+        if row['name'] in nodes:
+            raise ValueError(f"노드 이름 중복: {row['name']}")
+        nodes[row['name']] = {key: row[key] for key in ('name', 'type', 'order') if row.get(key)}
+
+    roots = []
+    for row in rows:
+        parent = row.get('parent')
+        if parent is None:
+            roots.append(nodes[row['name']])
+        elif parent in nodes:
+            nodes[parent].setdefault('children', []).append(nodes[row['name']])
+        else:
+            raise ValueError(f"{row['name']}: 부모 '{parent}'이(가) 스펙에 없습니다.")
+    return roots
+
+
+def generate_spec(fanouts: list[int], types: list[str] | None = None, prefix: str | None = None) -> list[dict]:
+    """
+    레벨별 자식 수로 균일한 트리 스펙 생성
+
+    예: generate_spec([2, 3]) -> 루트 2개, 각 루트 아래 3개 (이름 'TREE_<시각>-1-2' 형식)
+
+    Args:
+        fanouts: 레벨별 자식 수 (첫 값은 루트 수)
+        types: 레벨별 장소 유형 (짧으면 마지막 값 반복, 기본 사무공간)
+        prefix: 이름 접두사 (기본 'TREE_<시각>', 실행 간 충돌 방지)
+    """
+    types = types or [DEFAULT_TYPE]
+    prefix = prefix or f"TREE_{int(time.time())}"
+
+    def build(depth: int, path: str) -> list[dict]:
+        if depth >= len(fanouts):
+            return []
+        nodes = []
+        for order in range(1, fanouts[depth] + 1):
+            name = f"{path}-{order}"
+            node = {'name': name, 'type': types[min(depth, len(types) - 1)], 'order': order}
+            children = build(depth + 1, name)
+            if children:
+                node['children'] = children
+            nodes.append(node)
+        return nodes
+
+    return build(0, prefix)
+
+
+def spec_levels(spec: list[dict]) -> list[list[dict]]:
+    """
+    flatten_tree 결과에서 이름 중복 확인 후 레벨 목록 반환
+    """
+    levels = [level for level in flatten_tree(spec) if level]
+    seen = set()
+    for node in (n for level in levels for n in level):
+        if node['name'] in seen:
+            raise ValueError(f"노드 이름 중복: {node['name']} (부모를 이름으로 찾으므로 고유해야 합니다)")
+        seen.add(node['name'])
+    return levels
+
+
+# ============================================================================
+# 생성
+# ============================================================================
+
+def find_created_id(client: ApiClient, name: str, parent_id):
+    """
+    생성 응답에 id가 없을 때 목록에서 부모가 parent_id인 같은 이름의 장소 id 조회
+
+    Raises:
+        LookupError: 찾지 못함 (자식을 최상위로 만들지 않도록 하위 트리를 실패 처리)
+    """
+    snapshot = LocationSnapshot.from_api(client)
+    for i in reversed(snapshot.find(name)):
+        parent = snapshot.parents[i]
+        if (snapshot.ids[parent] if parent >= 0 else None) == parent_id:
+            return snapshot.ids[i]
+    raise LookupError(f"생성 응답에 id가 없고 목록에서도 찾을 수 없음: {name}")
+
+
+def build_via_api(levels: list[list[dict]], base_url: str | None = None, workers: int = 8) -> BuildResult:
+    """
+    API로 트리 생성 (부모가 끝나면 자식을 바로 제출, 독립 하위 트리는 병렬)
+    """
+    children = defaultdict(list)
+    for node in (n for level in levels for n in level):
+        children[node['parent']].append(node)
+
+    result = BuildResult()
+    local = threading.local()
+
+    def create(node: dict, parent_id):
+        # ApiClient는 스레드 간 공유하지 않음
+        if not hasattr(local, 'client'):
+            local.client = ApiClient(base_url).login()
+        start = time.perf_counter()
+        record = local.client.create_location(node['name'], node['type'], node['order'], parent_id)
+        node_id = record.get('id') if isinstance(record, dict) else None
+        if node_id is None:
+            node_id = find_created_id(local.client, node['name'], parent_id)
+        return node_id, time.perf_counter() - start
+
+    def skip_subtree(name: str):
+        for child in children.get(name, []):
+            result.skipped.append(child['name'])
+            skip_subtree(child['name'])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = {pool.submit(create, node, None): node for node in children.get(None, [])}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = pending.pop(future)
+                try:
+                    node_id, duration = future.result()
+                except (ApiError, LookupError) as e:
+                    result.errors.append((node['name'], str(e)))
+                    skip_subtree(node['name'])
+                    continue
+                result.ids[node['name']] = node_id
+                result.order.append(node['name'])
+                result.durations.append(duration)
+                for child in children.get(node['name'], []):
+                    pending[pool.submit(create, child, node_id)] = child
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def build_via_ui(levels: list[list[dict]], concurrency: int = 4, headless: bool | None = None) -> BuildResult:
+    """
+    브라우저 폼으로 레벨별 생성 (레벨 안에서는 concurrency개 컨텍스트가 병렬로 입력)
+    """
+    async def run():
+        async with AsyncBulkRunner(concurrency=concurrency, headless=headless) as runner:
+            return await runner.create_location_levels(levels)
+
+    start = time.perf_counter()
+    results = run_in_thread(run())
+    result = BuildResult(seconds=time.perf_counter() - start)
+    for r in results:
+        if r.ok:
+            result.ids[r.key] = None
+            result.order.append(r.key)
+            result.durations.append(r.duration)
+        else:
+            result.errors.append((r.key, r.error or 'failed'))
+    return result
+
+
+# ============================================================================
+# 검증/정리
+# ============================================================================
+
+def verify_shape(client: ApiClient, levels: list[list[dict]]) -> TreeDiff:
+    """
+    서버의 장소 트리(한 번 조회)에서 스펙 루트의 하위 트리만 골라 스펙과 비교
+    """
+    expected = LocationSnapshot.from_levels(levels)
+    actual = LocationSnapshot.from_api(client).subtree([n['name'] for n in levels[0]])
+    return diff_trees(expected, actual)
+
+
+def cleanup(client: ApiClient, result: BuildResult, workers: int = 8) -> int:
+    """
+    생성한 노드를 잎부터 높이별 묶음으로 병렬 삭제 (location_tree.delete_by_height)
+
+    Returns:
+        int: 삭제한 노드 수
+    """
+    snapshot = LocationSnapshot.from_api(client)
+    ids = dict(result.ids)
+    if any(v is None for v in ids.values()):
+        ids.update({snapshot.names[i]: snapshot.ids[i] for i in range(len(snapshot)) if snapshot.names[i] in ids})
+    created = {snapshot.index[ids[name]] for name in result.order if ids.get(name) in snapshot.index}
+    # 생성한 노드 중 부모가 생성 대상이 아닌 것이 루트 (그 아래의 다른 장소는 지우지 않음)
+    roots = [i for i in created if snapshot.parents[i] not in created]
+    batches = [[i for i in batch if i in created] for batch in snapshot.height_batches(*roots)]
+    local = threading.local()
+
+    def delete(i: int) -> bool:
+        # ApiClient는 스레드 간 공유하지 않음
+        if not hasattr(local, 'client'):
+            local.client = ApiClient(client.base_url).login()
+        try:
+            local.client.delete_location(snapshot.ids[i])
+            return True
+        except ApiError as e:
+            print(f"[WARNING] 장소 삭제 실패: {snapshot.names[i]} ({e})")
+            return False
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return sum(delete_by_height(pool, batches, delete))
+
+
+def build_tree(spec: list[dict], driver: str = 'api', target: str = 'stub', workers: int = 8,
+               concurrency: int = 4, remove: bool = False, stub_latency_ms: float = 2.0) -> dict:
+    """
+    스펙으로 트리를 만들고 검증 (remove=True면 검증 후 삭제)
+
+    Returns:
+        dict: {'result': BuildResult, 'shape': TreeDiff, 'levels': 레벨별 노드 수, 'target': 대상}
+    """
+    if driver == 'ui' and target == 'stub':
+        raise ValueError("UI 생성은 server 대상에서만 사용할 수 있습니다.")
+
+    levels = spec_levels(spec)
+    server = StubServer(latency_ms=stub_latency_ms).start() if target == 'stub' else None
+    try:
+        base_url = server.url if server else None
+        if driver == 'api':
+            result = build_via_api(levels, base_url, workers)
+        else:
+            result = build_via_ui(levels, concurrency)
+        client = ApiClient(base_url).login()
+        shape = verify_shape(client, levels)
+        if remove:
+            print(f"[INFO] 정리: {cleanup(client, result, workers)}개 삭제")
+    finally:
+        if server is not None:
+            server.stop()
+    return {'result': result, 'shape': shape, 'levels': [len(level) for level in levels],
+            'target': 'stub' if server else settings.BASE_URL}
+
+
+def format_build(outcome: dict) -> list[str]:
+    result, shape = outcome['result'], outcome['shape']
+    total = sum(outcome['levels'])
+    lines = [
+        f"  nodes: {len(result.order)}/{total} (levels {' / '.join(str(n) for n in outcome['levels'])})",
+        f"  time: {result.seconds:.2f}s, {result.nodes_per_second:.1f} nodes/s",
+    ]
+    if result.durations:
+        lines.append(f"  per node: p50={percentile(result.durations, 50) * 1000:.1f}ms "
+                     f"p95={percentile(result.durations, 95) * 1000:.1f}ms")
+    if result.errors:
+        lines.append(f"  errors: {len(result.errors)} (예: {result.errors[:3]}), skipped: {len(result.skipped)}")
+    lines.append(f"  shape: {shape.summary()}")
+    return lines
+
+
+def record_build(db_path: str, started_at: float, outcome: dict, driver: str, concurrency: int):
+    result = outcome['result']
+    durations = result.durations or [0.0]
+    ops = len(result.order) + len(result.errors)
+    record_benchmark(db_path, SUITE, {
+        'started_at': started_at, 'target': outcome['target'], 'driver': driver, 'git_rev': git_revision(),
+    }, [{
+        'flow': f"location-tree:{driver}", 'concurrency': concurrency, 'reps': 1, 'ops': ops,
+        'errors': len(result.errors), 'error_rate': len(result.errors) / ops if ops else 0.0,
+        'throughput_per_min': result.nodes_per_second * 60,
+        'p50': percentile(durations, 50), 'p90': percentile(durations, 90),
+        'p95': percentile(durations, 95), 'p99': percentile(durations, 99),
+    }])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='장소 트리 대량 생성')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--spec', help='트리 스펙 (JSON/YAML/Excel)')
+    source.add_argument('--generate', help="레벨별 자식 수 (예: 3,5,10,20,2)")
+    parser.add_argument('--types', help='--generate 레벨별 장소 유형 (쉼표 구분, 기본 사무공간)')
+    parser.add_argument('--prefix', help='--generate 이름 접두사')
+    parser.add_argument('--driver', choices=['api', 'ui'], default='api')
+    parser.add_argument('--target', choices=['stub', 'server'], default='stub')
+    parser.add_argument('--workers', type=int, default=8, help='api 동시 요청 수')
+    parser.add_argument('--concurrency', type=int, default=4, help='ui 동시 컨텍스트 수')
+    parser.add_argument('--cleanup', action='store_true', help='검증 후 생성한 장소 삭제')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='실행 이력 SQLite 경로')
+    parser.add_argument('--no-record', action='store_true', help='이력 DB에 기록하지 않음')
+    args = parser.parse_args()
+
+    if args.spec:
+        spec = load_spec(args.spec)
+    else:
+        spec = generate_spec([int(v) for v in args.generate.split(',')],
+                             args.types.split(',') if args.types else None, args.prefix)
+
+    started_at = time.time()
+    outcome = build_tree(spec, args.driver, args.target, args.workers, args.concurrency, args.cleanup)
+    print(f"[INFO] location tree: target={outcome['target']}, driver={args.driver}")
+    for line in format_build(outcome):
+        print(line)
+    if outcome['shape'].ok:
+        print("[OK] 트리 모양 일치")
+    else:
+        print(f"[WARNING] 트리 모양 불일치: {outcome['shape'].summary()}")
+    if not args.no_record:
+        concurrency = args.workers if args.driver == 'api' else args.concurrency
+        record_build(args.db, started_at, outcome, args.driver, concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+"""
+로그인 폭주(sign-in storm) 벤치마크
+
+test_signin.py는 사용자 한 명의 정상/오류 경로만 확인합니다. 매일 아침 운영자 수백 명이
+몇 분 안에 로그인하므로, 동시 로그인 수를 단계적으로 올리며 인증 엔드포인트가 SLA를 지키지 못하기
+시작하는 동시성을 찾습니다.
+
+단계마다 N건의 로그인을 준비해 두었다가 한 번에 출발시킵니다 (--rounds번 반복, 단계 사이 --pause초 휴식).
+    브라우저   소수(--browsers)의 새 컨텍스트가 /signin 폼을 채워 두고, "Sign In" 클릭부터
+               signin이 아닌 URL로 이동할 때까지 (authenticated_context와 같은 기준)
+    API        나머지는 세션 없는 ApiClient가 로그인 요청 1회 (응답까지)
+
+결과 분류:
+    ok        로그인 성공 (지연 표본)
+    error     시간 초과, 연결 실패, 5xx, 올바른 계정의 401
+    locked    423(계정 잠금) 또는 429(요청 제한)
+    rejected  --bad-ratio로 섞은 잘못된 비밀번호의 401 (기대한 거부, 비율 계산에서 제외)
+
+SLA: 성공 지연 p95 <= --sla-p95초, 오류율 <= --max-error-rate, 잠금 비율 <= --max-lockout-rate.
+기본으로 SLA를 처음 넘는 단계에서 멈춥니다 (--keep-going이면 끝까지).
+
+실행 예 (저장소 루트에서):
+    python -m e2e.auth.signin.signin_storm --levels 10,25,50,100,200
+    python -m e2e.auth.signin.signin_storm --target server --browsers 3 --levels 10,25,50,100,200 --sla-p95 2
+"""
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+from playwright.async_api import async_playwright
+
+from e2e.utils import settings
+from e2e.utils.api import ENDPOINTS, ApiClient, ApiError
+from e2e.utils.async_core import run_in_thread
+from e2e.utils.benchmark import default_executor, percentile
+from e2e.utils.run_history import DEFAULT_DB_PATH, git_revision, record_benchmark
+from e2e.utils.stub_server import SigninGate, StubServer
+
+SUITE = 'signin-storm'
+# 잠금(423)/요청 제한(429)
+LOCKOUT_STATUSES = (423, 429)
+OUTCOMES = ('ok', 'error', 'locked', 'rejected')
+
+
+def parse_levels(text: str) -> list[int]:
+    """
+    "10,25,50" -> [10, 25, 50] (오름차순)
+    """
+    levels = sorted({int(v) for v in text.split(',') if v.strip()})
+    if not levels or levels[0] < 1:
+        raise ValueError(f"동시 로그인 수는 1 이상이어야 합니다: {text}")
+    return levels
+
+
+def classify(status: int, bad: bool) -> str:
+    """
+    실패 응답 상태 코드 -> 결과 분류 (0은 연결 실패/시간 초과)
+    """
+    if status in LOCKOUT_STATUSES:
+        return 'locked'
+    if bad and status == 401:
+        return 'rejected'
+    return 'error'
+
+
+@dataclass
+class StormRecorder:
+    """
+    (동시 로그인 수, 경로)별 결과 수집
+    """
+    level: int = 0
+    samples: dict[tuple[int, str], list[float]] = field(default_factory=dict)
+    counts: dict[tuple[int, str], dict[str, int]] = field(default_factory=dict)
+    seconds: dict[int, float] = field(default_factory=dict)
+    error_samples: list[str] = field(default_factory=list)
+
+    def add(self, kind: str, outcome: str, seconds: float, detail: str | None = None):
+        key = (self.level, kind)
+        counts = self.counts.setdefault(key, dict.fromkeys(OUTCOMES, 0))
+        counts[outcome] += 1
+        if outcome == 'ok':
+            self.samples.setdefault(key, []).append(seconds)
+        elif outcome != 'rejected' and detail and len(self.error_samples) < 5:
+            self.error_samples.append(f"{kind} c={self.level}: {detail}")
+
+    def rows(self, rounds: int) -> list[dict]:
+        """
+        run_history.record_benchmark 형식 (flow='signin:<경로>', concurrency=동시 로그인 수)
+
+        errors에는 잠금/제한도 포함하고, error_rate/lockout_rate는 나눠서 계산합니다.
+        """
+        rows = []
+        for (level, kind) in sorted(self.counts):
+            counts = self.counts[(level, kind)]
+            latencies = self.samples.get((level, kind), [])
+            attempts = counts['ok'] + counts['error'] + counts['locked']
+            seconds = self.seconds.get(level, 0.0)
+            rows.append({
+                'flow': f"signin:{kind}",
+                'concurrency': level,
+                'reps': rounds,
+                'ops': attempts,
+                'errors': counts['error'] + counts['locked'],
+                'locked': counts['locked'],
+                'rejected': counts['rejected'],
+                'error_rate': counts['error'] / attempts if attempts else 0.0,
+                'lockout_rate': counts['locked'] / attempts if attempts else 0.0,
+                'throughput_per_min': counts['ok'] / seconds * 60 if seconds else 0.0,
+                'p50': percentile(latencies, 50),
+                'p90': percentile(latencies, 90),
+                'p95': percentile(latencies, 95),
+                'p99': percentile(latencies, 99),
+            })
+        return rows
+
+
+def find_sla_break(rows: list[dict], sla_p95: float, max_error_rate: float = 0.01,
+                   max_lockout_rate: float = 0.0) -> dict[str, dict]:
+    """
+    경로별로 SLA를 처음 넘는 동시 로그인 수와 그 직전까지 SLA를 지킨 최대 동시성
+
+    Returns:
+        dict: {flow: {'concurrency', 'last_ok', 'reasons', 'p95', 'error_rate', 'lockout_rate'}}
+    """
+    by_flow: dict[str, list[dict]] = {}
+    for row in rows:
+        by_flow.setdefault(row['flow'], []).append(row)
+
+    broken = {}
+    for flow, flow_rows in by_flow.items():
+        last_ok = None
+        for row in sorted(flow_rows, key=lambda r: r['concurrency']):
+            reasons = []
+            if row['p95'] is None or row['p95'] > sla_p95:
+                reasons.append('p95')
+            if row['error_rate'] > max_error_rate:
+                reasons.append('errors')
+            if row['lockout_rate'] > max_lockout_rate:
+                reasons.append('lockout')
+            if not reasons:
+                last_ok = row['concurrency']
+                continue
+            broken[flow] = {
+                'concurrency': row['concurrency'], 'last_ok': last_ok, 'reasons': reasons,
+                'p95': row['p95'], 'error_rate': row['error_rate'], 'lockout_rate': row['lockout_rate'],
+            }
+            break
+    return broken
+
+
+class SigninStorm:
+    """
+    동시 로그인 단계 실행기
+    """
+
+    def __init__(self, levels: list[int], base_url: str | None = None, browsers: int = 0, rounds: int = 1,
+                 bad_ratio: float = 0.0, pause: float = 1.0, timeout: float = 20.0,
+                 sla_p95: float = 2.0, max_error_rate: float = 0.01, max_lockout_rate: float = 0.0,
+                 stop_on_break: bool = True):
+        self.levels = levels
+        self.base_url = base_url
+        self.browsers = browsers
+        self.rounds = max(1, rounds)
+        self.bad_ratio = bad_ratio
+        self.pause = pause
+        self.timeout = timeout
+        self.sla = (sla_p95, max_error_rate, max_lockout_rate)
+        self.stop_on_break = stop_on_break
+        self.recorder = StormRecorder()
+        self.browser = None
+        self._seq = 0
+
+    def _next_is_bad(self) -> bool:
+        # bad_ratio 비율만큼 잘못된 비밀번호를 고르게 섞음 (0.25면 네 번째마다)
+        seq, self._seq = self._seq, self._seq + 1
+        return int((seq + 1) * self.bad_ratio) > int(seq * self.bad_ratio)
+
+    async def _api_attempt(self, bad: bool):
+        client = ApiClient(self.base_url, timeout=self.timeout)
+        password = 'wrong-password' if bad else None
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(client.login, None, password)
+        except ApiError as e:
+            self.recorder.add('api', classify(e.status, bad), time.perf_counter() - start, str(e))
+            return
+        # 잘못된 비밀번호가 통과하면 인증 오류로 봄
+        self.recorder.add('api', 'error' if bad else 'ok', time.perf_counter() - start,
+                          'wrong password accepted' if bad else None)
+
+    async def _prepare_page(self, bad: bool):
+        """
+        새 컨텍스트에서 /signin 폼까지 채워 둠 (측정 제외)
+        """
+        context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080}, locale='ko-KR', timezone_id='Asia/Seoul',
+        )
+        page = await context.new_page()
+        statuses: list[int] = []
+        page.on("response", lambda r: statuses.append(r.status)
+                if r.request.method == 'POST' and ENDPOINTS['signin'] in r.url else None)
+        await page.goto(settings.url('signin'), wait_until='networkidle')
+        await page.get_by_role("textbox", name="Enter your Login ID or Email").fill(settings.TEST_USER_EMAIL)
+        await page.get_by_role("textbox", name="Password").fill(
+            'wrong-password' if bad else settings.TEST_USER_PASSWORD)
+        return context, page, statuses
+
+    async def _browser_attempt(self, prepared, bad: bool):
+        context, page, statuses = prepared
+        start = time.perf_counter()
+        try:
+            await page.get_by_role("button", name="Sign In").click()
+            await page.wait_for_url(lambda url: 'signin' not in url, timeout=self.timeout * 1000)
+            self.recorder.add('ui', 'error' if bad else 'ok', time.perf_counter() - start,
+                              'wrong password accepted' if bad else None)
+        except Exception as e:
+            # signin 페이지에 머문 경우 로그인 응답 상태로 분류
+            status = next((s for s in reversed(statuses) if s >= 400), 0)
+            self.recorder.add('ui', classify(status, bad), time.perf_counter() - start,
+                              f"HTTP {status}" if status else f"{type(e).__name__}: {e}")
+        finally:
+            await context.close()
+
+    async def _burst(self, level: int):
+        ui = min(self.browsers, level)
+        plan = [('ui' if i < ui else 'api', self._next_is_bad()) for i in range(level)]
+        prepared = await asyncio.gather(*(self._prepare_page(bad) for kind, bad in plan if kind == 'ui'))
+        pages = iter(prepared)
+        start = time.perf_counter()
+        await asyncio.gather(*(self._browser_attempt(next(pages), bad) if kind == 'ui' else self._api_attempt(bad)
+                               for kind, bad in plan))
+        self.recorder.seconds[level] = self.recorder.seconds.get(level, 0.0) + time.perf_counter() - start
+
+    async def run(self) -> list[dict]:
+        # urllib 호출은 스레드에서 실행되므로 최대 동시 로그인 수만큼 스레드 확보
+        with default_executor(max(self.levels) + 4):
+            return await self._run()
+
+    async def _run(self) -> list[dict]:
+        playwright = None
+        if self.browsers:
+            playwright = await async_playwright().start()
+            self.browser = await playwright.chromium.launch(headless=settings.HEADLESS)
+        try:
+            for index, level in enumerate(self.levels):
+                if index:
+                    await asyncio.sleep(self.pause)
+                self.recorder.level = level
+                for _ in range(self.rounds):
+                    await self._burst(level)
+                rows = [r for r in self.recorder.rows(self.rounds) if r['concurrency'] == level]
+                broken = find_sla_break(rows, *self.sla)
+                print(f"[BENCH] signin c={level}: " + ", ".join(
+                    f"{r['flow']} p95={_ms(r['p95'])} err={r['error_rate']:.1%} locked={r['lockout_rate']:.1%}"
+                    for r in rows))
+                if broken and self.stop_on_break:
+                    print(f"[INFO] c={level}에서 SLA 초과, 이후 단계는 건너뜀")
+                    break
+        finally:
+            if self.browser is not None:
+                await self.browser.close()
+            if playwright is not None:
+                await playwright.stop()
+        return self.recorder.rows(self.rounds)
+
+
+def _ms(seconds: float | None) -> str:
+    return f"{seconds * 1000:.0f}ms" if seconds is not None else "-"
+
+
+def format_storm_rows(rows: list[dict]) -> list[str]:
+    lines = [f"  {'conc':>5} {'flow':<10} {'ok':>6} {'err':>6} {'locked':>7} {'rejected':>8} "
+             f"{'p50':>8} {'p95':>8} {'p99':>8} {'ok/min':>9}"]
+    for row in rows:
+        ok = row['ops'] - row['errors']
+        lines.append(
+            f"  {row['concurrency']:>5} {row['flow']:<10} {ok:>6} {row['error_rate'] * 100:>5.1f}% "
+            f"{row['lockout_rate'] * 100:>6.1f}% {row['rejected']:>8} {_ms(row['p50']):>8} {_ms(row['p95']):>8} "
+            f"{_ms(row['p99']):>8} {row['throughput_per_min']:>9.0f}"
+        )
+    return lines
+
+
+def format_breaks(broken: dict[str, dict], sla_p95: float) -> list[str]:
+    if not broken:
+        return [f"[OK] 모든 단계에서 SLA 충족 (p95 <= {sla_p95:.1f}s)"]
+    lines = []
+    for flow, info in broken.items():
+        last_ok = f"{info['last_ok']}건까지 충족" if info['last_ok'] else "첫 단계부터 초과"
+        lines.append(f"[WARNING] {flow}: 동시 {info['concurrency']}건에서 SLA 초과 ({', '.join(info['reasons'])}, "
+                     f"p95 {_ms(info['p95'])}, 오류율 {info['error_rate']:.1%}, 잠금 {info['lockout_rate']:.1%}), "
+                     f"{last_ok}")
+    return lines
+
+
+def run_signin_storm(levels: list[int], target: str = 'stub', browsers: int = 0, rounds: int = 1,
+                     bad_ratio: float = 0.0, pause: float = 1.0, sla_p95: float = 2.0,
+                     max_error_rate: float = 0.01, max_lockout_rate: float = 0.0, stop_on_break: bool = True,
+                     gate: SigninGate | None = None) -> tuple[list[dict], str, list[str]]:
+    """
+    단계별 로그인 폭주 실행 (stub 대상이면 gate로 로그인 처리 용량을 흉내 낸 대역 서버를 띄움)
+
+    Returns:
+        tuple: (동시성/경로별 rows, 대상 이름, 오류 예시)
+    """
+    server = None
+    if target == 'stub':
+        if browsers:
+            raise ValueError("브라우저 로그인은 server 대상에서만 사용할 수 있습니다.")
+        server = StubServer(signin=gate or SigninGate(work_ms=30, workers=8, queue=200)).start()
+    try:
+        storm = SigninStorm(levels, server.url if server else None, browsers, rounds, bad_ratio, pause,
+                            sla_p95=sla_p95, max_error_rate=max_error_rate, max_lockout_rate=max_lockout_rate,
+                            stop_on_break=stop_on_break)
+        # pytest 세션(동기 Playwright)에서도 호출할 수 있도록 별도 스레드의 이벤트 루프에서 실행
+        rows = run_in_thread(storm.run())
+    finally:
+        if server is not None:
+            server.stop()
+    return rows, 'stub' if server else settings.BASE_URL, storm.recorder.error_samples
+
+
+def record_storm(db_path: str, started_at: float, target: str, browsers: int, rows: list[dict]):
+    """
+    실행 이력 DB의 benchmark_results에 기록 (flow=signin:<경로>, concurrency=동시 로그인 수)
+    """
+    record_benchmark(db_path, SUITE, {
+        'started_at': started_at, 'target': target, 'driver': f"api+{browsers}browsers",
+        'git_rev': git_revision(),
+    }, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로그인 폭주 벤치마크')
+    parser.add_argument('--levels', default='10,25,50,100,200', help='동시 로그인 수 (쉼표 구분, 오름차순 실행)')
+    parser.add_argument('--target', choices=['stub', 'server'], default='stub')
+    parser.add_argument('--browsers', type=int, default=0, help='실제 브라우저로 로그인할 수 (server 전용)')
+    parser.add_argument('--rounds', type=int, default=2, help='단계별 반복 횟수')
+    parser.add_argument('--pause', type=float, default=2.0, help='단계 사이 휴식(초)')
+    parser.add_argument('--bad-ratio', type=float, default=0.0,
+                        help='잘못된 비밀번호 비율 (실제 서버에서는 공용 계정이 잠길 수 있음)')
+    parser.add_argument('--sla-p95', type=float, default=2.0, help='로그인 지연 p95 SLA(초)')
+    parser.add_argument('--max-error-rate', type=float, default=0.01)
+    parser.add_argument('--max-lockout-rate', type=float, default=0.0)
+    parser.add_argument('--keep-going', action='store_true', help='SLA를 넘어도 남은 단계 계속')
+    parser.add_argument('--stub-signin-ms', type=float, default=30.0, help='대역 서버 로그인 1건 처리 시간')
+    parser.add_argument('--stub-signin-workers', type=int, default=8, help='대역 서버 동시 로그인 처리 수')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='실행 이력 SQLite 경로')
+    parser.add_argument('--no-record', action='store_true', help='이력 DB에 기록하지 않음')
+    args = parser.parse_args()
+
+    started_at = time.time()
+    rows, target, samples = run_signin_storm(
+        parse_levels(args.levels), args.target, args.browsers, args.rounds, args.bad_ratio, args.pause,
+        args.sla_p95, args.max_error_rate, args.max_lockout_rate, not args.keep_going,
+        SigninGate(args.stub_signin_ms, args.stub_signin_workers, queue=200),
+    )
+    print(f"[INFO] signin storm: target={target}")
+    for line in format_storm_rows(rows):
+        print(line)
+    for line in format_breaks(find_sla_break(rows, args.sla_p95, args.max_error_rate, args.max_lockout_rate),
+                              args.sla_p95):
+        print(line)
+    if samples:
+        print(f"[INFO] 오류 예: {samples}")
+    if not args.no_record:
+        record_storm(args.db, started_at, target, args.browsers, rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ import pytest
 from playwright.sync_api import Page, expect, Browser, BrowserContext
 from dotenv import load_dotenv
 
+from e2e.utils.emulation import apply_to_context
+
 # 환경 변수 로드
 load_dotenv('.env.test')
 
@@ -23,7 +25,7 @@ class TestSignIn:
     """로그인 기능 테스트"""
 
     @pytest.fixture(autouse=False)
-    def clean_page(self, browser: Browser):
+    def clean_page(self, browser: Browser, emulation_profile, instrument_page):
         """
         인증되지 않은 새로운 페이지 생성
         (authenticated_context를 사용하지 않음)
@@ -33,7 +35,8 @@ class TestSignIn:
             locale='ko-KR',
             timezone_id='Asia/Seoul',
         )
-        page = context.new_page()
+        apply_to_context(context, emulation_profile)
+        page = instrument_page(context.new_page())
         yield page
         context.close()
 
@@ -52,20 +55,24 @@ class TestSignIn:
         expect(page.get_by_role("button", name="Sign In")).to_be_visible()
 
 
-    def test_signin_with_valid_credentials(self, clean_page: Page):
+    def test_signin_with_valid_credentials(self, clean_page: Page, step_timer):
         """
         유효한 계정으로 로그인 성공 테스트
         """
         page = clean_page
-        page.goto(f'{BASE_URL}signin')
-        page.wait_for_load_state('networkidle')
+        with step_timer.step('signin: 로그인 페이지 로딩'):
+            page.goto(f'{BASE_URL}signin')
+            page.wait_for_load_state('networkidle')
 
         # 로그인 정보 입력
-        page.get_by_role("textbox", name="Enter your Login ID or Email").fill(TEST_USER_EMAIL)
-        page.get_by_role("textbox", name="Password").fill(TEST_USER_PASSWORD)
-
-        # Sign In 버튼 클릭
-        page.get_by_role("button", name="Sign In").click()
+        with step_timer.step('signin: 계정 입력'):
+            page.get_by_role("textbox", name="Enter your Login ID or Email").fill(TEST_USER_EMAIL)
+            page.get_by_role("textbox", name="Password").fill(TEST_USER_PASSWORD)
+
+        # Sign In 버튼 클릭 후 signin 페이지를 벗어날 때까지의 시간
+        with step_timer.step('signin: 로그인 처리'):
+            page.get_by_role("button", name="Sign In").click()
+            page.wait_for_url(lambda url: 'signin' not in url, timeout=20000)
 
         # 로그인 처리 대기
         page.wait_for_timeout(3000)
@@ -0,0 +1,75 @@
+"""
+로그인 폭주 벤치마크 테스트 (동시 로그인 단계 증가)
+
+기본은 로컬 대역 API 서버(로그인 처리 용량을 흉내 낸 SigninGate)를 대상으로 하므로 서버 없이도 실행됩니다.
+실제 서버 측정은 BENCH_TARGET=server로 실행하세요 (STORM_BROWSERS개는 실제 브라우저로 로그인).
+
+환경 변수:
+    BENCH_TARGET      stub | server (기본 stub)
+    STORM_LEVELS      동시 로그인 수 (기본 4,16,64)
+    STORM_BROWSERS    브라우저로 로그인할 수 (server 전용, 기본 0)
+    STORM_SLA_P95     로그인 지연 p95 SLA 초 (기본 stub 0.15, server 2.0)
+"""
+import os
+import time
+
+import pytest
+
+from e2e.auth.signin.signin_storm import (
+    find_sla_break, format_breaks, format_storm_rows, parse_levels, record_storm, run_signin_storm,
+)
+from e2e.utils.stub_server import SigninGate
+
+BENCH_TARGET = os.getenv('BENCH_TARGET', 'stub')
+STORM_LEVELS = parse_levels(os.getenv('STORM_LEVELS', '4,16,64'))
+STORM_BROWSERS = int(os.getenv('STORM_BROWSERS', '0'))
+STORM_SLA_P95 = float(os.getenv('STORM_SLA_P95', '0.15' if BENCH_TARGET == 'stub' else '2.0'))
+
+
+@pytest.mark.auth
+@pytest.mark.benchmark
+class TestSigninStorm:
+    """
+    동시 로그인 지연/오류/잠금 비율과 SLA 초과 지점
+    """
+
+    def test_signin_storm_ramp(self, pytestconfig):
+        """
+        단계별 동시 로그인 측정 후 SLA를 넘는 동시성 보고
+
+        대역 서버는 4건씩 건당 20ms로 처리하므로 64건 동시 로그인에서 p95가 SLA를 넘어야 합니다.
+        """
+        started_at = time.time()
+        rows, target, samples = run_signin_storm(
+            STORM_LEVELS, BENCH_TARGET, STORM_BROWSERS, rounds=2, pause=0.1, sla_p95=STORM_SLA_P95,
+            stop_on_break=False, gate=SigninGate(work_ms=20, workers=4),
+        )
+        broken = find_sla_break(rows, STORM_SLA_P95)
+
+        print(f"\n[INFO] signin storm: target={target}")
+        for line in format_storm_rows(rows):
+            print(line)
+        for line in format_breaks(broken, STORM_SLA_P95):
+            print(line)
+        if not pytestconfig.getoption('no_run_history'):
+            record_storm(pytestconfig.getoption('run_history_db'), started_at, target, STORM_BROWSERS, rows)
+
+        assert {row['concurrency'] for row in rows} == set(STORM_LEVELS), "모든 단계가 기록되어야 합니다."
+        if BENCH_TARGET == 'stub':
+            assert not samples, samples
+            assert broken['signin:api']['concurrency'] == 64 and broken['signin:api']['last_ok'] == 16
+            assert broken['signin:api']['reasons'] == ['p95']
+
+    def test_lockout_and_throttle_rates(self):
+        """
+        잘못된 비밀번호가 섞이면 공용 계정이 잠기고(423), 대기열이 넘치면 제한(429)되는지 확인
+        """
+        rows, _, _ = run_signin_storm([8], rounds=2, bad_ratio=0.5, stop_on_break=False,
+                                      gate=SigninGate(lockout_after=3))
+        row = rows[0]
+        assert row['rejected'] >= 3, "잠기기 전의 잘못된 비밀번호는 거부(rejected)로 분류되어야 합니다."
+        assert row['locked'] >= 4 and row['lockout_rate'] > 0
+        assert find_sla_break(rows, 1.0)['signin:api']['reasons'] == ['lockout']
+
+        rows, _, _ = run_signin_storm([40], gate=SigninGate(work_ms=20, workers=2, queue=8))
+        assert rows[0]['locked'] > 0 and rows[0]['error_rate'] == 0.0
@@ -2,10 +2,21 @@
 E2E 테스트 공통 설정 및 픽스처
 """
 import os
+import time
 import pytest
 from playwright.sync_api import Page, BrowserContext, Browser
 from dotenv import load_dotenv
 
+from e2e.utils.api import ApiClient, ApiError
+from e2e.utils.datasets import Dataset, restore_dataset
+from e2e.utils.emulation import apply_to_context, apply_to_page, get_profile
+from e2e.utils.location_tree import LocationSnapshot
+from e2e.utils.memory import PageRecycler
+from e2e.utils.resources import DEFAULT_JOURNAL, ResourceRegistry, journal_path
+from e2e.utils.run_history import git_revision, record_run
+from e2e.utils.timeline import TimelineRecorder
+from e2e.utils.timing import StepTimer, TimingReport
+
 # 환경 변수 로드
 load_dotenv('.env.test')
 
@@ -14,6 +25,84 @@ BASE_URL = os.getenv('BASE_URL', 'http://localhost:3000')
 TEST_USER_EMAIL = os.getenv('TEST_USER_EMAIL', 'admin@test.com')
 TEST_USER_PASSWORD = os.getenv('TEST_USER_PASSWORD', 'test1234!')
 
+# 세션 전체의 단계별 시간 기록
+TIMING_REPORT_KEY = pytest.StashKey[TimingReport]()
+# 세션 시작 시각 및 테스트별 결과 (실행 이력 DB 기록용)
+SESSION_START_KEY = pytest.StashKey[float]()
+TEST_RESULTS_KEY = pytest.StashKey[dict]()
+# 타임라인 이벤트 수집기 (--timeline 지정 시에만 생성)
+TIMELINE_KEY = pytest.StashKey[TimelineRecorder]()
+
+
+def pytest_configure(config):
+    config.stash[TIMING_REPORT_KEY] = TimingReport()
+    config.stash[SESSION_START_KEY] = time.time()
+    config.stash[TEST_RESULTS_KEY] = {}
+    if config.getoption('--timeline'):
+        config.stash[TIMELINE_KEY] = TimelineRecorder()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    세션 종료 시 실행 이력 DB에 기록
+    """
+    config = session.config
+    if config.option.collectonly:
+        return
+    results = config.stash.get(TEST_RESULTS_KEY, {})
+    if not results:
+        return
+
+    report = config.stash.get(TIMING_REPORT_KEY, None)
+
+    recorder = config.stash.get(TIMELINE_KEY, None)
+    if recorder is not None:
+        path = config.getoption('--timeline')
+        worker = os.getenv('PYTEST_XDIST_WORKER')
+        if worker:
+            root, ext = os.path.splitext(path)
+            path = f"{root}-{worker}{ext or '.html'}"
+        recorder.write_html(path, report.records if report else [], title=f"E2E Timeline {worker or ''}".strip())
+        print(f"\n[INFO] Timeline saved: {path}")
+
+    if config.getoption('--no-run-history'):
+        return
+    browsers = config.getoption('browser', None) or ['chromium']
+    meta = {
+        'started_at': config.stash.get(SESSION_START_KEY, time.time()),
+        'finished_at': time.time(),
+        'base_url': BASE_URL,
+        'browser': ','.join(browsers),
+        'headless': not config.getoption('headed', False),
+        'profile': config.getoption('--emulation-profile') or 'none',
+        'git_rev': git_revision(),
+        'outcome': 'passed' if exitstatus == 0 else 'failed',
+    }
+    try:
+        run_id = record_run(
+            config.getoption('--run-history-db'),
+            meta,
+            [(test_id, outcome, duration) for test_id, (outcome, duration) in results.items()],
+            report.records if report else [],
+        )
+        print(f"\n[INFO] Run history saved: #{run_id} ({config.getoption('--run-history-db')})")
+    except Exception as e:
+        print(f"\n[WARNING] Failed to save run history: {e}")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    세션 종료 시 프로파일별 단계 시간 요약 출력
+    """
+    report = config.stash.get(TIMING_REPORT_KEY, None)
+    if report is None:
+        return
+    lines = report.format_summary()
+    if lines:
+        terminalreporter.section('step timing')
+        for line in lines:
+            terminalreporter.write_line(line)
+
 
 @pytest.fixture(scope='session')
 def browser_context_args(browser_context_args):
@@ -29,7 +118,84 @@ def browser_context_args(browser_context_args):
 
 
 @pytest.fixture(scope='session')
-def authenticated_context(browser: Browser):
+def session_emulation_profile(pytestconfig):
+    """
+    --emulation-profile 옵션으로 지정한 세션 공통 프로파일
+    """
+    return get_profile(pytestconfig.getoption('--emulation-profile'))
+
+
+@pytest.fixture
+def emulation_profile(request, session_emulation_profile):
+    """
+    테스트에 적용할 프로파일 (emulation 마커가 옵션보다 우선)
+    """
+    marker = request.node.get_closest_marker('emulation')
+    if marker and marker.args:
+        return get_profile(marker.args[0])
+    return session_emulation_profile
+
+
+@pytest.fixture
+def instrument_page(request):
+    """
+    --timeline 지정 시 페이지의 네트워크/대기/다이얼로그를 타임라인에 기록하는 함수
+    (지정하지 않으면 아무 동작도 하지 않음)
+    """
+    recorder = request.config.stash.get(TIMELINE_KEY, None)
+
+    def _instrument(page: Page):
+        if recorder is not None:
+            recorder.instrument_page(page, request.node.nodeid)
+        return page
+
+    return _instrument
+
+
+@pytest.fixture
+def step_timer(request, emulation_profile):
+    """
+    테스트 단계별 시간 계측기
+    """
+    timer = StepTimer(
+        request.node.nodeid,
+        request.config.stash.get(TIMING_REPORT_KEY, None),
+        emulation_profile.name,
+    )
+    yield timer
+    timer.stop()
+
+
+@pytest.fixture(scope='session')
+def resource_registry(pytestconfig):
+    """
+    테스트가 만든 장소/임직원 기록기 (세션 종료 시 API로 자식 -> 부모 순서 병렬 삭제)
+
+    이전 세션에서 정리하지 못한 저널 항목도 이어받아 함께 정리합니다.
+    --keep-resources 지정 시 삭제하지 않고 저널만 남깁니다.
+    """
+    registry = ResourceRegistry.load(journal_path(DEFAULT_JOURNAL))
+    if len(registry):
+        print(f"\n[INFO] 이전 세션에서 남은 테스트 데이터 {len(registry)}건을 이어받습니다: {registry.journal}")
+    yield registry
+
+    if not len(registry):
+        return
+    if pytestconfig.getoption('--keep-resources'):
+        print(f"\n[INFO] --keep-resources: 테스트 데이터 {len(registry)}건 유지 ({registry.journal})")
+        return
+    try:
+        report = registry.teardown()
+    except (ApiError, OSError) as e:
+        print(f"\n[WARNING] 테스트 데이터 정리 실패: {e} (저널: {registry.journal})")
+        return
+    print(f"\n[INFO] 테스트 데이터 정리: {report.summary()}")
+    for kind, name, message in report.failed[:5]:
+        print(f"[WARNING] {kind} {name}: {message}")
+
+
+@pytest.fixture(scope='session')
+def authenticated_context(browser: Browser, pytestconfig, session_emulation_profile):
     """
     인증된 브라우저 컨텍스트 생성 (세션 전체에서 재사용)
 
@@ -37,23 +203,33 @@ def authenticated_context(browser: Browser):
     - 폼 필드가 실제로 입력 가능한 상태일 때까지 대기
     - 로그인 성공 검증을 URL 변경으로 명확하게 처리
     - 각 단계마다 충분한 대기 시간 확보
+    - --emulation-profile 지정 시 모든 페이지에 스로틀링 적용
     """
     context = browser.new_context(
         viewport={'width': 1920, 'height': 1080},
         locale='ko-KR',
         timezone_id='Asia/Seoul',
     )
+    apply_to_context(context, session_emulation_profile)
+
+    timer = StepTimer(
+        'session:authenticated_context',
+        pytestconfig.stash.get(TIMING_REPORT_KEY, None),
+        session_emulation_profile.name,
+    )
 
     page = context.new_page()
 
     try:
         # 로그인 페이지로 이동 및 완전한 로딩 대기
+        timer.checkpoint('signin: 로그인 페이지 로딩')
         page.goto(f'{BASE_URL}signin', wait_until='networkidle')
 
         # 추가 대기: React 앱이 완전히 렌더링될 때까지
         page.wait_for_timeout(1000)
 
         # 로그인 폼 필드가 실제로 보일 때까지 대기 후 입력
+        timer.checkpoint('signin: 계정 입력')
         email_field = page.get_by_role("textbox", name="Enter your Login ID or Email")
         email_field.wait_for(state='visible', timeout=10000)
         email_field.fill(TEST_USER_EMAIL)
@@ -66,6 +242,7 @@ def authenticated_context(browser: Browser):
         sign_in_button = page.get_by_role("button", name="Sign In")
         sign_in_button.wait_for(state='visible', timeout=10000)
         page.wait_for_timeout(500)  # 버튼 활성화를 위한 추가 대기
+        timer.checkpoint('signin: 로그인 처리')
         sign_in_button.click()
 
         # 로그인 성공 확인: signin 페이지에서 벗어났는지 URL로 검증
@@ -73,7 +250,9 @@ def authenticated_context(browser: Browser):
         page.wait_for_url(lambda url: 'signin' not in url, timeout=20000)
 
         # 페이지 로딩 완료 대기
+        timer.checkpoint('signin: 메인 화면 로딩')
         page.wait_for_load_state('networkidle', timeout=15000)
+        timer.stop()
 
         # 추가 안전 대기: 메인 UI 요소 확인
         page.wait_for_timeout(2000)
@@ -96,6 +275,7 @@ def authenticated_context(browser: Browser):
 
         raise
     finally:
+        timer.stop()
         page.close()
 
     yield context
@@ -104,17 +284,40 @@ def authenticated_context(browser: Browser):
 
 
 @pytest.fixture
-def page(authenticated_context: BrowserContext):
+def page(authenticated_context: BrowserContext, emulation_profile, session_emulation_profile, instrument_page):
     """
     인증된 페이지 픽스처
     """
     page = authenticated_context.new_page()
+    instrument_page(page)
+    if emulation_profile != session_emulation_profile:
+        apply_to_page(page, emulation_profile)
     page.goto(BASE_URL)
     page.wait_for_load_state('networkidle')
     yield page
     page.close()
 
 
+@pytest.fixture
+def page_recycler(authenticated_context: BrowserContext, browser: Browser, step_timer, record_property,
+                  instrument_page, emulation_profile, request):
+    """
+    대량 처리 루프용 메모리 샘플링 및 페이지 자동 재생성기
+    정책은 RECYCLE_* 환경 변수로 조정 (e2e/utils/memory.py 참고)
+    """
+    recycler = PageRecycler(authenticated_context, browser, step_timer=step_timer, on_new_page=instrument_page,
+                            profile=emulation_profile)
+    yield recycler
+
+    # 재생성된 페이지는 아래 close()로 닫히므로 take_screenshot보다 먼저 실패 화면을 남김
+    save_failure_screenshot(recycler.current, request)
+    for line in recycler.report_lines():
+        print(line)
+    record_property('memory_samples', len(recycler.samples))
+    record_property('page_recycles', [(e.row, e.reason) for e in recycler.events])
+    recycler.close()
+
+
 @pytest.fixture
 def goto_location_page(page: Page):
     """
@@ -130,38 +333,116 @@ def goto_location_page(page: Page):
 
 
 @pytest.fixture
-def navigate_to_location(page: Page):
+def navigate_to_location(page: Page, step_timer):
     """
     메인 페이지에서 장소 관리 페이지로 메뉴를 통해 이동하는 헬퍼 픽스처
     """
     def _navigate():
-        page.get_by_role("button", name="출입 통합 관리").click()
-        page.wait_for_timeout(500)
-        page.get_by_role("button", name="장소 정보 관리").click()
-        page.wait_for_timeout(1000)
-        page.wait_for_load_state('networkidle')
+        with step_timer.step('location: 장소 관리 화면 진입'):
+            page.get_by_role("button", name="출입 통합 관리").click()
+            page.wait_for_timeout(500)
+            page.get_by_role("button", name="장소 정보 관리").click()
+            page.wait_for_timeout(1000)
+            page.wait_for_load_state('networkidle')
         return page
 
     return _navigate
 
 
+@pytest.fixture(scope='module')
+def dataset(request):
+    """
+    모듈의 dataset 마커로 지정한 데이터셋을 모듈 시작 전에 복원 (e2e/fixtures/datasets/<이름>.json)
+
+    사용 예 (테스트 모듈 상단):
+        pytestmark = pytest.mark.dataset('employee-basic')
+    """
+    marker = request.node.get_closest_marker('dataset')
+    if marker is None or not marker.args:
+        pytest.fail("dataset 픽스처는 모듈에 pytestmark = pytest.mark.dataset('<이름>')가 필요합니다.")
+    data = Dataset.load(marker.args[0])
+    report = restore_dataset(data)
+    print(f"\n[INFO] 데이터셋 복원: {report.summary()}")
+    if report.failed:
+        pytest.fail(f"데이터셋 복원 실패: {report.failed[:3]}")
+    return data
+
+
+@pytest.fixture(scope='module')
+def location_parents(resource_registry, pytestconfig):
+    """
+    모듈 공용 부모 장소 체인 (API로 한 번 생성, 모듈 종료 시 하위 장소까지 삭제)
+
+    [{'id', 'name'}, ...] 순서로 1단 -> 2단 부모이며, 2단 테스트는 [0], 3단 테스트는 [1] 아래에
+    테스트 대상 장소만 UI로 추가합니다. 정리에 실패하면 세션 종료 시 resource_registry가 다시 정리합니다.
+    --keep-resources 지정 시 삭제하지 않고 저널에 남깁니다.
+    """
+    client = ApiClient().login()
+    timestamp = int(time.time())
+    chain = []
+    for depth in (1, 2):
+        name = f'공용부모_{depth}_{timestamp}'
+        parent = chain[-1] if chain else None
+        response = client.create_location(name, '사무공간', order=10 * depth,
+                                          parent_id=parent['id'] if parent else None)
+        location_id = response.get('id') if isinstance(response, dict) else None
+        if location_id is None:
+            # id를 돌려주지 않는 서버는 목록에서 이름으로 찾음
+            snapshot = LocationSnapshot.from_api(client)
+            location_id = snapshot.ids[snapshot.find(name)[-1]]
+        resource_registry.add('location', name, id=location_id, parent=parent['name'] if parent else None,
+                              test_id='fixture:location_parents')
+        chain.append({'id': location_id, 'name': name})
+    print(f"\n[INFO] 공용 부모 장소 생성: {' / '.join(p['name'] for p in chain)}")
+    yield chain
+
+    if pytestconfig.getoption('--keep-resources'):
+        return
+    # 테스트가 남긴 자식까지 잎부터 높이별 묶음으로 삭제
+    module_registry = ResourceRegistry()
+    module_registry.add('location', chain[0]['name'], id=chain[0]['id'])
+    report = module_registry.teardown()
+    if report.failed:
+        print(f"\n[WARNING] 공용 부모 장소 정리 실패: {report.failed[:3]}")
+        return
+    for parent in chain:
+        resource_registry.discard('location', parent['name'])
+
+
+def save_failure_screenshot(page: Page | None, request):
+    """
+    테스트가 실패했으면 page 스크린샷 저장 (테스트당 한 번, 닫힌 페이지는 건너뜀)
+    """
+    rep_call = getattr(request.node, 'rep_call', None)
+    if rep_call is None or not rep_call.failed or getattr(request.node, 'failure_screenshot', None):
+        return
+    if page is None or page.is_closed():
+        return
+
+    screenshot_dir = 'playwright-report/screenshots'
+    os.makedirs(screenshot_dir, exist_ok=True)
+
+    screenshot_path = os.path.join(
+        screenshot_dir,
+        f'{request.node.name}.png'
+    )
+    page.screenshot(path=screenshot_path, full_page=True)
+    request.node.failure_screenshot = screenshot_path
+    print(f'스크린샷 저장: {screenshot_path}')
+
+
 @pytest.fixture
 def take_screenshot(page: Page, request):
     """
     테스트 실패 시 자동 스크린샷
+
+    page_recycler가 페이지를 재생성했다면 원래 page는 닫혀 있으므로 재생성기의 현재 페이지를 찍습니다.
     """
     yield
 
-    if request.node.rep_call.failed:
-        screenshot_dir = 'playwright-report/screenshots'
-        os.makedirs(screenshot_dir, exist_ok=True)
-
-        screenshot_path = os.path.join(
-            screenshot_dir,
-            f'{request.node.name}.png'
-        )
-        page.screenshot(path=screenshot_path, full_page=True)
-        print(f'스크린샷 저장: {screenshot_path}')
+    recycler = request.node.funcargs.get('page_recycler')
+    current = recycler.current if recycler is not None and recycler.current is not None else page
+    save_failure_screenshot(current, request)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -172,3 +453,15 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
     setattr(item, f'rep_{rep.when}', rep)
+
+    # 실행 이력 DB용 테스트별 결과 누적 (setup/call/teardown 합산, 실패가 있으면 실패)
+    results = item.config.stash.get(TEST_RESULTS_KEY, None)
+    if results is not None:
+        previous, duration = results.get(rep.nodeid, ('passed', 0.0))
+        if rep.failed or previous == 'failed':
+            current = 'failed'
+        elif rep.skipped or previous == 'skipped':
+            current = 'skipped'
+        else:
+            current = 'passed'
+        results[rep.nodeid] = (current, duration + rep.duration)
@@ -0,0 +1,5 @@
+"""
+E2E 테스트 공통 유틸리티
+
+테스트 코드에서 반복되는 계측/에뮬레이션 로직을 모아둔 패키지
+"""
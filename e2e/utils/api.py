@@ -0,0 +1,208 @@
+"""
+백엔드 REST API 경량 클라이언트 (표준 라이브러리 urllib)
+
+브라우저 없이 임직원 추가/검색/삭제를 반복하는 벤치마크, 부하 생성, 데이터 준비/정리용입니다.
+UI가 호출하는 API 경로는 서버 버전에 따라 다를 수 있으므로 ENDPOINTS는 환경 변수로 덮어쓸 수 있습니다.
+로컬 대역 서버(e2e/utils/stub_server.py)도 같은 경로를 제공합니다.
+
+환경 변수:
+    API_BASE_URL              API 서버 주소 (기본: BASE_URL)
+    API_SIGNIN_PATH           로그인 (POST)
+    API_EMPLOYEES_PATH        임직원 목록/검색 (GET), 추가 (POST)
+    API_EMPLOYEE_PATH         임직원 단건 삭제 (DELETE), {id} 치환
+    API_LOCATIONS_PATH        장소 전체 계층 (GET, 평면 목록 또는 children 중첩), 추가 (POST)
+    API_LOCATION_PATH         장소 단건 수정 (PATCH), 삭제 (DELETE), {id} 치환
+    API_ACCESS_CASES_PATH     출입 케이스 목록 (GET), 추가 (POST)
+
+stub_snapshot/stub_restore는 대역 서버 전용 경로입니다 (실제 서버는 404).
+"""
+import json
+import os
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.cookiejar import CookieJar
+from typing import Any, Callable
+
+from e2e.utils import settings
+
+API_BASE_URL = os.getenv('API_BASE_URL', settings.BASE_URL)
+
+ENDPOINTS = {
+    'signin': os.getenv('API_SIGNIN_PATH', '/api/auth/signin'),
+    'employees': os.getenv('API_EMPLOYEES_PATH', '/api/employees'),
+    'employee': os.getenv('API_EMPLOYEE_PATH', '/api/employees/{id}'),
+    'locations': os.getenv('API_LOCATIONS_PATH', '/api/locations'),
+    'location': os.getenv('API_LOCATION_PATH', '/api/locations/{id}'),
+    'access_cases': os.getenv('API_ACCESS_CASES_PATH', '/api/access-cases'),
+    'stub_snapshot': '/__stub/snapshots/{id}',
+    'stub_restore': '/__stub/snapshots/{id}/restore',
+}
+
+# 응답 시간 콜백: (endpoint 키, HTTP 메서드, 상태 코드, 소요 시간(초))
+ResponseHook = Callable[[str, str, int, float], None]
+
+
+class ApiError(Exception):
+    """
+    2xx가 아닌 응답 또는 연결 실패 (status 0)
+    """
+
+    def __init__(self, status: int, message: str, endpoint: str = ''):
+        super().__init__(f"[{status}] {endpoint}: {message}")
+        self.status = status
+        self.endpoint = endpoint
+
+
+def items_of(response: Any) -> list[dict]:
+    """
+    목록 응답에서 레코드 배열 추출 (배열 그대로 또는 items/content/data/list 키)
+    """
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        for key in ('items', 'content', 'data', 'list', 'employees', 'locations', 'accessCases'):
+            value = response.get(key)
+            if isinstance(value, list):
+                return value
+            if isinstance(value, dict):
+                return items_of(value)
+    return []
+
+
+class ApiClient:
+    """
+    로그인 세션(쿠키 + Bearer 토큰)을 유지하는 API 클라이언트
+
+    인스턴스 하나를 스레드 하나(가상 사용자 하나)에서 사용합니다.
+
+    사용 예:
+        client = ApiClient()
+        client.login()
+        client.list_employees(name="홍길동")
+    """
+
+    def __init__(self, base_url: str | None = None, timeout: float = 10.0,
+                 on_response: ResponseHook | None = None):
+        self.base_url = (base_url or API_BASE_URL).rstrip('/')
+        self.timeout = timeout
+        self.on_response = on_response
+        self.token: str | None = None
+        self.cookies = CookieJar()
+        self._opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies))
+
+    def request(self, method: str, endpoint: str, path_params: dict | None = None,
+                query: dict | None = None, body: Any = None) -> Any:
+        """
+        ENDPOINTS[endpoint]로 요청을 보내고 JSON 응답을 반환 (본문이 없으면 None)
+        """
+        path = ENDPOINTS[endpoint].format(**(path_params or {}))
+        url = f"{self.base_url}{path}"
+        if query:
+            query = {k: v for k, v in query.items() if v not in (None, '')}
+            url += '?' + urllib.parse.urlencode(query)
+
+        headers = {'Accept': 'application/json'}
+        data = None
+        if body is not None:
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+
+        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        start = time.perf_counter()
+        status = 0
+        try:
+            with self._opener.open(req, timeout=self.timeout) as resp:
+                status = resp.status
+                payload = resp.read()
+        except urllib.error.HTTPError as e:
+            status = e.code
+            raise ApiError(e.code, e.read().decode('utf-8', 'replace')[:200], endpoint) from None
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+            raise ApiError(0, str(e), endpoint) from None
+        finally:
+            if self.on_response is not None:
+                self.on_response(endpoint, method, status, time.perf_counter() - start)
+
+        if not payload:
+            return None
+        return json.loads(payload)
+
+    def login(self, user: str | None = None, password: str | None = None) -> 'ApiClient':
+        """
+        로그인 (응답의 accessToken/token을 이후 요청의 Bearer 토큰으로 사용, 쿠키 세션도 유지)
+        """
+        response = self.request('POST', 'signin', body={
+            'email': user or settings.TEST_USER_EMAIL,
+            'password': password or settings.TEST_USER_PASSWORD,
+        })
+        if isinstance(response, dict):
+            data = response.get('data') if isinstance(response.get('data'), dict) else response
+            self.token = data.get('accessToken') or data.get('token')
+        return self
+
+    # ========================================================================
+    # 임직원
+    # ========================================================================
+
+    def list_employees(self, name: str | None = None, employee_id: str | None = None,
+                       department: str | None = None, page: int = 1, size: int = 20) -> Any:
+        return self.request('GET', 'employees', query={
+            'name': name, 'employeeId': employee_id, 'department': department, 'page': page, 'size': size,
+        })
+
+    def create_employee(self, employee: dict) -> Any:
+        """
+        employee: generate_dataset 레코드 형식 (id, name, email, department, job_grade, ...)
+        """
+        return self.request('POST', 'employees', body={
+            'employeeId': employee['id'],
+            'name': employee['name'],
+            'email': employee.get('email') or f"{employee['id']}@secern.ai",
+            'department': employee.get('department'),
+            'jobGrade': employee.get('job_grade'),
+            'jobPosition': employee.get('job_position'),
+            'accessCases': employee.get('access_cases', []),
+            'rfCards': employee.get('rf_card', []),
+        })
+
+    def delete_employee(self, employee_id: str) -> Any:
+        return self.request('DELETE', 'employee', path_params={'id': employee_id})
+
+    # ========================================================================
+    # 장소
+    # ========================================================================
+
+    def list_locations(self) -> Any:
+        """
+        장소 전체 계층 (한 번의 요청)
+        """
+        return self.request('GET', 'locations')
+
+    def create_location(self, name: str, location_type: str = '사무공간', order: int = 1,
+                        parent_id: Any = None) -> Any:
+        return self.request('POST', 'locations', body={
+            'name': name, 'type': location_type, 'order': order, 'parentId': parent_id,
+        })
+
+    def update_location(self, location_id: Any, changes: dict) -> Any:
+        """
+        changes: 바꿀 항목만 ({'parentId', 'order', 'name', 'type'} 중, parentId None은 최상위로 이동)
+        """
+        return self.request('PATCH', 'location', path_params={'id': location_id}, body=changes)
+
+    def delete_location(self, location_id: Any) -> Any:
+        return self.request('DELETE', 'location', path_params={'id': location_id})
+
+    # ========================================================================
+    # 출입 케이스
+    # ========================================================================
+
+    def list_access_cases(self) -> Any:
+        return self.request('GET', 'access_cases')
+
+    def create_access_case(self, name: str) -> Any:
+        return self.request('POST', 'access_cases', body={'name': name})
@@ -0,0 +1,780 @@
+"""
+asyncio 기반 대량 처리 실행 코어 (playwright.async_api)
+
+동기 테스트는 스레드 하나가 페이지 하나만 다룰 수 있어 I/O를 겹칠 수 없습니다.
+이 모듈은 하나의 프로세스/브라우저에서 여러 컨텍스트(작업자)를 동시에 구동하고,
+행 파싱/이미지 준비/Excel 저장 같은 순수 Python 작업은 executor로 넘겨
+이벤트 루프가 막히지 않도록 합니다.
+
+JSON/Excel 해석과 '인원' 시트 기록은 동기 테스트와 같은 e2e.utils.employee_data를 사용합니다.
+
+실행 예:
+    python -m e2e.utils.async_core add --excel e2e/access/employee/em_add.xlsx --concurrency 8
+    python -m e2e.utils.async_core add --json e2e/access/employee/em_add.json --concurrency 4
+    python -m e2e.utils.async_core add --excel e2e/access/employee/em_add.xlsx --pipeline --tabs 2
+    python -m e2e.utils.async_core remove --json e2e/access/employee/em_remove.json --concurrency 4
+    python -m e2e.utils.async_core locations --spec tree.json --concurrency 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from typing import Any, Awaitable, Callable
+
+from playwright.async_api import Browser, BrowserContext, Page, async_playwright, expect
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from e2e.utils import settings
+from e2e.utils.date_picker import (
+    ASSIGNMENT_DATE_GROUP, FIELD_STATE_JS, NEXT_MONTH, OPEN_PICKER_LABEL, PREVIOUS_MONTH,
+    calendar_plan, date_keys, parse_calendar_header, section_order, value_matches,
+)
+from e2e.utils.employee_data import (
+    list_image_files, load_employees_json, make_unique_name, parse_assignment_date, personnel_row,
+    prepare_upload_image, read_excel_employees, save_personnel_rows,
+)
+
+
+@dataclass
+class BulkResult:
+    """
+    작업 하나의 처리 결과
+
+    Attributes:
+        index: 입력 순서
+        key: 처리 대상 식별자 (사번, 장소 이름 등)
+        ok: 성공 여부
+        duration: 처리 시간 (초)
+        error: 실패 사유
+        data: 후처리에 필요한 부가 정보
+        saved_at: "저장" 클릭 시각 (time.perf_counter, 파이프라인 추가에서만 기록)
+    """
+    index: int
+    key: str
+    ok: bool
+    duration: float
+    error: str | None = None
+    data: Any = None
+    saved_at: float | None = None
+
+
+# ============================================================================
+# 페이지 단위 플로우 (동기 테스트와 같은 셀렉터 사용)
+# ============================================================================
+
+async def open_employee_list(page: Page):
+    """
+    메뉴를 통해 임직원 출입자 목록으로 이동
+    """
+    await page.goto(settings.url())
+    await page.wait_for_load_state('networkidle')
+    await page.get_by_role("button", name="출입 통합 관리").click()
+    await page.get_by_role("button", name="임직원 출입자 관리").click()
+    tab = page.get_by_role("tab", name="임직원 출입자")
+    await tab.wait_for(state='visible')
+    await tab.click()
+    await page.wait_for_load_state('networkidle')
+
+
+async def _select_option(page: Page, trigger_selector: str, name: str):
+    """
+    MUI Select 드롭다운에서 이름이 일치하는 옵션 선택 (동일 이름이 여러 개면 첫 번째)
+    """
+    await page.locator(trigger_selector).click()
+    await page.get_by_role("option").first.wait_for(state="visible", timeout=5000)
+    option = page.get_by_role("option", name=name, exact=True)
+    if await option.count() == 0:
+        await page.keyboard.press('Escape')
+        raise LookupError(f"옵션을 찾을 수 없음: {trigger_selector} -> {name}")
+    await option.first.click()
+
+
+async def set_date(page: Page, value: date, group_name: str = ASSIGNMENT_DATE_GROUP,
+                   today: date | None = None):
+    """
+    date_picker.set_date / pick_from_calendar의 async 버전 (같은 호출 순서와 calendar_plan 판단)
+    """
+    group = page.get_by_role("group", name=group_name)
+    state = await group.evaluate(FIELD_STATE_JS)
+    order = section_order(state)
+    if state['spinbuttons']:
+        await group.locator('[role="spinbutton"]').first.click()
+    else:
+        await group.locator('input').first.click()
+        await page.keyboard.press('ControlOrMeta+a')
+    await page.keyboard.type(date_keys(order, value))
+    if value_matches(await group.evaluate(FIELD_STATE_JS), order, value):
+        return 'typed'
+
+    today = today or date.today()
+    await group.get_by_label(OPEN_PICKER_LABEL).click()
+    dialog = page.get_by_role("dialog")
+    try:
+        await dialog.get_by_role("grid").wait_for(state='visible', timeout=3000)
+        shown = parse_calendar_header(await dialog.inner_text())
+    except PlaywrightTimeoutError:
+        shown = None
+
+    use_today, steps = calendar_plan(shown, value, today)
+    if use_today:
+        today_button = page.get_by_role("button", name="오늘", exact=True)
+        if await today_button.is_visible():
+            await today_button.click()
+            return 'calendar'
+
+    button = page.get_by_role("button", name=NEXT_MONTH if steps > 0 else PREVIOUS_MONTH)
+    for _ in range(abs(steps)):
+        header = await dialog.inner_text()
+        await button.click()
+        await expect(dialog).not_to_have_text(header, use_inner_text=True)
+    await page.get_by_role("gridcell", name=str(value.day), exact=True).click()
+    return 'calendar'
+
+
+async def add_employee(page: Page, employee_id: str, name: str, employee_data: dict, image_path: str):
+    """
+    /employeeadd 폼 입력 후 저장하고 목록에서 사번을 확인
+    """
+    await fill_employee_form(page, employee_id, name, employee_data, image_path)
+    await page.get_by_role("button", name="저장").click()
+    await confirm_employee_saved(page, employee_id)
+
+
+async def fill_employee_form(page: Page, employee_id: str, name: str, employee_data: dict, image_path: str):
+    """
+    목록에서 "임직원 추가"로 이동해 폼 입력 ("저장"은 누르지 않음)
+    """
+    await page.get_by_role("button", name="임직원 추가").click()
+    await page.wait_for_url("**/employeeadd")
+
+    async with page.expect_file_chooser() as fc_info:
+        await page.locator(".MuiSvgIcon-root.MuiSvgIcon-fontSizeMedium.css-185tx24 > path").first.click()
+    await (await fc_info.value).set_files(image_path)
+
+    await page.get_by_label("사번").fill(employee_id)
+    await page.get_by_label("이름").fill(name)
+    await page.get_by_label("이메일").fill(f"{employee_id}@secern.ai")
+
+    if employee_data.get("department"):
+        await _select_option(page, "#mui-component-select-departmentId", employee_data["department"])
+    if employee_data.get("job_grade"):
+        await _select_option(page, "#mui-component-select-jobGradeId", employee_data["job_grade"])
+    if employee_data.get("job_position"):
+        await _select_option(page, "#mui-component-select-jobPositionId", employee_data["job_position"])
+
+    assignment_start = parse_assignment_date(employee_data.get("assignment_start_date"))
+    if assignment_start:
+        await set_date(page, assignment_start)
+
+    access_cases = [c.strip() for c in employee_data.get("access_cases", []) if c and c.strip()]
+    if access_cases:
+        await page.locator("#mui-component-select-accessCaseId").click()
+        await page.get_by_role("option").first.wait_for(state="visible", timeout=3000)
+        for case_name in access_cases:
+            case_option = page.get_by_role("option", name=case_name, exact=True)
+            if await case_option.count():
+                await case_option.first.click()
+        await page.keyboard.press('Escape')
+
+    rf_cards = [c.strip() for c in employee_data.get("rf_card", []) if c and c.strip()]
+    if rf_cards:
+        await page.get_by_role("combobox", name="출입 카드").click()
+        await page.get_by_role("option").first.wait_for(state="visible", timeout=3000)
+        for card_value in rf_cards:
+            await page.get_by_role("option").filter(has_text=card_value).first.click()
+        await page.keyboard.press('Escape')
+
+    async with page.expect_file_chooser() as fc_info:
+        await page.locator("div").filter(has_text=re.compile(r"^출입자 이미지$")).locator("svg").first.click()
+    await (await fc_info.value).set_files(image_path)
+
+
+async def confirm_employee_saved(page: Page, employee_id: str):
+    """
+    "저장" 후 목록으로 돌아와 사번 셀이 보일 때까지 대기
+    """
+    await page.wait_for_load_state('networkidle', timeout=15000)
+    await page.get_by_role("cell", name=employee_id, exact=True).wait_for(state='visible', timeout=10000)
+
+
+# /employeeadd 드롭다운 -> 카탈로그 키
+CATALOG_SELECTS = {
+    "departments": "#mui-component-select-departmentId",
+    "job_grades": "#mui-component-select-jobGradeId",
+    "job_positions": "#mui-component-select-jobPositionId",
+    "access_cases": "#mui-component-select-accessCaseId",
+}
+
+
+async def _option_texts(page: Page) -> list[str]:
+    await page.get_by_role("option").first.wait_for(state="visible", timeout=5000)
+    texts = await page.get_by_role("option").all_inner_texts()
+    await page.keyboard.press('Escape')
+    return [t.strip() for t in texts if t.strip()]
+
+
+async def read_employee_catalog(page: Page) -> dict[str, list[str]]:
+    """
+    /employeeadd 화면의 드롭다운 옵션(부서/직급/직책/출입케이스/출입 카드) 수집
+
+    임직원 목록 화면에서 호출합니다. 저장하지 않고 목록으로 돌아갑니다.
+    """
+    await page.get_by_role("button", name="임직원 추가").click()
+    await page.wait_for_url("**/employeeadd")
+
+    catalog = {}
+    for key, selector in CATALOG_SELECTS.items():
+        await page.locator(selector).click()
+        catalog[key] = await _option_texts(page)
+    await page.get_by_role("combobox", name="출입 카드").click()
+    try:
+        catalog["rf_cards"] = await _option_texts(page)
+    except PlaywrightTimeoutError:
+        # 등록된 카드가 없으면 옵션 목록이 열리지 않음
+        await page.keyboard.press('Escape')
+        catalog["rf_cards"] = []
+
+    await page.go_back()
+    await page.wait_for_load_state('networkidle')
+    return catalog
+
+
+async def search_employee(page: Page, text: str):
+    """
+    test_search_and_delete_employee와 같은 절차로 필터 -> 이름 입력 -> 검색 후 결과 셀 대기
+    """
+    name_input = page.get_by_role("textbox", name="이름")
+    if not await name_input.is_visible():
+        await page.get_by_role("button", name="필터").click()
+    await name_input.fill(text)
+    await page.get_by_role("button", name="검색").click()
+    await page.get_by_role("cell", name=text, exact=True).first.wait_for(state='visible', timeout=10000)
+
+
+async def delete_employee(page: Page, name: str):
+    """
+    목록에서 이름(또는 사번) 셀을 선택해 삭제
+    """
+    cell = page.get_by_role("cell", name=name).first
+    await cell.wait_for(state='visible', timeout=5000)
+    await cell.click()
+    # 삭제 버튼 -> 확인 다이얼로그의 삭제 버튼
+    await page.get_by_role("button", name="삭제").click()
+    await page.get_by_role("button", name="삭제").last.click()
+    await cell.wait_for(state='hidden', timeout=5000)
+
+
+async def top_employee_names(page: Page, count: int) -> list[str]:
+    """
+    목록 상단에서 count명의 식별 셀(세 번째 컬럼) 텍스트를 한 번의 evaluate로 수집
+    """
+    await page.locator("td:nth-child(3)").first.wait_for(state='visible', timeout=5000)
+    texts = await page.locator("td:nth-child(3)").evaluate_all(
+        "(cells, n) => cells.slice(0, n).map(c => c.textContent.trim())", count
+    )
+    return [t for t in texts if t]
+
+
+async def open_location_page(page: Page):
+    """
+    메뉴를 통해 장소 정보 관리 화면으로 이동
+    """
+    await page.goto(settings.url())
+    await page.wait_for_load_state('networkidle')
+    await page.get_by_role("button", name="출입 통합 관리").click()
+    await page.get_by_role("button", name="장소 정보 관리").click()
+    await page.wait_for_load_state('networkidle')
+
+
+async def create_location(page: Page, name: str, location_type: str = "사무공간", order: int = 1,
+                          parent: str | None = None):
+    """
+    장소 추가 (parent가 있으면 부모 treeitem을 선택한 뒤 추가)
+    """
+    if parent:
+        parent_item = page.get_by_role("treeitem", name=parent)
+        await parent_item.wait_for(state='visible', timeout=5000)
+        await parent_item.click()
+
+    await page.get_by_role("button", name="장소 추가").click()
+    name_field = page.get_by_role("textbox", name="장소 이름")
+    await name_field.wait_for(state='visible')
+    await name_field.fill(name)
+    await page.get_by_label("", exact=True).click()
+    await page.get_by_role("option", name=location_type).click()
+    await page.get_by_role("spinbutton", name="표시 순서").fill(str(order))
+    await page.get_by_role("button", name="저장").click()
+    await page.wait_for_load_state('networkidle', timeout=10000)
+    await page.get_by_role("treeitem", name=name).wait_for(state='visible', timeout=5000)
+
+
+async def delete_location(page: Page, name: str):
+    """
+    장소 선택 후 삭제
+    """
+    item = page.get_by_role("treeitem", name=name)
+    await item.wait_for(state='visible', timeout=5000)
+    await item.click()
+    await page.get_by_role("button", name="삭제").click()
+    await page.wait_for_load_state('networkidle', timeout=10000)
+    await item.wait_for(state='hidden', timeout=5000)
+
+
+# ============================================================================
+# 실행 코어
+# ============================================================================
+
+def _accept_dialog(dialog):
+    asyncio.ensure_future(dialog.accept())
+
+
+class AsyncBulkRunner:
+    """
+    하나의 브라우저에서 여러 인증 컨텍스트를 동시에 구동하는 실행기
+
+    로그인은 한 번만 수행하고 storage_state를 각 작업자 컨텍스트에 복사합니다.
+
+    사용 예:
+        async with AsyncBulkRunner(concurrency=8) as runner:
+            results = await runner.add_employees(employees, image_dir)
+    """
+
+    def __init__(self, base_url: str | None = None, user: str | None = None, password: str | None = None,
+                 concurrency: int = 4, headless: bool | None = None, browser_name: str = 'chromium',
+                 io_workers: int | None = None, cpu_workers: int | None = None):
+        self.base_url = base_url or settings.BASE_URL
+        self.user = user or settings.TEST_USER_EMAIL
+        self.password = password or settings.TEST_USER_PASSWORD
+        self.concurrency = max(1, concurrency)
+        self.headless = settings.HEADLESS if headless is None else headless
+        self.browser_name = browser_name
+        # Excel 읽기/쓰기 등 I/O 작업용, 이미지 변환 등 CPU 작업용 executor 분리
+        self.io_executor = ThreadPoolExecutor(max_workers=io_workers or 4)
+        self.cpu_executor = ProcessPoolExecutor(max_workers=cpu_workers) if cpu_workers else None
+        self._playwright = None
+        self.browser: Browser | None = None
+        self.storage_state: dict | None = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def start(self):
+        self._playwright = await async_playwright().start()
+        self.browser = await getattr(self._playwright, self.browser_name).launch(headless=self.headless)
+        self.storage_state = await self._login()
+
+    async def close(self):
+        if self.browser is not None:
+            await self.browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self.io_executor.shutdown(wait=False)
+        if self.cpu_executor is not None:
+            self.cpu_executor.shutdown(wait=False)
+
+    async def offload(self, fn: Callable, *args, cpu: bool = False, **kwargs):
+        """
+        순수 Python 작업을 executor에서 실행
+        """
+        executor = self.cpu_executor if cpu and self.cpu_executor is not None else self.io_executor
+        return await asyncio.get_running_loop().run_in_executor(executor, partial(fn, *args, **kwargs))
+
+    async def new_context(self) -> BrowserContext:
+        return await self.browser.new_context(
+            storage_state=self.storage_state,
+            viewport={'width': 1920, 'height': 1080},
+            locale='ko-KR',
+            timezone_id='Asia/Seoul',
+        )
+
+    async def _login(self) -> dict:
+        """
+        conftest.authenticated_context와 같은 절차로 로그인 후 storage_state 반환
+        """
+        context = await self.browser.new_context(locale='ko-KR', timezone_id='Asia/Seoul')
+        page = await context.new_page()
+        try:
+            await page.goto(settings.url('signin'), wait_until='networkidle')
+            await page.get_by_role("textbox", name="Enter your Login ID or Email").fill(self.user)
+            await page.get_by_role("textbox", name="Password").fill(self.password)
+            await page.get_by_role("button", name="Sign In").click()
+            await page.wait_for_url(lambda url: 'signin' not in url, timeout=20000)
+            await page.wait_for_load_state('networkidle', timeout=15000)
+            print(f"[OK] Login successful: {page.url}")
+            return await context.storage_state()
+        finally:
+            await context.close()
+
+    async def _recover(self, context: BrowserContext, page: Page, prepare: Callable[[Page], Awaitable[None]],
+                       label: str) -> Page:
+        """
+        실패 후 초기 화면으로 복귀 (복귀도 실패하면 탭을 닫고 새 탭에서 한 번 더 시도)
+
+        여기서는 예외를 올리지 않으므로 작업자 하나의 복귀 실패가 gather 전체를 중단시키지 않습니다.
+
+        Returns:
+            Page: 이후 작업에 쓸 페이지 (교체했으면 새 탭)
+        """
+        try:
+            await prepare(page)
+            return page
+        except Exception as e:
+            print(f"[WARNING] {label}: 초기 화면 복귀 실패, 새 탭으로 교체 ({e})")
+        try:
+            await page.close()
+            page = await context.new_page()
+            page.on("dialog", _accept_dialog)
+            await prepare(page)
+        except Exception as e:
+            print(f"[WARNING] {label}: 새 탭 초기 화면 실패 ({e})")
+        return page
+
+    async def run_jobs(self, jobs: list, handler: Callable[[Page, int, Any], Awaitable[BulkResult]],
+                       prepare: Callable[[Page], Awaitable[None]] | None = None,
+                       concurrency: int | None = None) -> list[BulkResult]:
+        """
+        작업 목록을 concurrency개의 작업자 페이지로 나누어 실행
+
+        각 작업자는 자신의 컨텍스트/페이지를 가지며 큐에서 작업을 꺼내 처리합니다.
+        결과는 입력 순서대로 반환됩니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, job in enumerate(jobs):
+            queue.put_nowait((index, job))
+
+        results: list[BulkResult | None] = [None] * len(jobs)
+        worker_count = min(concurrency or self.concurrency, len(jobs)) or 1
+
+        async def worker(worker_id: int):
+            context = await self.new_context()
+            page = await context.new_page()
+            page.on("dialog", _accept_dialog)
+            try:
+                if prepare is not None:
+                    page = await self._recover(context, page, prepare, f"worker={worker_id}")
+                while True:
+                    try:
+                        index, job = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    start = time.time()
+                    try:
+                        results[index] = await handler(page, index, job)
+                    except Exception as e:
+                        results[index] = BulkResult(index, str(job), False, time.time() - start, str(e))
+                        print(f"[ERROR] worker={worker_id}, job={index}: {e}")
+                        # 실패 후 화면 상태를 알 수 없으므로 초기 화면으로 복귀
+                        if prepare is not None:
+                            page = await self._recover(context, page, prepare, f"worker={worker_id}")
+            finally:
+                await context.close()
+
+        await asyncio.gather(*(worker(i) for i in range(worker_count)))
+        return [r for r in results if r is not None]
+
+    # ------------------------------------------------------------------------
+    # 대량 처리 플로우
+    # ------------------------------------------------------------------------
+
+    async def _employee_jobs(self, employees: list[dict], image_dir: str) -> list[tuple[dict, str]]:
+        """
+        Excel 데이터(original_index 있음)는 해당 순번의 이미지, JSON 데이터는 입력 순서의 이미지로 작업 구성
+        """
+        image_files = await self.offload(list_image_files, image_dir)
+        jobs = []
+        for idx, employee_data in enumerate(employees):
+            image_index = (employee_data.get("original_index") or idx + 1) - 1
+            if not 0 <= image_index < len(image_files):
+                print(f"[WARNING] Invalid image index {image_index + 1}, skipping...")
+                continue
+            jobs.append((employee_data, image_files[image_index]))
+        return jobs
+
+    async def _prepare_employee(self, job: tuple[dict, str], image_dir: str) -> tuple[str, str, str]:
+        """
+        작업 -> (사번, 이름, 업로드 이미지 경로)
+        """
+        employee_data, image_filename = job
+        employee_id = os.path.splitext(image_filename)[0]
+        name = employee_data.get("name") or make_unique_name(employee_id)
+        image_path = await self.offload(
+            prepare_upload_image, os.path.join(image_dir, image_filename),
+            os.path.join(image_dir, '.upload_cache'), cpu=True
+        )
+        return employee_id, name, image_path
+
+    async def _save_personnel(self, excel_path: str | None, next_index: int | None, results: list[BulkResult]):
+        if not excel_path or next_index is None:
+            return
+        rows = [
+            personnel_row(next_index + i, r.data[0], r.data[1], r.key)
+            for i, r in enumerate(r for r in results if r.ok)
+        ]
+        if rows and not await self.offload(save_personnel_rows, excel_path, rows):
+            print(f"[WARNING] Excel file is locked, '인원' sheet was NOT saved: {excel_path}")
+
+    async def add_employees(self, employees: list[dict], image_dir: str,
+                            excel_path: str | None = None, next_index: int | None = None) -> list[BulkResult]:
+        """
+        임직원 대량 추가
+
+        Excel 데이터(original_index 있음)는 해당 순번의 이미지, JSON 데이터는 입력 순서의 이미지를 사용합니다.
+        excel_path를 지정하면 성공한 임직원을 입력 순서대로 '인원' 시트에 기록합니다.
+        """
+        jobs = await self._employee_jobs(employees, image_dir)
+
+        async def handler(page: Page, index: int, job) -> BulkResult:
+            start = time.time()
+            employee_id, name, image_path = await self._prepare_employee(job, image_dir)
+            await add_employee(page, employee_id, name, job[0], image_path)
+            elapsed = time.time() - start
+            print(f"[OK] Employee added successfully: ID={employee_id}, Name={name}, Time={elapsed:.2f}s")
+            return BulkResult(index, employee_id, True, elapsed, data=(job[0], name))
+
+        results = await self.run_jobs(jobs, handler, prepare=open_employee_list)
+        await self._save_personnel(excel_path, next_index, results)
+        return results
+
+    async def add_employees_pipelined(self, employees: list[dict], image_dir: str,
+                                      excel_path: str | None = None, next_index: int | None = None,
+                                      tabs: int = 2, flush_every: int = 20) -> list[BulkResult]:
+        """
+        하나의 인증 컨텍스트에서 탭 여러 개(기본 2)로 폼 입력과 저장 대기를 겹쳐 임직원 추가
+
+        탭 A가 N+1번 폼을 입력하는 동안 탭 B는 N번 저장 확인(목록 복귀, 사번 셀)을 기다립니다.
+        컨텍스트가 하나이므로 사용자당 세션 수가 제한된 서버에서도 쓸 수 있습니다.
+        "저장" 클릭은 입력 순서대로만 하고, '인원' 시트는 앞선 임직원이 모두 끝난 구간만
+        입력 순서대로 flush_every건마다 기록합니다 (중간에 중단돼도 순서가 어긋나지 않음).
+        """
+        jobs = await self._employee_jobs(employees, image_dir)
+        results: list[BulkResult | None] = [None] * len(jobs)
+        next_job = iter(range(len(jobs)))
+        turn = asyncio.Condition()
+        save_turn = 0
+        written = 0          # '인원' 시트에 반영된 결과 수 (입력 순서 기준)
+        personnel_count = 0  # 기록한 성공 행 수
+        pending_rows: list[list] = []
+        write_lock = asyncio.Lock()
+
+        async def pass_turn(index: int, action: Callable[[], Awaitable[None]] | None = None):
+            # index번 차례가 올 때까지 기다렸다가 action("저장" 클릭)을 하고 다음 차례로 넘김
+            nonlocal save_turn
+            async with turn:
+                await turn.wait_for(lambda: save_turn == index)
+                try:
+                    if action is not None:
+                        await action()
+                finally:
+                    save_turn += 1
+                    turn.notify_all()
+
+        async def commit(final: bool = False):
+            # 앞에서부터 끝난 결과만 순서대로 '인원' 시트 행으로 옮기고 flush_every건마다 저장
+            nonlocal written, personnel_count
+            async with write_lock:
+                while written < len(results) and results[written] is not None:
+                    result = results[written]
+                    if result.ok and excel_path and next_index is not None:
+                        pending_rows.append(personnel_row(next_index + personnel_count, result.data[0],
+                                                          result.data[1], result.key))
+                        personnel_count += 1
+                    written += 1
+                if pending_rows and (final or len(pending_rows) >= flush_every):
+                    if await self.offload(save_personnel_rows, excel_path, list(pending_rows)):
+                        pending_rows.clear()
+                    else:
+                        print(f"[WARNING] Excel file is locked, '인원' sheet was NOT saved: {excel_path}")
+
+        async def tab_worker(tab_id: int, page: Page):
+            page = await self._recover(context, page, open_employee_list, f"tab={tab_id}")
+            for index in next_job:
+                job = jobs[index]
+                start = time.time()
+                employee_id = os.path.splitext(job[1])[0]
+                saved_at = None
+                try:
+                    employee_id, name, image_path = await self._prepare_employee(job, image_dir)
+                    await fill_employee_form(page, employee_id, name, job[0], image_path)
+
+                    async def click_save():
+                        nonlocal saved_at
+                        await page.get_by_role("button", name="저장").click()
+                        saved_at = time.perf_counter()
+
+                    await pass_turn(index, click_save)
+                    await confirm_employee_saved(page, employee_id)
+                    elapsed = time.time() - start
+                    print(f"[OK] Employee added successfully: tab={tab_id}, ID={employee_id}, Name={name}, "
+                          f"Time={elapsed:.2f}s")
+                    results[index] = BulkResult(index, employee_id, True, elapsed, data=(job[0], name),
+                                                saved_at=saved_at)
+                except Exception as e:
+                    if saved_at is None and save_turn <= index:
+                        # 입력 중 실패해도 뒤 순번이 막히지 않도록 차례는 넘김
+                        await pass_turn(index)
+                    results[index] = BulkResult(index, employee_id, False, time.time() - start, str(e),
+                                                saved_at=saved_at)
+                    print(f"[ERROR] tab={tab_id}, job={index}: {e}")
+                    page = await self._recover(context, page, open_employee_list, f"tab={tab_id}")
+                await commit()
+
+        context = await self.new_context()
+        try:
+            pages = []
+            for _ in range(max(1, min(tabs, len(jobs)))):
+                page = await context.new_page()
+                page.on("dialog", _accept_dialog)
+                pages.append(page)
+            await asyncio.gather(*(tab_worker(i, page) for i, page in enumerate(pages)))
+        finally:
+            await context.close()
+            await commit(final=True)
+        return [r for r in results if r is not None]
+
+    async def remove_employees(self, names: list[str | None]) -> list[BulkResult]:
+        """
+        임직원 대량 삭제
+
+        이름이 없는 항목(None/빈 문자열)은 목록 상단 임직원으로 대체합니다.
+        작업자들이 같은 상단 행을 동시에 지우지 않도록 대상 이름을 먼저 확정합니다.
+        """
+        missing = sum(1 for n in names if not n)
+        if missing:
+            context = await self.new_context()
+            page = await context.new_page()
+            try:
+                await open_employee_list(page)
+                top_names = iter(await top_employee_names(page, missing))
+            finally:
+                await context.close()
+            names = [n or next(top_names, None) for n in names]
+        targets = [n for n in names if n]
+
+        async def handler(page: Page, index: int, name: str) -> BulkResult:
+            start = time.time()
+            await delete_employee(page, name)
+            elapsed = time.time() - start
+            print(f"[OK] Employee removed successfully: Name={name}, Time={elapsed:.2f}s")
+            return BulkResult(index, name, True, elapsed)
+
+        return await self.run_jobs(targets, handler, prepare=open_employee_list)
+
+    async def create_location_levels(self, levels: list[list[dict]]) -> list[BulkResult]:
+        """
+        장소 트리를 레벨 순서로 생성
+
+        같은 레벨의 노드는 서로 독립적이므로 동시에 생성하고,
+        부모 레벨이 모두 끝난 뒤 다음 레벨을 시작합니다.
+
+        Args:
+            levels: [[{'name', 'type', 'order', 'parent'}, ...], ...] (루트 레벨부터)
+        """
+        all_results = []
+        for depth, nodes in enumerate(levels):
+            async def handler(page: Page, index: int, node: dict) -> BulkResult:
+                start = time.time()
+                # 다른 작업자가 추가한 노드가 보이도록 트리를 새로 읽음
+                await page.reload(wait_until='networkidle')
+                await create_location(
+                    page, node['name'], node.get('type', '사무공간'), node.get('order', 1), node.get('parent')
+                )
+                return BulkResult(index, node['name'], True, time.time() - start, data=node)
+
+            level_start = time.time()
+            results = await self.run_jobs(nodes, handler, prepare=open_location_page)
+            ok = sum(1 for r in results if r.ok)
+            print(f"[INFO] Level {depth + 1}: {ok}/{len(nodes)} nodes, Time={time.time() - level_start:.2f}s")
+            all_results.extend(results)
+        return all_results
+
+
+def flatten_tree(spec: list[dict], parent: str | None = None, depth: int = 0,
+                 levels: list[list[dict]] | None = None) -> list[list[dict]]:
+    """
+    중첩 트리 스펙({'name', 'type', 'order', 'children'})을 레벨별 노드 목록으로 변환
+    """
+    if levels is None:
+        levels = []
+    if len(levels) <= depth:
+        levels.append([])
+    for order, node in enumerate(spec, 1):
+        levels[depth].append({
+            'name': node['name'],
+            'type': node.get('type', '사무공간'),
+            'order': node.get('order', order),
+            'parent': parent,
+        })
+        if node.get('children'):
+            flatten_tree(node['children'], node['name'], depth + 1, levels)
+    return levels
+
+
+def run_in_thread(coro):
+    """
+    별도 스레드의 새 이벤트 루프에서 코루틴 실행
+
+    동기 Playwright가 이미 동작 중인 pytest 세션에서도 안전하게 asyncio 코어를 사용하기 위함입니다.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def summarize(results: list[BulkResult], elapsed: float) -> str:
+    ok = [r for r in results if r.ok]
+    throughput = len(ok) / elapsed * 60 if elapsed else 0
+    return (f"[COMPLETE] {len(ok)}/{len(results)} succeeded, Total: {elapsed:.2f}s, "
+            f"Throughput: {throughput:.1f}/min")
+
+
+async def _main(args):
+    start = time.time()
+    async with AsyncBulkRunner(concurrency=args.concurrency, headless=not args.headed) as runner:
+        if args.command == 'add':
+            if args.excel:
+                _, _, employees, next_index = await runner.offload(read_excel_employees, args.excel)
+            else:
+                employees = await runner.offload(load_employees_json, args.json)
+                next_index = None
+            if args.pipeline:
+                results = await runner.add_employees_pipelined(employees, args.images, args.excel, next_index,
+                                                               tabs=args.tabs)
+            else:
+                results = await runner.add_employees(employees, args.images, args.excel, next_index)
+        elif args.command == 'remove':
+            employees = await runner.offload(load_employees_json, args.json)
+            results = await runner.remove_employees([e.get("name") for e in employees])
+        else:
+            with open(args.spec, 'r', encoding='utf-8') as f:
+                spec = json.load(f)
+            results = await runner.create_location_levels(flatten_tree(spec.get('nodes', spec)))
+    print(summarize(results, time.time() - start))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='asyncio 기반 임직원/장소 대량 처리')
+    parser.add_argument('command', choices=['add', 'remove', 'locations'])
+    parser.add_argument('--json', help='em_add.json / em_remove.json 경로')
+    parser.add_argument('--excel', help='em_add.xlsx 경로 (add 전용)')
+    parser.add_argument('--spec', help='장소 트리 스펙 JSON 경로 (locations 전용)')
+    parser.add_argument('--images', default=settings.EMPLOYEE_IMAGE_DIR, help='임직원 사진 디렉터리')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 작업자(컨텍스트) 수')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='add: 컨텍스트 하나에서 탭 여러 개로 폼 입력과 저장 대기를 겹침 (--concurrency 무시)')
+    parser.add_argument('--tabs', type=int, default=2, help='--pipeline 탭 수')
+    parser.add_argument('--headed', action='store_true', help='브라우저 표시')
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+동시성 스윕 벤치마크 공통 엔진
+
+흐름(Flow)을 동시성 수준별로 워밍업 후 반복 실행하여 처리량, 지연 백분위, 오류율을 계산하고
+결과를 실행 이력 DB(e2e/utils/run_history.py)의 benchmark_results 테이블에 저장합니다.
+
+흐름은 asyncio 코루틴으로 작성합니다. 브라우저 흐름은 playwright.async_api를 그대로 쓰고,
+동기 API 클라이언트는 asyncio.to_thread로 감쌉니다.
+"""
+import asyncio
+import contextlib
+import math
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """
+    선형 보간 백분위 (q: 0~100)
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    pos = (len(values) - 1) * q / 100
+    low, high = math.floor(pos), math.ceil(pos)
+    return values[low] + (values[high] - values[low]) * (pos - low)
+
+
+@dataclass
+class LevelResult:
+    """
+    동시성 수준 하나, 반복 한 번의 측정 결과
+    """
+    flow: str
+    concurrency: int
+    rep: int
+    seconds: float
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    error_samples: list[str] = field(default_factory=list)
+
+    @property
+    def ops(self) -> int:
+        return len(self.latencies) + self.errors
+
+    @property
+    def throughput_per_min(self) -> float:
+        return len(self.latencies) / self.seconds * 60 if self.seconds else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.ops if self.ops else 0.0
+
+    def p(self, q: float) -> float | None:
+        return percentile(self.latencies, q)
+
+
+class Flow:
+    """
+    벤치마크 흐름 기본 클래스
+
+    setup()은 작업자마다 한 번 호출되어 작업자 컨텍스트(페이지, API 클라이언트 등)를 만들고,
+    op()는 측정 대상 작업 1회입니다. 실패는 예외로 알립니다.
+    prepare()/cleanup()은 측정 밖에서 스윕 전후에 한 번씩 호출됩니다.
+    """
+
+    name = 'flow'
+
+    async def prepare(self, total_ops: int):
+        pass
+
+    async def setup(self, worker_id: int) -> Any:
+        return None
+
+    async def op(self, ctx: Any, seq: int):
+        raise NotImplementedError
+
+    async def teardown(self, ctx: Any):
+        pass
+
+    async def cleanup(self):
+        pass
+
+
+async def run_level(flow: Flow, concurrency: int, ops_per_worker: int, warmup: int = 1,
+                    rep: int = 1) -> LevelResult:
+    """
+    concurrency개 작업자가 각자 warmup회(측정 제외) + ops_per_worker회 op 실행
+    """
+    contexts = await asyncio.gather(*(flow.setup(i) for i in range(concurrency)))
+    result = LevelResult(flow=flow.name, concurrency=concurrency, rep=rep, seconds=0.0)
+    seq = iter(range(10 ** 9))
+
+    async def worker(ctx, count: int, measure: bool):
+        for _ in range(count):
+            start = time.perf_counter()
+            try:
+                await flow.op(ctx, next(seq))
+            except Exception as e:
+                if measure:
+                    result.errors += 1
+                    if len(result.error_samples) < 5:
+                        result.error_samples.append(f"{type(e).__name__}: {e}")
+                continue
+            if measure:
+                result.latencies.append(time.perf_counter() - start)
+
+    try:
+        if warmup:
+            await asyncio.gather(*(worker(ctx, warmup, False) for ctx in contexts))
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(ctx, ops_per_worker, True) for ctx in contexts))
+        result.seconds = time.perf_counter() - start
+    finally:
+        await asyncio.gather(*(flow.teardown(ctx) for ctx in contexts), return_exceptions=True)
+    return result
+
+
+@contextlib.contextmanager
+def default_executor(max_workers: int):
+    """
+    실행 중인 루프의 기본 executor(asyncio.to_thread)를 max_workers 크기로 두고, 끝나면 종료
+
+    set_default_executor는 이전 executor를 닫지 않으므로 실행마다 스레드가 남지 않도록 직접 닫습니다.
+    끝난 뒤에는 새 executor(스레드는 쓸 때 생성)로 바꿔 같은 루프의 이후 to_thread 호출이 실패하지 않게 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    loop.set_default_executor(executor)
+    try:
+        yield executor
+    finally:
+        loop.set_default_executor(ThreadPoolExecutor())
+        executor.shutdown(wait=False)
+
+
+async def sweep(flow: Flow, levels: list[int], ops_per_worker: int, warmup: int = 1,
+                reps: int = 3, log: bool = True) -> list[LevelResult]:
+    """
+    동시성 수준별로 reps회 반복 측정
+    """
+    # asyncio.to_thread를 쓰는 흐름이 최대 동시성만큼 스레드를 쓸 수 있도록 executor 지정
+    with default_executor(max(levels) + 4):
+        total_ops = sum((ops_per_worker + warmup) * level * reps for level in levels)
+        await flow.prepare(total_ops)
+        results = []
+        try:
+            for level in levels:
+                for rep in range(1, reps + 1):
+                    result = await run_level(flow, level, ops_per_worker, warmup, rep)
+                    results.append(result)
+                    if log:
+                        print(f"[BENCH] {flow.name} c={level} rep={rep}: "
+                              f"{result.throughput_per_min:.1f}/min, p95={_fmt(result.p(95))}, "
+                              f"errors={result.errors}/{result.ops}")
+        finally:
+            await flow.cleanup()
+    return results
+
+
+def _fmt(seconds: float | None) -> str:
+    return f"{seconds * 1000:.0f}ms" if seconds is not None else "-"
+
+
+def aggregate(results: list[LevelResult]) -> list[dict]:
+    """
+    (흐름, 동시성)별로 반복 결과 합산: 처리량은 반복 중앙값, 백분위는 전체 표본 기준
+    """
+    groups: dict[tuple[str, int], list[LevelResult]] = {}
+    for r in results:
+        groups.setdefault((r.flow, r.concurrency), []).append(r)
+
+    rows = []
+    for (flow, concurrency), reps in groups.items():
+        latencies = [v for r in reps for v in r.latencies]
+        ops = sum(r.ops for r in reps)
+        errors = sum(r.errors for r in reps)
+        rows.append({
+            'flow': flow,
+            'concurrency': concurrency,
+            'reps': len(reps),
+            'ops': ops,
+            'errors': errors,
+            'error_rate': errors / ops if ops else 0.0,
+            'throughput_per_min': statistics.median(r.throughput_per_min for r in reps),
+            'p50': percentile(latencies, 50),
+            'p90': percentile(latencies, 90),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+        })
+    return rows
+
+
+def format_rows(rows: list[dict], previous: dict | None = None) -> list[str]:
+    """
+    집계 표 출력. previous: {(flow, concurrency): 이전 실행 처리량}이면 변화율 표시
+    """
+    lines = [f"  {'flow':<10} {'conc':>4} {'ops':>6} {'thru/min':>10} {'p50':>8} {'p90':>8} "
+             f"{'p95':>8} {'p99':>8} {'err':>6}  vs prev"]
+    for row in rows:
+        prev = (previous or {}).get((row['flow'], row['concurrency']))
+        delta = f"{(row['throughput_per_min'] / prev - 1) * 100:+.0f}%" if prev else "-"
+        lines.append(
+            f"  {row['flow']:<10} {row['concurrency']:>4} {row['ops']:>6} {row['throughput_per_min']:>10.1f} "
+            f"{_fmt(row['p50']):>8} {_fmt(row['p90']):>8} {_fmt(row['p95']):>8} {_fmt(row['p99']):>8} "
+            f"{row['error_rate'] * 100:>5.1f}%  {delta}"
+        )
+    return lines
@@ -0,0 +1,347 @@
+"""
+이름 있는 서버 데이터셋 저장/복원 (테스트 사전조건)
+
+test_delete_employee_from_list처럼 특정 사번(1000460, 1000415)이 있다고 가정하는 테스트는
+매 실행 전 수작업 시딩이나 앞선 테스트에 의존했습니다. 데이터셋은 필요한 임직원/장소/출입 케이스를
+e2e/fixtures/datasets/<이름>.json에 한 번 캡처해 두고, 테스트 모듈 시작 전에 그 상태로 되돌립니다.
+
+복원 경로:
+    snapshot  대역 서버: 저장해 둔 메모리 스냅샷으로 한 번에 되돌림 (요청 1회)
+    api       실제 서버: 출입 케이스 -> 장소(레벨마다 병렬) -> 임직원(병렬) 순으로 차이만 맞춤
+              - 출입 케이스/임직원: 없으면 추가, 값이 다르면 삭제 후 다시 추가
+              - 장소: 데이터셋 루트의 하위 트리가 다르면 잎부터 높이별 묶음으로 지우고 다시 생성
+
+대역 서버에서 api 경로로 처음 복원하면 그 상태를 같은 이름의 스냅샷으로 저장하므로 두 번째부터는 snapshot 경로입니다.
+
+사용 예:
+    python -m e2e.utils.datasets capture employee-basic --employee-ids 1000460,1000415
+    python -m e2e.utils.datasets restore employee-basic
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+
+from e2e.utils.api import ApiClient, ApiError, items_of
+from e2e.utils.async_core import flatten_tree
+from e2e.utils.location_tree import LocationSnapshot, delete_by_height, diff_trees
+
+DATASET_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fixtures', 'datasets')
+
+# 복원 시 같은지 비교하는 임직원 항목 (create_employee 입력 형식)
+EMPLOYEE_FIELDS = ('name', 'email', 'department', 'job_grade', 'job_position', 'access_cases', 'rf_card')
+
+
+@dataclass
+class Dataset:
+    """
+    데이터셋 파일 내용
+
+    Attributes:
+        name: 데이터셋 이름 (파일 이름, 대역 서버 스냅샷 이름)
+        description: 설명
+        access_cases: 출입 케이스 이름
+        locations: 중첩 장소 스펙 ({'name', 'type', 'order', 'children'}, 노드 이름 고유)
+        employees: generate_dataset 레코드 형식 (id, name, email, department, job_grade, ...)
+    """
+    name: str
+    description: str = ''
+    access_cases: list[str] = field(default_factory=list)
+    locations: list[dict] = field(default_factory=list)
+    employees: list[dict] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, name_or_path: str) -> 'Dataset':
+        """
+        이름(DATASET_DIR/<이름>.json) 또는 파일 경로에서 읽기
+        """
+        path = name_or_path if name_or_path.endswith('.json') else dataset_path(name_or_path)
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+    def save(self, path: str | None = None) -> str:
+        path = path or dataset_path(self.name)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(self), f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        return path
+
+
+@dataclass
+class RestoreReport:
+    """
+    복원 결과
+
+    Attributes:
+        dataset: 데이터셋 이름
+        mode: 'snapshot' 또는 'api'
+        created: 새로 만든 (종류, 이름)
+        replaced: 값이 달라 다시 만든 (종류, 이름)
+        unchanged: 이미 같던 항목 수
+        deleted: 데이터셋에 없어 지운 장소 수
+        failed: (종류, 이름, 사유)
+        seconds: 소요 시간
+    """
+    dataset: str
+    mode: str = 'api'
+    created: list[tuple[str, str]] = field(default_factory=list)
+    replaced: list[tuple[str, str]] = field(default_factory=list)
+    unchanged: int = 0
+    deleted: int = 0
+    failed: list[tuple[str, str, str]] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        if self.mode == 'snapshot':
+            return f"{self.dataset}: snapshot 복원 {self.seconds:.2f}s"
+        return (f"{self.dataset}: created={len(self.created)}, replaced={len(self.replaced)}, "
+                f"unchanged={self.unchanged}, deleted={self.deleted}, failed={len(self.failed)}, "
+                f"{self.seconds:.2f}s")
+
+
+def dataset_path(name: str) -> str:
+    return os.path.join(DATASET_DIR, f"{name}.json")
+
+
+def employee_input(record: dict) -> dict:
+    """
+    임직원 API 응답 -> create_employee 입력 형식 (stub_server.api_record의 반대)
+    """
+    return {
+        'id': str(record.get('employeeId', record.get('id'))),
+        'name': record.get('name'),
+        'email': record.get('email', ''),
+        'department': record.get('department'),
+        'job_grade': record.get('jobGrade', record.get('job_grade')),
+        'job_position': record.get('jobPosition', record.get('job_position')),
+        'access_cases': record.get('accessCases', record.get('access_cases', [])),
+        'rf_card': record.get('rfCards', record.get('rf_card', [])),
+    }
+
+
+def _same_employee(want: dict, got: dict) -> bool:
+    return all(want.get(key) in (None, '') or want.get(key) == got.get(key) for key in EMPLOYEE_FIELDS)
+
+
+def _location_spec(snapshot: LocationSnapshot, i: int) -> dict:
+    node = {'name': snapshot.names[i], 'type': snapshot.types[i], 'order': snapshot.orders[i]}
+    children = sorted(snapshot.children[i], key=lambda c: (snapshot.orders[c] is None, snapshot.orders[c]))
+    if children:
+        node['children'] = [_location_spec(snapshot, c) for c in children]
+    return node
+
+
+# ============================================================================
+# 캡처
+# ============================================================================
+
+def capture_dataset(client: ApiClient, name: str, employee_ids: list[str] = (),
+                    location_roots: list[str] = (), description: str = '') -> Dataset:
+    """
+    현재 서버에서 지정한 임직원과 장소 하위 트리, 그들이 쓰는 출입 케이스를 읽어 데이터셋 생성
+
+    Raises:
+        ValueError: 서버에 없는 사번/장소
+    """
+    employees = []
+    for employee_id in employee_ids:
+        records = [r for r in items_of(client.list_employees(employee_id=employee_id))
+                   if str(r.get('employeeId', r.get('id'))) == str(employee_id)]
+        if not records:
+            raise ValueError(f"서버에 없는 사번: {employee_id}")
+        employees.append(employee_input(records[0]))
+
+    locations = []
+    if location_roots:
+        snapshot = LocationSnapshot.from_api(client)
+        for root in location_roots:
+            matches = [i for i in snapshot.find(root) if snapshot.parents[i] < 0]
+            if not matches:
+                raise ValueError(f"서버에 없는 최상위 장소: {root}")
+            locations.append(_location_spec(snapshot, matches[0]))
+
+    access_cases = sorted({case for e in employees for case in e.get('access_cases') or []})
+    return Dataset(name, description, access_cases, locations, employees)
+
+
+# ============================================================================
+# 복원
+# ============================================================================
+
+def restore_dataset(dataset: Dataset, base_url: str | None = None, workers: int = 8,
+                    use_snapshot: bool = True) -> RestoreReport:
+    """
+    데이터셋 상태로 복원 (대역 서버 스냅샷이 있으면 한 번에, 없으면 API로 차이만 맞춤)
+    """
+    start = time.perf_counter()
+    report = RestoreReport(dataset.name)
+    main_client = ApiClient(base_url).login()
+
+    if use_snapshot:
+        try:
+            main_client.request('POST', 'stub_restore', path_params={'id': dataset.name})
+            report.mode = 'snapshot'
+            report.seconds = time.perf_counter() - start
+            return report
+        except ApiError:
+            pass  # 실제 서버이거나 아직 저장한 스냅샷이 없음
+
+    local = threading.local()
+
+    def client() -> ApiClient:
+        # ApiClient는 스레드 간 공유하지 않음
+        if not hasattr(local, 'client'):
+            local.client = ApiClient(base_url).login()
+        return local.client
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        _restore_access_cases(main_client, pool, client, dataset, report)
+        _restore_locations(main_client, pool, client, dataset, report)
+        list(pool.map(lambda e: _restore_employee(client(), e, report), dataset.employees))
+
+    if use_snapshot and not report.failed:
+        try:
+            main_client.request('POST', 'stub_snapshot', path_params={'id': dataset.name})
+        except ApiError:
+            pass
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def _restore_access_cases(main_client: ApiClient, pool: ThreadPoolExecutor, client, dataset: Dataset,
+                          report: RestoreReport):
+    if not dataset.access_cases:
+        return
+    existing = {r.get('name') for r in items_of(main_client.list_access_cases())}
+    report.unchanged += len(existing & set(dataset.access_cases))
+
+    def create(name: str):
+        try:
+            client().create_access_case(name)
+            report.created.append(('access_case', name))
+        except ApiError as e:
+            if e.status != 409:
+                report.failed.append(('access_case', name, str(e)))
+
+    list(pool.map(create, [name for name in dataset.access_cases if name not in existing]))
+
+
+def _restore_locations(main_client: ApiClient, pool: ThreadPoolExecutor, client, dataset: Dataset,
+                       report: RestoreReport):
+    if not dataset.locations:
+        return
+    snapshot = LocationSnapshot.from_api(main_client)
+    for root in dataset.locations:
+        levels = [level for level in flatten_tree([root]) if level]
+        actual = snapshot.subtree([root['name']])
+        if len(actual) and diff_trees(LocationSnapshot.from_levels(levels), actual).ok:
+            report.unchanged += len(actual)
+            continue
+
+        # 다르면 기존 하위 트리를 잎부터 높이별 묶음으로 지우고 다시 생성
+        batches = snapshot.height_batches(*(r for r in snapshot.find(root['name']) if snapshot.parents[r] < 0))
+        for node_id, error in delete_by_height(pool, batches, lambda i: _delete_location(client(), snapshot.ids[i])):
+            if error:
+                report.failed.append(('location', str(node_id), error))
+            else:
+                report.deleted += 1
+
+        ids = {}
+        for level in levels:
+            def create(node: dict):
+                parent_id = ids.get(node['parent']) if node['parent'] else None
+                if node['parent'] and parent_id is None:
+                    return node, None, '부모 생성 실패'
+                try:
+                    record = client().create_location(node['name'], node['type'], node['order'], parent_id)
+                    return node, record.get('id') if isinstance(record, dict) else None, ''
+                except ApiError as e:
+                    return node, None, str(e)
+
+            for node, node_id, error in pool.map(create, level):
+                if error:
+                    report.failed.append(('location', node['name'], error))
+                    continue
+                ids[node['name']] = node_id
+                key = ('location', node['name'])
+                (report.replaced if len(actual) else report.created).append(key)
+
+
+def _delete_location(client: ApiClient, node_id) -> tuple:
+    try:
+        client.delete_location(node_id)
+        return node_id, ''
+    except ApiError as e:
+        return node_id, '' if e.status == 404 else str(e)
+
+
+def _restore_employee(client: ApiClient, employee: dict, report: RestoreReport):
+    """
+    추가 후 사번 중복(409)이면 값을 비교해 다를 때만 삭제 후 다시 추가
+    """
+    key = ('employee', str(employee['id']))
+    try:
+        client.create_employee(employee)
+        report.created.append(key)
+        return
+    except ApiError as e:
+        if e.status != 409:
+            report.failed.append((*key, str(e)))
+            return
+    try:
+        records = [employee_input(r) for r in items_of(client.list_employees(employee_id=employee['id']))]
+        if any(r['id'] == key[1] and _same_employee(employee, r) for r in records):
+            report.unchanged += 1
+            return
+        client.delete_employee(employee['id'])
+        client.create_employee(employee)
+        report.replaced.append(key)
+    except ApiError as e:
+        report.failed.append((*key, str(e)))
+
+
+def _split_csv(text: str) -> list[str]:
+    return [v.strip() for v in text.split(',') if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='테스트 데이터셋 캡처/복원')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    capture = sub.add_parser('capture', help='현재 서버 상태에서 데이터셋 파일 생성')
+    capture.add_argument('name', help='데이터셋 이름')
+    capture.add_argument('--employee-ids', default='', help='포함할 사번 (쉼표 구분)')
+    capture.add_argument('--location-roots', default='', help='포함할 최상위 장소 이름 (쉼표 구분)')
+    capture.add_argument('--description', default='')
+    capture.add_argument('--output', help=f'저장 경로 (기본: {DATASET_DIR}/<이름>.json)')
+
+    restore = sub.add_parser('restore', help='데이터셋 상태로 복원')
+    restore.add_argument('name', help='데이터셋 이름 또는 JSON 경로')
+    restore.add_argument('--workers', type=int, default=8, help='동시 요청 수')
+    restore.add_argument('--no-snapshot', action='store_true', help='대역 서버 스냅샷을 쓰지 않고 API로 복원')
+
+    for command in (capture, restore):
+        command.add_argument('--base-url', help='API 서버 주소 (기본: API_BASE_URL)')
+    args = parser.parse_args()
+
+    if args.command == 'capture':
+        dataset = capture_dataset(ApiClient(args.base_url).login(), args.name, _split_csv(args.employee_ids),
+                                  _split_csv(args.location_roots), args.description)
+        path = dataset.save(args.output)
+        print(f"[OK] 데이터셋 저장: {path} (임직원 {len(dataset.employees)}명, "
+              f"최상위 장소 {len(dataset.locations)}개, 출입 케이스 {len(dataset.access_cases)}개)")
+        return
+
+    report = restore_dataset(Dataset.load(args.name), args.base_url, args.workers, not args.no_snapshot)
+    print(f"[{'OK' if not report.failed else 'WARNING'}] restore {report.summary()}")
+    for kind, name, message in report.failed[:10]:
+        print(f"[WARNING] {kind} {name}: {message}")
+
+
+if __name__ == "__main__":
+    main()
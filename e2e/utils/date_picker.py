@@ -0,0 +1,184 @@
+"""
+MUI DatePicker 직접 입력
+
+달력을 열어 "오늘"/날짜 gridcell을 누르는 방식은 임직원마다 여러 번 왕복하고
+오늘 이외의 날짜(소급 발령)를 넣을 수 없습니다.
+set_date는 날짜 필드에 숫자를 바로 입력하고, 입력값이 반영되지 않는 경우에만
+달력을 열어 월 이동 버튼으로 목표 월까지 이동한 뒤 날짜를 누릅니다.
+
+    1. evaluate 한 번으로 필드 섹션 순서(년/월/일)와 현재 값 확인
+    2. 첫 섹션 클릭 -> 숫자 입력 (예: 20250301)
+    3. evaluate 한 번으로 입력값 확인, 다르면 달력으로 대체
+
+날짜 값 해석은 e2e.utils.employee_data.parse_assignment_date를 사용합니다.
+왕복 수를 세는 호출자(EmployeeForm)는 call 인자로 Playwright 호출 래퍼를 넘깁니다.
+asyncio 코어(e2e.utils.async_core)는 동기 코드를 부를 수 없으므로 같은 섹션/키 계산과
+달력 판단 함수(calendar_plan)를 사용해 같은 순서로 호출합니다.
+"""
+import re
+from datetime import date
+from typing import Any, Callable
+
+from playwright.sync_api import Page, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+ASSIGNMENT_DATE_GROUP = "발령 시작일"
+OPEN_PICKER_LABEL = "날짜를 선택하세요"
+PREVIOUS_MONTH = re.compile(r"Previous month|이전 달")
+NEXT_MONTH = re.compile(r"Next month|다음 달")
+DEFAULT_SECTIONS = ['year', 'month', 'day']
+
+# 필드 루트(FormControl)의 섹션 순서와 현재 값 읽기
+# v7: role=spinbutton 섹션 / v6: 단일 input (placeholder 예: YYYY. MM. DD)
+FIELD_STATE_JS = """(group) => {
+    const root = group.closest('.MuiFormControl-root') || group;
+    const spins = Array.from(root.querySelectorAll('[role="spinbutton"]'));
+    const input = root.querySelector('input:not([type="file"])');
+    return {
+        sections: spins.map(s => (s.getAttribute('aria-label') || s.getAttribute('aria-valuetext') || '')),
+        placeholder: input ? (input.placeholder || '') : '',
+        value: input && input.value ? input.value : spins.map(s => s.textContent).join(' '),
+        spinbuttons: spins.length,
+    };
+}"""
+
+
+def section_order(state: dict) -> list[str]:
+    """
+    필드 상태에서 년/월/일 섹션 순서 추출 (알 수 없으면 년-월-일)
+    """
+    def kind(label: str) -> str | None:
+        label = label.lower()
+        for name, keys in (('year', ('year', '년', '연도', 'yyyy')), ('month', ('month', '월', 'mm')),
+                           ('day', ('day', '일', 'dd'))):
+            if any(k in label for k in keys):
+                return name
+        return None
+
+    order = [k for k in (kind(label) for label in state.get('sections', [])) if k]
+    if sorted(order) == sorted(DEFAULT_SECTIONS):
+        return order
+    placeholder = state.get('placeholder', '').upper()
+    positions = {name: placeholder.find(token) for name, token in (('year', 'YYYY'), ('month', 'MM'), ('day', 'DD'))}
+    if all(pos >= 0 for pos in positions.values()):
+        return sorted(positions, key=positions.get)
+    return list(DEFAULT_SECTIONS)
+
+
+def date_keys(order: list[str], value: date) -> str:
+    """
+    섹션 순서대로 입력할 숫자 (예: ['year', 'month', 'day'] -> '20250301')
+    """
+    parts = {'year': f"{value.year:04d}", 'month': f"{value.month:02d}", 'day': f"{value.day:02d}"}
+    return "".join(parts[name] for name in order)
+
+
+def value_matches(state: dict, order: list[str], value: date) -> bool:
+    """
+    필드에 표시된 숫자가 목표 날짜와 같은지 (구분자/로캘 무관)
+    """
+    numbers = [int(n) for n in re.findall(r"\d+", state.get('value', ''))]
+    expected = [int(date_keys([name], value)) for name in order]
+    return numbers[:3] == expected
+
+
+def month_steps(shown: tuple[int, int], target: date) -> int:
+    """
+    달력에 표시된 (년, 월)에서 목표 월까지 이동할 횟수 (음수면 이전 달)
+    """
+    return (target.year - shown[0]) * 12 + (target.month - shown[1])
+
+
+def parse_calendar_header(text: str) -> tuple[int, int] | None:
+    """
+    달력 머리글 '2025년 3월' / 'March 2025'에서 (년, 월)
+    """
+    match = re.search(r"(\d{4})\s*년\s*(\d{1,2})\s*월", text)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    match = re.search(r"([A-Za-z]+)\s+(\d{4})", text)
+    if match:
+        months = ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+                  'august', 'september', 'october', 'november', 'december']
+        name = match.group(1).lower()
+        for i, month in enumerate(months, start=1):
+            if month.startswith(name[:3]):
+                return int(match.group(2)), i
+    return None
+
+
+def calendar_plan(shown: tuple[int, int] | None, value: date, today: date) -> tuple[bool, int]:
+    """
+    달력 대체 경로 판단 (동기/async 공용)
+
+    Args:
+        shown: 달력 머리글의 (년, 월) (읽지 못했으면 None, 오늘이 속한 월로 간주)
+
+    Returns:
+        tuple[bool, int]: ("오늘" 버튼을 먼저 시도할지, 목표 월까지 이동 횟수)
+    """
+    use_today = value == today and shown in (None, (today.year, today.month))
+    return use_today, month_steps(shown or (today.year, today.month), value)
+
+
+def _direct(fn: Callable, *args, **kwargs) -> Any:
+    return fn(*args, **kwargs)
+
+
+def set_date(page: Page, value: date, group_name: str = ASSIGNMENT_DATE_GROUP, today: date | None = None,
+             call: Callable = _direct) -> str:
+    """
+    날짜 필드에 value 입력
+
+    Args:
+        call: Playwright 호출 래퍼 (예: EmployeeForm._call로 왕복 수 집계)
+
+    Returns:
+        str: 'typed' (직접 입력) 또는 'calendar' (달력 월 이동 대체)
+    """
+    group = page.get_by_role("group", name=group_name)
+    state = call(group.evaluate, FIELD_STATE_JS)
+    order = section_order(state)
+
+    if state['spinbuttons']:
+        call(group.locator('[role="spinbutton"]').first.click)
+    else:
+        call(group.locator('input').first.click)
+        call(page.keyboard.press, 'ControlOrMeta+a')
+    call(page.keyboard.type, date_keys(order, value))
+
+    if value_matches(call(group.evaluate, FIELD_STATE_JS), order, value):
+        return 'typed'
+
+    pick_from_calendar(page, value, group_name, today, call)
+    return 'calendar'
+
+
+def pick_from_calendar(page: Page, value: date, group_name: str = ASSIGNMENT_DATE_GROUP,
+                       today: date | None = None, call: Callable = _direct):
+    """
+    달력을 열고 목표 월까지 이동해 날짜 선택 (직접 입력이 안 될 때)
+    """
+    today = today or date.today()
+    call(page.get_by_role("group", name=group_name).get_by_label(OPEN_PICKER_LABEL).click)
+    dialog = page.get_by_role("dialog")
+    try:
+        call(dialog.get_by_role("grid").wait_for, state='visible', timeout=3000)
+        shown = parse_calendar_header(call(dialog.inner_text))
+    except PlaywrightTimeoutError:
+        shown = None
+
+    use_today, steps = calendar_plan(shown, value, today)
+    if use_today:
+        today_button = page.get_by_role("button", name="오늘", exact=True)
+        if call(today_button.is_visible):
+            call(today_button.click)
+            return
+
+    button = page.get_by_role("button", name=NEXT_MONTH if steps > 0 else PREVIOUS_MONTH)
+    for _ in range(abs(steps)):
+        header = call(dialog.inner_text)
+        call(button.click)
+        # 머리글이 바뀔 때까지 대기 (전환 애니메이션 중 연속 클릭 방지)
+        call(expect(dialog).not_to_have_text, header, use_inner_text=True)
+    call(page.get_by_role("gridcell", name=str(value.day), exact=True).click)
@@ -0,0 +1,204 @@
+"""
+임직원 테스트 데이터 읽기/쓰기 공통 로직
+
+동기(sync) 테스트와 asyncio 대량 처리 코어가 같은 규칙으로
+JSON/Excel 데이터를 해석하고 '인원' 시트에 결과를 기록하도록 모아둔 모듈입니다.
+순수 Python 함수만 포함하므로 executor에서 실행해도 안전합니다.
+"""
+import hashlib
+import json
+import os
+import re
+from datetime import date, datetime, timedelta
+
+# '임직원_추가' 시트 컬럼 순서
+EXCEL_ADD_COLUMNS = [
+    "index", "department", "job_grade", "job_position",
+    "assignment_start_date", "access_cases", "rf_card", "비고",
+]
+
+# Excel 날짜 일련번호 기준일 (1900 윤년 버그 보정된 값)
+EXCEL_EPOCH = date(1899, 12, 30)
+TODAY_WORDS = ('today', '오늘')
+
+
+def list_image_files(image_dir: str) -> list[str]:
+    """
+    이미지 디렉터리의 파일 이름 목록 (이름순)
+
+    추가 흐름은 N번째 JSON/Excel 행에 N번째 이미지(파일 이름이 사번)를 매칭하므로,
+    os.listdir의 파일 시스템 순서 대신 정렬된 순서를 씁니다 (generate_dataset의 사번은 같은 자릿수).
+    """
+    return sorted(f for f in os.listdir(image_dir) if os.path.isfile(os.path.join(image_dir, f)))
+
+
+def make_unique_name(employee_id: str) -> str:
+    """
+    사번 기반 고유 이름 생성 (예: 1000001-251027-1636)
+    """
+    timestamp = datetime.now().strftime("%y%m%d-%H%M")
+    return f"{employee_id}-{timestamp}"
+
+
+def load_employees_json(json_path: str) -> list[dict]:
+    """
+    em_add.json / em_remove.json 형식의 employees 배열 읽기
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get("employees", [])
+
+
+def parse_excel_row(row: tuple) -> dict | None:
+    """
+    '임직원_추가' 시트의 한 행을 employee_data 딕셔너리로 변환
+
+    Returns:
+        dict | None: index가 비어 있으면 None (데이터 끝)
+    """
+    if row[0] is None:
+        return None
+
+    def split(value):
+        return str(value).split(",") if value else []
+
+    return {
+        "original_index": int(row[0]) if row[0] else None,  # 원래 index 보관
+        "department": row[1] if row[1] else "",
+        "job_grade": row[2] if row[2] else "",
+        "job_position": row[3] if row[3] else "",
+        "assignment_start_date": row[4] if row[4] else "today",
+        "access_cases": split(row[5]),
+        "rf_card": split(row[6]),
+    }
+
+
+def parse_assignment_date(value, today: date | None = None) -> date | None:
+    """
+    assignment_start_date 값 해석
+
+    'today'/'오늘', ISO 날짜(2025-03-01, 2025.03.01, 2025/3/1, 20250301),
+    Excel 날짜 셀(datetime) 또는 날짜 일련번호(45717)를 받습니다.
+
+    Returns:
+        date | None: 값이 비어 있으면 None (발령 시작일 입력 생략)
+
+    Raises:
+        ValueError: 해석할 수 없는 값
+    """
+    today = today or date.today()
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return EXCEL_EPOCH + timedelta(days=int(value))
+
+    text = str(value).strip()
+    if text.lower() in TODAY_WORDS:
+        return today
+    match = re.fullmatch(r"(\d{4})[-./]\s*(\d{1,2})[-./]\s*(\d{1,2})\.?(?:[ T].*)?", text) or \
+        re.fullmatch(r"(\d{4})(\d{2})(\d{2})", text)
+    if not match:
+        raise ValueError(f"assignment_start_date를 해석할 수 없습니다: {value!r}")
+    return date(*(int(g) for g in match.groups()))
+
+
+def last_personnel_index(ws_personnel) -> int:
+    """
+    '인원' 시트 컬럼 A의 마지막 index (헤더 제외)
+    """
+    last_index = 0
+    for row in ws_personnel.iter_rows(min_row=2, min_col=1, max_col=1, values_only=True):
+        if row[0] is None:
+            continue
+        try:
+            last_index = max(last_index, int(row[0]))
+        except (ValueError, TypeError):
+            continue
+    return last_index
+
+
+def read_excel_employees(excel_path: str):
+    """
+    em_add.xlsx 읽기
+
+    Returns:
+        tuple: (workbook, '인원' 시트, employees 목록, 다음 index)
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(excel_path)
+    ws = wb["임직원_추가"]
+    ws_personnel = wb["인원"]
+
+    employees = []
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        employee_data = parse_excel_row(row)
+        if employee_data is None:  # index가 없으면 중단
+            break
+        employees.append(employee_data)
+
+    return wb, ws_personnel, employees, last_personnel_index(ws_personnel) + 1
+
+
+def personnel_row(index: int, employee_data: dict, name: str, employee_id: str) -> list:
+    """
+    '인원' 시트에 추가할 행
+    A=index, B=department, C=job_grade, D=job_position, E=assignment_start_date,
+    F=access_cases, G=rf_card, H=빈 컬럼, I=name, J=id
+    """
+    return [
+        index,
+        employee_data.get("department", ""),
+        employee_data.get("job_grade", ""),
+        employee_data.get("job_position", ""),
+        employee_data.get("assignment_start_date", ""),
+        ",".join(employee_data.get("access_cases", [])),
+        ",".join(employee_data.get("rf_card", [])),
+        None,
+        name,
+        employee_id,
+    ]
+
+
+def save_personnel_rows(excel_path: str, rows: list[list]) -> bool:
+    """
+    '인원' 시트에 행들을 추가하고 저장 (파일이 잠겨 있으면 False)
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(excel_path)
+    ws_personnel = wb["인원"]
+    for row in rows:
+        ws_personnel.append(row)
+    try:
+        wb.save(excel_path)
+    except PermissionError:
+        return False
+    return True
+
+
+def prepare_upload_image(image_path: str, cache_dir: str, max_size: int = 1024) -> str:
+    """
+    업로드용 이미지 준비
+
+    긴 변이 max_size를 넘는 사진은 JPEG로 축소해 cache_dir에 저장하고 그 경로를 반환합니다.
+    캐시 파일 이름은 원본 내용 해시이므로 같은 사진은 한 번만 변환됩니다.
+    """
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        if max(img.size) <= max_size:
+            return image_path
+
+        with open(image_path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        os.makedirs(cache_dir, exist_ok=True)
+        cached_path = os.path.join(cache_dir, f"{digest}_{max_size}.jpg")
+        if not os.path.exists(cached_path):
+            img.thumbnail((max_size, max_size))
+            img.convert('RGB').save(cached_path, 'JPEG', quality=90)
+        return cached_path
@@ -0,0 +1,255 @@
+"""
+/employeeadd 폼 입력 (프로토콜 왕복 최소화)
+
+기존 흐름은 임직원 한 명에 fill 3번, 드롭다운 열기/옵션 목록/선택 4세트, 달력,
+파일 선택 창 2번과 여러 wait_for_timeout을 거치며 수십 번 왕복합니다.
+EmployeeForm은 같은 입력을 다음과 같이 묶습니다.
+
+    - 폼 구조(파일 input 위치) 확인과 사번/이름/이메일 입력: evaluate 1번씩
+    - 사진 2장: 숨은 input[type=file]에 set_input_files (파일 선택 창 없음)
+    - 단일 선택 드롭다운: 열기 클릭 + 트리거에 연결된 목록에서 옵션 선택 evaluate (없는 옵션은 LookupError)
+    - 다중 선택(출입케이스/출입 카드): 열기 + 선택 evaluate + Escape
+    - 발령 시작일: date_picker의 직접 입력
+    - 마지막 evaluate 1번으로 입력값을 다시 읽어 다른 항목만 fill로 재입력
+
+고정 대기는 없으며, 임직원마다 왕복 수와 소요 시간을 FormReport로 돌려줍니다.
+
+사용 예:
+    report = EmployeeForm(page).fill(employee_id, unique_name, employee_data, image_path)
+    print(f"[INFO] form: {report.round_trips} round-trips, {report.seconds:.2f}s")
+"""
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import date
+
+from playwright.sync_api import Page
+
+from e2e.utils.date_picker import ASSIGNMENT_DATE_GROUP, set_date
+from e2e.utils.employee_data import parse_assignment_date
+
+SINGLE_SELECTS = {
+    "department": "#mui-component-select-departmentId",
+    "job_grade": "#mui-component-select-jobGradeId",
+    "job_position": "#mui-component-select-jobPositionId",
+}
+ACCESS_CASE_SELECT = "#mui-component-select-accessCaseId"
+RF_CARD_COMBOBOX = "출입 카드"
+ACCESS_IMAGE_LABEL = "출입자 이미지"
+EMAIL_DOMAIN = "secern.ai"
+
+# 파일 input 중 '출입자 이미지' 영역에 속한 것과 프로필 사진 input 위치
+_FILE_INPUTS_JS = """(label) => {
+    const files = Array.from(document.querySelectorAll('input[type="file"]'));
+    const near = f => {
+        for (let n = f.parentElement, i = 0; n && i < 5; n = n.parentElement, i++) {
+            if ((n.innerText || '').trim().startsWith(label)) return true;
+        }
+        return false;
+    };
+    let access = files.findIndex(near);
+    if (access < 0) access = files.length - 1;
+    const profile = files.findIndex((_, i) => i !== access);
+    return {count: files.length, profile, access};
+}"""
+
+# label 텍스트로 input을 찾아 React가 인식하도록 native setter + input 이벤트로 값 설정
+_SET_TEXT_JS = """(values) => {
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const missing = [];
+    const labels = Array.from(document.querySelectorAll('label'));
+    for (const [name, value] of Object.entries(values)) {
+        const label = labels.find(l => l.textContent.replace('*', '').trim() === name);
+        const input = label && (label.htmlFor ? document.getElementById(label.htmlFor) : label.querySelector('input'));
+        if (!input) { missing.push(name); continue; }
+        setter.call(input, value);
+        input.dispatchEvent(new Event('input', {bubbles: true}));
+        input.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return missing;
+}"""
+
+# 트리거(드롭다운 열기 요소)에 연결된 목록에서 옵션 선택 (옵션이 렌더링될 때까지 최대 timeout ms 대기)
+# 목록은 트리거의 aria-controls/aria-owns로 찾고, 연결 속성이 없으면 닫히는 중인 이전 목록이
+# 분리되어 listbox가 하나만 남을 때까지 기다림 (다른 드롭다운의 옵션을 누르지 않도록)
+_PICK_OPTIONS_JS = """async (trigger, [names, partial, timeout]) => {
+    const listbox = () => {
+        const id = trigger.getAttribute('aria-controls') || trigger.getAttribute('aria-owns');
+        if (id) return document.getElementById(id);
+        const boxes = document.querySelectorAll('[role="listbox"]');
+        return boxes.length === 1 ? boxes[0] : null;
+    };
+    const start = performance.now();
+    let options = [];
+    while (performance.now() - start < timeout) {
+        const box = listbox();
+        options = box ? Array.from(box.querySelectorAll('[role="option"]')) : [];
+        if (options.length) break;
+        await new Promise(r => requestAnimationFrame(r));
+    }
+    const picked = [], missing = [];
+    for (const name of names) {
+        const option = options.find(o => {
+            const text = (o.textContent || '').trim();
+            return partial ? text.includes(name) : text === name;
+        });
+        if (option) { option.click(); picked.push(name); } else { missing.push(name); }
+    }
+    return {picked, missing, options: options.length};
+}"""
+
+# 입력 결과 확인 (텍스트 필드 값, 드롭다운 표시 텍스트)
+_READ_FORM_JS = """([names, selects]) => {
+    const labels = Array.from(document.querySelectorAll('label'));
+    const texts = {};
+    for (const name of names) {
+        const label = labels.find(l => l.textContent.replace('*', '').trim() === name);
+        const input = label && (label.htmlFor ? document.getElementById(label.htmlFor) : label.querySelector('input'));
+        texts[name] = input ? input.value : null;
+    }
+    const shown = {};
+    for (const [key, selector] of Object.entries(selects)) {
+        const el = document.querySelector(selector);
+        shown[key] = el ? el.textContent.trim() : null;
+    }
+    return {texts, shown};
+}"""
+
+
+@dataclass
+class FormReport:
+    """
+    임직원 한 명의 폼 입력 결과
+
+    Attributes:
+        round_trips: Playwright 호출(프로토콜 왕복) 수
+        seconds: 폼 입력 소요 시간
+        fallbacks: 대체 경로를 쓴 항목 (예: 'date:calendar', '출입 카드:missing')
+    """
+    round_trips: int = 0
+    seconds: float = 0.0
+    fallbacks: list[str] = field(default_factory=list)
+
+
+class EmployeeForm:
+    """
+    /employeeadd 화면 폼 입력기 (저장 버튼은 누르지 않음)
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.report = FormReport()
+
+    def _call(self, fn, *args, **kwargs):
+        self.report.round_trips += 1
+        return fn(*args, **kwargs)
+
+    def fill(self, employee_id: str, name: str, employee_data: dict, image_path: str,
+             access_image_path: str | None = None, email: str | None = None) -> FormReport:
+        """
+        폼 전체 입력
+
+        Args:
+            employee_id: 사번
+            name: 이름
+            employee_data: employee_data.parse_excel_row / em_add.json 형식
+            image_path: 프로필 사진
+            access_image_path: 출입자 이미지 (없으면 프로필 사진 사용)
+            email: 이메일 (없으면 사번@secern.ai)
+        """
+        self.report = FormReport()
+        start = time.perf_counter()
+        page = self.page
+
+        self.upload_images(image_path, access_image_path or image_path)
+
+        values = {"사번": employee_id, "이름": name, "이메일": email or f"{employee_id}@{EMAIL_DOMAIN}"}
+        missing = self._call(page.evaluate, _SET_TEXT_JS, values)
+        for label in missing:
+            self._call(page.get_by_label(label).fill, values[label])
+
+        expected_selects = {}
+        for key, selector in SINGLE_SELECTS.items():
+            value = (employee_data.get(key) or "").strip()
+            if value:
+                self.pick(selector, [value])
+                expected_selects[key] = value
+
+        assignment_start = parse_assignment_date(employee_data.get("assignment_start_date"))
+        if assignment_start:
+            self.set_date(assignment_start)
+
+        access_cases = [c.strip() for c in employee_data.get("access_cases", []) if c and c.strip()]
+        if access_cases:
+            self.pick(ACCESS_CASE_SELECT, access_cases, multiple=True)
+
+        rf_cards = [c.strip() for c in employee_data.get("rf_card", []) if c and c.strip()]
+        if rf_cards:
+            self.pick(page.get_by_role("combobox", name=RF_CARD_COMBOBOX), rf_cards, multiple=True, partial=True)
+
+        self.verify(values, expected_selects)
+        self.report.seconds = time.perf_counter() - start
+        return self.report
+
+    def upload_images(self, image_path: str, access_image_path: str):
+        """
+        숨은 file input에 직접 설정 (파일 input이 하나뿐이면 출입자 이미지는 파일 선택 창 사용)
+        """
+        files = self._call(self.page.evaluate, _FILE_INPUTS_JS, ACCESS_IMAGE_LABEL)
+        inputs = self.page.locator('input[type="file"]')
+        if files['count'] >= 2:
+            self._call(inputs.nth(files['profile']).set_input_files, image_path)
+            self._call(inputs.nth(files['access']).set_input_files, access_image_path)
+            return
+
+        self.report.fallbacks.append('images:file_chooser')
+        if files['count'] == 1:
+            self._call(inputs.first.set_input_files, image_path)
+        with self.page.expect_file_chooser() as fc_info:
+            self._call(self.page.locator("div").filter(has_text=re.compile(rf"^{ACCESS_IMAGE_LABEL}$"))
+                       .locator("svg").first.click)
+        self._call(fc_info.value.set_files, access_image_path)
+
+    def pick(self, opener, names: list[str], multiple: bool = False, partial: bool = False) -> list[str]:
+        """
+        드롭다운을 열고 evaluate 한 번으로 옵션 선택
+
+        Returns:
+            list[str]: 선택한 옵션 텍스트
+
+        Raises:
+            LookupError: 단일 선택에서 일치하는 옵션이 없음 (다중 선택은 경고 후 건너뜀)
+        """
+        locator = self.page.locator(opener) if isinstance(opener, str) else opener
+        self._call(locator.click)
+        result = self._call(locator.evaluate, _PICK_OPTIONS_JS, [names, partial, 3000])
+        if result['missing']:
+            label = opener if isinstance(opener, str) else RF_CARD_COMBOBOX
+            if not multiple:
+                self._call(self.page.keyboard.press, 'Escape')
+                raise LookupError(f"옵션을 찾을 수 없음: {label} -> {result['missing']} (목록 {result['options']}개)")
+            print(f"[WARNING] {label}: {result['missing']} 옵션 없음")
+            self.report.fallbacks.append(f"{label}:missing")
+        if multiple:
+            self._call(self.page.keyboard.press, 'Escape')
+        return result['picked']
+
+    def set_date(self, value: date, group_name: str = ASSIGNMENT_DATE_GROUP):
+        """
+        date_picker.set_date에 _call을 넘겨 달력 대체 경로까지 왕복 수 집계
+        """
+        if set_date(self.page, value, group_name, call=self._call) == 'calendar':
+            self.report.fallbacks.append('date:calendar')
+
+    def verify(self, values: dict[str, str], expected_selects: dict[str, str]):
+        """
+        입력값을 한 번에 읽어 다른 텍스트 필드만 fill로 재입력
+        """
+        state = self._call(self.page.evaluate, _READ_FORM_JS, [list(values), SINGLE_SELECTS])
+        for label, value in values.items():
+            if state['texts'].get(label) != value:
+                self.report.fallbacks.append(f"{label}:fill")
+                self._call(self.page.get_by_label(label).fill, value)
+        for key, value in expected_selects.items():
+            if value not in (state['shown'].get(key) or ''):
+                print(f"[WARNING] {key}: '{value}' 선택 확인 실패 (표시: {state['shown'].get(key)!r})")
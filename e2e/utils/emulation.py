@@ -0,0 +1,132 @@
+"""
+네트워크/CPU 스로틀링 프로파일
+
+현장 키오스크 PC와 혼잡한 사이트 회선을 재현하기 위해
+CDP(Chrome DevTools Protocol)로 지연, 대역폭, CPU 감속을 적용합니다.
+CDP는 Chromium 계열 브라우저에서만 동작하므로 다른 브라우저에서는 경고만 출력합니다.
+
+사용 예:
+    uv run pytest --browser chromium --emulation-profile kiosk-3g
+
+    @pytest.mark.emulation("site-dsl")
+    def test_xxx(page): ...
+
+    @pytest.mark.emulation("none")   # --emulation-profile로 적용된 스로틀링 해제
+    def test_yyy(page): ...
+
+페이지마다 CDP 세션 하나를 재사용하므로, 마커 프로파일은 세션 프로파일(컨텍스트 단위 적용)을 덮어씁니다.
+"""
+import weakref
+from dataclasses import dataclass
+
+from playwright.sync_api import BrowserContext, CDPSession, Page
+
+
+@dataclass(frozen=True)
+class EmulationProfile:
+    """
+    에뮬레이션 프로파일
+
+    Attributes:
+        name: 프로파일 이름 (CLI/마커에서 사용)
+        latency_ms: 요청당 추가 지연 (밀리초)
+        download_kbps: 다운로드 대역폭 (kbit/s, -1이면 제한 없음)
+        upload_kbps: 업로드 대역폭 (kbit/s, -1이면 제한 없음)
+        cpu_slowdown: CPU 감속 배율 (1이면 감속 없음)
+    """
+    name: str
+    latency_ms: float = 0
+    download_kbps: float = -1
+    upload_kbps: float = -1
+    cpu_slowdown: float = 1
+
+    @property
+    def is_noop(self) -> bool:
+        return (self.latency_ms == 0 and self.download_kbps < 0
+                and self.upload_kbps < 0 and self.cpu_slowdown <= 1)
+
+
+# 현장 조건별 프로파일
+PROFILES = {
+    'none': EmulationProfile('none'),
+    # 사무실 LAN + 일반 PC
+    'lan': EmulationProfile('lan', latency_ms=2, download_kbps=100_000, upload_kbps=100_000),
+    # 지사 DSL 회선 + 보급형 PC
+    'site-dsl': EmulationProfile('site-dsl', latency_ms=80, download_kbps=4_000, upload_kbps=1_000, cpu_slowdown=2),
+    # 경비실 키오스크 (저사양 PC + 무선 브리지)
+    'kiosk-3g': EmulationProfile('kiosk-3g', latency_ms=300, download_kbps=1_600, upload_kbps=750, cpu_slowdown=4),
+    # 출근 시간대 혼잡 회선 + 저사양 PC
+    'congested': EmulationProfile('congested', latency_ms=500, download_kbps=500, upload_kbps=250, cpu_slowdown=6),
+}
+
+
+def get_profile(name: str | None) -> EmulationProfile:
+    """
+    이름으로 프로파일 조회 (None 또는 빈 문자열이면 'none')
+    """
+    if not name:
+        return PROFILES['none']
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 에뮬레이션 프로파일: {name} (사용 가능: {', '.join(PROFILES)})")
+
+
+# 페이지별로 스로틀링을 적용한 CDP 세션 (같은 세션으로 보내야 이전 조건을 덮어쓰거나 해제할 수 있음)
+# 값이 None이면 감속 없는 프로파일을 명시적으로 지정한 페이지 (컨텍스트 프로파일을 적용하지 않음)
+_sessions: 'weakref.WeakKeyDictionary[Page, CDPSession | None]' = weakref.WeakKeyDictionary()
+
+
+def apply_to_page(page: Page, profile: EmulationProfile):
+    """
+    페이지에 프로파일 적용
+
+    이미 스로틀링이 적용된 페이지에 감속 없는 프로파일('none')을 주면 네트워크 조건과 CPU 배율을 해제합니다.
+
+    Returns:
+        CDPSession | None: 적용된 CDP 세션 (적용하지 않았으면 None)
+    """
+    session = _sessions.get(page)
+    if profile.is_noop and session is None:
+        _sessions[page] = None
+        return None
+
+    if session is None:
+        try:
+            session = page.context.new_cdp_session(page)
+        except Exception as e:
+            print(f"[WARNING] CDP 세션을 열 수 없어 '{profile.name}' 프로파일을 건너뜁니다: {e}")
+            return None
+        session.send('Network.enable')
+        _sessions[page] = session
+
+    # kbit/s -> byte/s 변환 (CDP는 byte/s 단위, -1은 제한 없음)
+    def to_bytes(kbps: float) -> float:
+        return -1 if kbps < 0 else kbps * 1000 / 8
+
+    session.send('Network.emulateNetworkConditions', {
+        'offline': False,
+        'latency': profile.latency_ms,
+        'downloadThroughput': to_bytes(profile.download_kbps),
+        'uploadThroughput': to_bytes(profile.upload_kbps),
+    })
+    session.send('Emulation.setCPUThrottlingRate', {'rate': max(1, profile.cpu_slowdown)})
+    return session
+
+
+def apply_to_context(context: BrowserContext, profile: EmulationProfile):
+    """
+    컨텍스트의 기존 페이지와 이후 생성되는 모든 페이지에 프로파일 적용
+    """
+    if profile.is_noop:
+        return
+
+    def on_page(page: Page):
+        # 페이지 단위로 이미 지정한 프로파일(마커)이 있으면 덮어쓰지 않음
+        if page not in _sessions:
+            apply_to_page(page, profile)
+
+    for page in context.pages:
+        on_page(page)
+    context.on('page', on_page)
+    print(f"[INFO] Emulation profile applied: {profile}")
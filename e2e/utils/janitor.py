@@ -0,0 +1,353 @@
+"""
+오래된 테스트 데이터 일괄 정리 (이름 규칙 + 나이 기준)
+
+개발 서버에는 이 스위트가 남긴 '1단_원본_<ts>', '다이얼로그테스트_<ts>', '2단_부모_<ts>' 장소와
+'<사번>-<yymmdd-HHMM>' 임직원이 쌓여 장소 트리와 임직원 목록을 느리게 합니다.
+resource_registry(e2e/utils/resources.py)는 기록한 데이터만 지우므로, 기록 이전에 쌓인 데이터는 이 도구로 정리합니다.
+
+    - 장소: 이름 끝의 유닉스 시각(초), TREE_<ts>/RENDER_<모양>_<크기>_<ts> 생성 트리 루트
+    - 임직원: 이름이 '<사번>-<yymmdd-HHMM>'이고 앞부분이 레코드 사번과 같은 경우만
+
+이름에서 읽은 생성 시각이 --older-than보다 오래된 항목만 대상으로 하고,
+일치한 장소는 하위 장소까지 잎부터 높이별 묶음마다 병렬로 지웁니다.
+모든 삭제 요청은 작업자 수(--workers)와 초당 요청 수(--rate)로 제한합니다.
+
+사용 예:
+    python -m e2e.utils.janitor --older-than 1d --dry-run
+    python -m e2e.utils.janitor --older-than 12h --kinds location --workers 16 --rate 50
+"""
+import argparse
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from e2e.utils.api import ApiClient, ApiError, items_of
+from e2e.utils.benchmark import percentile
+from e2e.utils.location_tree import LocationSnapshot, delete_by_height
+
+KINDS = ('employee', 'location')
+
+# 테스트가 '<라벨>_<int(time.time())>' 또는 '<라벨>_<i>_<ts>'로 만드는 장소
+LOCATION_LABELS = (
+    '1단_원본', '1단_수정', '2단_부모', '2단_원본', '2단_수정',
+    '3단_부모1', '3단_부모2', '3단_원본', '3단_수정', '공용부모',
+    '다이얼로그테스트', '수정테스트', '수정완료', '삭제테스트',
+    # backup/ 의 이전 테스트
+    '테스트장소', '완전한장소', '회의실', '연속', '클릭테스트', '수정전', '수정후', '타입수정', '순서수정',
+    '취소테스트', '다중수정', '다중수정완료', '삭제취소', '다중삭제', '트리업데이트', '즉시삭제',
+)
+LOCATION_PATTERNS = (
+    re.compile(rf"^(?:{'|'.join(map(re.escape, LOCATION_LABELS))})_(?:\d+_)?(?P<ts>\d{{9,10}})$"),
+    # tree_builder / render_benchmark 생성 트리의 루트 (하위 '<접두사>-1-2'는 함께 삭제)
+    re.compile(r"^(?:TREE|RENDER_(?:wide|deep)_\d+)_(?P<ts>\d{9,10})$"),
+)
+# make_unique_name: '<사번>-<yymmdd-HHMM>'
+EMPLOYEE_PATTERN = re.compile(r"^(?P<id>.+)-(?P<ts>\d{6}-\d{4})$")
+
+AGE_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def parse_age(text: str) -> float:
+    """
+    '90m', '12h', '7d' 같은 나이를 초로 (단위가 없으면 초)
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*", text)
+    if not match:
+        raise ValueError(f"나이 형식 오류: {text} (예: 90m, 12h, 7d)")
+    return float(match.group(1)) * AGE_UNITS[match.group(2) or 's']
+
+
+def location_created_at(name: str) -> float | None:
+    """
+    테스트 장소 이름이면 이름에 들어 있는 생성 시각(유닉스 초), 아니면 None
+    """
+    for pattern in LOCATION_PATTERNS:
+        match = pattern.match(name or '')
+        if match:
+            return float(match.group('ts'))
+    return None
+
+
+def employee_created_at(name: str, employee_id: str) -> float | None:
+    """
+    '<사번>-<yymmdd-HHMM>' 이름이고 사번이 레코드와 같으면 생성 시각(로컬 시각 기준), 아니면 None
+    """
+    match = EMPLOYEE_PATTERN.match(name or '')
+    if not match or match.group('id') != str(employee_id):
+        return None
+    try:
+        return datetime.strptime(match.group('ts'), "%y%m%d-%H%M").timestamp()
+    except ValueError:
+        return None
+
+
+@dataclass
+class Candidate:
+    """
+    정리 대상 하나 (장소는 일치한 하위 트리의 루트)
+
+    Attributes:
+        kind: 'employee' 또는 'location'
+        id: 서버 id (임직원은 사번)
+        name: 이름
+        created_at: 이름에서 읽은 생성 시각
+        size: 함께 지울 노드 수 (장소 하위 트리 크기, 임직원은 1)
+    """
+    kind: str
+    id: str | int
+    name: str
+    created_at: float
+    size: int = 1
+
+
+@dataclass
+class JanitorReport:
+    """
+    정리 결과
+
+    Attributes:
+        candidates: 찾은 대상
+        deleted: 삭제한 요청 수 (장소는 하위 노드 포함)
+        missing: 이미 없던 수 (404)
+        failed: (종류, 이름, 사유)
+        latencies: 삭제 요청별 응답 시간(초)
+        discover_seconds: 대상 조회 시간
+        seconds: 삭제 시간
+    """
+    candidates: list[Candidate] = field(default_factory=list)
+    deleted: int = 0
+    missing: int = 0
+    failed: list[tuple[str, str, str]] = field(default_factory=list)
+    latencies: list[float] = field(default_factory=list)
+    discover_seconds: float = 0.0
+    seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return sum(c.size for c in self.candidates)
+
+    @property
+    def per_second(self) -> float:
+        return self.deleted / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        p50, p95 = percentile(self.latencies, 50), percentile(self.latencies, 95)
+        latency = f", p50={p50 * 1000:.0f}ms p95={p95 * 1000:.0f}ms" if self.latencies else ''
+        return (f"deleted={self.deleted}/{self.total}, missing={self.missing}, failed={len(self.failed)}, "
+                f"{self.seconds:.1f}s ({self.per_second:.1f}/s{latency})")
+
+
+class RateLimiter:
+    """
+    초당 요청 수 제한 (스레드 간 공유, rate <= 0이면 제한 없음)
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class Progress:
+    """
+    every초마다 진행률과 처리량 출력
+    """
+
+    def __init__(self, total: int, every: float = 2.0, enabled: bool = True):
+        self.total = total
+        self.every = every
+        self.enabled = enabled
+        self.done = 0
+        self.start = time.perf_counter()
+        self._last = self.start
+        self._lock = threading.Lock()
+
+    def step(self):
+        with self._lock:
+            self.done += 1
+            now = time.perf_counter()
+            if not self.enabled or (now - self._last < self.every and self.done < self.total):
+                return
+            self._last = now
+            rate = self.done / (now - self.start) if now > self.start else 0.0
+        print(f"[INFO] 진행 {self.done}/{self.total} ({rate:.1f}/s)")
+
+
+# ============================================================================
+# 조회
+# ============================================================================
+
+def list_all_employees(client: ApiClient, page_size: int = 500) -> list[dict]:
+    """
+    임직원 목록을 끝까지 페이지 단위로 조회
+
+    서버가 size를 자체 상한으로 줄여 짧은 페이지를 돌려줄 수 있으므로, 짧은 페이지가 아니라
+    빈 페이지 또는 응답의 total에 도달할 때 멈춥니다.
+    """
+    records, page = [], 1
+    while True:
+        response = client.list_employees(page=page, size=page_size)
+        items = items_of(response)
+        records += items
+        total = response.get('total') if isinstance(response, dict) else None
+        if not items or (total is not None and len(records) >= total):
+            return records
+        page += 1
+
+
+def discover(client: ApiClient, older_than: float, kinds: tuple[str, ...] = KINDS,
+             now: float | None = None) -> tuple[list[Candidate], LocationSnapshot | None]:
+    """
+    이름 규칙에 맞고 older_than초보다 오래된 대상 조회
+
+    Returns:
+        (대상 목록, 장소 스냅샷 - 장소를 조회하지 않았으면 None)
+    """
+    cutoff = (now if now is not None else time.time()) - older_than
+    candidates, snapshot = [], None
+
+    if 'employee' in kinds:
+        for record in list_all_employees(client):
+            employee_id = record.get('employeeId', record.get('id'))
+            created_at = employee_created_at(record.get('name'), employee_id)
+            if created_at is not None and created_at <= cutoff:
+                candidates.append(Candidate('employee', employee_id, record['name'], created_at))
+
+    if 'location' in kinds:
+        snapshot = LocationSnapshot.from_api(client)
+        stack = [(i, False) for i in snapshot.roots()]
+        while stack:
+            i, covered = stack.pop()
+            created_at = None if covered else location_created_at(snapshot.names[i])
+            matched = created_at is not None and created_at <= cutoff
+            if matched:
+                candidates.append(Candidate('location', snapshot.ids[i], snapshot.names[i], created_at,
+                                            len(snapshot.descendants(i))))
+            # 이미 대상인 하위 트리 안의 노드는 따로 세지 않음
+            stack.extend((child, covered or matched) for child in snapshot.children[i])
+
+    return candidates, snapshot
+
+
+# ============================================================================
+# 삭제
+# ============================================================================
+
+def purge(base_url: str | None = None, older_than: float = 86400, kinds: tuple[str, ...] = KINDS,
+          workers: int = 8, rate: float = 20.0, dry_run: bool = False, progress: bool = True) -> JanitorReport:
+    """
+    대상 조회 후 동시 삭제 (임직원 병렬, 장소는 잎부터 높이별 묶음마다 병렬)
+    """
+    report = JanitorReport()
+    start = time.perf_counter()
+    main_client = ApiClient(base_url).login()
+    report.candidates, snapshot = discover(main_client, older_than, kinds)
+    report.discover_seconds = time.perf_counter() - start
+    if dry_run or not report.candidates:
+        return report
+
+    limiter = RateLimiter(rate)
+    tracker = Progress(report.total, enabled=progress)
+    local = threading.local()
+    lock = threading.Lock()
+
+    def client() -> ApiClient:
+        # ApiClient는 스레드 간 공유하지 않음
+        if not hasattr(local, 'client'):
+            local.client = ApiClient(base_url).login()
+        return local.client
+
+    def delete(job: tuple[str, object, str]):
+        kind, node_id, name = job
+        limiter.acquire()
+        began = time.perf_counter()
+        try:
+            if kind == 'employee':
+                client().delete_employee(node_id)
+            else:
+                client().delete_location(node_id)
+            outcome = 'deleted'
+        except ApiError as e:
+            outcome = 'missing' if e.status == 404 else str(e)
+        elapsed = time.perf_counter() - began
+        with lock:
+            report.latencies.append(elapsed)
+            if outcome == 'deleted':
+                report.deleted += 1
+            elif outcome == 'missing':
+                report.missing += 1
+            else:
+                report.failed.append((kind, name, outcome))
+        tracker.step()
+
+    # 임직원만 정리하면 장소를 조회하지 않으므로 스냅샷이 없음
+    batches = snapshot.height_batches(*(snapshot.index[c.id] for c in report.candidates
+                                        if c.kind == 'location')) if snapshot is not None else []
+    employees = [('employee', c.id, c.name) for c in report.candidates if c.kind == 'employee']
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(delete, employees))
+        delete_by_height(pool, batches, lambda i: delete(('location', snapshot.ids[i], snapshot.names[i])))
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def format_candidates(candidates: list[Candidate], limit: int = 20) -> list[str]:
+    """
+    대상 목록 표 (오래된 순)
+    """
+    lines = []
+    for c in sorted(candidates, key=lambda c: c.created_at)[:limit]:
+        created = datetime.fromtimestamp(c.created_at).strftime('%Y-%m-%d %H:%M')
+        lines.append(f"  {c.kind:<9}{created}  {c.name}" + (f"  (+{c.size - 1} 하위)" if c.size > 1 else ''))
+    if len(candidates) > limit:
+        lines.append(f"  ... 외 {len(candidates) - limit}건")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='이름 규칙에 맞는 오래된 테스트 데이터 일괄 삭제')
+    parser.add_argument('--older-than', default='1d', help='이보다 오래된 데이터만 (예: 90m, 12h, 7d, 기본 1d)')
+    parser.add_argument('--kinds', default=','.join(KINDS), help='employee,location 중 정리할 종류')
+    parser.add_argument('--base-url', help='API 서버 주소 (기본: API_BASE_URL)')
+    parser.add_argument('--workers', type=int, default=8, help='동시 삭제 요청 수')
+    parser.add_argument('--rate', type=float, default=20.0, help='초당 최대 삭제 요청 수 (0: 제한 없음)')
+    parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상만 출력')
+    parser.add_argument('--limit', type=int, default=20, help='출력할 대상 수')
+    args = parser.parse_args()
+
+    kinds = tuple(k.strip() for k in args.kinds.split(',') if k.strip())
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        parser.error(f"알 수 없는 종류: {sorted(unknown)} (가능: {KINDS})")
+
+    report = purge(args.base_url, parse_age(args.older_than), kinds, args.workers, args.rate, args.dry_run)
+    by_kind = {kind: sum(c.size for c in report.candidates if c.kind == kind) for kind in kinds}
+    print(f"[INFO] 대상 {len(report.candidates)}건 / 노드 {report.total}개 {by_kind} "
+          f"(조회 {report.discover_seconds:.1f}s, older-than={args.older_than})")
+    for line in format_candidates(report.candidates, args.limit):
+        print(line)
+    if args.dry_run:
+        print("[INFO] dry-run: 삭제하지 않았습니다.")
+        return
+    print(f"[{'OK' if not report.failed else 'WARNING'}] janitor: {report.summary()}")
+    for kind, name, message in report.failed[:10]:
+        print(f"[WARNING] {kind} {name}: {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+페이지네이션/가상 스크롤 목록 스캐너
+
+get_by_role("cell", name=...)은 현재 렌더링된 페이지만 보므로, 임직원이 많아
+대상 행이 다음 페이지(또는 가상 스크롤 창 밖)에 있으면 검증/삭제가 실패합니다.
+ListScanner는 목록을 다음과 같은 순서로 찾습니다.
+
+    1. 현재 창에서 대기 (저장 직후 목록 갱신 포함, wait_for_function 한 번)
+    2. search가 주어지면 "필터" -> "이름" -> "검색"으로 범위를 좁힘
+    3. 페이지(또는 가상 스크롤 창)를 넘기며 순회, 찾으면 즉시 중단
+
+각 창의 셀 텍스트는 evaluate_all 한 번으로 읽으므로 셀마다 왕복하지 않습니다.
+10만 명 목록도 2단계에서 대부분 1페이지로 끝나며, 3단계는 필터가 없는 화면을 위한 대비책입니다.
+
+사용 예:
+    scanner = ListScanner(page)
+    hit = scanner.find(employee_id, search=unique_name)
+    assert hit, f"목록에 없음: {employee_id}"
+"""
+from dataclasses import dataclass
+from typing import Iterator
+
+from playwright.sync_api import Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+ROW_SELECTOR = "tbody tr"
+# MUI TablePagination 다음 페이지 버튼 (영문/한글 로캘)
+NEXT_PAGE_SELECTOR = 'button[aria-label="Go to next page"], button[aria-label="다음 페이지"]'
+
+# 현재 창의 행 전체를 한 번에 읽고, target이 있으면 일치하는 첫 행/열 위치도 계산
+_READ_JS = """(rows, [target, column, exact]) => {
+    const match = text => exact ? text === target : text.includes(target);
+    const cells = rows.map(r => Array.from(r.querySelectorAll('td'), c => (c.textContent || '').trim()));
+    let hit = null;
+    if (target !== null) {
+        for (let i = 0; i < cells.length && !hit; i++) {
+            const cols = column === null ? cells[i].map((_, j) => j) : [column];
+            const j = cols.find(j => cells[i][j] !== undefined && match(cells[i][j]));
+            if (j !== undefined) hit = [i, j];
+        }
+    }
+    return {
+        cells,
+        hit,
+        first: rows.length ? rows[0].textContent : null,
+        last: rows.length ? rows[rows.length - 1].textContent : null,
+        rowText: hit ? rows[hit[0]].textContent : null,
+    };
+}"""
+
+# 현재 창에 target이 나타날 때까지 대기 (wait_for_function)
+_CONTAINS_JS = """([selector, target, column, exact]) => {
+    const match = text => exact ? text === target : text.includes(target);
+    return Array.from(document.querySelectorAll(selector)).some(r => {
+        const cells = Array.from(r.querySelectorAll('td'), c => (c.textContent || '').trim());
+        return column === null ? cells.some(match) : cells[column] !== undefined && match(cells[column]);
+    });
+}"""
+
+# index 위치 행(음수면 끝에서부터)의 textContent가 바뀔 때까지 대기
+_CHANGED_JS = """([selector, index, text]) => {
+    const rows = document.querySelectorAll(selector);
+    const row = rows[index < 0 ? rows.length + index : index];
+    return !row || row.textContent !== text;
+}"""
+
+
+@dataclass
+class ScanHit:
+    """
+    스캔 결과 위치
+
+    Attributes:
+        page: 찾은 페이지/스크롤 창 번호 (1부터)
+        row: 현재 창 안의 행 위치
+        column: 일치한 셀의 열 위치
+        cells: 행의 셀 텍스트
+        row_text: 행 textContent (삭제 확인용)
+    """
+    page: int
+    row: int
+    column: int
+    cells: list[str]
+    row_text: str
+
+    @property
+    def text(self) -> str:
+        return self.cells[self.column]
+
+
+class ListScanner:
+    """
+    목록 화면 스캐너
+
+    다음 페이지 버튼이 있으면 페이지를 넘기고, 없으면 마지막 행을 스크롤해 가상 스크롤 창을 넘깁니다.
+    """
+
+    def __init__(self, page: Page, row_selector: str = ROW_SELECTOR, timeout: float = 10000):
+        self.page = page
+        self.row_selector = row_selector
+        self.timeout = timeout
+        self.rows = page.locator(row_selector)
+        self.pages_scanned = 0
+        self.filtered = False
+
+    def read_window(self, target: str | None = None, column: int | None = None, exact: bool = True) -> dict:
+        """
+        현재 창의 셀 텍스트 (evaluate_all 한 번)
+        """
+        return self.rows.evaluate_all(_READ_JS, [target, column, exact])
+
+    def wait_for_rows(self, timeout: float | None = None) -> bool:
+        try:
+            self.rows.first.wait_for(state='visible', timeout=self.timeout if timeout is None else timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    def find(self, text: str, column: int | None = None, exact: bool = True, search: str | None = None,
+             settle_ms: float = 5000, max_pages: int | None = None) -> ScanHit | None:
+        """
+        text와 일치하는 셀이 있는 행을 찾음 (없으면 None)
+
+        Args:
+            text: 찾을 셀 텍스트
+            column: 열 위치 (None이면 모든 열)
+            exact: False면 부분 일치
+            search: 현재 창에 없을 때 이름 필터에 입력할 값 (None이면 필터 없이 순회)
+            settle_ms: 현재 창에 나타나기를 기다리는 시간 (저장 직후 목록 갱신 대기,
+                       목록이 바뀌지 않는 삭제 반복 등에서는 0이면 현재 창만 한 번 확인)
+            max_pages: 순회할 최대 페이지 수
+        """
+        if not self._in_window(text, column, exact, settle_ms) and search:
+            apply_name_filter(self.page, search)
+            self.filtered = True
+        return next(self._scan(text, column, exact, max_pages), None)
+
+    def _in_window(self, text: str, column: int | None, exact: bool, settle_ms: float) -> bool:
+        if settle_ms <= 0:
+            # Playwright timeout=0은 무제한 대기이므로 기다리지 않고 현재 창만 확인
+            return bool(self.read_window(text, column, exact)['hit'])
+        try:
+            self.page.wait_for_function(_CONTAINS_JS, arg=[self.row_selector, text, column, exact],
+                                        timeout=settle_ms)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    def iter_rows(self, max_pages: int | None = None) -> Iterator[list[str]]:
+        """
+        현재 위치부터 모든 행의 셀 텍스트 (가상 스크롤 창이 겹치는 행은 한 번만)
+        """
+        seen = set()
+        for window in self._windows(None, None, True, max_pages):
+            for cells in window['cells']:
+                key = tuple(cells)
+                if key not in seen:
+                    seen.add(key)
+                    yield cells
+
+    def first_row(self, column: int | None = None) -> ScanHit | None:
+        """
+        현재 창의 맨 위 행 (목록이 비어 있으면 None)
+        """
+        if not self.wait_for_rows(timeout=3000):
+            return None
+        window = self.read_window()
+        if not window['cells']:
+            return None
+        cells = window['cells'][0]
+        return ScanHit(1, 0, column if column is not None else 0, cells, window['first'])
+
+    def cell_locator(self, hit: ScanHit, column: int | None = None) -> Locator:
+        return self.rows.nth(hit.row).locator("td").nth(hit.column if column is None else column)
+
+    def wait_row_gone(self, hit: ScanHit, timeout: float = 5000):
+        """
+        hit 위치의 행이 다른 행으로 바뀔 때까지 대기 (삭제 확인)
+        """
+        self.page.wait_for_function(_CHANGED_JS, arg=[self.row_selector, hit.row, hit.row_text], timeout=timeout)
+
+    def clear_search(self):
+        """
+        find(search=...)로 건 이름 필터 해제
+        """
+        if self.filtered:
+            apply_name_filter(self.page, '')
+            self.filtered = False
+
+    def _scan(self, text: str, column: int | None, exact: bool, max_pages: int | None) -> Iterator[ScanHit]:
+        for window in self._windows(text, column, exact, max_pages):
+            if window['hit']:
+                row, col = window['hit']
+                yield ScanHit(self.pages_scanned, row, col, window['cells'][row], window['rowText'])
+                return
+        print(f"[WARNING] 목록 {self.pages_scanned}페이지를 모두 확인했지만 '{text}'이(가) 없습니다.")
+
+    def _windows(self, text: str | None, column: int | None, exact: bool,
+                 max_pages: int | None) -> Iterator[dict]:
+        self.pages_scanned = 0
+        if not self.wait_for_rows():
+            return
+        while True:
+            window = self.read_window(text, column, exact)
+            self.pages_scanned += 1
+            yield window
+            if max_pages and self.pages_scanned >= max_pages:
+                return
+            if not self._advance(window):
+                return
+
+    def _advance(self, window: dict) -> bool:
+        """
+        다음 페이지/스크롤 창으로 이동 (더 없으면 False)
+        """
+        if not window['cells']:
+            return False
+        next_button = self.page.locator(NEXT_PAGE_SELECTOR).first
+        if next_button.count() and next_button.is_visible():
+            if not next_button.is_enabled():
+                return False
+            next_button.click()
+            self.page.wait_for_function(_CHANGED_JS, arg=[self.row_selector, 0, window['first']],
+                                        timeout=self.timeout)
+            return True
+
+        # 페이지 버튼이 없으면 가상 스크롤로 보고 마지막 행을 스크롤
+        self.rows.last.scroll_into_view_if_needed()
+        self.page.mouse.wheel(0, 2000)
+        try:
+            self.page.wait_for_function(_CHANGED_JS, arg=[self.row_selector, -1, window['last']], timeout=1500)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+
+def apply_name_filter(page: Page, text: str):
+    """
+    test_search_and_delete_employee와 같은 절차로 필터 -> 이름 입력 -> 검색
+    """
+    name_input = page.get_by_role("textbox", name="이름")
+    if not name_input.is_visible():
+        page.get_by_role("button", name="필터").click()
+    name_input.fill(text)
+    page.get_by_role("button", name="검색").click()
+    page.wait_for_load_state('networkidle')
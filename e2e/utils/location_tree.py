@@ -0,0 +1,365 @@
+"""
+장소 트리 스냅샷과 구조 비교
+
+get_by_role("treeitem", name=...) 확인은 해당 가지가 펼쳐져 있어야 하고,
+트리가 커질수록 느려지고 불안정해집니다. LocationSnapshot은 트리 전체를 한 번에 읽어
+(id, 부모, 이름, 유형, 표시 순서) 배열로 보관하고, diff_trees로 기대 트리와 비교합니다.
+
+    from_api    장소 목록 API 한 번 (평면 또는 children 중첩 응답)
+    from_page   DOM의 treeitem을 evaluate 한 번으로 추출 (펼쳐진 가지만 보이며 유형은 알 수 없음)
+    from_levels flatten_tree 레벨 목록 (기대 트리, id 대신 이름 사용)
+
+비교는 루트부터 두 트리를 함께 내려가며 형제를 이름으로 맞추므로 다른 건물 아래의 같은 이름('1층')도
+구분하고, 노드마다 dict 조회 한 번으로 끝납니다. 10k 노드 비교는 수십 ms 이내입니다 (TreeDiff.seconds).
+
+사용 예:
+    actual = LocationSnapshot.from_api(client).subtree(['본사'])
+    diff = diff_trees(LocationSnapshot.from_levels(levels), actual)
+    assert diff.ok, diff.summary()
+
+장소 삭제는 자식이 남은 부모를 거부하므로 height_batches로 묶고 delete_by_height로 잎부터 병렬 삭제합니다.
+"""
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from playwright.sync_api import Page
+
+from e2e.utils.api import ApiClient, items_of
+
+COMPARE_FIELDS = ('type', 'order')
+
+# treeitem 전체를 [id, 부모 위치, 이름, 형제 중 순서, 펼침 여부] 배열로 추출
+TREE_SNAPSHOT_JS = """() => {
+    const items = Array.from(document.querySelectorAll('[role="treeitem"]'));
+    const index = new Map(items.map((el, i) => [el, i]));
+    const position = new Map();
+    return items.map((el, i) => {
+        const parentEl = el.parentElement ? el.parentElement.closest('[role="treeitem"]') : null;
+        const parent = parentEl ? index.get(parentEl) : -1;
+        const count = (position.get(parent) || 0) + 1;
+        position.set(parent, count);
+        const label = el.querySelector('.MuiTreeItem-label, [class*="TreeItem-label"]');
+        const name = (label ? label.textContent : (el.getAttribute('aria-label') || '')).trim();
+        return [el.dataset.id || el.id || null, parent, name, count, el.getAttribute('aria-expanded')];
+    });
+}"""
+
+
+def location_rows(response) -> list[dict]:
+    """
+    장소 목록 응답(평면 또는 children 중첩)을 {'id', 'parentId', 'name', 'type', 'order'} 목록으로
+    """
+    rows = []
+    stack = [(record, None) for record in reversed(items_of(response))]
+    while stack:
+        record, parent_id = stack.pop()
+        rows.append({
+            'id': record.get('id'),
+            'parentId': record.get('parentId', record.get('parent_id', parent_id)),
+            'name': record.get('name'),
+            'type': record.get('type', record.get('locationType')),
+            'order': record.get('order', record.get('displayOrder')),
+        })
+        for child in reversed(record.get('children') or []):
+            stack.append((child, record.get('id')))
+    return rows
+
+
+class LocationSnapshot:
+    """
+    장소 트리 스냅샷 (노드 위치 i의 값이 각 배열의 i번째에 있음, 부모는 위치 또는 -1)
+    """
+
+    __slots__ = ('ids', 'parents', 'names', 'types', 'orders', 'index', '_children')
+
+    def __init__(self, ids: list, parents: list[int], names: list[str], types: list, orders: list):
+        self.ids = ids
+        self.parents = parents
+        self.names = names
+        self.types = types
+        self.orders = orders
+        self.index = {node_id: i for i, node_id in enumerate(ids)}
+        self._children: list[list[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # ------------------------------------------------------------------------
+    # 생성
+    # ------------------------------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, rows: list[dict]) -> 'LocationSnapshot':
+        """
+        location_rows 형식에서 생성 (목록에 없는 부모 id는 루트로 취급)
+        """
+        index = {row['id']: i for i, row in enumerate(rows)}
+        return cls([row['id'] for row in rows],
+                   [index.get(row['parentId'], -1) for row in rows],
+                   [row['name'] for row in rows],
+                   [row.get('type') for row in rows],
+                   [row.get('order') for row in rows])
+
+    @classmethod
+    def from_api(cls, client: ApiClient) -> 'LocationSnapshot':
+        return cls.from_rows(location_rows(client.list_locations()))
+
+    @classmethod
+    def from_levels(cls, levels: list[list[dict]]) -> 'LocationSnapshot':
+        """
+        flatten_tree 레벨 목록에서 기대 트리 생성 (이름이 id, 부모는 이름으로 연결)
+        """
+        return cls.from_rows([{'id': n['name'], 'parentId': n['parent'], 'name': n['name'],
+                               'type': n.get('type'), 'order': n.get('order')}
+                              for level in levels for n in level])
+
+    @classmethod
+    def from_dom(cls, items: list[list]) -> 'LocationSnapshot':
+        """
+        TREE_SNAPSHOT_JS 결과에서 생성 (유형 없음, 표시 순서는 형제 중 위치)
+        """
+        return cls([item[0] if item[0] is not None else i for i, item in enumerate(items)],
+                   [item[1] for item in items],
+                   [item[2] for item in items],
+                   [None] * len(items),
+                   [item[3] for item in items])
+
+    @classmethod
+    def from_page(cls, page: Page) -> 'LocationSnapshot':
+        """
+        현재 렌더링된 트리 (evaluate 한 번)
+        """
+        return cls.from_dom(page.evaluate(TREE_SNAPSHOT_JS))
+
+    # ------------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------------
+
+    @property
+    def children(self) -> list[list[int]]:
+        if self._children is None:
+            self._children = [[] for _ in self.ids]
+            for i, parent in enumerate(self.parents):
+                if parent >= 0:
+                    self._children[parent].append(i)
+        return self._children
+
+    def roots(self) -> list[int]:
+        return [i for i, parent in enumerate(self.parents) if parent < 0]
+
+    def find(self, name: str) -> list[int]:
+        return [i for i, n in enumerate(self.names) if n == name]
+
+    def resolve(self, ref) -> int:
+        """
+        id 또는 고유한 이름으로 위치 찾기
+
+        Raises:
+            ValueError: 없거나 같은 이름이 여러 개
+        """
+        if ref in self.index:
+            return self.index[ref]
+        matches = self.find(str(ref))
+        if len(matches) != 1:
+            raise ValueError(f"장소를 찾을 수 없거나 이름이 중복됩니다: {ref} ({len(matches)}개) - id로 지정하세요")
+        return matches[0]
+
+    def path(self, i: int) -> tuple:
+        """
+        루트부터 i까지의 이름 경로
+        """
+        names = []
+        for _ in range(len(self.ids)):
+            names.append(self.names[i])
+            i = self.parents[i]
+            if i < 0:
+                break
+        return tuple(reversed(names))
+
+    def sibling_keys(self, i: int) -> dict:
+        """
+        i의 자식(i < 0이면 루트)을 이름으로 찾는 dict (형제 중 같은 이름은 (이름, 순번) 키)
+        """
+        keys = {}
+        for child in (self.roots() if i < 0 else self.children[i]):
+            key = self.names[child]
+            if key in keys:
+                n = 2
+                while (key, n) in keys:
+                    n += 1
+                key = (key, n)
+            keys[key] = child
+        return keys
+
+    def descendants(self, i: int) -> list[int]:
+        result, stack = [], [i]
+        while stack:
+            node = stack.pop()
+            result.append(node)
+            stack.extend(self.children[node])
+        return result
+
+    def postorder(self, i: int) -> list[int]:
+        """
+        i의 하위 트리를 자식이 부모보다 먼저 오는 순서로 (i가 마지막)
+        """
+        return list(reversed(self.descendants(i)))
+
+    def height_batches(self, *roots: int) -> list[list[int]]:
+        """
+        roots 하위 트리(겹치면 합집합)를 높이(잎이 0)별로 묶은 목록 (잎부터, 가장 높은 루트가 마지막 묶음)
+
+        같은 묶음의 노드는 서로 조상/자손 관계가 없고, 자식은 모두 앞 묶음에 있으므로
+        묶음 단위로 병렬 삭제할 수 있습니다. 깊이 대신 높이로 묶어 얕은 곳의 잎도 첫 묶음에서 지웁니다.
+        """
+        heights: dict[int, int] = {}
+        for root in roots:
+            for node in self.postorder(root):
+                if node not in heights:
+                    heights[node] = 1 + max((heights[c] for c in self.children[node]), default=-1)
+        batches: list[list[int]] = [[] for _ in range(max(heights.values(), default=-1) + 1)]
+        for node, height in heights.items():
+            batches[height].append(node)
+        return batches
+
+    def depth_of(self, i: int) -> int:
+        """
+        루트가 0인 i의 깊이
+        """
+        depth, parent = 0, self.parents[i]
+        while parent >= 0:
+            depth, parent = depth + 1, self.parents[parent]
+        return depth
+
+    def depth(self) -> int:
+        depth, level = 0, self.roots()
+        while level:
+            depth += 1
+            level = [child for i in level for child in self.children[i]]
+        return depth
+
+    def subtree(self, root_names: list[str]) -> 'LocationSnapshot':
+        """
+        루트 이름 목록의 하위 트리만 남긴 스냅샷 (다른 데이터가 섞인 서버에서 비교할 때)
+        """
+        wanted = set(root_names)
+        keep = sorted(n for root in self.roots() if self.names[root] in wanted for n in self.descendants(root))
+        position = {old: new for new, old in enumerate(keep)}
+        return LocationSnapshot([self.ids[i] for i in keep],
+                                [position.get(self.parents[i], -1) for i in keep],
+                                [self.names[i] for i in keep],
+                                [self.types[i] for i in keep],
+                                [self.orders[i] for i in keep])
+
+
+@dataclass
+class TreeDiff:
+    """
+    구조 비교 결과 (경로는 ' / '로 이은 이름)
+
+    Attributes:
+        missing: 기대 트리에만 있는 하위 트리의 루트 경로
+        unexpected: 실제 트리에만 있는 하위 트리의 루트 경로
+        moved: (이름, 기대 경로, 실제 경로) - 이름이 같은 missing/unexpected 쌍
+        changed: (경로, 항목, 기대값, 실제값)
+        missing_count: missing 하위 트리 전체 노드 수 (이동한 하위 트리 제외)
+        unexpected_count: unexpected 하위 트리 전체 노드 수 (이동한 하위 트리 제외)
+        seconds: 비교에 걸린 Python 시간
+    """
+    missing: list[str] = field(default_factory=list)
+    unexpected: list[str] = field(default_factory=list)
+    moved: list[tuple[str, str, str]] = field(default_factory=list)
+    changed: list[tuple[str, str, Any, Any]] = field(default_factory=list)
+    missing_count: int = 0
+    unexpected_count: int = 0
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.unexpected or self.moved or self.changed)
+
+    def summary(self, limit: int = 5) -> str:
+        if self.ok:
+            return f"일치 ({self.seconds * 1000:.1f}ms)"
+        parts = []
+        for label, items, count in (('missing', self.missing, self.missing_count),
+                                    ('unexpected', self.unexpected, self.unexpected_count),
+                                    ('moved', self.moved, len(self.moved)),
+                                    ('changed', self.changed, len(self.changed))):
+            if items:
+                parts.append(f"{label}={count} {items[:limit]}")
+        return ", ".join(parts) + f" ({self.seconds * 1000:.1f}ms)"
+
+
+def delete_by_height(pool: Executor, batches: list[list[int]], delete: Callable[[int], Any],
+                     blocked: set[int] | None = None) -> list:
+    """
+    height_batches 묶음을 잎부터 차례로 pool에서 병렬 실행 (다음 묶음은 앞 묶음 응답을 모두 받은 뒤)
+
+    Args:
+        delete: 노드 인덱스를 받아 삭제하는 함수 (반환값은 그대로 모아 돌려줌)
+        blocked: 보내지 않을 노드 (delete가 실패한 노드의 조상을 추가하면 다음 묶음부터 제외)
+
+    Returns:
+        list: 보낸 노드의 delete 반환값 (묶음 순서)
+    """
+    results = []
+    for batch in batches:
+        results.extend(pool.map(delete, [i for i in batch if not blocked or i not in blocked]))
+    return results
+
+
+def _join(path: tuple) -> str:
+    return " / ".join(str(p) for p in path)
+
+
+def diff_trees(expected: LocationSnapshot, actual: LocationSnapshot,
+               fields: tuple[str, ...] = COMPARE_FIELDS) -> TreeDiff:
+    """
+    루트부터 두 트리를 함께 내려가며 형제를 이름으로 맞춰 비교
+
+    실제 값이 None인 항목(서버/DOM이 제공하지 않는 값)은 비교하지 않습니다.
+    한쪽에만 있는 노드는 하위 트리 루트만 목록에 남기고 수만 셉니다.
+    """
+    start = time.perf_counter()
+    columns = [(name, getattr(expected, f"{name}s"), getattr(actual, f"{name}s")) for name in fields]
+    diff = TreeDiff()
+    missing_roots, unexpected_roots = [], []
+
+    stack = [(-1, -1)]
+    while stack:
+        i, j = stack.pop()
+        mine, theirs = expected.sibling_keys(i), actual.sibling_keys(j)
+        for key, child in mine.items():
+            other = theirs.get(key)
+            if other is None:
+                missing_roots.append(child)
+                continue
+            for name, want, got in columns:
+                if got[other] is not None and want[child] is not None and got[other] != want[child]:
+                    diff.changed.append((_join(expected.path(child)), name, want[child], got[other]))
+            stack.append((child, other))
+        unexpected_roots.extend(child for key, child in theirs.items() if key not in mine)
+
+    # 같은 이름이 한 번씩만 사라지고 나타났으면 이동으로 봄
+    lost, found = {}, {}
+    for i in missing_roots:
+        lost.setdefault(expected.names[i], []).append(i)
+    for j in unexpected_roots:
+        found.setdefault(actual.names[j], []).append(j)
+    moved = {name for name in lost if len(lost[name]) == 1 and len(found.get(name, [])) == 1}
+    for name in sorted(moved):
+        diff.moved.append((name, _join(expected.path(lost[name][0])), _join(actual.path(found[name][0]))))
+
+    for i in missing_roots:
+        if expected.names[i] not in moved:
+            diff.missing.append(_join(expected.path(i)))
+            diff.missing_count += len(expected.descendants(i))
+    for j in unexpected_roots:
+        if actual.names[j] not in moved:
+            diff.unexpected.append(_join(actual.path(j)))
+            diff.unexpected_count += len(actual.descendants(j))
+    diff.seconds = time.perf_counter() - start
+    return diff
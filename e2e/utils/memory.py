@@ -0,0 +1,279 @@
+"""
+장시간 대량 처리 시 메모리 증가 추적 및 페이지 자동 재생성
+
+하나의 페이지로 수백 건의 SPA 이동(목록 <-> /employeeadd)을 반복하면
+렌더러 메모리가 계속 늘어나 건당 처리 시간이 점점 느려집니다.
+PageRecycler는 주기적으로 JS 힙/렌더러 RSS를 샘플링하고,
+N건 처리 또는 메모리 임계치 초과 시 페이지(또는 컨텍스트)를 새로 만듭니다.
+
+환경 변수:
+    RECYCLE_EVERY_ROWS: N건마다 재생성 (0이면 건수 기준 비활성화, 기본 200)
+    RECYCLE_MAX_HEAP_MB: JS 힙 사용량 임계치 (0이면 비활성화, 기본 512)
+    RECYCLE_MAX_RSS_MB: 렌더러 RSS 임계치 (0이면 비활성화, 기본 0)
+    RECYCLE_MODE: page 또는 context (기본 page)
+    MEMORY_SAMPLE_EVERY: N건마다 메모리 샘플링 (기본 10)
+
+렌더러 RSS는 psutil이 설치된 경우에만 수집합니다.
+"""
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from e2e.utils.emulation import EmulationProfile, apply_to_context, apply_to_page
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+@dataclass
+class MemorySample:
+    """
+    메모리 샘플 하나
+
+    값을 수집하지 못한 항목은 None
+    """
+    row: int
+    timestamp: float
+    js_heap_used_mb: float | None = None
+    js_heap_total_mb: float | None = None
+    dom_nodes: int | None = None
+    renderer_rss_mb: float | None = None
+
+
+@dataclass
+class RecyclePolicy:
+    """
+    페이지 재생성 정책
+    """
+    every_rows: int = 200
+    max_heap_mb: float = 512
+    max_rss_mb: float = 0
+    mode: str = 'page'
+    sample_every: int = 10
+
+    @classmethod
+    def from_env(cls) -> 'RecyclePolicy':
+        return cls(
+            every_rows=int(os.getenv('RECYCLE_EVERY_ROWS', '200')),
+            max_heap_mb=float(os.getenv('RECYCLE_MAX_HEAP_MB', '512')),
+            max_rss_mb=float(os.getenv('RECYCLE_MAX_RSS_MB', '0')),
+            mode=os.getenv('RECYCLE_MODE', 'page'),
+            sample_every=max(1, int(os.getenv('MEMORY_SAMPLE_EVERY', '10'))),
+        )
+
+    def reason(self, rows_since_recycle: int, sample: MemorySample | None) -> str | None:
+        """
+        재생성이 필요하면 사유 문자열, 아니면 None
+        """
+        if self.every_rows and rows_since_recycle >= self.every_rows:
+            return f"rows={rows_since_recycle}"
+        if sample is None:
+            return None
+        if self.max_heap_mb and sample.js_heap_used_mb and sample.js_heap_used_mb >= self.max_heap_mb:
+            return f"js_heap={sample.js_heap_used_mb:.0f}MB"
+        if self.max_rss_mb and sample.renderer_rss_mb and sample.renderer_rss_mb >= self.max_rss_mb:
+            return f"renderer_rss={sample.renderer_rss_mb:.0f}MB"
+        return None
+
+
+def _renderer_rss_mb() -> float | None:
+    """
+    현재 프로세스 하위의 Chromium 렌더러 프로세스 RSS 합계 (MB)
+    """
+    if psutil is None:
+        return None
+
+    total = 0
+    try:
+        for child in psutil.Process().children(recursive=True):
+            try:
+                if '--type=renderer' in ' '.join(child.cmdline()):
+                    total += child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+    except psutil.Error:
+        return None
+    return total / (1024 * 1024)
+
+
+def sample_memory(page: Page, row: int) -> MemorySample:
+    """
+    페이지의 JS 힙, DOM 노드 수, 렌더러 RSS 샘플링
+
+    Chromium은 CDP Performance.getMetrics를 사용하고,
+    그 외 브라우저는 performance.memory(지원 시)로 대체합니다.
+    """
+    sample = MemorySample(row=row, timestamp=time.time())
+    mb = 1024 * 1024
+
+    try:
+        session = page.context.new_cdp_session(page)
+        try:
+            session.send('Performance.enable')
+            metrics = {m['name']: m['value'] for m in session.send('Performance.getMetrics')['metrics']}
+        finally:
+            session.detach()
+        sample.js_heap_used_mb = metrics.get('JSHeapUsedSize', 0) / mb
+        sample.js_heap_total_mb = metrics.get('JSHeapTotalSize', 0) / mb
+        sample.dom_nodes = int(metrics.get('Nodes', 0))
+    except Exception:
+        memory = page.evaluate(
+            "() => performance.memory ? "
+            "[performance.memory.usedJSHeapSize, performance.memory.totalJSHeapSize] : null"
+        )
+        if memory:
+            sample.js_heap_used_mb = memory[0] / mb
+            sample.js_heap_total_mb = memory[1] / mb
+
+    sample.renderer_rss_mb = _renderer_rss_mb()
+    return sample
+
+
+@dataclass
+class RecycleEvent:
+    """
+    재생성 이력
+    """
+    row: int
+    reason: str
+    duration: float
+    before: MemorySample | None = None
+
+
+@dataclass
+class PageRecycler:
+    """
+    대량 처리 루프용 페이지 재생성기
+
+    사용 예:
+        page = page_recycler.start(page, setup=prepare)
+        for idx, row in enumerate(rows):
+            ...
+            page = page_recycler.after_row(page, idx + 1)
+
+    Attributes:
+        context: 페이지를 생성할 컨텍스트 (mode=page)
+        browser: 새 컨텍스트를 생성할 브라우저 (mode=context)
+        policy: 재생성 정책
+        setup: 새 페이지를 작업 가능한 상태로 만드는 함수 (다이얼로그 핸들러 등록, 목록 이동)
+        on_new_page: 새 페이지 생성 직후 호출 (타임라인 계측 등)
+        profile: 새 페이지/컨텍스트에 다시 적용할 에뮬레이션 프로파일 (테스트에 적용된 프로파일)
+        current: 지금 사용 중인 페이지 (실패 스크린샷 대상)
+    """
+    context: BrowserContext
+    browser: Browser | None = None
+    policy: RecyclePolicy = field(default_factory=RecyclePolicy.from_env)
+    setup: Callable[[Page], Page] | None = None
+    step_timer: object | None = None
+    on_new_page: Callable[[Page], object] | None = None
+    profile: EmulationProfile | None = None
+    current: Page | None = None
+    samples: list[MemorySample] = field(default_factory=list)
+    events: list[RecycleEvent] = field(default_factory=list)
+    _rows_since_recycle: int = 0
+    _owned_context: BrowserContext | None = None
+    _owned_pages: list[Page] = field(default_factory=list)
+
+    def start(self, page: Page, setup: Callable[[Page], Page] | None = None) -> Page:
+        """
+        루프 시작 전 호출 (기준 메모리 샘플 수집)
+        """
+        if setup is not None:
+            self.setup = setup
+        self.samples.append(sample_memory(page, 0))
+        self.current = page
+        return page
+
+    def after_row(self, page: Page, row: int) -> Page:
+        """
+        한 건 처리 후 호출
+
+        Returns:
+            Page: 계속 사용할 페이지 (재생성된 경우 새 페이지)
+        """
+        self._rows_since_recycle += 1
+
+        sample = None
+        if row % self.policy.sample_every == 0:
+            sample = sample_memory(page, row)
+            self.samples.append(sample)
+            heap = f"{sample.js_heap_used_mb:.1f}MB" if sample.js_heap_used_mb is not None else "n/a"
+            rss = f"{sample.renderer_rss_mb:.1f}MB" if sample.renderer_rss_mb is not None else "n/a"
+            print(f"[MEMORY] row={row}, js_heap={heap}, dom_nodes={sample.dom_nodes}, renderer_rss={rss}")
+
+        reason = self.policy.reason(self._rows_since_recycle, sample)
+        if reason is None:
+            return page
+        return self._recycle(page, row, reason, sample)
+
+    def _recycle(self, page: Page, row: int, reason: str, sample: MemorySample | None) -> Page:
+        start = time.time()
+
+        if self.policy.mode == 'context' and self.browser is not None:
+            # 인증 상태를 이어받은 새 컨텍스트 생성 후 이전 컨텍스트 정리
+            storage = page.context.storage_state()
+            old_context = self._owned_context
+            self._owned_context = self.browser.new_context(
+                storage_state=storage,
+                viewport={'width': 1920, 'height': 1080},
+                locale='ko-KR',
+                timezone_id='Asia/Seoul',
+            )
+            # 새 컨텍스트에는 세션 스로틀링이 없으므로 다시 적용 (재생성 이후 행의 시간이 왜곡되지 않도록)
+            if self.profile is not None:
+                apply_to_context(self._owned_context, self.profile)
+            new_page = self._owned_context.new_page()
+            if old_context is not None:
+                old_context.close()
+            elif not page.is_closed():
+                page.close()
+        else:
+            new_page = self.context.new_page()
+            # 컨텍스트 프로파일과 다른 마커 프로파일은 페이지 단위이므로 새 페이지에 다시 적용
+            if self.profile is not None:
+                apply_to_page(new_page, self.profile)
+            if not page.is_closed():
+                page.close()
+
+        self._owned_pages = [p for p in self._owned_pages if not p.is_closed()] + [new_page]
+        if self.on_new_page is not None:
+            self.on_new_page(new_page)
+        if self.setup is not None:
+            new_page = self.setup(new_page)
+
+        duration = time.time() - start
+        self.events.append(RecycleEvent(row, reason, duration, sample))
+        self._rows_since_recycle = 0
+        if self.step_timer is not None:
+            self.step_timer.record('memory: 페이지 재생성', start, start + duration, {'row': row, 'reason': reason})
+        print(f"[RECYCLE] row={row}, mode={self.policy.mode}, reason={reason}, Time={duration:.2f}s")
+        self.current = new_page
+        return new_page
+
+    def report_lines(self) -> list[str]:
+        """
+        메모리 추이 및 재생성 이력 요약
+        """
+        lines = [f"[MEMORY] samples={len(self.samples)}, recycles={len(self.events)}, policy={self.policy}"]
+        heaps = [s.js_heap_used_mb for s in self.samples if s.js_heap_used_mb is not None]
+        if heaps:
+            lines.append(f"[MEMORY] js_heap first={heaps[0]:.1f}MB, last={heaps[-1]:.1f}MB, max={max(heaps):.1f}MB")
+        for event in self.events:
+            lines.append(f"[RECYCLE] row={event.row}, reason={event.reason}, Time={event.duration:.2f}s")
+        return lines
+
+    def close(self):
+        """
+        재생성기가 만든 페이지/컨텍스트 정리
+        """
+        for page in self._owned_pages:
+            if not page.is_closed():
+                page.close()
+        if self._owned_context is not None:
+            self._owned_context.close()
+            self._owned_context = None
@@ -0,0 +1,303 @@
+"""
+테스트가 만든 서버 데이터 추적과 세션 종료 시 일괄 정리
+
+장소/임직원 테스트가 중간에 실패하면 만든 데이터가 서버에 계속 남아 목록/트리 로드를 느리게 합니다.
+(2단/3단 부모 장소는 성공 경로에서만 지워지고, 추가한 임직원은 지우지 않습니다.)
+ResourceRegistry는 만든 즉시 (종류, 이름, id, 부모)를 기록하고, 세션이 끝나면 API로 지웁니다.
+
+    - 임직원: 서로 의존성이 없으므로 한꺼번에 병렬 삭제
+    - 장소: API 스냅샷 한 번으로 id와 하위 장소를 찾고, 잎부터 높이별 묶음마다 병렬 삭제
+            (등록하지 않은 자식이 남아 있어도 부모보다 먼저 지움)
+
+기록은 작업자별 JSONL 저널에도 즉시 추가되므로, 세션이 비정상 종료돼도 다음 세션 시작 시
+남은 항목을 이어받아 함께 정리합니다. 정리에 실패한 항목만 저널에 다시 남깁니다.
+
+사용 예 (e2e/conftest.py의 resource_registry 픽스처):
+    resource_registry.add('location', parent_name)
+    resource_registry.add('location', child_name, parent=parent_name)
+    resource_registry.rename('location', child_name, edited_name)
+    resource_registry.discard('location', edited_name)   # 테스트가 직접 지운 경우
+    resource_registry.add('employee', employee_id, label=unique_name)
+
+남은 저널 수동 정리:
+    python -m e2e.utils.resources --dry-run
+    python -m e2e.utils.resources test-results/resources.jsonl
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+
+from e2e.utils.api import ApiClient, ApiError, items_of
+from e2e.utils.location_tree import LocationSnapshot, delete_by_height
+
+KINDS = ('employee', 'location')
+DEFAULT_JOURNAL = os.getenv('RESOURCE_JOURNAL', 'test-results/resources.jsonl')
+
+
+@dataclass
+class Resource:
+    """
+    테스트가 만든 서버 데이터 하나
+
+    Attributes:
+        kind: 'employee' (name은 사번) 또는 'location'
+        name: 사번 또는 장소 이름
+        id: 서버 id (모르면 None, 정리 시 이름으로 찾음)
+        parent: 부모 장소 이름 (같은 이름의 장소가 여러 개일 때 구분용)
+        label: 임직원 이름 (지정하면 서버 레코드 이름이 같을 때만 삭제, 원래 있던 같은 사번 보호)
+        test_id: 만든 테스트
+        created_at: 기록 시각
+    """
+    kind: str
+    name: str
+    id: str | int | None = None
+    parent: str | None = None
+    label: str | None = None
+    test_id: str = ''
+    created_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class TeardownReport:
+    """
+    정리 결과
+
+    Attributes:
+        deleted: 삭제한 (종류, 이름)
+        missing: 이미 없던 (종류, 이름)
+        skipped: label이 달라 지우지 않은 (종류, 이름)
+        failed: (종류, 이름, 사유)
+        seconds: 소요 시간
+    """
+    deleted: list[tuple[str, str]] = field(default_factory=list)
+    missing: list[tuple[str, str]] = field(default_factory=list)
+    skipped: list[tuple[str, str]] = field(default_factory=list)
+    failed: list[tuple[str, str, str]] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (f"deleted={len(self.deleted)}, missing={len(self.missing)}, skipped={len(self.skipped)}, "
+                f"failed={len(self.failed)}, {self.seconds:.2f}s")
+
+
+def journal_path(path: str = DEFAULT_JOURNAL) -> str:
+    """
+    pytest-xdist 작업자별 저널 경로 (resources-gw0.jsonl)
+    """
+    worker = os.getenv('PYTEST_XDIST_WORKER')
+    if not worker:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}-{worker}{ext or '.jsonl'}"
+
+
+class ResourceRegistry:
+    """
+    생성 데이터 기록기 (스레드 안전, 같은 (종류, 이름)은 하나만 유지)
+    """
+
+    def __init__(self, journal: str | None = None):
+        self.journal = journal
+        self.items: dict[tuple[str, str], Resource] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, journal: str) -> 'ResourceRegistry':
+        """
+        저널을 재생해 이전 세션에서 정리하지 못한 항목을 이어받음
+        """
+        registry = cls(journal)
+        if os.path.exists(journal):
+            with open(journal, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 비정상 종료로 잘린 마지막 줄
+                    registry._apply(entry)
+        return registry
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, kind: str, name: str, id=None, parent: str | None = None, label: str | None = None,
+            test_id: str = '') -> Resource:
+        if kind not in KINDS:
+            raise ValueError(f"알 수 없는 종류: {kind} (가능: {KINDS})")
+        resource = Resource(kind, name, id, parent, label, test_id)
+        self._record({'op': 'add', **asdict(resource)})
+        return resource
+
+    def rename(self, kind: str, name: str, new_name: str):
+        """
+        테스트가 이름을 바꾼 경우 (자식의 parent도 함께 변경)
+        """
+        self._record({'op': 'rename', 'kind': kind, 'name': name, 'new_name': new_name})
+
+    def discard(self, kind: str, name: str):
+        """
+        테스트가 직접 지운 항목은 정리 대상에서 제외
+        """
+        self._record({'op': 'discard', 'kind': kind, 'name': name})
+
+    def pending(self, kind: str | None = None) -> list[Resource]:
+        with self._lock:
+            return [r for r in self.items.values() if kind is None or r.kind == kind]
+
+    def _record(self, entry: dict):
+        with self._lock:
+            self._apply(entry)
+            if self.journal:
+                os.makedirs(os.path.dirname(self.journal) or '.', exist_ok=True)
+                with open(self.journal, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def _apply(self, entry: dict):
+        key = (entry['kind'], entry['name'])
+        if entry['op'] == 'add':
+            self.items[key] = Resource(**{k: v for k, v in entry.items() if k != 'op'})
+        elif entry['op'] == 'discard':
+            self.items.pop(key, None)
+        elif entry['op'] == 'rename' and key in self.items:
+            resource = self.items.pop(key)
+            resource.name = entry['new_name']
+            self.items[(resource.kind, resource.name)] = resource
+            for other in self.items.values():
+                if other.kind == resource.kind and other.parent == entry['name']:
+                    other.parent = entry['new_name']
+
+    def _rewrite_journal(self, remaining: list[Resource]):
+        if not self.journal:
+            return
+        if not remaining:
+            if os.path.exists(self.journal):
+                os.remove(self.journal)
+            return
+        with open(self.journal, 'w', encoding='utf-8') as f:
+            for resource in remaining:
+                f.write(json.dumps({'op': 'add', **asdict(resource)}, ensure_ascii=False) + '\n')
+
+    # ------------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------------
+
+    def teardown(self, base_url: str | None = None, workers: int = 8, dry_run: bool = False) -> TeardownReport:
+        """
+        기록한 데이터를 API로 삭제 (임직원 병렬, 장소는 잎부터 높이별 묶음마다 병렬)
+        """
+        start = time.perf_counter()
+        report = TeardownReport()
+        local = threading.local()
+
+        def client() -> ApiClient:
+            # ApiClient는 스레드 간 공유하지 않음
+            if not hasattr(local, 'client'):
+                local.client = ApiClient(base_url).login()
+            return local.client
+
+        def delete(job: tuple[str, str, object, str | None]):
+            kind, name, node_id, label = job
+            try:
+                api = client()
+                if label is not None:
+                    records = items_of(api.list_employees(employee_id=name))
+                    if not records:
+                        return kind, name, 'missing', ''
+                    if not any(r.get('name') == label for r in records):
+                        return kind, name, 'skipped', ''
+            except ApiError as e:
+                # 로그인/조회 실패(경로가 다른 서버의 404 포함)는 삭제 여부를 알 수 없으므로 저널에 남김
+                return kind, name, 'failed', str(e)
+            if dry_run:
+                return kind, name, 'deleted', ''
+            try:
+                if kind == 'employee':
+                    api.delete_employee(node_id)
+                else:
+                    api.delete_location(node_id)
+                return kind, name, 'deleted', ''
+            except ApiError as e:
+                return kind, name, 'missing' if e.status == 404 else 'failed', str(e)
+
+        def collect(results):
+            for kind, name, status, message in results:
+                if status == 'deleted':
+                    report.deleted.append((kind, name))
+                elif status == 'missing':
+                    report.missing.append((kind, name))
+                elif status == 'skipped':
+                    report.skipped.append((kind, name))
+                else:
+                    report.failed.append((kind, name, message))
+
+        employees = self.pending('employee')
+        locations = self.pending('location')
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            collect(pool.map(delete, [('employee', r.name, r.id or r.name, r.label) for r in employees]))
+            if locations:
+                try:
+                    snapshot, batches, missing = self._location_batches(client(), locations)
+                except ApiError as e:
+                    snapshot, batches, missing = None, [], []
+                    report.failed.extend(('location', r.name, str(e)) for r in locations)
+                report.missing.extend(('location', name) for name in missing)
+                collect(delete_by_height(pool, batches, lambda i: delete(
+                    ('location', snapshot.names[i], snapshot.ids[i], None))))
+
+        if not dry_run:
+            failed = {(kind, name) for kind, name, _ in report.failed}
+            with self._lock:
+                remaining = [r for r in self.items.values() if (r.kind, r.name) in failed]
+                self.items = {(r.kind, r.name): r for r in remaining}
+            self._rewrite_journal(remaining)
+        report.seconds = time.perf_counter() - start
+        return report
+
+    @staticmethod
+    def _location_batches(client: ApiClient, locations: list[Resource]) -> tuple:
+        """
+        등록 장소와 서버상의 하위 장소를 높이별 삭제 묶음으로 (LocationSnapshot.height_batches)
+
+        Returns:
+            (스냅샷, 잎부터의 묶음 [[노드 인덱스, ...], ...], 서버에 없는 등록 장소 이름)
+        """
+        snapshot = LocationSnapshot.from_api(client)
+        roots, missing = [], []
+        for resource in locations:
+            if resource.id is not None and resource.id in snapshot.index:
+                matches = [snapshot.index[resource.id]]
+            else:
+                matches = [i for i in snapshot.find(resource.name)
+                           if resource.parent is None
+                           or (snapshot.parents[i] >= 0 and snapshot.names[snapshot.parents[i]] == resource.parent)]
+            if not matches:
+                missing.append(resource.name)
+            roots.extend(matches)
+        return snapshot, snapshot.height_batches(*roots), missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description='저널에 남은 테스트 데이터 정리')
+    parser.add_argument('journal', nargs='?', default=DEFAULT_JOURNAL, help='리소스 저널 JSONL 경로')
+    parser.add_argument('--workers', type=int, default=8, help='동시 삭제 요청 수')
+    parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상만 출력')
+    args = parser.parse_args()
+
+    registry = ResourceRegistry.load(args.journal)
+    if not len(registry):
+        print(f"[INFO] 정리할 항목이 없습니다: {args.journal}")
+        return
+    for resource in registry.pending():
+        print(f"  {resource.kind:<9}{resource.name}  (parent={resource.parent}, test={resource.test_id})")
+    report = registry.teardown(workers=args.workers, dry_run=args.dry_run)
+    print(f"[{'INFO' if args.dry_run else 'OK'}] {'dry-run ' if args.dry_run else ''}teardown: {report.summary()}")
+    for kind, name, message in report.failed[:10]:
+        print(f"[WARNING] {kind} {name}: {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,467 @@
+"""
+실행 이력 데이터베이스 및 성능 회귀 감지
+
+모든 테스트 실행의 테스트별/단계별 소요 시간, 실행 환경(BASE_URL, 브라우저, headless),
+git 리비전, 결과를 로컬 SQLite에 기록하고, 최근 실행들의 기준선(rolling baseline)과 비교해
+통계적으로 유의미한 지연을 찾아냅니다.
+
+기록은 conftest.py가 세션 종료 시 자동으로 수행합니다 (--run-history-db 옵션).
+
+실행 예:
+    # 최근 실행 목록
+    python -m e2e.utils.run_history list
+
+    # 마지막 실행을 직전 10회 실행과 비교
+    python -m e2e.utils.run_history compare --baseline 10
+
+    # 예산 초과 또는 회귀 발생 시 종료 코드 1 (CI 파이프라인용)
+    python -m e2e.utils.run_history compare --budget budgets.json --fail-on-regression
+
+    # 벤치마크(동시성 스윕) 결과 이력
+    python -m e2e.utils.run_history bench --suite employee
+
+budgets.json 형식 (단계 이름: 평균 허용 시간(초)):
+    {"employee: 저장": 2.0, "signin: 로그인 처리": 3.0}
+"""
+import argparse
+import json
+import math
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+DEFAULT_DB_PATH = os.getenv('RUN_HISTORY_DB', 'test-results/run_history.sqlite')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    finished_at REAL NOT NULL,
+    base_url TEXT,
+    browser TEXT,
+    headless INTEGER,
+    profile TEXT,
+    git_rev TEXT,
+    outcome TEXT
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_id TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS step_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_id TEXT NOT NULL,
+    step TEXT NOT NULL,
+    profile TEXT,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS benchmark_results (
+    suite TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    target TEXT,
+    driver TEXT,
+    git_rev TEXT,
+    flow TEXT NOT NULL,
+    concurrency INTEGER NOT NULL,
+    reps INTEGER NOT NULL,
+    ops INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    throughput_per_min REAL NOT NULL,
+    p50 REAL,
+    p90 REAL,
+    p95 REAL,
+    p99 REAL
+);
+CREATE INDEX IF NOT EXISTS idx_step_results_run ON step_results(run_id, step);
+CREATE INDEX IF NOT EXISTS idx_benchmark_results_suite ON benchmark_results(suite, target, driver, flow);
+CREATE INDEX IF NOT EXISTS idx_test_results_run ON test_results(run_id);
+"""
+
+
+def connect(db_path: str = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    if os.path.dirname(db_path):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def git_revision() -> str | None:
+    """
+    현재 git 리비전 (git이 없거나 저장소가 아니면 None)
+    """
+    try:
+        rev = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'], capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if not rev:
+        return None
+    return f"{rev}-dirty" if dirty else rev
+
+
+def record_run(db_path: str, meta: dict, test_results: list[tuple], step_records: list) -> int:
+    """
+    실행 한 건 기록
+
+    Args:
+        meta: started_at, finished_at, base_url, browser, headless, profile, git_rev, outcome
+        test_results: [(test_id, outcome, duration), ...]
+        step_records: e2e.utils.timing.StepRecord 목록
+
+    Returns:
+        int: 생성된 run id
+    """
+    conn = connect(db_path)
+    try:
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (started_at, finished_at, base_url, browser, headless, profile, git_rev, outcome) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (meta.get('started_at'), meta.get('finished_at', time.time()), meta.get('base_url'),
+                 meta.get('browser'), int(bool(meta.get('headless'))), meta.get('profile'),
+                 meta.get('git_rev'), meta.get('outcome')),
+            )
+            run_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT INTO test_results (run_id, test_id, outcome, duration) VALUES (?, ?, ?, ?)",
+                [(run_id, *row) for row in test_results],
+            )
+            conn.executemany(
+                "INSERT INTO step_results (run_id, test_id, step, profile, started_at, duration) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, r.test_id, r.name, r.profile, r.start, r.duration) for r in step_records],
+            )
+        return run_id
+    finally:
+        conn.close()
+
+
+BENCHMARK_COLUMNS = ('flow', 'concurrency', 'reps', 'ops', 'errors', 'throughput_per_min',
+                     'p50', 'p90', 'p95', 'p99')
+
+
+def record_benchmark(db_path: str, suite: str, meta: dict, rows: list[dict]):
+    """
+    벤치마크 집계 결과 기록 (rows: e2e.utils.benchmark.aggregate 결과)
+
+    Args:
+        meta: started_at, target(서버 주소 또는 'stub'), driver(api/ui), git_rev
+    """
+    conn = connect(db_path)
+    try:
+        with conn:
+            conn.executemany(
+                f"INSERT INTO benchmark_results (suite, started_at, target, driver, git_rev, "
+                f"{', '.join(BENCHMARK_COLUMNS)}) VALUES ({', '.join('?' * (5 + len(BENCHMARK_COLUMNS)))})",
+                [(suite, meta.get('started_at', time.time()), meta.get('target'), meta.get('driver'),
+                  meta.get('git_rev'), *(row[c] for c in BENCHMARK_COLUMNS)) for row in rows],
+            )
+    finally:
+        conn.close()
+
+
+def previous_throughput(db_path: str, suite: str, target: str, driver: str,
+                        before: float, runs: int = 5) -> dict[tuple[str, int], float]:
+    """
+    같은 대상/드라이버의 이전 runs회 실행의 (흐름, 동시성)별 처리량 중앙값
+    """
+    conn = connect(db_path)
+    try:
+        samples: dict[tuple[str, int], list[float]] = {}
+        started = [row[0] for row in conn.execute(
+            "SELECT DISTINCT started_at FROM benchmark_results WHERE suite = ? AND target IS ? AND driver IS ? "
+            "AND started_at < ? ORDER BY started_at DESC LIMIT ?", (suite, target, driver, before, runs))]
+        if not started:
+            return {}
+        placeholders = ",".join("?" * len(started))
+        for flow, concurrency, throughput in conn.execute(
+                f"SELECT flow, concurrency, throughput_per_min FROM benchmark_results WHERE suite = ? "
+                f"AND target IS ? AND driver IS ? AND started_at IN ({placeholders})",
+                (suite, target, driver, *started)):
+            samples.setdefault((flow, concurrency), []).append(throughput)
+        return {key: statistics.median(values) for key, values in samples.items()}
+    finally:
+        conn.close()
+
+
+# ============================================================================
+# 회귀 감지
+# ============================================================================
+
+def mann_whitney_p(current: list[float], baseline: list[float]) -> float:
+    """
+    단측 Mann-Whitney U 검정 p-value (current가 baseline보다 느린지)
+
+    정규 근사를 사용하며, 동순위는 평균 순위로 처리합니다.
+    지연 시간 분포는 꼬리가 길어 t-검정보다 순위 기반 검정이 안정적입니다.
+    """
+    n1, n2 = len(current), len(baseline)
+    combined = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        avg_rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = avg_rank
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean_u = n1 * n2 / 2
+    n = n1 + n2
+    var_u = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if var_u <= 0:
+        return 1.0
+    z = (u - mean_u - 0.5) / math.sqrt(var_u)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def robust_z(value: float, baseline: list[float]) -> float:
+    """
+    기준선 중앙값/MAD 기준 robust z-score (MAD가 0이면 편차가 있을 때 inf)
+
+    표본이 하나뿐이면 순위 검정의 p-value가 1/(기준선 수+1) 아래로 내려가지 않으므로 이 값으로 판정합니다.
+    """
+    median = statistics.median(baseline)
+    mad = statistics.median(abs(v - median) for v in baseline) * 1.4826
+    if mad == 0:
+        return math.inf if value > median else 0.0
+    return (value - median) / mad
+
+
+@dataclass
+class StepComparison:
+    """
+    단계 하나의 비교 결과
+    """
+    step: str
+    baseline_mean: float | None
+    current_mean: float
+    current_p95: float
+    samples: int
+    baseline_samples: int
+    p_value: float | None
+    z_score: float | None = None
+    regression: bool = False
+    over_budget: bool = False
+    budget: float | None = None
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline_mean:
+            return None
+        return self.current_mean / self.baseline_mean
+
+
+def _p95(values: list[float]) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(0.95 * (len(values) - 1))))]
+
+
+def latest_run_id(conn: sqlite3.Connection) -> int | None:
+    row = conn.execute("SELECT MAX(id) FROM runs").fetchone()
+    return row[0] if row else None
+
+
+def compare_run(conn: sqlite3.Connection, run_id: int, baseline_runs: int = 10, threshold: float = 1.2,
+                alpha: float = 0.01, budgets: dict | None = None, same_env: bool = True,
+                z_limit: float = 3.5) -> list[StepComparison]:
+    """
+    run_id의 단계별 시간을 직전 baseline_runs회 실행과 비교
+
+    회귀 판정: 평균이 threshold배 이상 느려지고,
+        현재 표본 3개 이상   Mann-Whitney p-value < alpha
+        현재 표본 3개 미만   기준선 최댓값보다 느리고 robust z-score >= z_limit
+                             (로그인/저장처럼 테스트당 한 번인 단계는 p-value가 alpha까지 내려갈 수 없음)
+    기준선 실행의 단계별 평균을 표본으로 쓰므로, 단계가 한 번뿐인 실행끼리도 비교할 수 있습니다.
+    현재 실행은 단계가 여러 번 반복되면(대량 추가 등) 모든 반복을 표본으로 사용합니다.
+    """
+    budgets = budgets or {}
+    run = conn.execute("SELECT base_url, browser, profile FROM runs WHERE id = ?", (run_id,)).fetchone()
+    if run is None:
+        raise ValueError(f"run id {run_id}을(를) 찾을 수 없습니다.")
+
+    query = "SELECT id FROM runs WHERE id < ?"
+    params: list = [run_id]
+    if same_env:
+        query += " AND base_url IS ? AND browser IS ? AND profile IS ?"
+        params += list(run)
+    query += " ORDER BY id DESC LIMIT ?"
+    params.append(baseline_runs)
+    baseline_ids = [row[0] for row in conn.execute(query, params)]
+
+    current: dict[str, list[float]] = {}
+    for step, duration in conn.execute(
+            "SELECT step, duration FROM step_results WHERE run_id = ?", (run_id,)):
+        current.setdefault(step, []).append(duration)
+
+    # 기준선: 실행별 단계 평균
+    baseline: dict[str, list[float]] = {}
+    if baseline_ids:
+        placeholders = ",".join("?" * len(baseline_ids))
+        for step, mean in conn.execute(
+                f"SELECT step, AVG(duration) FROM step_results WHERE run_id IN ({placeholders}) "
+                f"GROUP BY run_id, step", baseline_ids):
+            baseline.setdefault(step, []).append(mean)
+
+    comparisons = []
+    for step, durations in sorted(current.items()):
+        base = baseline.get(step, [])
+        current_mean = statistics.fmean(durations)
+        comparison = StepComparison(
+            step=step,
+            baseline_mean=statistics.median(base) if base else None,
+            current_mean=current_mean,
+            current_p95=_p95(durations),
+            samples=len(durations),
+            baseline_samples=len(base),
+            p_value=None,
+            budget=budgets.get(step),
+        )
+        if len(base) >= 3:
+            slower = comparison.ratio is not None and comparison.ratio >= threshold
+            if len(durations) >= 3:
+                comparison.p_value = mann_whitney_p(durations, base)
+                comparison.regression = slower and comparison.p_value < alpha
+            else:
+                # 표본이 적으면 실행 평균 하나를 기준선 분포와 직접 비교
+                comparison.z_score = robust_z(current_mean, base)
+                comparison.regression = slower and current_mean > max(base) and comparison.z_score >= z_limit
+        if comparison.budget is not None and current_mean > comparison.budget:
+            comparison.over_budget = True
+        comparisons.append(comparison)
+    return comparisons
+
+
+def _format_stat(c: StepComparison) -> str:
+    """
+    판정 근거 (표본이 3개 이상이면 p-value, 적으면 robust z-score)
+    """
+    if c.p_value is not None:
+        return f"{c.p_value:.4f}"
+    if c.z_score is not None:
+        return f"z={c.z_score:.1f}" if math.isfinite(c.z_score) else "z=inf"
+    return "-"
+
+
+def format_comparisons(comparisons: list[StepComparison]) -> list[str]:
+    lines = [f"  {'step':<40} {'baseline':>9} {'current':>9} {'ratio':>7} {'p':>8}  flag"]
+    for c in comparisons:
+        baseline = f"{c.baseline_mean:.2f}s" if c.baseline_mean is not None else "-"
+        ratio = f"x{c.ratio:.2f}" if c.ratio is not None else "-"
+        p_value = _format_stat(c)
+        flags = []
+        if c.regression:
+            flags.append("REGRESSION")
+        if c.over_budget:
+            flags.append(f"BUDGET>{c.budget:.2f}s")
+        lines.append(
+            f"  {c.step:<40} {baseline:>9} {c.current_mean:>8.2f}s {ratio:>7} {p_value:>8}  {' '.join(flags)}"
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='테스트 실행 이력 조회 및 성능 회귀 감지')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='SQLite 파일 경로')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = sub.add_parser('list', help='최근 실행 목록')
+    list_parser.add_argument('--limit', type=int, default=20)
+
+    compare_parser = sub.add_parser('compare', help='기준선 대비 단계별 회귀 확인')
+    compare_parser.add_argument('--run', type=int, help='비교할 run id (기본: 마지막 실행)')
+    compare_parser.add_argument('--baseline', type=int, default=10, help='기준선으로 사용할 직전 실행 수')
+    compare_parser.add_argument('--threshold', type=float, default=1.2, help='회귀로 판정할 최소 배율')
+    compare_parser.add_argument('--alpha', type=float, default=0.01, help='유의수준')
+    compare_parser.add_argument('--z-limit', type=float, default=3.5,
+                                help='표본이 3개 미만인 단계의 robust z-score 기준')
+    compare_parser.add_argument('--budget', help='단계별 시간 예산 JSON 파일')
+    compare_parser.add_argument('--any-env', action='store_true', help='BASE_URL/브라우저/프로파일이 달라도 비교')
+    compare_parser.add_argument('--fail-on-regression', action='store_true', help='회귀 발생 시 종료 코드 1')
+
+    bench_parser = sub.add_parser('bench', help='벤치마크 결과 이력')
+    bench_parser.add_argument('--suite', default='employee', help='벤치마크 이름')
+    bench_parser.add_argument('--limit', type=int, default=10, help='최근 실행 수')
+
+    args = parser.parse_args(argv)
+    conn = connect(args.db)
+    try:
+        if args.command == 'bench':
+            started = [row[0] for row in conn.execute(
+                "SELECT DISTINCT started_at FROM benchmark_results WHERE suite = ? "
+                "ORDER BY started_at DESC LIMIT ?", (args.suite, args.limit))]
+            for started_at in reversed(started):
+                started_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(started_at))
+                for target, driver, rev, flow, conc, ops, errors, thru, p95 in conn.execute(
+                        "SELECT target, driver, git_rev, flow, concurrency, ops, errors, throughput_per_min, p95 "
+                        "FROM benchmark_results WHERE suite = ? AND started_at = ? ORDER BY flow, concurrency",
+                        (args.suite, started_at)):
+                    p95_str = f"{p95 * 1000:.0f}ms" if p95 is not None else "-"
+                    print(f"{started_str} {rev} {driver}@{target} {flow:<8} c={conc:<3} "
+                          f"{thru:>8.1f}/min p95={p95_str:>7} err={errors}/{ops}")
+            return 0
+
+        if args.command == 'list':
+            rows = conn.execute(
+                "SELECT id, started_at, finished_at, base_url, browser, headless, profile, git_rev, outcome "
+                "FROM runs ORDER BY id DESC LIMIT ?", (args.limit,)
+            ).fetchall()
+            for run_id, started, finished, base_url, browser, headless, profile, rev, outcome in rows:
+                started_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(started))
+                print(f"#{run_id} {started_str} {finished - started:>8.1f}s {outcome:<7} "
+                      f"{browser}{'' if headless else '(headed)'} {profile} {rev} {base_url}")
+            return 0
+
+        run_id = args.run or latest_run_id(conn)
+        if run_id is None:
+            print("[INFO] 기록된 실행이 없습니다.")
+            return 0
+
+        budgets = {}
+        if args.budget:
+            with open(args.budget, 'r', encoding='utf-8') as f:
+                budgets = json.load(f)
+
+        comparisons = compare_run(conn, run_id, args.baseline, args.threshold, args.alpha, budgets,
+                                  same_env=not args.any_env, z_limit=args.z_limit)
+        print(f"[INFO] Run #{run_id} vs previous {args.baseline} runs")
+        for line in format_comparisons(comparisons):
+            print(line)
+
+        regressions = [c for c in comparisons if c.regression]
+        over_budget = [c for c in comparisons if c.over_budget]
+        for c in regressions:
+            print(f"[REGRESSION] {c.step}: {c.baseline_mean:.2f}s -> {c.current_mean:.2f}s "
+                  f"(x{c.ratio:.2f}, {'p=' if c.p_value is not None else ''}{_format_stat(c)})")
+        for c in over_budget:
+            print(f"[BUDGET] {c.step}: {c.current_mean:.2f}s > {c.budget:.2f}s")
+
+        if over_budget or (args.fail_on_regression and regressions):
+            return 1
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+테스트 외부(스크립트/CLI)에서 사용하는 공통 환경 설정
+
+conftest.py와 같은 규칙으로 .env.test를 읽습니다.
+"""
+import os
+
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv('.env.test')
+
+BASE_URL = os.getenv('BASE_URL', 'http://localhost:3000')
+TEST_USER_EMAIL = os.getenv('TEST_USER_EMAIL', 'admin@test.com')
+TEST_USER_PASSWORD = os.getenv('TEST_USER_PASSWORD', 'test1234!')
+HEADLESS = os.getenv('HEADLESS', 'true').lower() != 'false'
+
+# 임직원 사진 디렉터리 및 등록 완료 사진 이동 디렉터리
+EMPLOYEE_IMAGE_DIR = os.getenv('EMPLOYEE_IMAGE_DIR', 'C:/00project/2025/SDG/ACS-WebApp-Test/employee')
+EMPLOYEE_DONE_DIR = os.getenv('EMPLOYEE_DONE_DIR', 'C:/00project/2025/SDG/ACS-WebApp-Test/employee_add')
+
+
+def url(path: str = '') -> str:
+    """
+    BASE_URL 기준 절대 URL (슬래시 중복 방지)
+    """
+    return f"{BASE_URL.rstrip('/')}/{path.lstrip('/')}"
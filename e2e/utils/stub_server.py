@@ -0,0 +1,568 @@
+"""
+오프라인 개발용 로컬 대역(stand-in) API 서버
+
+e2e/utils/api.py의 ENDPOINTS 경로(임직원, 장소)를 메모리 저장소로 흉내 냅니다.
+벤치마크/부하 도구를 실제 서버 없이 개발하고 검증하는 용도이며, 응답 지연과
+검색 방식(인덱스 사용/전체 스캔)을 조절해 서버 측 회귀를 재현할 수 있습니다.
+
+실행 예:
+    python -m e2e.utils.stub_server --port 8765 --seed dataset/employees.jsonl
+    API_BASE_URL=http://127.0.0.1:8765 python -m e2e.access.employee.employee_benchmark --target server
+
+테스트/스크립트에서:
+    with StubServer(latency_ms=5) as server:
+        client = ApiClient(server.url).login()
+
+로그인 부하 (e2e/auth/signin/signin_storm.py가 사용):
+    StubServer(signin=SigninGate(work_ms=20, workers=4, queue=64, lockout_after=5))
+    비밀번호 확인 비용/동시 처리 수를 흉내 내고, 대기열이 차면 429, 실패가 쌓여 잠긴 계정은 423
+
+스냅샷 (e2e/utils/datasets.py가 데이터셋 복원에 사용):
+    POST /__stub/snapshots/<이름>           현재 상태 저장
+    POST /__stub/snapshots/<이름>/restore   저장한 상태로 되돌림 (없으면 404)
+"""
+import argparse
+import bisect
+import copy
+import json
+import secrets
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from e2e.utils import settings
+from e2e.utils.api import ENDPOINTS
+
+
+class EmployeeStore:
+    """
+    임직원 메모리 저장소
+
+    indexed=True면 사번 dict와 이름 정렬 목록(bisect)으로 검색하고,
+    False면 매 요청 전체를 스캔합니다 (인덱스 누락 회귀 재현용).
+    scanned는 검색이 살펴본 레코드 수 누계로, 벽시계 시간과 달리 부하에 흔들리지 않는 규모 지표입니다.
+    """
+
+    def __init__(self, indexed: bool = True):
+        self.indexed = indexed
+        self.scanned = 0
+        self.lock = threading.Lock()
+        self.by_id: dict[str, dict] = {}
+        self._names: list[tuple[str, str]] = []  # (name, employeeId) 정렬 목록
+
+    def add(self, record: dict) -> dict:
+        with self.lock:
+            employee_id = str(record['employeeId'])
+            if employee_id in self.by_id:
+                raise KeyError(employee_id)
+            self.by_id[employee_id] = record
+            bisect.insort(self._names, (record.get('name', ''), employee_id))
+            return record
+
+    def bulk_load(self, records: list[dict]) -> int:
+        """
+        대량 적재 (이름 목록은 한 번만 정렬, 중복 사번은 덮어씀)
+        """
+        with self.lock:
+            for record in records:
+                self.by_id[str(record['employeeId'])] = record
+            self._names = sorted((r.get('name', ''), employee_id) for employee_id, r in self.by_id.items())
+            return len(records)
+
+    def remove(self, employee_id: str) -> bool:
+        with self.lock:
+            record = self.by_id.pop(employee_id, None)
+            if record is None:
+                return False
+            key = (record.get('name', ''), employee_id)
+            pos = bisect.bisect_left(self._names, key)
+            if pos < len(self._names) and self._names[pos] == key:
+                del self._names[pos]
+            return True
+
+    def search(self, name: str = '', employee_id: str = '', department: str = '') -> list[dict]:
+        with self.lock:
+            if employee_id:
+                if self.indexed:
+                    candidates = [self.by_id[employee_id]] if employee_id in self.by_id else []
+                    self.scanned += 1
+                else:
+                    candidates = [r for r in self.by_id.values() if r['employeeId'] == employee_id]
+                    self.scanned += len(self.by_id)
+            elif name and self.indexed:
+                start = bisect.bisect_left(self._names, (name, ''))
+                candidates = []
+                for entry_name, entry_id in self._names[start:]:
+                    if not entry_name.startswith(name):
+                        break
+                    candidates.append(self.by_id[entry_id])
+                self.scanned += len(candidates) + 1
+            else:
+                candidates = list(self.by_id.values())
+                self.scanned += len(candidates)
+            return [
+                r for r in candidates
+                if (not name or r.get('name', '').startswith(name))
+                and (not department or r.get('department') == department)
+            ]
+
+    def dump(self) -> dict:
+        with self.lock:
+            return copy.deepcopy({'by_id': self.by_id, 'names': self._names})
+
+    def load(self, state: dict):
+        state = copy.deepcopy(state)
+        with self.lock:
+            self.by_id, self._names = state['by_id'], state['names']
+
+    def load_jsonl(self, path: str) -> int:
+        """
+        generate_dataset.py의 employees.jsonl 적재
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return self.bulk_load([api_record(json.loads(line)) for line in f if line.strip()])
+
+
+class LocationStore:
+    """
+    장소 메모리 저장소 (id는 1부터 증가, 자식이 있는 장소는 삭제 거부)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.by_id: dict[int, dict] = {}
+        self.children: dict[int | None, set[int]] = {None: set()}
+        self._next_id = 1
+
+    def add(self, name: str, location_type: str = '사무공간', order: int = 1, parent_id: int | None = None) -> dict:
+        with self.lock:
+            if parent_id is not None and parent_id not in self.by_id:
+                raise KeyError(parent_id)
+            record = {'id': self._next_id, 'parentId': parent_id, 'name': name,
+                      'type': location_type, 'order': order}
+            self._next_id += 1
+            self.by_id[record['id']] = record
+            self.children.setdefault(parent_id, set()).add(record['id'])
+            self.children[record['id']] = set()
+            return record
+
+    def remove(self, location_id: int) -> bool:
+        """
+        Raises:
+            ValueError: 자식 장소가 남아 있음
+        """
+        with self.lock:
+            record = self.by_id.get(location_id)
+            if record is None:
+                return False
+            if self.children.get(location_id):
+                raise ValueError(location_id)
+            del self.by_id[location_id]
+            del self.children[location_id]
+            self.children[record['parentId']].discard(location_id)
+            return True
+
+    def update(self, location_id: int, changes: dict) -> dict | None:
+        """
+        이름/유형/표시 순서/부모 변경 (없는 id면 None)
+
+        Raises:
+            KeyError: 없는 부모
+            ValueError: 자기 자신이나 하위 장소 아래로 이동
+        """
+        with self.lock:
+            record = self.by_id.get(location_id)
+            if record is None:
+                return None
+            if 'parentId' in changes and changes['parentId'] != record['parentId']:
+                parent_id = changes['parentId']
+                if parent_id is not None and parent_id not in self.by_id:
+                    raise KeyError(parent_id)
+                ancestor = parent_id
+                while ancestor is not None:
+                    if ancestor == location_id:
+                        raise ValueError(location_id)
+                    ancestor = self.by_id[ancestor]['parentId']
+                self.children[record['parentId']].discard(location_id)
+                self.children.setdefault(parent_id, set()).add(location_id)
+                record['parentId'] = parent_id
+            for key in ('name', 'type', 'order'):
+                if key in changes:
+                    record[key] = changes[key]
+            return dict(record)
+
+    def all(self) -> list[dict]:
+        with self.lock:
+            return [dict(r) for r in self.by_id.values()]
+
+    def dump(self) -> dict:
+        with self.lock:
+            return copy.deepcopy({'by_id': self.by_id, 'children': self.children, 'next_id': self._next_id})
+
+    def load(self, state: dict):
+        state = copy.deepcopy(state)
+        with self.lock:
+            self.by_id, self.children, self._next_id = state['by_id'], state['children'], state['next_id']
+
+
+class AccessCaseStore:
+    """
+    출입 케이스 메모리 저장소 (이름 고유)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.by_name: dict[str, dict] = {}
+
+    def add(self, name: str) -> dict:
+        with self.lock:
+            if name in self.by_name:
+                raise KeyError(name)
+            record = {'id': len(self.by_name) + 1, 'name': name}
+            self.by_name[name] = record
+            return record
+
+    def all(self) -> list[dict]:
+        with self.lock:
+            return [dict(r) for r in self.by_name.values()]
+
+    def dump(self) -> dict:
+        with self.lock:
+            return copy.deepcopy(self.by_name)
+
+    def load(self, state: dict):
+        state = copy.deepcopy(state)
+        with self.lock:
+            self.by_name = state
+
+
+class SigninGate:
+    """
+    로그인 처리 모델
+
+    workers개만 동시에 비밀번호를 확인하고(건당 work_ms) 나머지는 대기합니다.
+    대기 중인 요청이 queue개를 넘으면 429, 같은 계정이 lockout_seconds 안에 lockout_after번 실패하면
+    (중간에 성공해도 초기화하지 않음) lockout_seconds 동안 423을 반환합니다. 값이 0이면 해당 제한 없음.
+    """
+
+    def __init__(self, work_ms: float = 0.0, workers: int = 0, queue: int = 0,
+                 lockout_after: int = 0, lockout_seconds: float = 300.0):
+        self.work_ms = work_ms
+        self.queue = queue
+        self.lockout_after = lockout_after
+        self.lockout_seconds = lockout_seconds
+        self._slots = threading.BoundedSemaphore(workers) if workers else None
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._failures: dict[str, list[float]] = {}
+        self._locked_until: dict[str, float] = {}
+
+    def check(self, user: str, valid: bool) -> int:
+        """
+        로그인 시도 하나를 처리하고 응답 상태 코드 반환 (200/401/423/429)
+        """
+        with self._lock:
+            if self._locked_until.get(user, 0) > time.monotonic():
+                return 423
+            if self.queue and self._waiting >= self.queue:
+                return 429
+            self._waiting += 1
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            with self._lock:
+                self._waiting -= 1
+            if self.work_ms:
+                time.sleep(self.work_ms / 1000)
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+        if valid:
+            return 200
+        with self._lock:
+            now = time.monotonic()
+            failures = [t for t in self._failures.get(user, []) if now - t < self.lockout_seconds] + [now]
+            self._failures[user] = failures
+            if self.lockout_after and len(failures) >= self.lockout_after:
+                self._failures.pop(user)
+                self._locked_until[user] = now + self.lockout_seconds
+        return 401
+
+
+def api_record(employee: dict) -> dict:
+    """
+    generate_dataset 레코드 -> API 응답 형식
+    """
+    return {
+        'employeeId': str(employee['id']),
+        'name': employee['name'],
+        'email': employee.get('email', ''),
+        'department': employee.get('department'),
+        'jobGrade': employee.get('job_grade'),
+        'jobPosition': employee.get('job_position'),
+        'accessCases': employee.get('access_cases', []),
+        'rfCards': employee.get('rf_card', []),
+    }
+
+
+def _route_pattern(path: str) -> tuple[str, str]:
+    """
+    '/api/employees/{id}' -> ('/api/employees/', '') 형태의 접두사/접미사
+    """
+    prefix, _, rest = path.partition('{id}')
+    return prefix, rest
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: 'StubServer'
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, payload=None, headers: dict | None = None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def _authorized(self) -> bool:
+        auth = self.headers.get('Authorization', '')
+        cookie = self.headers.get('Cookie', '')
+        tokens = self.server.tokens
+        return (auth.startswith('Bearer ') and auth[7:] in tokens) or any(
+            part.strip().startswith('session=') and part.strip()[8:] in tokens for part in cookie.split(';'))
+
+    def _dispatch(self, method: str):
+        self.server.delay()
+        url = urllib.parse.urlsplit(self.path)
+        path = url.path
+        query = dict(urllib.parse.parse_qsl(url.query))
+        store = self.server.store
+
+        if method == 'POST' and path == ENDPOINTS['signin']:
+            body = self._body()
+            valid = body.get('email') == self.server.user and body.get('password') == self.server.password
+            status = self.server.signin.check(str(body.get('email')), valid)
+            if status == 423:
+                return self._send(423, {'message': 'account locked'})
+            if status == 429:
+                return self._send(429, {'message': 'too many sign-in requests'}, {'Retry-After': '1'})
+            if status != 200:
+                return self._send(401, {'message': 'invalid credentials'})
+            token = secrets.token_hex(16)
+            self.server.tokens.add(token)
+            return self._send(200, {'accessToken': token}, {'Set-Cookie': f'session={token}; Path=/'})
+
+        if not self._authorized():
+            return self._send(401, {'message': 'unauthorized'})
+
+        if path == ENDPOINTS['employees']:
+            if method == 'GET':
+                matches = store.search(query.get('name', ''), query.get('employeeId', ''),
+                                       query.get('department', ''))
+                page, size = int(query.get('page', 1)), int(query.get('size', 20))
+                if self.server.max_page_size:
+                    size = min(size, self.server.max_page_size)
+                items = matches[(page - 1) * size: page * size]
+                return self._send(200, {'items': items, 'total': len(matches), 'page': page, 'size': size})
+            if method == 'POST':
+                record = self._body()
+                if not record.get('employeeId') or not record.get('name'):
+                    return self._send(400, {'message': 'employeeId and name are required'})
+                try:
+                    return self._send(201, store.add(record))
+                except KeyError:
+                    return self._send(409, {'message': f"duplicate employeeId {record['employeeId']}"})
+
+        prefix, suffix = _route_pattern(ENDPOINTS['employee'])
+        if method == 'DELETE' and path.startswith(prefix) and path.endswith(suffix):
+            employee_id = urllib.parse.unquote(path[len(prefix):len(path) - len(suffix)])
+            if store.remove(employee_id):
+                return self._send(204)
+            return self._send(404, {'message': 'not found'})
+
+        locations = self.server.locations
+        if path == ENDPOINTS['locations']:
+            if method == 'GET':
+                return self._send(200, {'items': locations.all()})
+            if method == 'POST':
+                body = self._body()
+                if not body.get('name'):
+                    return self._send(400, {'message': 'name is required'})
+                try:
+                    return self._send(201, locations.add(body['name'], body.get('type') or '사무공간',
+                                                         int(body.get('order') or 1), body.get('parentId')))
+                except KeyError:
+                    return self._send(404, {'message': f"parent not found: {body.get('parentId')}"})
+
+        prefix, suffix = _route_pattern(ENDPOINTS['location'])
+        if method == 'DELETE' and path.startswith(prefix) and path.endswith(suffix):
+            location_id = path[len(prefix):len(path) - len(suffix)]
+            try:
+                removed = locations.remove(int(location_id))
+            except ValueError:
+                return self._send(409, {'message': f'location {location_id} has children'})
+            return self._send(204) if removed else self._send(404, {'message': 'not found'})
+        if method == 'PATCH' and path.startswith(prefix) and path.endswith(suffix):
+            location_id = path[len(prefix):len(path) - len(suffix)]
+            changes = self._body()
+            if 'order' in changes:
+                changes['order'] = int(changes['order'])
+            try:
+                record = locations.update(int(location_id), changes)
+            except KeyError:
+                return self._send(404, {'message': f"parent not found: {changes.get('parentId')}"})
+            except ValueError:
+                return self._send(409, {'message': f'cannot move location {location_id} under itself'})
+            return self._send(200, record) if record else self._send(404, {'message': 'not found'})
+
+        access_cases = self.server.access_cases
+        if path == ENDPOINTS['access_cases']:
+            if method == 'GET':
+                return self._send(200, {'items': access_cases.all()})
+            if method == 'POST':
+                name = self._body().get('name')
+                if not name:
+                    return self._send(400, {'message': 'name is required'})
+                try:
+                    return self._send(201, access_cases.add(name))
+                except KeyError:
+                    return self._send(409, {'message': f'duplicate access case {name}'})
+
+        if method == 'POST':
+            prefix, suffix = _route_pattern(ENDPOINTS['stub_restore'])
+            if path.startswith(prefix) and path.endswith(suffix):
+                name = urllib.parse.unquote(path[len(prefix):len(path) - len(suffix)])
+                if self.server.restore_snapshot(name):
+                    return self._send(200, {'snapshot': name, 'restored': True})
+                return self._send(404, {'message': f'no snapshot: {name}'})
+            prefix, suffix = _route_pattern(ENDPOINTS['stub_snapshot'])
+            if path.startswith(prefix) and path.endswith(suffix):
+                name = urllib.parse.unquote(path[len(prefix):len(path) - len(suffix)])
+                self.server.save_snapshot(name)
+                return self._send(201, {'snapshot': name})
+
+        return self._send(404, {'message': f'no route: {method} {path}'})
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def do_PATCH(self):
+        self._dispatch('PATCH')
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    백그라운드 스레드에서 동작하는 대역 서버 (port=0이면 빈 포트 자동 선택)
+    """
+
+    daemon_threads = True
+    # 수백 개 가상 사용자가 동시에 접속해도 연결 대기열에서 밀리지 않도록 (기본 5)
+    request_queue_size = 256
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0.0,
+                 indexed: bool = True, user: str | None = None, password: str | None = None,
+                 signin: SigninGate | None = None, max_page_size: int = 0):
+        super().__init__((host, port), _Handler)
+        self.latency_ms = latency_ms
+        self.store = EmployeeStore(indexed=indexed)
+        self.locations = LocationStore()
+        self.access_cases = AccessCaseStore()
+        self.snapshots: dict[str, dict] = {}
+        self.user = user or settings.TEST_USER_EMAIL
+        self.password = password or settings.TEST_USER_PASSWORD
+        self.tokens: set[str] = set()
+        self.signin = signin or SigninGate()
+        # 목록 API의 size 상한 (0이면 요청한 size 그대로, 실서버처럼 큰 size를 줄이는 경우 재현)
+        self.max_page_size = max_page_size
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def delay(self):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+    def save_snapshot(self, name: str):
+        """
+        임직원/장소/출입 케이스 전체 상태를 이름으로 저장
+        """
+        self.snapshots[name] = {'employees': self.store.dump(), 'locations': self.locations.dump(),
+                                'access_cases': self.access_cases.dump()}
+
+    def restore_snapshot(self, name: str) -> bool:
+        """
+        저장한 상태로 되돌림 (없는 이름이면 False)
+        """
+        state = self.snapshots.get(name)
+        if state is None:
+            return False
+        self.store.load(state['employees'])
+        self.locations.load(state['locations'])
+        self.access_cases.load(state['access_cases'])
+        return True
+
+    def start(self) -> 'StubServer':
+        self._thread = threading.Thread(target=self.serve_forever, name='stub-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 대역 API 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', help='초기 데이터 (generate_dataset.py의 employees.jsonl)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='모든 응답에 추가할 지연')
+    parser.add_argument('--no-index', action='store_true', help='검색 시 전체 스캔 (인덱스 누락 재현)')
+    parser.add_argument('--signin-ms', type=float, default=0.0, help='로그인 1건 처리 시간')
+    parser.add_argument('--signin-workers', type=int, default=0, help='동시에 처리하는 로그인 수 (0은 제한 없음)')
+    parser.add_argument('--signin-queue', type=int, default=0, help='로그인 대기열 한도, 넘으면 429 (0은 제한 없음)')
+    parser.add_argument('--lockout-after', type=int, default=0, help='계정 잠금까지의 실패 횟수 (0은 잠금 없음)')
+    args = parser.parse_args()
+
+    server = StubServer(args.host, args.port, latency_ms=args.latency_ms, indexed=not args.no_index,
+                        signin=SigninGate(args.signin_ms, args.signin_workers, args.signin_queue,
+                                          args.lockout_after))
+    if args.seed:
+        print(f"[INFO] {server.store.load_jsonl(args.seed)}명 적재: {args.seed}")
+    print(f"[OK] Stub API server: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+단계별 성능 회귀 감지(e2e/utils/run_history.py compare_run) 테스트
+
+로그인 단계처럼 실행당 한 번뿐인 단계도 기준선 대비 회귀로 잡히는지 확인합니다 (서버/브라우저 불필요).
+"""
+import pytest
+
+from e2e.utils.run_history import compare_run, connect, main, record_run
+from e2e.utils.timing import StepRecord
+
+STEP = 'signin: 로그인 처리'
+BASELINE = (1.18, 1.21, 1.19, 1.22, 1.20, 1.17, 1.23, 1.20, 1.19, 1.21)
+
+
+def _record(db_path: str, seconds: list[float]) -> int:
+    meta = {'started_at': 0.0, 'finished_at': 1.0, 'base_url': 'http://stub', 'browser': 'chromium',
+            'headless': True, 'profile': 'none', 'outcome': 'passed'}
+    steps = [StepRecord('test_signin', STEP, 0.0, value) for value in seconds]
+    return record_run(db_path, meta, [('test_signin', 'passed', sum(seconds))], steps)
+
+
+class TestRunHistoryRegression:
+    """
+    표본 하나짜리 단계의 회귀 판정
+    """
+
+    @pytest.mark.parametrize("current, expected", [(3.0, True), (1.25, False)])
+    def test_single_sample_step(self, tmp_path, current, expected):
+        """
+        기준선 10회(약 1.2초) 대비 로그인 한 번이 3.0초면 회귀, 1.25초면 정상
+        """
+        db_path = str(tmp_path / 'history.sqlite')
+        for value in BASELINE:
+            _record(db_path, [value])
+        run_id = _record(db_path, [current])
+
+        conn = connect(db_path)
+        try:
+            [comparison] = compare_run(conn, run_id)
+        finally:
+            conn.close()
+
+        assert comparison.samples == 1 and comparison.p_value is None
+        assert comparison.regression is expected, f"z={comparison.z_score}, ratio={comparison.ratio}"
+
+    def test_cli_reports_single_sample_regression(self, tmp_path, capsys):
+        """
+        compare CLI가 p-value 없는 회귀를 z-score로 출력하고 종료 코드 1을 돌려주는지 확인
+        """
+        db_path = str(tmp_path / 'history.sqlite')
+        for value in BASELINE:
+            _record(db_path, [value])
+        _record(db_path, [3.0])
+
+        assert main(['--db', db_path, 'compare', '--fail-on-regression']) == 1
+        out = capsys.readouterr().out
+        assert f"[REGRESSION] {STEP}: 1.20s -> 3.00s" in out
+        assert "z=" in out and "p=" not in out
@@ -0,0 +1,384 @@
+"""
+테스트 단계/네트워크 요청/대기/다이얼로그 타임라인 HTML 리포트
+
+대량 처리에서 시간이 드롭다운, 업로드, 저장, 고정 대기 중 어디에 쓰였는지 보기 위해
+step_timer 단계와 같은 시간축에 아래 이벤트를 함께 그립니다.
+- 네트워크 요청 (request -> requestfinished/requestfailed)
+- 명시적 대기 (page.wait_for_timeout)
+- 다이얼로그 (alert/confirm/prompt)
+
+리포트는 외부 의존성이 없는 단일 HTML 파일이며, canvas에 보이는 구간만 그리므로
+수만 개 단계가 있어도 부드럽게 확대/이동할 수 있습니다.
+
+사용 예:
+    uv run pytest --browser chromium --timeline=test-results/timeline.html
+    # pytest-xdist 사용 시 작업자별로 timeline-gw0.html 형태로 저장
+"""
+import json
+import os
+import time
+from dataclasses import dataclass
+
+from playwright.sync_api import Page
+
+KINDS = ['step', 'net', 'wait', 'dialog']
+
+
+@dataclass
+class TimelineEvent:
+    """
+    타임라인 이벤트 하나
+    """
+    test_id: str
+    kind: str
+    start: float
+    end: float
+    label: str
+    detail: str = ''
+
+
+class TimelineRecorder:
+    """
+    세션 전체의 네트워크/대기/다이얼로그 이벤트 수집기
+
+    단계(step) 이벤트는 TimingReport에 이미 있으므로 HTML 생성 시 합칩니다.
+    """
+
+    def __init__(self):
+        self.events: list[TimelineEvent] = []
+
+    def instrument_page(self, page: Page, test_id: str):
+        """
+        페이지의 네트워크 요청, wait_for_timeout 호출, 다이얼로그를 기록하도록 연결
+        """
+        pending: dict = {}
+        statuses: dict = {}
+
+        def on_request(request):
+            pending[request] = time.time()
+
+        def on_response(response):
+            # 상태 코드는 응답 시점에만 알 수 있으므로 완료 시까지 보관
+            statuses[response.request] = response.status
+
+        def on_done(request, failed: bool = False):
+            start = pending.pop(request, None)
+            status = statuses.pop(request, '')
+            if start is None:
+                return
+            if failed:
+                status = f"failed: {request.failure}"
+            self.events.append(TimelineEvent(
+                test_id, 'net', start, time.time(),
+                f"{request.method} {request.url}", f"{request.resource_type} {status}".strip(),
+            ))
+
+        # 테스트가 등록한 dialog 핸들러 [(함수, once 여부)]
+        dialog_handlers: list[tuple] = []
+
+        def on_dialog(dialog):
+            now = time.time()
+            self.events.append(TimelineEvent(test_id, 'dialog', now, now, f"{dialog.type}: {dialog.message}"))
+            handled = bool(dialog_handlers)
+            dialog_handlers[:] = [h for h in dialog_handlers if not h[1]]
+            if not handled:
+                # 리스너가 하나라도 있으면 Playwright가 자동으로 닫지 않으므로, 기록만 하는 이 리스너가
+                # 유일하면 기본 동작(dismiss)을 대신 수행 (alert/confirm에서 멈추지 않도록)
+                try:
+                    dialog.dismiss()
+                except Exception:
+                    pass
+
+        page.on('request', on_request)
+        page.on('response', on_response)
+        page.on('requestfinished', on_done)
+        page.on('requestfailed', lambda request: on_done(request, failed=True))
+        page.on('dialog', on_dialog)
+
+        original_on, original_once, original_remove = page.on, page.once, page.remove_listener
+
+        def on(event: str, f):
+            if event == 'dialog':
+                dialog_handlers.append((f, False))
+            return original_on(event, f)
+
+        def once(event: str, f):
+            if event == 'dialog':
+                dialog_handlers.append((f, True))
+            return original_once(event, f)
+
+        def remove_listener(event: str, f):
+            if event == 'dialog':
+                dialog_handlers[:] = [h for h in dialog_handlers if h[0] is not f]
+            return original_remove(event, f)
+
+        page.on, page.once, page.remove_listener = on, once, remove_listener
+
+        # 고정 대기 시간 기록 (인스턴스 메서드만 감싸므로 다른 페이지에는 영향 없음)
+        original_wait = page.wait_for_timeout
+
+        def wait_for_timeout(timeout: float):
+            start = time.time()
+            try:
+                return original_wait(timeout)
+            finally:
+                self.events.append(TimelineEvent(test_id, 'wait', start, time.time(), f"wait_for_timeout({timeout:g})"))
+
+        page.wait_for_timeout = wait_for_timeout
+
+    def write_html(self, path: str, step_records: list, title: str = 'E2E Timeline') -> str:
+        """
+        단계 기록과 수집한 이벤트를 합쳐 HTML 파일 생성
+
+        Returns:
+            str: 저장한 파일 경로
+        """
+        events = list(self.events)
+        for record in step_records:
+            detail = ' '.join(f"{k}={v}" for k, v in record.meta.items())
+            events.append(TimelineEvent(record.test_id, 'step', record.start, record.end, record.name, detail))
+
+        data = build_payload(events, title)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(HTML_TEMPLATE.replace('__TITLE__', title).replace(
+                '__DATA__', json.dumps(data, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+            ))
+        return path
+
+
+def build_payload(events: list[TimelineEvent], title: str) -> dict:
+    """
+    HTML에 삽입할 압축 데이터 생성
+
+    문자열은 labels 배열에 한 번만 저장하고, 이벤트는 정수 배열
+    [row, kind, start_ms, end_ms, label, detail]로 표현합니다.
+    겹치는 이벤트(병렬 네트워크 요청, 중첩 단계)는 같은 레인 안의 하위 행으로 나눕니다.
+    """
+    if not events:
+        return {'title': title, 'origin': time.time(), 'rows': [], 'labels': [], 'events': []}
+
+    origin = min(e.start for e in events)
+    labels: dict[str, int] = {}
+
+    def label_index(text: str) -> int:
+        if text not in labels:
+            labels[text] = len(labels)
+        return labels[text]
+
+    first_start: dict[str, float] = {}
+    grouped: dict[tuple[str, str], list[TimelineEvent]] = {}
+    for event in events:
+        grouped.setdefault((event.test_id, event.kind), []).append(event)
+        first_start[event.test_id] = min(first_start.get(event.test_id, event.start), event.start)
+    tests = sorted(first_start, key=first_start.get)
+
+    rows = []
+    packed = []
+    for test_id in tests:
+        for kind in KINDS:
+            lane_events = sorted(grouped.get((test_id, kind), []), key=lambda e: e.start)
+            if not lane_events:
+                continue
+            # 그리디 방식으로 겹치지 않는 하위 행에 배치
+            lane_ends: list[float] = []
+            first_row = len(rows)
+            for event in lane_events:
+                for sub, end in enumerate(lane_ends):
+                    if end <= event.start:
+                        break
+                else:
+                    sub = len(lane_ends)
+                    lane_ends.append(0)
+                    rows.append([label_index(test_id), KINDS.index(kind), sub])
+                lane_ends[sub] = max(event.end, event.start + 1e-4)
+                packed.append([
+                    first_row + sub, KINDS.index(kind),
+                    round((event.start - origin) * 1000, 1), round((event.end - origin) * 1000, 1),
+                    label_index(event.label), label_index(event.detail),
+                ])
+
+    packed.sort(key=lambda e: e[2])
+    return {
+        'title': title,
+        'origin': origin,
+        'rows': rows,
+        'labels': list(labels),
+        'events': packed,
+    }
+
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+  body { margin: 0; font: 12px sans-serif; background: #fafafa; }
+  #bar { padding: 6px 10px; background: #263238; color: #fff; display: flex; gap: 16px; align-items: center; }
+  #bar input { width: 240px; }
+  .legend span { display: inline-block; width: 10px; height: 10px; margin: 0 4px 0 10px; }
+  #wrap { position: relative; }
+  canvas { display: block; }
+  #tip { position: fixed; pointer-events: none; background: #fff; border: 1px solid #999; padding: 4px 6px;
+         max-width: 600px; white-space: pre-wrap; word-break: break-all; display: none; z-index: 2; }
+</style>
+</head>
+<body>
+<div id="bar">
+  <b>__TITLE__</b>
+  <span id="stats"></span>
+  <input id="filter" placeholder="필터 (단계/URL 포함 문자열)">
+  <span class="legend"><span style="background:#42a5f5"></span>step<span style="background:#66bb6a"></span>network<span style="background:#ffa726"></span>wait<span style="background:#ef5350"></span>dialog</span>
+  <span>휠: 확대/축소, 드래그: 이동, Shift+휠: 세로 스크롤</span>
+</div>
+<div id="wrap"><canvas id="c"></canvas></div>
+<div id="tip"></div>
+<script>
+const DATA = __DATA__;
+const COLORS = ['#42a5f5', '#66bb6a', '#ffa726', '#ef5350'];
+const KIND_NAMES = ['step', 'net', 'wait', 'dialog'];
+const ROW_H = 16, LABEL_W = 320, AXIS_H = 20;
+const ev = DATA.events, labels = DATA.labels, rows = DATA.rows;
+const canvas = document.getElementById('c'), ctx = canvas.getContext('2d');
+const tip = document.getElementById('tip');
+const total = ev.reduce((m, e) => Math.max(m, e[3]), 1);
+let view = {start: 0, end: total * 1.02}, scrollY = 0, filter = '', visible = ev;
+// 이벤트 시작 시각 기준 정렬 + 최대 지속시간으로 이분 탐색 범위 결정
+const maxDur = ev.reduce((m, e) => Math.max(m, e[3] - e[2]), 0);
+
+document.getElementById('stats').textContent =
+  `${ev.length.toLocaleString()} events, ${rows.length.toLocaleString()} rows, ${(total / 1000).toFixed(1)}s`;
+
+function lowerBound(arr, t) {
+  let lo = 0, hi = arr.length;
+  while (lo < hi) { const mid = (lo + hi) >> 1; if (arr[mid][2] < t) lo = mid + 1; else hi = mid; }
+  return lo;
+}
+
+function resize() {
+  canvas.width = window.innerWidth * devicePixelRatio;
+  canvas.height = (window.innerHeight - 34) * devicePixelRatio;
+  canvas.style.width = window.innerWidth + 'px';
+  canvas.style.height = (window.innerHeight - 34) + 'px';
+  ctx.setTransform(devicePixelRatio, 0, 0, devicePixelRatio, 0, 0);
+  draw();
+}
+
+function x(t) { return LABEL_W + (t - view.start) / (view.end - view.start) * (canvas.clientWidth - LABEL_W); }
+
+let pending = false;
+function draw() {
+  if (pending) return;
+  pending = true;
+  requestAnimationFrame(() => { pending = false; render(); });
+}
+
+function render() {
+  const w = canvas.clientWidth, h = canvas.clientHeight;
+  ctx.clearRect(0, 0, w, h);
+  const firstRow = Math.floor(scrollY / ROW_H), lastRow = firstRow + Math.ceil((h - AXIS_H) / ROW_H);
+
+  // 행 라벨
+  ctx.fillStyle = '#fff'; ctx.fillRect(0, AXIS_H, LABEL_W, h);
+  ctx.font = '11px sans-serif';
+  for (let r = firstRow; r <= lastRow && r < rows.length; r++) {
+    const y = AXIS_H + r * ROW_H - scrollY;
+    const [testIdx, kind, sub] = rows[r];
+    if (r % 2 === 0) { ctx.fillStyle = '#f0f0f0'; ctx.fillRect(0, y, w, ROW_H); }
+    if (sub === 0) {
+      ctx.fillStyle = '#333';
+      const name = labels[testIdx];
+      ctx.fillText(`${KIND_NAMES[kind].padEnd(6)} ${name.length > 44 ? '…' + name.slice(-43) : name}`, 4, y + 12);
+    }
+  }
+
+  // 보이는 시간 구간의 이벤트만 그림 (픽셀보다 짧은 이벤트는 1px로 표시)
+  const from = lowerBound(visible, view.start - maxDur), to = lowerBound(visible, view.end);
+  ctx.save(); ctx.beginPath(); ctx.rect(LABEL_W, AXIS_H, w - LABEL_W, h); ctx.clip();
+  for (let i = from; i < to; i++) {
+    const e = visible[i];
+    if (e[3] < view.start || e[0] < firstRow || e[0] > lastRow) continue;
+    const x0 = x(e[2]), x1 = Math.max(x0 + 1, x(e[3]));
+    const y = AXIS_H + e[0] * ROW_H - scrollY + 2;
+    ctx.fillStyle = COLORS[e[1]];
+    if (e[1] === 3) { ctx.fillRect(x0 - 2, y, 4, ROW_H - 4); continue; }
+    ctx.fillRect(x0, y, x1 - x0, ROW_H - 4);
+    if (x1 - x0 > 40) {
+      ctx.fillStyle = '#fff';
+      ctx.fillText(labels[e[4]].slice(0, Math.floor((x1 - x0) / 6)), x0 + 2, y + 10);
+    }
+  }
+  ctx.restore();
+
+  // 시간축
+  ctx.fillStyle = '#eceff1'; ctx.fillRect(0, 0, w, AXIS_H);
+  ctx.fillStyle = '#333';
+  const span = view.end - view.start, step = Math.pow(10, Math.floor(Math.log10(span / 8)));
+  const tick = span / step > 40 ? step * 5 : span / step > 16 ? step * 2 : step;
+  for (let t = Math.ceil(view.start / tick) * tick; t < view.end; t += tick) {
+    const px = x(t);
+    ctx.fillRect(px, AXIS_H - 5, 1, 5);
+    ctx.fillText(t >= 1000 ? (t / 1000).toFixed(tick < 1000 ? 2 : 0) + 's' : t.toFixed(0) + 'ms', px + 2, 12);
+  }
+}
+
+function hit(mx, my) {
+  const row = Math.floor((my - AXIS_H + scrollY) / ROW_H);
+  const t = view.start + (mx - LABEL_W) / (canvas.clientWidth - LABEL_W) * (view.end - view.start);
+  const slack = 3 / (canvas.clientWidth - LABEL_W) * (view.end - view.start);
+  const from = lowerBound(visible, t - maxDur - slack), to = lowerBound(visible, t + slack);
+  for (let i = to - 1; i >= from; i--) {
+    const e = visible[i];
+    if (e[0] === row && e[2] - slack <= t && e[3] + slack >= t) return e;
+  }
+  return null;
+}
+
+canvas.addEventListener('wheel', (evt) => {
+  evt.preventDefault();
+  if (evt.shiftKey) {
+    scrollY = Math.max(0, Math.min(rows.length * ROW_H, scrollY + evt.deltaY));
+  } else {
+    const t = view.start + (evt.offsetX - LABEL_W) / (canvas.clientWidth - LABEL_W) * (view.end - view.start);
+    const k = evt.deltaY > 0 ? 1.25 : 0.8;
+    view = {start: Math.max(0, t - (t - view.start) * k), end: t + (view.end - t) * k};
+  }
+  draw();
+}, {passive: false});
+
+let drag = null;
+canvas.addEventListener('mousedown', (evt) => { drag = {x: evt.clientX, y: evt.clientY, view: {...view}, scrollY}; });
+window.addEventListener('mouseup', () => { drag = null; });
+window.addEventListener('mousemove', (evt) => {
+  if (drag) {
+    const dt = (evt.clientX - drag.x) / (canvas.clientWidth - LABEL_W) * (drag.view.end - drag.view.start);
+    view = {start: drag.view.start - dt, end: drag.view.end - dt};
+    scrollY = Math.max(0, drag.scrollY - (evt.clientY - drag.y));
+    tip.style.display = 'none';
+    draw();
+    return;
+  }
+  if (evt.target !== canvas) { tip.style.display = 'none'; return; }
+  const e = hit(evt.offsetX, evt.offsetY);
+  if (!e) { tip.style.display = 'none'; return; }
+  tip.textContent = `[${KIND_NAMES[e[1]]}] ${labels[e[4]]}\\n${(e[3] - e[2]).toFixed(1)}ms @ ${(e[2] / 1000).toFixed(3)}s` +
+    (labels[e[5]] ? `\\n${labels[e[5]]}` : '') + `\\n${labels[rows[e[0]][0]]}`;
+  tip.style.left = (evt.clientX + 12) + 'px'; tip.style.top = (evt.clientY + 12) + 'px';
+  tip.style.display = 'block';
+});
+
+document.getElementById('filter').addEventListener('input', (evt) => {
+  filter = evt.target.value.toLowerCase();
+  visible = filter ? ev.filter(e => labels[e[4]].toLowerCase().includes(filter) ||
+                                    labels[rows[e[0]][0]].toLowerCase().includes(filter)) : ev;
+  draw();
+});
+
+window.addEventListener('resize', resize);
+resize();
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,153 @@
+"""
+단계별(step) 실행 시간 계측
+
+테스트 안에서 "로그인", "부서 선택", "저장" 같은 단계를 이름으로 감싸서
+소요 시간을 기록하고, 세션 종료 시 프로파일별로 집계해 출력합니다.
+
+사용 예:
+    def test_xxx(page, step_timer):
+        with step_timer.step("임직원 추가 화면 진입"):
+            page.get_by_role("button", name="임직원 추가").click()
+
+        # 들여쓰기 없이 구간을 이어서 기록할 때
+        step_timer.checkpoint("부서 선택")
+        ...
+        step_timer.checkpoint("저장")
+        ...
+        step_timer.stop()
+"""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass
+class StepRecord:
+    """
+    단계 하나의 실행 기록
+    """
+    test_id: str
+    name: str
+    start: float
+    end: float
+    profile: str = 'none'
+    meta: dict = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class TimingReport:
+    """
+    세션 전체의 단계 기록 저장소
+    """
+
+    def __init__(self):
+        self.records: list[StepRecord] = []
+
+    def add(self, record: StepRecord):
+        self.records.append(record)
+
+    def summarize(self) -> dict:
+        """
+        (프로파일, 단계 이름)별 통계 반환
+
+        Returns:
+            dict: {(profile, name): {'count', 'total', 'mean', 'p95', 'max'}}
+        """
+        grouped: dict[tuple[str, str], list[float]] = {}
+        for record in self.records:
+            grouped.setdefault((record.profile, record.name), []).append(record.duration)
+
+        summary = {}
+        for key, durations in grouped.items():
+            durations.sort()
+            p95_index = min(len(durations) - 1, int(round(0.95 * (len(durations) - 1))))
+            summary[key] = {
+                'count': len(durations),
+                'total': sum(durations),
+                'mean': sum(durations) / len(durations),
+                'p95': durations[p95_index],
+                'max': durations[-1],
+            }
+        return summary
+
+    def format_summary(self) -> list[str]:
+        """
+        터미널 출력용 요약 라인 생성
+        """
+        summary = self.summarize()
+        if not summary:
+            return []
+
+        lines = []
+        for profile in sorted({profile for profile, _ in summary}):
+            lines.append(f"[TIME] Profile: {profile}")
+            lines.append(f"  {'step':<40} {'count':>6} {'mean':>8} {'p95':>8} {'max':>8}")
+            for (p, name), stats in summary.items():
+                if p != profile:
+                    continue
+                lines.append(
+                    f"  {name:<40} {stats['count']:>6} "
+                    f"{stats['mean']:>7.2f}s {stats['p95']:>7.2f}s {stats['max']:>7.2f}s"
+                )
+        return lines
+
+
+class StepTimer:
+    """
+    테스트 하나의 단계 시간 계측기
+    """
+
+    def __init__(self, test_id: str, report: TimingReport | None = None, profile: str = 'none'):
+        self.test_id = test_id
+        self.report = report
+        self.profile = profile
+        self.records: list[StepRecord] = []
+        self._open: tuple[str, float, dict] | None = None
+
+    def record(self, name: str, start: float, end: float, meta: dict | None = None) -> StepRecord:
+        """
+        이미 측정된 구간을 단계로 기록
+        """
+        record = StepRecord(self.test_id, name, start, end, self.profile, meta or {})
+        self.records.append(record)
+        if self.report is not None:
+            self.report.add(record)
+        return record
+
+    @contextmanager
+    def step(self, name: str, **meta):
+        """
+        with 블록 구간을 하나의 단계로 기록
+
+        블록 안에서 예외가 발생해도 기록은 남기며, meta에 'error'를 표시합니다.
+        """
+        start = time.time()
+        try:
+            yield
+        except Exception:
+            meta['error'] = True
+            raise
+        finally:
+            self.record(name, start, time.time(), meta)
+
+    def checkpoint(self, name: str, **meta):
+        """
+        열려 있는 단계를 종료하고 새 단계를 시작
+        """
+        now = time.time()
+        if self._open is not None:
+            open_name, open_start, open_meta = self._open
+            self.record(open_name, open_start, now, open_meta)
+        self._open = (name, now, meta)
+
+    def stop(self):
+        """
+        열려 있는 단계를 종료
+        """
+        if self._open is not None:
+            open_name, open_start, open_meta = self._open
+            self.record(open_name, open_start, time.time(), open_meta)
+            self._open = None